@@ -1,3 +1,52 @@
+import threading
+import time
+from unittest import mock
+
 from django.test import TestCase
+from rest_framework.test import APIClient
+
+from .models import ScrapingSession, User
+from . import views
+from .views import AnalysisViewSet
+
+
+class ResumeAnalysisTests(TestCase):
+    """Reprise d'une analyse : un seul crawl par session dans le process."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='reprise', email='reprise@example.com', password='x')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.session = ScrapingSession.objects.create(
+            user=self.user, url='https://example.com', status='in_progress', configuration={'max_pages': 5}
+        )
+
+    def _wait_released(self):
+        deadline = time.monotonic() + 5
+        while self.session.id in views._running_analyses and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertNotIn(self.session.id, views._running_analyses)
+
+    def test_double_resume_refused_while_crawl_runs(self):
+        release = threading.Event()
+        started = []
+
+        def fake_task(viewset, session_id, url, config):
+            started.append(session_id)
+            release.wait(5)
+
+        with mock.patch.object(AnalysisViewSet, '_run_analysis_task', fake_task), \
+                mock.patch('api.views.get_checkpoint_store', None):
+            first = self.client.post('/api/analysis/resume/', {'session_id': self.session.id}, format='json')
+            second = self.client.post('/api/analysis/resume/', {'session_id': self.session.id}, format='json')
+            self.assertEqual(first.status_code, 200)
+            self.assertEqual(second.status_code, 409)
+
+            # Crawl terminé : la session peut de nouveau être reprise
+            release.set()
+            self._wait_released()
+            third = self.client.post('/api/analysis/resume/', {'session_id': self.session.id}, format='json')
+            self.assertEqual(third.status_code, 200)
+            self._wait_released()
 
-# Create your tests here.
+        self.assertEqual(started, [self.session.id, self.session.id])
@@ -54,6 +54,7 @@ urlpatterns = [
     path('analysis/preview/', AnalysisViewSet.as_view({'post': 'preview'}), name='analysis-preview'),
     path('analysis/estimate/', AnalysisViewSet.as_view({'post': 'estimate'}), name='analysis-estimate'),
     path('analysis/analyze/', AnalysisViewSet.as_view({'post': 'analyze'}), name='analysis-analyze'),
+    path('analysis/resume/', AnalysisViewSet.as_view({'post': 'resume'}), name='analysis-resume'),
     
     # Routes d'export
     # path('export/<int:session_id>/', export_results, name='export-results'),
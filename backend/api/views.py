@@ -15,6 +15,7 @@ from django.core.mail import send_mail
 from django.conf import settings
 import random
 import string
+import threading
 from datetime import timedelta
 import json
 import csv
@@ -35,14 +36,16 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 try:
-    from core.scraper import scrape_url
-    from core.analyzer import analyze_url
-    from core.subdomain_finder import discover_subdomains
-    from core.site_checker import SiteChecker, filter_scrapable_sites
-    from core.path_finder import discover_paths
-    from core.smart_crawler import discover_paths_smart
-    from core.site_estimator import SiteEstimator
-    from core.fetcher_playwright import take_screenshot
+    from src.core.scraper import scrape_url
+    from src.core.analyzer import analyze_url
+    from src.core.subdomain_finder import discover_subdomains
+    from src.core.site_checker import SiteChecker, filter_scrapable_sites
+    from src.core.path_finder import discover_paths
+    from src.core.smart_crawler import discover_paths_smart
+    from src.core.crawl_checkpoint import get_checkpoint_store, session_checkpoint_id
+    from src.core.site_estimator import SiteEstimator
+    from src.core.fetcher_playwright import take_screenshot
+    from src.core.loop_runner import run_sync
     SCRAPER_AVAILABLE = True
 except ImportError as e:
     print(f"Import error: {e}")
@@ -51,8 +54,11 @@ except ImportError as e:
     discover_subdomains = None
     discover_paths = None
     discover_paths_smart = None
+    get_checkpoint_store = None
+    session_checkpoint_id = None
     SiteEstimator = None
     take_screenshot = None
+    run_sync = None
     SiteChecker = None
     filter_scrapable_sites = None
     SCRAPER_AVAILABLE = False
@@ -662,6 +668,25 @@ class DashboardViewSet(viewsets.ViewSet):
         })
 
 
+# Analyses dont le crawl tourne dans ce process (ids de session) : une reprise ne relance pas un crawl vivant
+_running_analyses = set()
+_running_analyses_lock = threading.Lock()
+
+
+def _claim_analysis(session_id) -> bool:
+    """Réserve la session pour un thread d'analyse ; False si un crawl de cette session tourne déjà."""
+    with _running_analyses_lock:
+        if session_id in _running_analyses:
+            return False
+        _running_analyses.add(session_id)
+        return True
+
+
+def _release_analysis(session_id):
+    with _running_analyses_lock:
+        _running_analyses.discard(session_id)
+
+
 class AnalysisViewSet(viewsets.ViewSet):
     """
     ViewSet pour l'analyse d'URL avant scraping.
@@ -772,7 +797,7 @@ class AnalysisViewSet(viewsets.ViewSet):
             # Analyse de contenu limitée
             content_types_count = 0
             if SCRAPER_AVAILABLE and analyze_url:
-                result = analyze_url(url, max_candidates=3, max_items_preview=2, use_js=True)
+                result = analyze_url(url, max_candidates=3, max_items_preview=2, use_js='auto')
                 if result.get('collections'):
                     content_types_count = len(result['collections'])
             
@@ -808,11 +833,10 @@ class AnalysisViewSet(viewsets.ViewSet):
             return Response({'error': 'La fonctionnalité de capture d\'écran n\'est pas disponible.'}, status=status.HTTP_503_SERVICE_UNAVAILABLE)
 
         try:
-            import asyncio
             import base64
             
-            # Exécuter la fonction asynchrone dans le thread principal de l'événementiel
-            screenshot_bytes = asyncio.run(take_screenshot(url))
+            # Soumettre la coroutine à la boucle partagée (pas de nouvelle boucle par requête)
+            screenshot_bytes = run_sync(take_screenshot(url))
             
             # Encoder en base64 pour l'envoyer en JSON
             screenshot_base64 = base64.b64encode(screenshot_bytes).decode('utf-8')
@@ -875,8 +899,12 @@ class AnalysisViewSet(viewsets.ViewSet):
         from threading import Thread
         
         session_id = session.id
+        _claim_analysis(session_id)
         def run_analysis():
-            self._run_analysis_task(session_id, url, config)
+            try:
+                self._run_analysis_task(session_id, url, config)
+            finally:
+                _release_analysis(session_id)
         
         thread = Thread(target=run_analysis)
         thread.daemon = True
@@ -889,6 +917,64 @@ class AnalysisViewSet(viewsets.ViewSet):
             'message': 'Analyse démarrée'
         })
     
+    @action(detail=False, methods=['post'])
+    def resume(self, request):
+        """
+        Reprend une analyse interrompue (ex. redémarrage du serveur pendant le crawl).
+        Le crawl repart de son dernier point de reprise : les pages déjà crawlées ne sont pas revisitées.
+        POST /api/analysis/resume/
+        Body: { "session_id": 42 }
+        """
+        session_id = request.data.get('session_id')
+        if not session_id:
+            return Response({'error': 'session_id requis'}, status=status.HTTP_400_BAD_REQUEST)
+        
+        try:
+            session = ScrapingSession.objects.get(id=session_id, user=request.user)
+        except (ScrapingSession.DoesNotExist, ValueError):
+            return Response({'error': 'Session non trouvée'}, status=status.HTTP_404_NOT_FOUND)
+        
+        if session.status == 'completed':
+            return Response({'error': 'Session déjà terminée'}, status=status.HTTP_400_BAD_REQUEST)
+        if session.status == 'failed' and 'Annulé' in (session.error_message or ''):
+            return Response({'error': 'Session annulée'}, status=status.HTTP_400_BAD_REQUEST)
+        # Deux crawls de la même session écriraient le même point de reprise et les mêmes résultats
+        if not _claim_analysis(session.id):
+            return Response({'error': 'Analyse déjà en cours'}, status=status.HTTP_409_CONFLICT)
+        
+        store = get_checkpoint_store() if get_checkpoint_store else None
+        checkpoint = store.load(session_checkpoint_id(session.id)) if store else None
+        
+        session.status = 'in_progress'
+        session.completed_at = None
+        session.error_message = None
+        session.save(update_fields=['status', 'completed_at', 'error_message'])
+        if checkpoint:
+            session.add_log(f"♻️ Reprise de l'analyse ({len(checkpoint.get('completed', []))} pages déjà crawlées)", 'info')
+        else:
+            session.add_log("[*] Reprise de l'analyse (aucun point de reprise, crawl complet)", 'warning')
+        
+        from threading import Thread
+        
+        url = session.url
+        config = session.configuration or {}
+        def run_analysis():
+            try:
+                self._run_analysis_task(session.id, url, config)
+            finally:
+                _release_analysis(session.id)
+        
+        thread = Thread(target=run_analysis)
+        thread.daemon = True
+        thread.start()
+        
+        return Response({
+            'success': True,
+            'session_id': session.id,
+            'resumed_pages': len(checkpoint.get('completed', [])) if checkpoint else 0,
+            'message': 'Analyse reprise'
+        })
+    
     def _run_analysis_task(self, session_id, url, config):
         """
         Exécute l'analyse complète en arrière-plan.
@@ -1043,7 +1129,10 @@ class AnalysisViewSet(viewsets.ViewSet):
                 session.add_log(f"🕷️ Lancement du Smart Crawler (max {max_pages_to_crawl} pages sur ~{estimated_pages})...", 'info')
                 
                 # Lancer le crawling avec la limite adaptative
-                paths_result = discover_paths_smart(url, max_pages=max_pages_to_crawl)
+                # (état sauvegardé périodiquement : reprise possible via /api/analysis/resume/)
+                paths_result = discover_paths_smart(
+                    url, max_pages=max_pages_to_crawl, checkpoint_id=session_checkpoint_id(session_id)
+                )
                 
                 # --- NOUVEAU: Gestion intelligente des liens (KnownPath) ---
                 try:
@@ -1141,7 +1230,7 @@ class AnalysisViewSet(viewsets.ViewSet):
                 session.add_log(f"[*] Analyse du contenu avec IA...")
                 
                 # Analyser la page principale
-                result = analyze_url(url, max_candidates=5, max_items_preview=3, use_js=True)
+                result = analyze_url(url, max_candidates=5, max_items_preview=3, use_js='auto')
                 
                 # Vérifier si annulé
                 session.refresh_from_db()
@@ -1162,7 +1251,7 @@ class AnalysisViewSet(viewsets.ViewSet):
                                 
                             if page_url and page_url != url:
                                 session.add_log(f"    └─ Analyse de {page_url}...")
-                                result = analyze_url(page_url, max_candidates=5, max_items_preview=3, use_js=True)
+                                result = analyze_url(page_url, max_candidates=5, max_items_preview=3, use_js='auto')
                                 if result.get('collections'):
                                     session.add_log(f"    └─ ✓ Contenu trouvé", 'success')
                                     break
@@ -1260,6 +1349,11 @@ class AnalysisViewSet(viewsets.ViewSet):
             session.total_items = paths_data.get('pages_crawled', 0) if paths_data else 0
             session.mark_completed()
             
+            # Le crawl est terminé et sauvegardé dans la session : point de reprise inutile
+            store = get_checkpoint_store() if get_checkpoint_store else None
+            if store:
+                store.delete(session_checkpoint_id(session_id))
+            
         except Exception as e:
             import traceback
             print(f"❌ ERREUR SCRAPING CRITIQUE: {str(e)}")
@@ -1901,13 +1995,13 @@ class ScrapingViewSet(viewsets.ModelViewSet):
                     timeout = config.get('timeout', 30)
                     
                     new_session.add_log(f"[*] Récupération du HTML...", 'info')
-                    html_content = fetch_html_smart(url, use_js=True, timeout_seconds=float(timeout))
+                    html_content = fetch_html_smart(url, use_js='auto', timeout_seconds=float(timeout))
                     
                     if html_content:
                         new_session.add_log(f"[*] HTML récupéré ({len(html_content)} caractères)", 'info')
                         
                         # Analyser et extraire
-                        result = analyze_url(url, max_candidates=10, max_items_preview=10, use_js=True)
+                        result = analyze_url(url, max_candidates=10, max_items_preview=10, use_js='auto')
                         
                         if result and result.get('scrapable_content'):
                             # Sauvegarder les résultats (même logique que start)
@@ -1995,8 +2089,8 @@ class ScrapingViewSet(viewsets.ModelViewSet):
         def run_batch_scraping():
             try:
                 from src.core.fetcher_playwright import fetch_html_smart
+                from src.core.rate_limiter import get_rate_limiter
                 from bs4 import BeautifulSoup
-                import time as time_module
                 
                 config = session.configuration
                 delay = config.get('delay', 500)
@@ -2004,6 +2098,7 @@ class ScrapingViewSet(viewsets.ModelViewSet):
                 custom_selectors = config.get('custom_selectors', [])
                 
                 total_extracted = 0
+                politeness_owner = f"session-{session.id}"
                 
                 for i, url in enumerate(urls):
                     # Check cancellation (status might be updated from another thread/process)
@@ -2014,18 +2109,18 @@ class ScrapingViewSet(viewsets.ModelViewSet):
                     session.add_log(f"[{i+1}/{len(urls)}] Traitement de {url}", 'info')
                     
                     try:
+                        # Délai configuré = intervalle minimal par hôte, le temps de la session
+                        # (les autres hôtes ne l'attendent pas)
+                        get_rate_limiter().configure_host(url, interval=delay / 1000.0, owner=politeness_owner)
+                        
                         # Fetch
-                        html_content = fetch_html_smart(url, use_js=True, timeout_seconds=float(timeout))
+                        html_content = fetch_html_smart(url, use_js='auto', timeout_seconds=float(timeout))
                         if not html_content:
                             session.add_log(f"[!] Impossible de récupérer {url}", 'warning')
                             continue
                         
                         soup = BeautifulSoup(html_content, 'html.parser')
                         
-                        # Apply delay
-                        if delay > 0 and i < len(urls) - 1:
-                            time_module.sleep(delay / 1000.0)
-                            
                         # Extract Custom Selectors
                         if custom_selectors:
                             for selector_config in custom_selectors:
@@ -2079,6 +2174,10 @@ class ScrapingViewSet(viewsets.ModelViewSet):
                     
             except Exception as e:
                 session.mark_failed(str(e))
+            finally:
+                # Délais de la session retirés : les sessions suivantes repartent de la politesse par défaut
+                from src.core.rate_limiter import get_rate_limiter
+                get_rate_limiter().release(f"session-{session.id}")
                 
         thread = Thread(target=run_batch_scraping)
         thread.start()
@@ -2159,13 +2258,16 @@ class ScrapingViewSet(viewsets.ModelViewSet):
             from src.core.analyzer import analyze_url
             from src.core.content_detector import ContentDetector
             from src.core.fetcher_playwright import fetch_html_smart
+            from src.core.rate_limiter import get_rate_limiter
             from bs4 import BeautifulSoup
-            import time as time_module
+            
+            # Délai configuré entre requêtes = intervalle minimal vers cet hôte, le temps de la session
+            get_rate_limiter().configure_host(url, interval=delay / 1000.0, owner=f"session-{session.id}")
             
             session.add_log(f"[*] Récupération du contenu HTML réel...", 'info')
             
-            # Récupérer le HTML réel avec Playwright (utiliser le timeout configuré)
-            html_content = fetch_html_smart(url, use_js=True, timeout_seconds=float(timeout))
+            # Récupérer le HTML réel (HTTP d'abord, Playwright si la page exige JS)
+            html_content = fetch_html_smart(url, use_js='auto', timeout_seconds=float(timeout))
             if not html_content:
                 session.add_log("[!] Impossible de récupérer le contenu HTML", 'error')
                 raise Exception("Échec de récupération HTML")
@@ -2173,12 +2275,8 @@ class ScrapingViewSet(viewsets.ModelViewSet):
             soup = BeautifulSoup(html_content, 'html.parser')
             session.add_log(f"[*] HTML récupéré ({len(html_content)} caractères)", 'info')
             
-            # Appliquer le délai configuré entre requêtes
-            if delay > 0:
-                time_module.sleep(delay / 1000.0)  # Convertir ms en secondes
-            
             # Analyser le contenu pour détecter les types
-            result = analyze_url(url, max_candidates=10, max_items_preview=10, use_js=True)
+            result = analyze_url(url, max_candidates=10, max_items_preview=10, use_js='auto')
             
             scraped_data = []
             total_extracted = 0
@@ -2459,7 +2557,10 @@ class ScrapingViewSet(viewsets.ModelViewSet):
                                 session.add_log("[!] Aucun texte trouvé avec méthode standard. Tentative extraction avancée (Playwright)...", 'warning')
                                 try:
                                     from src.core.fetcher_playwright import extract_complete_content_sync
-                                    adv_data = extract_complete_content_sync(url, timeout_seconds=60, scroll_for_dynamic=True)
+                                    # Seul le texte est utilisé : médias, liens et background CSS ne sont pas calculés
+                                    adv_data = extract_complete_content_sync(
+                                        url, timeout_seconds=60, scroll_for_dynamic=True, sections=['text']
+                                    )
                                     
                                     # Récupérer les textes de l'extraction avancée
                                     adv_text = adv_data.get('text', {})
@@ -2901,6 +3002,10 @@ class ScrapingViewSet(viewsets.ModelViewSet):
         except Exception as e:
             session.add_log(f"[!] Erreur lors du scraping: {str(e)}", 'error')
             session.mark_failed(str(e))
+        finally:
+            # Délai de la session retiré : il ne s'applique pas aux sessions suivantes
+            from src.core.rate_limiter import get_rate_limiter
+            get_rate_limiter().release(f"session-{session.id}")
         
         return Response({
             'session_id': session.id,
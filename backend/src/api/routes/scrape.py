@@ -1,6 +1,6 @@
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel, HttpUrl
-from typing import Optional
+from typing import List, Optional
 
 from src.core.scraper import scrape_url, scrape_url_ultra_complete
 from src.core.fetcher_playwright import get_fetcher, cleanup_fetcher
@@ -19,6 +19,7 @@ class UltraCompleteRequest(BaseModel):
     url: HttpUrl
     use_scroll: bool = True
     timeout_seconds: float = 20.0
+    sections: Optional[List[str]] = None   # ex. ["metadata", "links"] ; None = tout
 
 
 @router.post("/scrape")
@@ -57,7 +58,8 @@ async def scrape_ultra_complete(req: UltraCompleteRequest):
             url=str(req.url),
             use_scroll=req.use_scroll,
             timeout_seconds=req.timeout_seconds,
-            wait_for_selector=None
+            wait_for_selector=None,
+            sections=req.sections
         )
         
         if not result.get('success', False):
@@ -70,6 +72,8 @@ async def scrape_ultra_complete(req: UltraCompleteRequest):
         
     except HTTPException:
         raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Erreur serveur: {str(e)}")
 
@@ -92,7 +96,8 @@ async def scrape_ultra_complete_advanced(req: UltraCompleteRequest):
             url=str(req.url),
             use_scroll=req.use_scroll, 
             timeout_seconds=req.timeout_seconds,
-            wait_for_selector=getattr(req, 'wait_for_selector', None)
+            wait_for_selector=getattr(req, 'wait_for_selector', None),
+            sections=req.sections
         )
         
         if not result.get('success', False):
@@ -105,6 +110,8 @@ async def scrape_ultra_complete_advanced(req: UltraCompleteRequest):
         
     except HTTPException:
         raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Erreur extraction avancée: {str(e)}")
 
@@ -1,12 +1,86 @@
 # backend/src/core/ai_structure_validator.py
 # Validation intelligente de la structure des sites web
 # Utilise l'analyse de patterns pour confirmer les types de contenus détectés
-# RELEVANT FILES: content_detector.py, analyzer.py
+# Marqueurs et indicateurs textuels de tous les types compilés en un seul moteur, exécuté une fois par page
+# RELEVANT FILES: content_detector.py, analyzer.py, parsed_page.py, selector_matcher.py
 
-from typing import Dict, List
-from bs4 import BeautifulSoup
+from typing import Dict, List, Union
 import re
 
+from .parsed_page import ParsedPage
+from .selector_matcher import SelectorMatcher
+
+
+_WORD_RE = re.compile(r'\w+')
+
+
+class StructureSignalMatcher:
+    """
+    Indicateurs textuels et marqueurs de structure de tous les types, évalués en un passage par page.
+
+        matcher = StructureSignalMatcher(AIStructureValidator.VALIDATION_PATTERNS)
+        matcher.scan(page)['products']
+        # {'text_indicators': [(pattern, nb_occurrences), ...], 'text_matches': 7,
+        #  'structure_markers': ['price', 'stock'], 'structure_matches': 2}
+
+    Indicateurs : une alternative unique en lookahead repère chaque position où au moins un motif démarre,
+    puis chaque motif est vérifié à cette position ; les comptes sont ceux de re.findall motif par motif
+    (occurrences sans chevauchement), même quand les motifs se recouvrent entre eux.
+    Marqueurs : \bmarqueur\b équivaut à un mot entier du HTML, d'où une recherche dans l'ensemble des mots.
+    """
+
+    def __init__(self, patterns: Dict[str, Dict]):
+        self.patterns = patterns
+        self.indicators: List[str] = []
+        self.markers: List[str] = []
+        for config in patterns.values():
+            for indicator in config['text_indicators']:
+                if indicator not in self.indicators:
+                    self.indicators.append(indicator)
+            for marker in config['structure_markers']:
+                if marker not in self.markers:
+                    self.markers.append(marker)
+        self._indicator_regexes = [re.compile(indicator, re.IGNORECASE) for indicator in self.indicators]
+        self._any_indicator = re.compile(
+            '(?=' + '|'.join(f'(?:{indicator})' for indicator in self.indicators) + ')', re.IGNORECASE
+        )
+
+    def count_indicators(self, text: str) -> Dict[str, int]:
+        """Occurrences de chaque indicateur (len(re.findall(...))), en un parcours du texte."""
+        counts = [0] * len(self.indicators)
+        next_start = [0] * len(self.indicators)
+        for candidate in self._any_indicator.finditer(text):
+            position = candidate.start()
+            for index, regex in enumerate(self._indicator_regexes):
+                if position < next_start[index]:
+                    continue   # dans une occurrence déjà comptée pour ce motif
+                found = regex.match(text, position)
+                if found:
+                    counts[index] += 1
+                    next_start[index] = max(found.end(), position + 1)
+        return dict(zip(self.indicators, counts))
+
+    def present_markers(self, html: str) -> set:
+        """Marqueurs présents comme mots entiers dans le HTML (sans casse)."""
+        words = set(_WORD_RE.findall(html.lower()))
+        return {marker for marker in self.markers if marker in words}
+
+    def scan(self, page: ParsedPage) -> Dict[str, Dict]:
+        """Comptes par type de contenu, calculés sur un seul passage du texte et du HTML."""
+        counts = self.count_indicators(page.text_lower)
+        present = self.present_markers(page.html)
+        signals = {}
+        for content_type, config in self.patterns.items():
+            indicators = [(indicator, counts[indicator]) for indicator in config['text_indicators']]
+            markers = [marker for marker in config['structure_markers'] if marker in present]
+            signals[content_type] = {
+                'text_indicators': indicators,
+                'text_matches': sum(count for _, count in indicators),
+                'structure_markers': markers,
+                'structure_matches': len(markers)
+            }
+        return signals
+
 
 class AIStructureValidator:
     """
@@ -121,10 +195,18 @@ class AIStructureValidator:
             'required_elements': 2
         }
     }
+
+    def __init__(self):
+        # Marqueurs et indicateurs de tous les types compilés une fois : un passage par page
+        self.signal_matcher = StructureSignalMatcher(self.VALIDATION_PATTERNS)
+        # Balises typiques de tous les types : un parcours du DOM
+        self.tag_matcher = SelectorMatcher(
+            {content_type: config['html_tags'] for content_type, config in self.VALIDATION_PATTERNS.items()}
+        )
     
     def validate_content_type(
         self, 
-        html_content: str, 
+        html_content: Union[str, ParsedPage], 
         content_type: str, 
         detected_count: int
     ) -> Dict:
@@ -132,7 +214,7 @@ class AIStructureValidator:
         Valide si le type de contenu détecté est réellement présent.
         
         Args:
-            html_content: HTML complet du site
+            html_content: HTML complet du site, ou ParsedPage partagée (pas de nouveau parsing)
             content_type: Type détecté (articles, products, etc.)
             detected_count: Nombre d'éléments détectés
         
@@ -152,8 +234,10 @@ class AIStructureValidator:
                 'warnings': []
             }
         
-        soup = BeautifulSoup(html_content, 'html.parser')
+        page = ParsedPage.ensure(html_content)
         pattern = self.VALIDATION_PATTERNS[content_type]
+        signals = page.memo(self.signal_matcher, lambda: self.signal_matcher.scan(page))[content_type]
+        tagged = page.memo(self.tag_matcher, lambda: self.tag_matcher.match_selectors(page.soup))
         
         evidence = []
         warnings = []
@@ -162,7 +246,7 @@ class AIStructureValidator:
         # 1. Vérifier les balises HTML
         html_matches = 0
         for tag_selector in pattern['html_tags']:
-            elements = soup.select(tag_selector)
+            elements = tagged[tag_selector]
             if elements:
                 html_matches += len(elements)
                 evidence.append(f"Trouvé {len(elements)} éléments avec {tag_selector}")
@@ -172,15 +256,13 @@ class AIStructureValidator:
         else:
             warnings.append(f"Aucune balise HTML typique de {content_type} trouvée")
         
-        # 2. Vérifier les indicateurs textuels
-        text_content = soup.get_text().lower()
-        text_matches = 0
+        # 2. Vérifier les indicateurs textuels (comptes du passage unique)
+        text_content = page.text_lower
+        text_matches = signals['text_matches']
         
-        for regex_pattern in pattern['text_indicators']:
-            matches = re.findall(regex_pattern, text_content, re.IGNORECASE)
-            if matches:
-                text_matches += len(matches)
-                evidence.append(f"Pattern textuel '{regex_pattern[:30]}...' trouvé {len(matches)} fois")
+        for regex_pattern, count in signals['text_indicators']:
+            if count:
+                evidence.append(f"Pattern textuel '{regex_pattern[:30]}...' trouvé {count} fois")
         
         if text_matches >= 3:
             score += 0.3
@@ -189,13 +271,10 @@ class AIStructureValidator:
         else:
             warnings.append(f"Peu d'indicateurs textuels pour {content_type}")
         
-        # 3. Vérifier les marqueurs de structure
-        structure_matches = 0
-        for marker in pattern['structure_markers']:
-            # Chercher dans les classes, IDs, attributs
-            if re.search(rf'\b{marker}\b', html_content, re.IGNORECASE):
-                structure_matches += 1
-                evidence.append(f"Marqueur de structure '{marker}' présent")
+        # 3. Vérifier les marqueurs de structure (classes, IDs, attributs, balises)
+        structure_matches = signals['structure_matches']
+        for marker in signals['structure_markers']:
+            evidence.append(f"Marqueur de structure '{marker}' présent")
         
         if structure_matches >= pattern['required_elements']:
             score += 0.2
@@ -235,14 +314,14 @@ class AIStructureValidator:
     
     def validate_all_detected_types(
         self, 
-        html_content: str, 
+        html_content: Union[str, ParsedPage], 
         detected_types: List[Dict]
     ) -> Dict:
         """
-        Valide tous les types de contenus détectés.
+        Valide tous les types de contenus détectés (un seul parsing pour tous les types).
         
         Args:
-            html_content: HTML complet
+            html_content: HTML complet ou ParsedPage
             detected_types: Liste des types détectés par ContentDetector
         
         Returns:
@@ -255,12 +334,13 @@ class AIStructureValidator:
         validated = []
         rejected = []
         global_warnings = []
+        page = ParsedPage.ensure(html_content)
         
         for content_info in detected_types:
             content_type = content_info['type']
             count = content_info['count']
             
-            validation = self.validate_content_type(html_content, content_type, count)
+            validation = self.validate_content_type(page, content_type, count)
             
             if validation['valid']:
                 validated.append({
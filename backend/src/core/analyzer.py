@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import re
+from collections import Counter
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from bs4 import BeautifulSoup, Tag
 
@@ -10,6 +12,7 @@ from src.core.fetcher import fetch_html
 from src.core.fetcher_playwright import fetch_html_smart
 from src.core.content_detector import ContentDetector
 from src.core.ai_structure_validator import AIStructureValidator
+from src.core.parsed_page import ParsedPage
 
 
 _PRICE_RE = re.compile(
@@ -18,53 +21,61 @@ _PRICE_RE = re.compile(
 _DATE_RE = re.compile(
     r"(?i)\b(\d{1,2}[/-]\d{1,2}[/-]\d{2,4}|\d{4}[/-]\d{1,2}[/-]\d{1,2}|\w+ \d{1,2},? \d{4}|\d{1,2} \w+ \d{4})\b"
 )
+_NAV_PRICE_CLASS_RE = re.compile(r"(?i)(price|cost)")
+_PRICE_CLASS_RE = re.compile(r"(?i)(price|cost|amount)")
+_HEADING_TAGS = frozenset(["h1", "h2", "h3", "h4", "h5", "h6"])
+# Types de chaînes lues par get_text() sur une balise ordinaire (ni script, ni style, ni template)
+_TEXT_STRING_TYPES = Tag.DEFAULT_INTERESTING_STRING_TYPES
 
 
 def _clean_text(s: str) -> str:
     return re.sub(r"\s+", " ", s or "").strip()
 
 
-def _node_signature(tag: Tag) -> Tuple[str, Tuple[str, ...]]:
-    classes = tag.get("class") or []
-    filtered_classes = []
-
-    semantic_patterns = [
-        "product",
-        "item",
-        "card",
-        "post",
-        "article",
-        "entry",
-        "listing",
-        "result",
-        "tile",
-        "box",
-        "container",
-    ]
+_ITEM_ID_CLASS_RE = re.compile(r"^(post|id|item)-\d+")
+_SEMANTIC_CLASS_PATTERNS = (
+    "product",
+    "item",
+    "card",
+    "post",
+    "article",
+    "entry",
+    "listing",
+    "result",
+    "tile",
+    "box",
+    "container",
+)
 
-    for c in classes:
-        if isinstance(c, str):
-            if re.match(r"^(post|id|item)-\d+", c):
-                continue
-            if c.startswith("js-"):
-                continue
-            if c.startswith("product_cat-") or c.startswith("product_tag-"):
-                continue
-            if c.startswith("category-") or c.startswith("tag-"):
-                continue
-            if c in ["first", "last", "odd", "even"]:
-                continue
 
-            is_semantic = any(pattern in c.lower() for pattern in semantic_patterns)
-            if is_semantic or c in [
-                "has-post-thumbnail",
-                "instock",
-                "status-publish",
-                "type-product",
-            ]:
-                filtered_classes.append(c)
+@lru_cache(maxsize=4096)
+def _is_signature_class(c: str) -> bool:
+    """Classe retenue dans la signature (mémorisée : les mêmes classes reviennent sur chaque item)."""
+    if _ITEM_ID_CLASS_RE.match(c):
+        return False
+    if c.startswith("js-"):
+        return False
+    if c.startswith("product_cat-") or c.startswith("product_tag-"):
+        return False
+    if c.startswith("category-") or c.startswith("tag-"):
+        return False
+    if c in ["first", "last", "odd", "even"]:
+        return False
+
+    is_semantic = any(pattern in c.lower() for pattern in _SEMANTIC_CLASS_PATTERNS)
+    return is_semantic or c in [
+        "has-post-thumbnail",
+        "instock",
+        "status-publish",
+        "type-product",
+    ]
+
 
-    filtered_classes = tuple(sorted(filtered_classes))
+def _node_signature(tag: Tag) -> Tuple[str, Tuple[str, ...]]:
+    classes = tag.get("class") or []
+    filtered_classes = tuple(
+        sorted(c for c in classes if isinstance(c, str) and _is_signature_class(c))
+    )
     return tag.name, filtered_classes
 
 
@@ -183,7 +194,119 @@ class _Candidate:
     score: float
 
 
-def _is_navigation_or_filter(container: Tag) -> bool:
+# Drapeaux des sous-arbres (masques de bits)
+_HAS_LINK, _HAS_IMAGE, _HAS_NAV_PRICE, _HAS_PRICE, _HAS_TITLE = 1, 2, 4, 8, 16
+_TAG_FLAGS = {"a": _HAS_LINK, "img": _HAS_IMAGE, **{h: _HAS_TITLE for h in _HEADING_TAGS}}
+
+
+@dataclass
+class _NodeStats:
+    """Données d'un nœud calculées une fois, de bas en haut (enfants avant parent)."""
+    children: List[Tag]
+    signature: Tuple[str, Tuple[str, ...]]
+    text_len: int          # len(_clean_text(tag.get_text(" ")))
+    subtree_text_len: int  # idem, vu depuis un ancêtre (hors script / style / template)
+    descendants: int       # drapeaux des descendants (sans le nœud), comme tag.find(...)
+    flags: int             # drapeaux du sous-arbre, nœud compris
+    size: int              # nombre de balises du sous-arbre, nœud compris
+
+    @property
+    def has_link(self) -> bool:
+        return bool(self.descendants & _HAS_LINK)
+
+    @property
+    def has_image(self) -> bool:
+        return bool(self.descendants & _HAS_IMAGE)
+
+    @property
+    def has_nav_price(self) -> bool:
+        """Descendant de classe price|cost (filtre de navigation)."""
+        return bool(self.descendants & _HAS_NAV_PRICE)
+
+    @property
+    def has_price(self) -> bool:
+        """Descendant de classe price|cost|amount (richesse du contenu)."""
+        return bool(self.descendants & _HAS_PRICE)
+
+    @property
+    def has_title(self) -> bool:
+        return bool(self.descendants & _HAS_TITLE)
+
+
+def _clean_len(s: str) -> int:
+    """len(_clean_text(s)) sans regex."""
+    return len(" ".join(s.split()))
+
+
+def _collect_node_stats(root: Tag) -> Dict[int, _NodeStats]:
+    """
+    Parcours unique de bas en haut : chaque nœud agrège les données de ses enfants directs.
+    Longueur du texte nettoyé sans get_text() : les morceaux non vides sont joints par un espace,
+    donc len = somme des longueurs + (nombre de morceaux - 1).
+    Signatures et drapeaux de classes mémorisés par (balise, classes) : les items d'une liste les partagent.
+    """
+    tags = root.find_all(True)
+    if not isinstance(root, BeautifulSoup):
+        tags.insert(0, root)
+
+    signatures: Dict[Tuple[str, Tuple[str, ...]], Tuple[str, Tuple[str, ...]]] = {}
+    class_flags: Dict[Tuple[str, ...], int] = {}
+    stats: Dict[int, _NodeStats] = {}
+    for tag in reversed(tags):
+        children: List[Tag] = []
+        text_len = parts = descendants = 0
+        size = 1
+        for child in tag.contents:
+            if isinstance(child, Tag):
+                children.append(child)
+                child_stats = stats[id(child)]
+                child_len = child_stats.subtree_text_len
+                descendants |= child_stats.flags
+                size += child_stats.size
+            elif type(child) in _TEXT_STRING_TYPES:
+                child_len = _clean_len(child)
+            else:
+                continue
+            if child_len:
+                text_len += child_len
+                parts += 1
+        subtree_text_len = text_len + parts - 1 if parts else 0
+
+        own_text_len = subtree_text_len
+        if tag.interesting_string_types != _TEXT_STRING_TYPES:
+            # script / style / template : get_text() lit leurs propres chaînes
+            own_text_len = _clean_len(tag.get_text(" "))
+
+        classes = tag.attrs.get("class") or ()
+        classes = (classes,) if isinstance(classes, str) else tuple(classes)
+        key = (tag.name, classes)
+        signature = signatures.get(key)
+        if signature is None:
+            signature = signatures[key] = _node_signature(tag)
+        flags = class_flags.get(classes)
+        if flags is None:
+            flags = 0
+            if any(_NAV_PRICE_CLASS_RE.search(c) for c in classes):
+                flags |= _HAS_NAV_PRICE
+            if any(_PRICE_CLASS_RE.search(c) for c in classes):
+                flags |= _HAS_PRICE
+            class_flags[classes] = flags
+
+        stats[id(tag)] = _NodeStats(
+            children=children,
+            signature=signature,
+            text_len=own_text_len,
+            subtree_text_len=subtree_text_len,
+            descendants=descendants,
+            flags=descendants | flags | _TAG_FLAGS.get(tag.name, 0),
+            size=size,
+        )
+    return stats
+
+
+def _is_navigation_or_filter(
+    container: Tag, stats: Optional[Dict[int, _NodeStats]] = None
+) -> bool:
     if container.name in [
         "head",
         "nav",
@@ -220,17 +343,18 @@ def _is_navigation_or_filter(container: Tag) -> bool:
         if pattern in container_id or pattern in container_classes:
             return True
 
-    children = [c for c in container.find_all(recursive=False) if isinstance(c, Tag)]
+    if stats is None:
+        stats = _collect_node_stats(container)
+    children = stats[id(container)].children
     if len(children) >= 4:
         link_only_count = 0
         for child in children[:10]:
-            child_text = _clean_text(child.get_text(" "))
-            links = child.find_all("a")
+            child_stats = stats[id(child)]
             if (
-                links
-                and len(child_text) < 50
-                and not child.find("img")
-                and not child.find(class_=re.compile(r"(?i)(price|cost)"))
+                child_stats.has_link
+                and child_stats.text_len < 50
+                and not child_stats.has_image
+                and not child_stats.has_nav_price
             ):
                 link_only_count += 1
 
@@ -244,23 +368,20 @@ def _find_repeating_candidates(
     soup: BeautifulSoup, max_candidates: int
 ) -> List[_Candidate]:
     candidates: List[_Candidate] = []
+    stats = _collect_node_stats(soup)
 
     for container in soup.find_all(True):
-        if _is_navigation_or_filter(container):
-            continue
-
-        children = [
-            c for c in container.find_all(recursive=False) if isinstance(c, Tag)
-        ]
+        container_stats = stats[id(container)]
+        children = container_stats.children
         if len(children) < 4:
             continue
 
-        sigs = [_node_signature(c) for c in children]
-        if not sigs:
+        if _is_navigation_or_filter(container, stats):
             continue
 
-        most_common = max(set(sigs), key=sigs.count)
-        count = sigs.count(most_common)
+        sigs = [stats[id(c)].signature for c in children]
+        # Signature la plus fréquente ; à égalité, la première dans l'ordre du document
+        most_common, count = Counter(sigs).most_common(1)[0]
         if count < 4:
             continue
 
@@ -272,18 +393,14 @@ def _find_repeating_candidates(
         if item_nodes:
             sample_size = min(3, len(item_nodes))
             for node in item_nodes[:sample_size]:
-                has_image = bool(node.find("img"))
-                has_price = bool(
-                    node.find(class_=re.compile(r"(?i)(price|cost|amount)"))
-                )
-                has_title = bool(node.find(["h1", "h2", "h3", "h4", "h5", "h6"]))
+                node_stats = stats[id(node)]
 
                 node_richness = 0
-                if has_image:
+                if node_stats.has_image:
                     node_richness += 2.0
-                if has_price:
+                if node_stats.has_price:
                     node_richness += 2.0
-                if has_title:
+                if node_stats.has_title:
                     node_richness += 1.5
 
                 content_richness += node_richness
@@ -317,10 +434,12 @@ def _find_repeating_candidates(
 
 
 def analyze_url(
-    url: str, max_candidates: int = 5, max_items_preview: int = 5, use_js: bool = False
+    url: str, max_candidates: int = 5, max_items_preview: int = 5, use_js: Union[bool, str] = False
 ) -> Dict[str, Any]:
     html = fetch_html_smart(url, use_js=use_js)
-    soup = BeautifulSoup(html, "lxml")
+    # Un seul parsing, partagé par l'analyse, ContentDetector et AIStructureValidator
+    page = ParsedPage(html, url)
+    soup = page.soup
 
     page_title = None
     if soup.title and soup.title.string:
@@ -391,7 +510,7 @@ def analyze_url(
     
     # Détection des types de contenus scrapables
     detector = ContentDetector()
-    content_analysis = detector.detect_content_types(html, url)
+    content_analysis = detector.detect_content_types(page, url)
     
     # -----------------------------------------------------------
     # INTELLIGENCE ARTIFICIELLE (LLM / Perplexity)
@@ -402,7 +521,7 @@ def analyze_url(
         llm = LLMClassifier() # Cherche la clé dans os.environ["LLM_API_KEY"]
         
         # On extrait juste le texte pour le LLM (pas tout le HTML lourd)
-        text_preview = soup.get_text(separator=' ', strip=True)
+        text_preview = page.normalized_text
         
         llm_result = llm.analyze_page(
             url, 
@@ -481,7 +600,7 @@ def analyze_url(
     if content_analysis.get('detected_types'):
         print("[*] Analyse du contenu...")
         validation_result = validator.validate_all_detected_types(
-            html, 
+            page, 
             content_analysis['detected_types']
         )
         # Remplacer les types détectés par les types validés
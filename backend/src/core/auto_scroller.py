@@ -0,0 +1,137 @@
+# backend/src/core/auto_scroller.py
+# Scroll automatique adaptatif pour le contenu lazy-loaded et les flux infinis
+# Avance d'une hauteur d'écran par pas, attend la stabilisation (DOM + réseau) puis mesure la page
+# S'arrête après K pas sans nouveau contenu en bas de page, ou sur budget temps / pas / items
+# RELEVANT FILES: fetcher_playwright.py, wait_strategy.py
+
+import os
+import time
+from typing import Dict, Optional
+
+from .wait_strategy import QuiescenceWaiter
+
+
+# Configuration du scroll (surchargeable par variables d'environnement)
+SCROLL_CONFIG = {
+    'stable_iterations': int(os.getenv('SCROLL_STABLE_ITERATIONS', '2')),   # K pas sans changement en bas de page
+    'max_seconds': float(os.getenv('SCROLL_MAX_SECONDS', '15')),            # budget temps total
+    'max_steps': int(os.getenv('SCROLL_MAX_STEPS', '60')),
+    'max_items': int(os.getenv('SCROLL_MAX_ITEMS', '0')),                   # 0 = pas de limite
+    'step_ratio': 0.9,             # fraction de la hauteur d'écran par pas (léger recouvrement)
+    'step_max_wait': 2.0,          # plafond d'attente de stabilisation par pas
+    'quiet_ms': 250
+}
+
+# Éléments comptés comme "items" (cartes, lignes de liste, articles, images)
+DEFAULT_ITEM_SELECTOR = (
+    'article, li, tr, img, '
+    '[class*="item"], [class*="card"], [class*="product"], [class*="post"], [class*="result"]'
+)
+
+_MEASURE_SCRIPT = """
+(itemSelector) => ({
+    height: document.documentElement.scrollHeight,
+    position: window.scrollY + window.innerHeight,
+    items: document.querySelectorAll(itemSelector).length
+})
+"""
+
+_STEP_SCRIPT = """
+(ratio) => { window.scrollBy(0, Math.max(1, Math.floor(window.innerHeight * ratio))); }
+"""
+
+
+class AdaptiveScroller:
+    """
+    Scroll jusqu'à stabilisation de la hauteur de page.
+
+        report = await AdaptiveScroller().run(page, waiter)
+        # {'steps': 7, 'items_before': 24, 'items_after': 96, 'items_revealed': 72, 'stop_reason': 'stable', ...}
+    """
+
+    def __init__(
+        self,
+        item_selector: Optional[str] = None,
+        stable_iterations: Optional[int] = None,
+        max_seconds: Optional[float] = None,
+        max_steps: Optional[int] = None,
+        max_items: Optional[int] = None
+    ):
+        self.item_selector = item_selector or DEFAULT_ITEM_SELECTOR
+        self.stable_iterations = stable_iterations or SCROLL_CONFIG['stable_iterations']
+        self.max_seconds = max_seconds or SCROLL_CONFIG['max_seconds']
+        self.max_steps = max_steps or SCROLL_CONFIG['max_steps']
+        self.max_items = SCROLL_CONFIG['max_items'] if max_items is None else max_items
+
+    async def _measure(self, page) -> Dict:
+        return await page.evaluate(_MEASURE_SCRIPT, self.item_selector)
+
+    async def run(self, page, waiter: Optional[QuiescenceWaiter] = None, return_to_top: bool = True) -> Dict:
+        """Scrolle la page ; waiter : suivi réseau déjà attaché (sinon un suivi est attaché le temps du scroll)."""
+        own_waiter = waiter is None
+        if own_waiter:
+            waiter = QuiescenceWaiter(quiet_ms=SCROLL_CONFIG['quiet_ms']).attach(page)
+
+        start = time.monotonic()
+        first = await self._measure(page)
+        previous = first
+        steps = 0
+        stable = 0
+        stop_reason = 'stable'
+
+        try:
+            while True:
+                if steps >= self.max_steps:
+                    stop_reason = 'max_steps'
+                    break
+                elapsed = time.monotonic() - start
+                if elapsed >= self.max_seconds:
+                    stop_reason = 'time_budget'
+                    break
+
+                await page.evaluate(_STEP_SCRIPT, SCROLL_CONFIG['step_ratio'])
+                steps += 1
+                await waiter.wait(
+                    page,
+                    max_wait=min(SCROLL_CONFIG['step_max_wait'], self.max_seconds - elapsed),
+                    kind='scroll'
+                )
+                current = await self._measure(page)
+
+                if self.max_items and current['items'] >= self.max_items:
+                    previous = current
+                    stop_reason = 'max_items'
+                    break
+
+                at_bottom = current['position'] >= current['height'] - 2
+                grew = current['height'] > previous['height'] or current['items'] > previous['items']
+                # Stable : en bas de page et rien de nouveau depuis le pas précédent
+                stable = stable + 1 if at_bottom and not grew else 0
+                previous = current
+                if stable >= self.stable_iterations:
+                    break
+
+            if return_to_top:
+                await page.evaluate("() => window.scrollTo(0, 0)")
+        finally:
+            if own_waiter:
+                waiter.detach(page)
+
+        report = {
+            'steps': steps,
+            'seconds': round(time.monotonic() - start, 3),
+            'height_before': first['height'],
+            'height_after': previous['height'],
+            'items_before': first['items'],
+            'items_after': previous['items'],
+            'items_revealed': max(0, previous['items'] - first['items']),
+            'stop_reason': stop_reason
+        }
+        print(f"📜 Scroll : {steps} pas en {report['seconds']}s, "
+              f"{report['items_revealed']} items révélés ({stop_reason})")
+        return report
+
+
+async def auto_scroll(page, waiter: Optional[QuiescenceWaiter] = None, **options) -> Dict:
+    """Raccourci : AdaptiveScroller(**options).run(page, waiter)."""
+    return await AdaptiveScroller(**options).run(page, waiter)
@@ -0,0 +1,130 @@
+# backend/src/core/background_images.py
+# Détection des images en background CSS d'une page Playwright
+# Méthode CSSOM : parcourt les règles des feuilles de style et les attributs style="" à la recherche de url(...),
+# puis ne calcule le style que des éléments ciblés par ces sélecteurs (au lieu de getComputedStyle sur chaque nœud)
+# RELEVANT FILES: fetcher_playwright.py, tests/bench_background_images.py
+
+import os
+from typing import Dict, Optional
+
+
+# Configuration (surchargeable par variables d'environnement)
+# 'auto'     : CSSOM, puis style calculé de tous les nœuds si une feuille cross-origin est illisible
+# 'cssom'    : CSSOM uniquement (feuilles cross-origin ignorées)
+# 'computed' : ancien parcours, getComputedStyle sur chaque élément
+BACKGROUND_SCAN_CONFIG = {
+    'method': os.getenv('BACKGROUND_SCAN_METHOD', 'auto'),
+    'max_images': int(os.getenv('BACKGROUND_SCAN_MAX_IMAGES', '2000'))
+}
+
+# Entrée commune aux deux méthodes (mêmes champs que l'ancien parcours)
+_ENTRY_JS = """
+    const toEntry = (el, bg, index) => {
+        const match = bg.match(/url\\((['"]?)(.*?)\\1\\)/);
+        return {
+            url: match ? match[2] : bg,
+            backgroundImage: bg,
+            element: el.tagName,
+            className: typeof el.className === 'string' ? el.className : '',
+            index
+        };
+    };
+    const hasUrl = (bg) => bg && bg !== 'none' && bg.includes('url(');
+"""
+
+COMPUTED_STYLE_SCRIPT = """
+(maxImages) => {
+    %s
+    const images = [];
+    for (const el of document.querySelectorAll('*')) {
+        const bg = window.getComputedStyle(el).backgroundImage;
+        if (hasUrl(bg)) {
+            images.push(toEntry(el, bg, images.length));
+            if (images.length >= maxImages) break;
+        }
+    }
+    return {images, method: 'computed', candidates: document.getElementsByTagName('*').length, crossOriginSheets: 0};
+}
+""" % _ENTRY_JS
+
+CSSOM_SCRIPT = """
+(maxImages) => {
+    %s
+    const selectors = new Set();
+    let crossOriginSheets = 0;
+
+    // Pseudo-éléments : le background appartient au pseudo-élément, pas à l'élément (comme le style calculé)
+    const PSEUDO_ELEMENT = /::?(before|after|first-line|first-letter|placeholder|selection|marker|backdrop|file-selector-button)\\b/i;
+
+    const walk = (rules) => {
+        for (const rule of rules) {
+            if (rule.media && rule.type === CSSRule.MEDIA_RULE && !window.matchMedia(rule.media.mediaText).matches) {
+                continue;
+            }
+            if (rule.type === CSSRule.IMPORT_RULE) {
+                try { if (rule.styleSheet) walk(rule.styleSheet.cssRules); } catch (e) { crossOriginSheets++; }
+                continue;
+            }
+            if (rule.selectorText && rule.style && hasUrl(rule.style.backgroundImage)) {
+                for (const selector of rule.selectorText.split(',')) {
+                    if (!PSEUDO_ELEMENT.test(selector)) selectors.add(selector.trim());
+                }
+            }
+            if (rule.cssRules) walk(rule.cssRules);
+        }
+    };
+
+    for (const sheet of document.styleSheets) {
+        let rules;
+        try {
+            rules = sheet.cssRules;
+        } catch (e) {
+            crossOriginSheets++;   // feuille d'un autre domaine sans CORS : règles illisibles
+            continue;
+        }
+        if (!sheet.disabled) walk(rules);
+    }
+
+    // Éléments candidats : ciblés par une règle avec url(...) ou style inline avec url(...)
+    const candidates = new Set(document.querySelectorAll('[style*="url("]'));
+    for (const selector of selectors) {
+        try {
+            for (const el of document.querySelectorAll(selector)) candidates.add(el);
+        } catch (e) {
+            // Sélecteur non supporté par querySelectorAll
+        }
+    }
+
+    // Style calculé des seuls candidats (règle plus spécifique possible : background: none)
+    const ordered = [...candidates].sort((a, b) =>
+        a.compareDocumentPosition(b) & Node.DOCUMENT_POSITION_FOLLOWING ? -1 : 1);
+    const images = [];
+    for (const el of ordered) {
+        const bg = window.getComputedStyle(el).backgroundImage;
+        if (hasUrl(bg)) {
+            images.push(toEntry(el, bg, images.length));
+            if (images.length >= maxImages) break;
+        }
+    }
+    return {images, method: 'cssom', candidates: candidates.size, crossOriginSheets};
+}
+""" % _ENTRY_JS
+
+
+async def scan_background_images(page, method: Optional[str] = None) -> Dict:
+    """
+    Images en background CSS de la page.
+    Renvoie {'images': [...], 'method': 'cssom'|'computed', 'candidates': n, 'crossOriginSheets': n}.
+    """
+    method = method or BACKGROUND_SCAN_CONFIG['method']
+    max_images = BACKGROUND_SCAN_CONFIG['max_images']
+    if method == 'computed':
+        return await page.evaluate(COMPUTED_STYLE_SCRIPT, max_images)
+
+    scan = await page.evaluate(CSSOM_SCRIPT, max_images)
+    if method == 'auto' and scan['crossOriginSheets']:
+        # Règles d'une feuille illisibles : seul le style calculé garantit un résultat complet
+        fallback = await page.evaluate(COMPUTED_STYLE_SCRIPT, max_images)
+        fallback['crossOriginSheets'] = scan['crossOriginSheets']
+        return fallback
+    return scan
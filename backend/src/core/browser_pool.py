@@ -0,0 +1,445 @@
+# backend/src/core/browser_pool.py
+# Pool de navigateurs Chromium persistants partagé par tout le processus
+# Évite de relancer Chromium à chaque fetch (1-3 s et plusieurs centaines de Mo par appel)
+# Prête aussi des contextes pré-configurés (anti-détection + headers) recyclés selon un budget
+# RELEVANT FILES: fetcher_playwright.py, loop_runner.py, smart_crawler.py, page_detector.py
+
+import asyncio
+import atexit
+import os
+import threading
+import time
+from contextlib import asynccontextmanager
+from typing import Any, Dict, List, Optional
+
+from playwright.async_api import async_playwright
+
+from .fetcher_playwright import ANTI_DETECTION_SCRIPT, PLAYWRIGHT_CONFIG, get_context_options
+from .loop_runner import LoopRunner, get_loop_runner
+
+
+# Configuration du pool (surchargeable par variables d'environnement)
+BROWSER_POOL_CONFIG = {
+    'size': int(os.getenv('BROWSER_POOL_SIZE', '2')),                          # Navigateurs gardés chauds
+    'max_contexts_per_browser': int(os.getenv('BROWSER_POOL_MAX_CONTEXTS', '4')),
+    'health_check_interval': float(os.getenv('BROWSER_POOL_HEALTH_INTERVAL', '30')),
+    'shutdown_timeout': 10.0,
+    # Recyclage des contextes pré-configurés (lease_context / lease_page)
+    'max_navigations_per_context': int(os.getenv('BROWSER_CONTEXT_MAX_NAVIGATIONS', '50')),
+    'max_context_memory_mb': float(os.getenv('BROWSER_CONTEXT_MAX_MEMORY_MB', '256')),
+    'max_idle_contexts_per_browser': int(os.getenv('BROWSER_CONTEXT_MAX_IDLE', '2'))
+}
+
+# Mémoire JS du renderer (API Chromium performance.memory)
+_RENDERER_MEMORY_JS = "() => (performance.memory && performance.memory.usedJSHeapSize) || 0"
+
+
+class _PooledBrowser:
+    """Emplacement du pool : un navigateur et ses compteurs."""
+
+    def __init__(self, index: int):
+        self.index = index
+        self.browser = None
+        self.active_contexts = 0
+        self.launched_at = None
+        self.launch_count = 0
+        self.lease_count = 0
+        self.launch_lock = None
+        self.idle_contexts: List['ContextLease'] = []
+
+    def is_healthy(self) -> bool:
+        return self.browser is not None and self.browser.is_connected()
+
+
+class ContextLease:
+    """
+    BrowserContext pré-configuré prêté par le pool.
+    Compte les navigations de ses pages et la mémoire JS observée pour décider du recyclage.
+    """
+
+    def __init__(self, slot: _PooledBrowser, context):
+        self.slot = slot
+        self.browser = slot.browser
+        self.context = context
+        self.created_at = time.time()
+        self.navigations = 0
+        self.lease_count = 0
+        self.peak_memory_mb = 0.0
+        self._pages = []
+
+    async def new_page(self):
+        """Ouvre une page dans le contexte ; ses navigations comptent dans le budget."""
+        page = await self.context.new_page()
+
+        def _on_navigation(frame):
+            if frame is page.main_frame and frame.url != 'about:blank':
+                self.navigations += 1
+
+        page.on('framenavigated', _on_navigation)
+        self._pages.append(page)
+        return page
+
+    async def measure_memory(self) -> float:
+        """Somme de la mémoire JS des pages encore ouvertes (Mo)."""
+        used = 0
+        for page in self._pages:
+            if page.is_closed():
+                continue
+            try:
+                used += await page.evaluate(_RENDERER_MEMORY_JS)
+            except Exception:
+                pass
+        memory_mb = used / (1024 * 1024)
+        self.peak_memory_mb = max(self.peak_memory_mb, memory_mb)
+        return memory_mb
+
+    async def close_pages(self):
+        for page in self._pages:
+            try:
+                await page.close()
+            except Exception:
+                pass
+        self._pages = []
+
+    def is_exhausted(self, max_navigations: int, max_memory_mb: float) -> bool:
+        return self.navigations >= max_navigations or self.peak_memory_mb >= max_memory_mb
+
+    async def close(self):
+        await self.close_pages()
+        try:
+            await self.context.close()
+        except Exception:
+            pass
+
+
+class BrowserPool:
+    """
+    Pool de navigateurs Chromium chauds, partagé par le processus.
+
+    Les objets Playwright async sont liés à la boucle asyncio qui les a créés :
+    le pool vit donc sur la boucle partagée de loop_runner (thread dédié),
+    la même que celle des fetchs async soumis par le code synchrone.
+    - run(coro)        : depuis du code synchrone (threads Django, SmartCrawler)
+    - run_async(coro)  : depuis n'importe quelle autre boucle asyncio
+    - context()/page() : à utiliser dans une coroutine exécutée sur la boucle du pool
+    - lease_context()/lease_page() : idem, avec un contexte pré-configuré réutilisé
+
+    context() ouvre un BrowserContext neuf sur le navigateur le moins chargé ;
+    lease_context() réutilise un contexte déjà configuré (script anti-détection
+    et headers optimaux appliqués une seule fois) jusqu'à épuisement de son
+    budget de navigations ou de mémoire, puis le recycle.
+    Un navigateur déconnecté ou planté est relancé avant d'être prêté.
+    """
+
+    def __init__(
+        self,
+        size: Optional[int] = None,
+        max_contexts_per_browser: Optional[int] = None,
+        health_check_interval: Optional[float] = None,
+        max_navigations_per_context: Optional[int] = None,
+        max_context_memory_mb: Optional[float] = None,
+        runner: Optional[LoopRunner] = None
+    ):
+        self.size = max(1, size or BROWSER_POOL_CONFIG['size'])
+        self.max_contexts_per_browser = max(
+            1, max_contexts_per_browser or BROWSER_POOL_CONFIG['max_contexts_per_browser']
+        )
+        self.health_check_interval = health_check_interval or BROWSER_POOL_CONFIG['health_check_interval']
+        self.max_navigations_per_context = max(
+            1, max_navigations_per_context or BROWSER_POOL_CONFIG['max_navigations_per_context']
+        )
+        self.max_context_memory_mb = max_context_memory_mb or BROWSER_POOL_CONFIG['max_context_memory_mb']
+
+        self._slots: List[_PooledBrowser] = [_PooledBrowser(i) for i in range(self.size)]
+        self._playwright = None
+        self._started = False
+        self._start_lock = None
+        self._capacity = None
+        self._health_task = None
+
+        # Boucle partagée sur laquelle vivent les objets Playwright
+        self._runner = runner or get_loop_runner()
+
+        self.stats = {
+            'leases': 0,
+            'launches': 0,
+            'relaunches': 0,
+            'health_checks': 0,
+            'wait_time_total': 0.0,
+            'contexts_created': 0,
+            'contexts_reused': 0,
+            'contexts_recycled': 0
+        }
+
+    # =================== BOUCLE PARTAGÉE ===================
+
+    def run(self, coro, timeout: Optional[float] = None) -> Any:
+        """Exécute une coroutine sur la boucle du pool depuis du code synchrone."""
+        return self._runner.run(coro, timeout)
+
+    async def run_async(self, coro) -> Any:
+        """Exécute une coroutine sur la boucle du pool depuis n'importe quelle boucle asyncio."""
+        return await self._runner.run_async(coro)
+
+    # =================== CYCLE DE VIE DES NAVIGATEURS ===================
+
+    async def start(self):
+        """Lance Playwright et les navigateurs chauds (idempotent)."""
+        if self._started:
+            return
+        if self._start_lock is None:
+            self._start_lock = asyncio.Lock()
+        async with self._start_lock:
+            if self._started:
+                return
+            self._playwright = await async_playwright().start()
+            self._capacity = asyncio.Semaphore(self.size * self.max_contexts_per_browser)
+            await asyncio.gather(*(self._launch(slot) for slot in self._slots))
+            self._health_task = asyncio.create_task(self._health_loop())
+            self._started = True
+            print(f"🌐 Pool navigateurs prêt: {self.size} Chromium chauds")
+
+    async def _launch(self, slot: _PooledBrowser):
+        """(Re)lance le navigateur d'un emplacement."""
+        if slot.browser is not None:
+            try:
+                await slot.browser.close()
+            except Exception:
+                pass
+            self.stats['relaunches'] += 1
+
+        slot.browser = await self._playwright.chromium.launch(
+            headless=PLAYWRIGHT_CONFIG['headless'],
+            args=PLAYWRIGHT_CONFIG['args'],
+            ignore_default_args=['--enable-automation', '--enable-blink-features=AutomationControlled']
+        )
+        slot.launched_at = time.time()
+        slot.launch_count += 1
+        slot.active_contexts = 0
+        # Les contextes en attente appartenaient à l'ancien navigateur
+        slot.idle_contexts = []
+        self.stats['launches'] += 1
+
+    async def _ensure_healthy(self, slot: _PooledBrowser):
+        if slot.is_healthy():
+            return
+        if slot.launch_lock is None:
+            slot.launch_lock = asyncio.Lock()
+        async with slot.launch_lock:
+            # Un autre lease a pu relancer le navigateur pendant l'attente
+            if not slot.is_healthy():
+                print(f"♻️ Navigateur #{slot.index} indisponible - relance")
+                await self._launch(slot)
+
+    async def _health_loop(self):
+        """Vérifie périodiquement les navigateurs inactifs et relance ceux qui sont tombés."""
+        while True:
+            await asyncio.sleep(self.health_check_interval)
+            self.stats['health_checks'] += 1
+            for slot in self._slots:
+                if slot.active_contexts == 0:
+                    try:
+                        await self._ensure_healthy(slot)
+                    except Exception as e:
+                        print(f"⚠️ Health check navigateur #{slot.index}: {e}")
+
+    # =================== LEASING ===================
+
+    @asynccontextmanager
+    async def context(self, **context_options):
+        """
+        Prête un BrowserContext neuf sur le navigateur le moins chargé.
+        Le contexte est fermé à la sortie, le navigateur reste chaud.
+        """
+        await self.start()
+        wait_start = time.perf_counter()
+        async with self._capacity:
+            self.stats['wait_time_total'] += time.perf_counter() - wait_start
+            slot = min(self._slots, key=lambda s: (not s.is_healthy(), s.active_contexts))
+            await self._ensure_healthy(slot)
+
+            slot.active_contexts += 1
+            slot.lease_count += 1
+            self.stats['leases'] += 1
+            browser = slot.browser
+            context = None
+            try:
+                context = await browser.new_context(**context_options)
+                yield context
+            finally:
+                if context is not None:
+                    try:
+                        await context.close()
+                    except Exception:
+                        pass
+                if slot.browser is browser:
+                    slot.active_contexts = max(0, slot.active_contexts - 1)
+
+    @asynccontextmanager
+    async def page(self, **context_options):
+        """Prête une page dans un contexte neuf (raccourci de context())."""
+        async with self.context(**context_options) as context:
+            page = await context.new_page()
+            try:
+                yield page
+            finally:
+                try:
+                    await page.close()
+                except Exception:
+                    pass
+
+    async def _new_lease(self, slot: _PooledBrowser) -> ContextLease:
+        """Crée un contexte pré-configuré : headers optimaux + script anti-détection."""
+        context = await slot.browser.new_context(**get_context_options())
+        await context.add_init_script(ANTI_DETECTION_SCRIPT)
+        self.stats['contexts_created'] += 1
+        return ContextLease(slot, context)
+
+    async def _release_lease(self, lease: ContextLease):
+        """Remet le contexte en attente, ou le ferme si son budget est épuisé."""
+        await lease.measure_memory()
+        await lease.close_pages()
+
+        slot = lease.slot
+        reusable = (
+            slot.browser is lease.browser
+            and slot.is_healthy()
+            and len(slot.idle_contexts) < BROWSER_POOL_CONFIG['max_idle_contexts_per_browser']
+        )
+        if reusable and not lease.is_exhausted(self.max_navigations_per_context, self.max_context_memory_mb):
+            slot.idle_contexts.append(lease)
+            return
+
+        if lease.is_exhausted(self.max_navigations_per_context, self.max_context_memory_mb):
+            self.stats['contexts_recycled'] += 1
+        await lease.close()
+
+    @asynccontextmanager
+    async def lease_context(self):
+        """
+        Prête un ContextLease pré-configuré (réutilisé si un contexte est en attente).
+        Le contexte est recyclé après max_navigations_per_context navigations
+        ou max_context_memory_mb Mo de mémoire JS.
+        """
+        await self.start()
+        wait_start = time.perf_counter()
+        async with self._capacity:
+            self.stats['wait_time_total'] += time.perf_counter() - wait_start
+            slot = min(self._slots, key=lambda s: (not s.is_healthy(), s.active_contexts))
+            await self._ensure_healthy(slot)
+
+            slot.active_contexts += 1
+            slot.lease_count += 1
+            self.stats['leases'] += 1
+            browser = slot.browser
+            lease = None
+            try:
+                if slot.idle_contexts:
+                    lease = slot.idle_contexts.pop()
+                    self.stats['contexts_reused'] += 1
+                else:
+                    lease = await self._new_lease(slot)
+                lease.lease_count += 1
+                yield lease
+            finally:
+                if lease is not None:
+                    await self._release_lease(lease)
+                if slot.browser is browser:
+                    slot.active_contexts = max(0, slot.active_contexts - 1)
+
+    @asynccontextmanager
+    async def lease_page(self):
+        """Prête une page dans un contexte pré-configuré (raccourci de lease_context())."""
+        async with self.lease_context() as lease:
+            yield await lease.new_page()
+
+    def get_stats(self) -> Dict:
+        """Statistiques du pool (leases, relances, occupation par navigateur)."""
+        return {
+            **self.stats,
+            'size': self.size,
+            'started': self._started,
+            'browsers': [
+                {
+                    'index': slot.index,
+                    'healthy': slot.is_healthy(),
+                    'active_contexts': slot.active_contexts,
+                    'leases': slot.lease_count,
+                    'launches': slot.launch_count,
+                    'idle_contexts': len(slot.idle_contexts),
+                    'uptime': round(time.time() - slot.launched_at, 1) if slot.launched_at else 0
+                }
+                for slot in self._slots
+            ]
+        }
+
+    # =================== FERMETURE ===================
+
+    async def close(self):
+        """Ferme les navigateurs et Playwright (sur la boucle du pool)."""
+        if self._health_task:
+            self._health_task.cancel()
+            self._health_task = None
+        for slot in self._slots:
+            for lease in slot.idle_contexts:
+                await lease.close()
+            slot.idle_contexts = []
+            if slot.browser is not None:
+                try:
+                    await slot.browser.close()
+                except Exception:
+                    pass
+                slot.browser = None
+        if self._playwright:
+            try:
+                await self._playwright.stop()
+            except Exception:
+                pass
+            self._playwright = None
+        self._started = False
+
+    def shutdown(self):
+        """Ferme le pool (appelable depuis du code synchrone) ; la boucle partagée reste active."""
+        if not self._started and self._playwright is None:
+            return
+        try:
+            self.run(self.close(), timeout=BROWSER_POOL_CONFIG['shutdown_timeout'])
+        except Exception as e:
+            print(f"⚠️ Erreur fermeture pool navigateurs: {e}")
+
+
+# Instance globale (singleton pattern)
+_pool_instance = None
+_pool_lock = threading.Lock()
+
+
+def get_browser_pool() -> BrowserPool:
+    """Obtenir le pool de navigateurs du processus (créé à la première utilisation)."""
+    global _pool_instance
+    if _pool_instance is None:
+        with _pool_lock:
+            if _pool_instance is None:
+                _pool_instance = BrowserPool()
+    return _pool_instance
+
+
+def configure_browser_pool(**kwargs) -> BrowserPool:
+    """Remplace le pool global par un pool configuré (size, max_contexts_per_browser...)."""
+    global _pool_instance
+    with _pool_lock:
+        if _pool_instance is not None:
+            _pool_instance.shutdown()
+        _pool_instance = BrowserPool(**kwargs)
+    return _pool_instance
+
+
+def shutdown_browser_pool():
+    """Fermer le pool global"""
+    global _pool_instance
+    with _pool_lock:
+        if _pool_instance is not None:
+            _pool_instance.shutdown()
+            _pool_instance = None
+
+
+atexit.register(shutdown_browser_pool)
@@ -1,12 +1,14 @@
 # backend/src/core/content_detector.py
 # Détection intelligente des types de contenus scrapables sur un site web
 # Identifie articles, commentaires, produits, images, etc.
-# RELEVANT FILES: analyzer.py, metadata_classifier.py
+# RELEVANT FILES: analyzer.py, metadata_classifier.py, parsed_page.py, selector_matcher.py
 
-from typing import Dict, List
-from bs4 import BeautifulSoup
+from typing import Dict, List, Union
 import re
 
+from .parsed_page import ParsedPage
+from .selector_matcher import SelectorMatcher
+
 
 class ContentDetector:
     """
@@ -185,13 +187,24 @@ class ContentDetector:
             'description': 'Paragraphes, textes principaux'
         }
     }
+
+    # Indices de pagination (évalués dans le même parcours que les types de contenus)
+    PAGINATION_SELECTORS = ['.pagination', '.pager', '.page-numbers', '.next', '.previous', 'a[rel="next"]']
+    PAGINATION_BLOCK_SELECTORS = ['.pagination, .pager']
+
+    def __init__(self):
+        # Table CONTENT_TYPES compilée : un seul parcours du DOM quel que soit le nombre de types
+        groups = {content_type: config['selectors'] for content_type, config in self.CONTENT_TYPES.items()}
+        groups['_pagination'] = self.PAGINATION_SELECTORS
+        groups['_pagination_blocks'] = self.PAGINATION_BLOCK_SELECTORS
+        self.matcher = SelectorMatcher(groups)
     
-    def detect_content_types(self, html_content: str, url: str = '') -> Dict:
+    def detect_content_types(self, html_content: Union[str, ParsedPage], url: str = '') -> Dict:
         """
         Analyse une page HTML et détecte tous les types de contenus présents.
         
         Args:
-            html_content: Contenu HTML de la page
+            html_content: Contenu HTML de la page, ou ParsedPage déjà parsée (pas de nouveau parsing)
             url: URL de la page (optionnel)
         
         Returns:
@@ -214,18 +227,13 @@ class ContentDetector:
                 'structure_complexity': 'simple' | 'medium' | 'complex'
             }
         """
-        soup = BeautifulSoup(html_content, 'html.parser')
+        page = ParsedPage.ensure(html_content, url)
+        matches = page.match(self.matcher)
         detected = []
         
         for content_type, config in self.CONTENT_TYPES.items():
-            # Chercher les éléments de ce type
-            elements = []
-            for selector in config['selectors']:
-                try:
-                    found = soup.select(selector)
-                    elements.extend(found)
-                except:
-                    continue
+            # Éléments de ce type (tous les sélecteurs de la table, dans leur ordre)
+            elements = matches[content_type]
             
             if not elements:
                 continue
@@ -236,7 +244,7 @@ class ContentDetector:
             # Analyser les éléments trouvés
             count = len(elements)
             sample_data = self._extract_sample(elements[0], content_type) if elements else None
-            fields_found = self._identify_fields(elements, config)
+            fields_found = self._identify_fields(page, elements, config)
             
             # Calculer la confiance
             confidence = self._calculate_confidence(elements, config, fields_found)
@@ -270,8 +278,8 @@ class ContentDetector:
             'total_types': len(detected),
             'recommended_action': recommendation,
             'structure_complexity': complexity,
-            'has_pagination': self._detect_pagination(soup),
-            'total_pages_estimate': self._estimate_total_pages(soup)
+            'has_pagination': self._detect_pagination(page),
+            'total_pages_estimate': self._estimate_total_pages(page)
         }
     
     def _extract_sample(self, element, content_type: str) -> Dict:
@@ -309,26 +317,28 @@ class ContentDetector:
                 continue
         return element.get_text(strip=True)[:100]
     
-    def _identify_fields(self, elements, config: Dict) -> List[str]:
+    def _identify_fields(self, page: ParsedPage, elements, config: Dict) -> List[str]:
         """Identifie quels champs sont présents dans les éléments."""
         fields = []
         
         # Vérifier chaque élément requis et optionnel
         all_fields = config['required_elements'] + config['optional_elements']
         
+        # Texte et jetons du balisage (class, id, itemprop, attributs) calculés une fois par élément
+        checked = [
+            (elem, page.element_text_lower(elem), page.element_tokens(elem))
+            for elem in elements[:5]  # Vérifier les 5 premiers
+        ]
+        
         for field in all_fields:
             # Chercher des indices de ce champ dans les éléments
             found = False
-            for elem in elements[:5]:  # Vérifier les 5 premiers
-                # Conversion en string pour chercher dans les attributs (class, id, etc)
-                elem_str = str(elem).lower()
-                elem_text = elem.get_text().lower()
-                
+            for elem, elem_text, elem_tokens in checked:
                 # Recherche plus large : dans le texte, les classes, les attributs
                 if (field in elem_text) or \
-                   (f'{field}' in elem_str) or \
+                   (field in elem_tokens) or \
                    (field == 'price' and any(curr in elem_text for curr in ['€', '$', '£', 'fcfa', 'xof'])) or \
-                   (field == 'image' and elem.find('img')) or \
+                   (field == 'image' and 'img' in elem_tokens.tokens and elem.find('img')) or \
                    (field == 'model' and any(kw in elem_text for kw in ['model', 'modèle', 'série', 'edition'])) or \
                    (field == 'specs' and any(kw in elem_text for kw in ['km/h', 'mph', '0-60', 'autonomie', 'range', 'battery', 'wh'])):
                     found = True
@@ -357,18 +367,14 @@ class ContentDetector:
         
         return min(count_score + required_score + optional_score, 1.0)
     
-    def _detect_pagination(self, soup: BeautifulSoup) -> bool:
+    def _detect_pagination(self, page: ParsedPage) -> bool:
         """Détecte si la page a une pagination."""
-        pagination_selectors = ['.pagination', '.pager', '.page-numbers', '.next', '.previous', 'a[rel="next"]']
-        for selector in pagination_selectors:
-            if soup.select(selector):
-                return True
-        return False
+        return bool(page.match(self.matcher)['_pagination'])
     
-    def _estimate_total_pages(self, soup: BeautifulSoup) -> int:
+    def _estimate_total_pages(self, page: ParsedPage) -> int:
         """Estime le nombre total de pages basé sur la pagination."""
         # Chercher des indicateurs de nombre de pages
-        pagination = soup.select('.pagination, .pager')
+        pagination = page.match(self.matcher)['_pagination_blocks']
         if pagination:
             # Chercher des numéros de page
             numbers = []
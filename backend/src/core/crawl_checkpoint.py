@@ -0,0 +1,134 @@
+# backend/src/core/crawl_checkpoint.py
+# Points de reprise des crawls longs : état du SmartCrawler (frontier, pages terminées) écrit périodiquement
+# sur disque en JSON (écriture atomique), résultats des pages ajoutés au fil de l'eau (JSON lines)
+# Un crawl interrompu (redémarrage du process Django) reprend depuis son id de session sans revisiter les pages finies
+# RELEVANT FILES: smart_crawler.py, crawl_frontier.py, api/views.py
+
+import json
+import os
+import re
+import threading
+import time
+from typing import Dict, List, Optional
+
+
+# Configuration des points de reprise (surchargeable par variables d'environnement)
+CRAWL_CHECKPOINT_CONFIG = {
+    'enabled': os.getenv('CRAWL_CHECKPOINT_ENABLED', '1') == '1',
+    'directory': os.getenv(
+        'CRAWL_CHECKPOINT_DIR',
+        os.path.join(os.path.dirname(__file__), '..', '..', '.cache', 'crawl_checkpoints')
+    ),
+    'every_pages': int(os.getenv('CRAWL_CHECKPOINT_EVERY_PAGES', '10')),      # sauvegarde toutes les N pages...
+    'every_seconds': float(os.getenv('CRAWL_CHECKPOINT_EVERY_SECONDS', '30'))  # ... ou toutes les N secondes
+}
+
+# Format du fichier (incrémenté si la structure change : les anciens points de reprise sont ignorés)
+CHECKPOINT_VERSION = 2
+
+
+def session_checkpoint_id(session_id) -> str:
+    """Identifiant du point de reprise du crawl d'une ScrapingSession."""
+    return f"session-{session_id}"
+
+
+class CrawlCheckpointStore:
+    """
+    Points de reprise sur disque, par crawl : un fichier JSON d'état (réécrit à chaque sauvegarde, donc
+    petit) et un fichier JSON lines de résultats de pages (seules les nouvelles pages y sont ajoutées).
+
+        store = get_checkpoint_store()
+        store.append_pages('session-42', [{'url': url, 'page': page_data}])
+        store.save('session-42', state)
+        state = store.load('session-42')            # None si absent ou illisible
+        records = store.load_pages('session-42')
+        store.delete('session-42')
+    """
+
+    def __init__(self, directory: Optional[str] = None):
+        self.directory = os.path.abspath(directory or CRAWL_CHECKPOINT_CONFIG['directory'])
+        self._lock = threading.Lock()
+
+    def path(self, checkpoint_id: str) -> str:
+        safe_id = re.sub(r'[^A-Za-z0-9_.-]', '_', str(checkpoint_id))
+        return os.path.join(self.directory, safe_id + '.json')
+
+    def pages_path(self, checkpoint_id: str) -> str:
+        return self.path(checkpoint_id)[:-len('.json')] + '.pages.jsonl'
+
+    def save(self, checkpoint_id: str, state: Dict):
+        """Écrit l'état (fichier temporaire puis os.replace : jamais de fichier à moitié écrit)."""
+        path = self.path(checkpoint_id)
+        payload = {**state, 'version': CHECKPOINT_VERSION, 'saved_at': time.time()}
+        with self._lock:
+            os.makedirs(self.directory, exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(payload, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+
+    def load(self, checkpoint_id: str) -> Optional[Dict]:
+        try:
+            with open(self.path(checkpoint_id), 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            print(f"⚠️ Point de reprise illisible ({checkpoint_id}): {e}")
+            return None
+        if state.get('version') != CHECKPOINT_VERSION:
+            return None
+        return state
+
+    def append_pages(self, checkpoint_id: str, records: List[Dict]):
+        """Ajoute des résultats de pages en fin de fichier (une ligne JSON par page)."""
+        if not records:
+            return
+        lines = ''.join(json.dumps(record, ensure_ascii=False) + '\n' for record in records)
+        with self._lock:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(self.pages_path(checkpoint_id), 'a', encoding='utf-8') as f:
+                f.write(lines)
+
+    def load_pages(self, checkpoint_id: str) -> List[Dict]:
+        """Résultats de pages ajoutés ; une ligne tronquée (arrêt pendant l'écriture) est ignorée."""
+        records = []
+        try:
+            with open(self.pages_path(checkpoint_id), 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        records.append(json.loads(line))
+                    except ValueError:
+                        continue
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            print(f"⚠️ Résultats du point de reprise illisibles ({checkpoint_id}): {e}")
+        return records
+
+    def delete(self, checkpoint_id: str) -> bool:
+        deleted = False
+        for path in (self.path(checkpoint_id), self.pages_path(checkpoint_id)):
+            try:
+                os.remove(path)
+                deleted = True
+            except FileNotFoundError:
+                pass
+        return deleted
+
+
+# Instance globale (singleton pattern)
+_store_instance = None
+_store_lock = threading.Lock()
+
+
+def get_checkpoint_store() -> Optional[CrawlCheckpointStore]:
+    """Stockage des points de reprise, ou None s'il est désactivé (CRAWL_CHECKPOINT_ENABLED=0)."""
+    global _store_instance
+    if not CRAWL_CHECKPOINT_CONFIG['enabled']:
+        return None
+    if _store_instance is None:
+        with _store_lock:
+            if _store_instance is None:
+                _store_instance = CrawlCheckpointStore()
+    return _store_instance
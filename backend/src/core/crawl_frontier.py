@@ -0,0 +1,148 @@
+# backend/src/core/crawl_frontier.py
+# File de priorité des URLs à crawler (frontier) : dédoublonnage en O(1) et score par URL
+# Score : zone du lien (nav/menu > contenu > footer), profondeur, nouveauté du préfixe de chemin, pagination
+# Un crawl à petit max_pages visite d'abord les pages les plus informatives sur la structure du site
+# RELEVANT FILES: smart_crawler.py, crawl_checkpoint.py
+
+import heapq
+import itertools
+import os
+from typing import Dict, Iterable, Optional, Set, Tuple
+from urllib.parse import urlparse
+
+
+# Poids des zones de navigation (surchargeables par variables d'environnement)
+FRONTIER_CONFIG = {
+    'zone_weights': {
+        'nav': 3.0,
+        'menu': 3.0,
+        'header': 2.0,
+        'sidebar': 1.5,
+        'other': 1.0,
+        'footer': 0.5
+    },
+    'pagination_weight': float(os.getenv('FRONTIER_PAGINATION_WEIGHT', '1.5')),
+    'depth_penalty': float(os.getenv('FRONTIER_DEPTH_PENALTY', '0.5')),
+    'novelty_weight': float(os.getenv('FRONTIER_NOVELTY_WEIGHT', '2.0'))
+}
+
+
+def path_prefix(url: str) -> str:
+    """Premier segment du chemin ('/produit/livre-1' -> '/produit'), clé de nouveauté."""
+    segments = [s for s in urlparse(url).path.split('/') if s]
+    return '/' + segments[0] if segments else '/'
+
+
+class CrawlFrontier:
+    """
+    URLs à visiter, servies par score décroissant (FIFO à score égal).
+
+        frontier = CrawlFrontier(visited=crawler.visited_urls)
+        frontier.push(url, zone='nav', depth=1)
+        url = frontier.pop()        # None si vide
+
+    Une URL déjà visitée ou déjà en file n'est pas ajoutée deux fois ; si elle est revue
+    avec un meilleur score (ex. footer puis nav), sa priorité est relevée.
+    """
+
+    def __init__(self, visited: Optional[Set[str]] = None):
+        self.visited: Set[str] = visited if visited is not None else set()
+        self._heap = []
+        self._best: Dict[str, float] = {}      # URL en file -> meilleur score
+        self._depth: Dict[str, int] = {}
+        self._prefix_counts: Dict[str, int] = {}
+        self._sequence = itertools.count()
+        self.stats = {'pushed': 0, 'duplicates': 0, 'upgraded': 0}
+
+    def __len__(self) -> int:
+        return len(self._best)
+
+    def __contains__(self, url: str) -> bool:
+        return url in self._best or url in self.visited
+
+    def score(self, url: str, zone: str = 'other', depth: int = 0, pagination: bool = False) -> float:
+        weights = FRONTIER_CONFIG['zone_weights']
+        score = weights.get(zone, weights['other'])
+        if pagination:
+            score = max(score, FRONTIER_CONFIG['pagination_weight'])
+        # Préfixe jamais vu : nouvelle section du site ; déjà fréquent : pages sœurs (produits, articles)
+        seen_with_prefix = self._prefix_counts.get(path_prefix(url), 0)
+        score += FRONTIER_CONFIG['novelty_weight'] / (1 + seen_with_prefix)
+        return score - FRONTIER_CONFIG['depth_penalty'] * depth
+
+    def push(self, url: str, zone: str = 'other', depth: int = 0, pagination: bool = False) -> bool:
+        """Ajoute (ou relève la priorité d') une URL ; False si déjà visitée ou déjà en file à meilleur score."""
+        if url in self.visited:
+            self.stats['duplicates'] += 1
+            return False
+        score = self.score(url, zone, depth, pagination)
+        previous = self._best.get(url)
+        if previous is not None:
+            if score <= previous:
+                self.stats['duplicates'] += 1
+                return False
+            self.stats['upgraded'] += 1
+        else:
+            prefix = path_prefix(url)
+            self._prefix_counts[prefix] = self._prefix_counts.get(prefix, 0) + 1
+            self._depth[url] = depth
+            self.stats['pushed'] += 1
+        self._best[url] = score
+        self._depth[url] = min(self._depth[url], depth)
+        heapq.heappush(self._heap, (-score, next(self._sequence), url))
+        return True
+
+    def pop(self) -> Optional[str]:
+        """URL de meilleur score, marquée visitée ; None si la file est vide."""
+        while self._heap:
+            neg_score, _, url = heapq.heappop(self._heap)
+            # Entrée périmée (priorité relevée depuis) ou URL déjà servie
+            if self._best.get(url) != -neg_score:
+                continue
+            del self._best[url]
+            self.visited.add(url)
+            return url
+        return None
+
+    def depth_of(self, url: str) -> int:
+        return self._depth.get(url, 0)
+
+    def get_stats(self) -> Dict:
+        return {**self.stats, 'queued': len(self._best), 'visited': len(self.visited)}
+
+    # =================== POINT DE REPRISE ===================
+
+    def to_dict(self, pending: Iterable[str] = ()) -> Dict:
+        """
+        État sérialisable (JSON) de la file, dans l'ordre de service.
+        pending : URLs servies mais pas terminées (pages en cours), remises en tête à la reprise.
+        """
+        live = sorted(entry for entry in self._heap if self._best.get(entry[2]) == -entry[0])
+        return {
+            'queued': [[url, -neg_score, self._depth.get(url, 0)] for neg_score, _, url in live],
+            'pending': [[url, self._depth.get(url, 0)] for url in pending],
+            'prefix_counts': dict(self._prefix_counts),
+            'stats': dict(self.stats)
+        }
+
+    def load_dict(self, state: Dict):
+        """Restaure un état produit par to_dict() (self.visited est restauré par l'appelant)."""
+        self._prefix_counts.update(state.get('prefix_counts', {}))
+        for key, value in state.get('stats', {}).items():
+            self.stats[key] = value
+        queued = [(url, score, depth) for url, score, depth in state.get('queued', []) if url not in self.visited]
+        top_score = max((score for _, score, _ in queued), default=0.0)
+        for url, depth in state.get('pending', []):
+            if url not in self.visited:
+                queued.insert(0, (url, top_score + 1, depth))
+        for url, score, depth in queued:
+            if score <= self._best.get(url, float('-inf')):
+                continue
+            self._best[url] = score
+            self._depth[url] = depth
+            heapq.heappush(self._heap, (-score, next(self._sequence), url))
+
+
+def link_key(link_data: Dict) -> Tuple:
+    """Clé hachable d'un lien de navigation (dédoublonnage par zone en O(1))."""
+    return link_data['url'], link_data.get('text', ''), link_data.get('href', '')
@@ -1,4 +1,5 @@
-import httpx
+from .http_client import get_http_client
+from .retry_policy import get_retry_policy
 
 
 def fetch_html(url: str, timeout_seconds: float = 20.0) -> str:
@@ -7,9 +8,11 @@ def fetch_html(url: str, timeout_seconds: float = 20.0) -> str:
         "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
     }
 
-    with httpx.Client(
-        follow_redirects=True, timeout=timeout_seconds, headers=headers
-    ) as client:
-        resp = client.get(url)
+    def _attempt() -> str:
+        resp = get_http_client().get(
+            url, follow_redirects=True, timeout=timeout_seconds, headers=headers
+        )
         resp.raise_for_status()
         return resp.text
+
+    return get_retry_policy().execute(url, _attempt)
@@ -11,6 +11,8 @@ import time
 from typing import Dict, Any, Optional, List
 import os
 
+from .retry_policy import RetryableStatusError, get_retry_policy
+
 # Import conditionnel pour éviter les erreurs si pas installé
 try:
     from playwright_stealth import stealth_async
@@ -484,44 +486,33 @@ class AdvancedFreeFetcher:
         timeout_seconds: float,
         max_retries: int = 3
     ) -> bool:
-        """Navigation intelligente avec retry adaptatif"""
-        for attempt in range(max_retries):
-            try:
-                print(f"   🔄 Navigation tentative {attempt + 1}/{max_retries}")
-                
-                # Délai progressif entre tentatives
-                if attempt > 0:
-                    delay = 2 ** attempt + random.uniform(1, 3)
-                    print(f"      ⏰ Attente {delay:.1f}s avant retry...")
-                    await asyncio.sleep(delay)
-                
-                # Tentative de navigation
-                response = await page.goto(
-                    url,
-                    wait_until='domcontentloaded',
-                    timeout=int(timeout_seconds * 1000)
-                )
-                
-                # Vérifier le statut de réponse
-                if response and response.status >= 400:
-                    print(f"      ⚠️ Status HTTP {response.status}")
-                    if attempt < max_retries - 1:
-                        continue
-                
-                print(f"      ✅ Navigation réussie")
-                await asyncio.sleep(random.uniform(1, 2))
-                return True
-                
-            except PlaywrightTimeout:
-                print(f"      ⏰ Timeout tentative {attempt + 1}")
-                if attempt == max_retries - 1:
-                    return False
-            except Exception as e:
-                print(f"      ❌ Erreur navigation: {str(e)[:100]}")
-                if attempt == max_retries - 1:
-                    return False
-        
-        return False
+        """Navigation avec la politique de retry partagée (jitter, Retry-After, disjoncteur par hôte)"""
+        policy = get_retry_policy()
+
+        async def _goto():
+            print(f"   🔄 Navigation vers {url}")
+            response = await page.goto(
+                url,
+                wait_until='domcontentloaded',
+                timeout=int(timeout_seconds * 1000)
+            )
+            # Vérifier le statut de réponse : seuls les statuts transitoires sont réessayés
+            if response and response.status in policy.retry_status_codes:
+                print(f"      ⚠️ Status HTTP {response.status}")
+                raise RetryableStatusError(response.status, response.headers.get('retry-after'))
+            if response and response.status >= 400:
+                print(f"      ⚠️ Status HTTP {response.status}")
+            return response
+
+        try:
+            await policy.execute_async(url, _goto, max_attempts=max_retries)
+        except Exception as e:
+            print(f"      ❌ Erreur navigation: {str(e)[:100]}")
+            return False
+
+        print(f"      ✅ Navigation réussie")
+        await asyncio.sleep(random.uniform(1, 2))
+        return True
     
     async def _wait_for_protections(self, page):
         """
@@ -2,9 +2,21 @@ import asyncio
 import random
 import time
 import warnings
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple, Union
 import httpx
-from playwright.async_api import async_playwright
+from bs4 import BeautifulSoup
+
+from .http_client import get_http_client
+from .loop_runner import run_sync
+from .network_capture import NetworkCapture, fetch_known_collections
+from .rate_limiter import get_rate_limiter
+from .retry_policy import RetryableStatusError, get_retry_policy
+from .render_cache import RenderCache, get_render_cache, user_agent_class
+from .render_decision import get_render_memory, needs_js_render
+from .resource_policy import get_resource_policy, record_resource_usage
+from .wait_strategy import QuiescenceWaiter
+from .auto_scroller import AdaptiveScroller
+from .background_images import scan_background_images
 
 # Suppress pkg_resources deprecation warning from playwright-stealth
 warnings.filterwarnings("ignore", category=UserWarning, module='pkg_resources')
@@ -131,21 +143,127 @@ PLAYWRIGHT_CONFIG = {
     'color_scheme': 'light'
 }
 
+# Scripts anti-détection injectés avant tout script de la page
+# (appliqués une fois par contexte dans le pool, ou par page via PlaywrightFetcher)
+ANTI_DETECTION_SCRIPT = """
+    // =================== MASQUAGE WEBDRIVER ===================
+    
+    // 1. Masquer la propriété webdriver
+    Object.defineProperty(navigator, 'webdriver', {
+        get: () => undefined
+    });
+    
+    // 2. Supprimer les flags d'automation
+    delete window.cdc_adoQpoasnfa76pfcZLmcfl_Array;
+    delete window.cdc_adoQpoasnfa76pfcZLmcfl_Promise;
+    delete window.cdc_adoQpoasnfa76pfcZLmcfl_Symbol;
+    
+    // =================== CHROME RUNTIME ===================
+    
+    // 3. Simuler l'objet Chrome (critique pour Cloudflare)
+    window.chrome = {
+        runtime: {
+            connect: () => {},
+            sendMessage: () => {},
+            onConnect: { addListener: () => {}, removeListener: () => {} },
+            onMessage: { addListener: () => {}, removeListener: () => {} }
+        },
+        loadTimes: function() {
+            return {
+                commitLoadTime: Math.random() * 1000 + 1000,
+                connectionInfo: 'h2',
+                finishDocumentLoadTime: Math.random() * 1000 + 2000,
+                finishLoadTime: Math.random() * 1000 + 2500,
+                navigationType: 'Navigation'
+            };
+        },
+        app: { isInstalled: false }
+    };
+    
+    // =================== PLUGINS RÉALISTES ===================
+    
+    // 4. Simuler des plugins de navigateur réalistes
+    Object.defineProperty(navigator, 'plugins', {
+        get: () => {
+            const plugins = [
+                { name: 'Chrome PDF Plugin', filename: 'internal-pdf-viewer', length: 1 },
+                { name: 'Chrome PDF Viewer', filename: 'mhjfbmdgcfjbbpaeojofohoefgiehjai', length: 1 },
+                { name: 'Native Client', filename: 'internal-nacl-plugin', length: 2 }
+            ];
+            plugins.refresh = () => {};
+            return plugins;
+        }
+    });
+    
+    // =================== PERMISSIONS API ===================
+    
+    // 5. Mockup permissions réalistes
+    const originalQuery = window.navigator.permissions.query;
+    window.navigator.permissions.query = (parameters) => {
+        if (parameters.name === 'notifications') {
+            return Promise.resolve({ state: 'prompt' });
+        }
+        return Promise.resolve({ state: 'prompt' });
+    };
+    
+    // =================== WEBGL PROTECTION ===================
+    
+    // 6. Masquer les infos GPU WebGL
+    const getParameter = WebGLRenderingContext.prototype.getParameter;
+    WebGLRenderingContext.prototype.getParameter = function(parameter) {
+        const fakeValues = {
+            37445: 'Intel Inc.',
+            37446: 'Intel Iris OpenGL Engine'
+        };
+        return fakeValues[parameter] || getParameter.apply(this, [parameter]);
+    };
+    
+    // =================== HARDWARE MASKING ===================
+    
+    // 7. Hardware concurrency réaliste
+    Object.defineProperty(navigator, 'hardwareConcurrency', {
+        get: () => [4, 8, 12, 16][Math.floor(Math.random() * 4)]
+    });
+    
+    // 8. Device memory réaliste
+    Object.defineProperty(navigator, 'deviceMemory', {
+        get: () => [4, 8, 16][Math.floor(Math.random() * 3)]
+    });
+    
+    // 9. Platform cohérent
+    Object.defineProperty(navigator, 'platform', {
+        get: () => 'Win32'
+    });
+    
+    Object.defineProperty(navigator, 'vendor', {
+        get: () => 'Google Inc.'
+    });
+    
+    console.info('🛡️ Anti-detection scripts loaded');
+"""
+
 # Configuration des délais adaptatifs
+# L'attente du contenu dynamique s'arrête dès que la page est stable (wait_strategy.py),
+# max_delay n'en est que le plafond ; la politesse entre requêtes est gérée par rate_limiter.py
 DELAY_CONFIG = {
-    'min_delay': 0.5,          # Délai minimum entre requêtes
+    'min_delay': 0.5,          # Délai minimum
     'max_delay': 2.0,          # Délai maximum 
-    'nginx_rate_limit': 1.13,  # Respect du rate limiting Nginx (1 req/sec)
+    'nginx_rate_limit': 1.13,  # Respect du rate limiting Nginx (1 req/sec), cf. RATE_LIMIT_CONFIG
     'adaptive_delay': True     # Délai adaptatif selon la charge serveur
 }
 
-# Configuration de retry intelligente
-RETRY_CONFIG = {
-    'max_retries': 3,
-    'backoff_factor': 0.3,
-    'retry_status_codes': [429, 500, 502, 503, 504],
-    'timeout_retry': 2
-}
+# Configuration de retry : RETRY_POLICY_CONFIG dans retry_policy.py (partagée par tous les fetchers)
+
+# Sections de l'extraction ultra-complète (paramètre sections=)
+# Le script de page ne calcule que les sections demandées : les passes coûteuses
+# (fullText, html, background CSS) et leur transfert CDP sont évités si non demandés
+EXTRACTION_SECTIONS = (
+    'metadata', 'text', 'html', 'images', 'background_images', 'videos', 'audios', 'iframes',
+    'links', 'files', 'forms', 'tables', 'structured_data', 'scripts', 'styles'
+)
+# Sections renvoyées par défaut (contenu historique de chaque fonction)
+COMPLETE_CONTENT_SECTIONS = tuple(s for s in EXTRACTION_SECTIONS if s != 'html')
+EXTRACT_EVERYTHING_SECTIONS = tuple(s for s in EXTRACTION_SECTIONS if s not in ('scripts', 'styles'))
 
 # ==============================================================================
 
@@ -193,53 +311,105 @@ def get_optimal_headers() -> dict:
     
     return headers
 
-def adaptive_delay():
-    """Calcule un délai adaptatif basé sur la configuration"""
-    if DELAY_CONFIG['adaptive_delay']:
-        return random.uniform(DELAY_CONFIG['min_delay'], DELAY_CONFIG['max_delay'])
-    return DELAY_CONFIG['min_delay']
-
+def get_context_options() -> dict:
+    """
+    Options d'un BrowserContext pré-configuré : config Playwright + headers optimaux.
+    Le User-Agent du contexte est celui des headers pour rester cohérent.
+    """
+    headers = get_optimal_headers()
+    return {
+        'viewport': PLAYWRIGHT_CONFIG['viewport'],
+        'user_agent': headers['User-Agent'],
+        'ignore_https_errors': PLAYWRIGHT_CONFIG['ignore_https_errors'],
+        'java_script_enabled': PLAYWRIGHT_CONFIG['java_script_enabled'],
+        'accept_downloads': PLAYWRIGHT_CONFIG['accept_downloads'],
+        'has_touch': PLAYWRIGHT_CONFIG['has_touch'],
+        'is_mobile': PLAYWRIGHT_CONFIG['is_mobile'],
+        'locale': PLAYWRIGHT_CONFIG['locale'],
+        'timezone_id': PLAYWRIGHT_CONFIG['timezone_id'],
+        'color_scheme': PLAYWRIGHT_CONFIG['color_scheme'],
+        'extra_http_headers': headers
+    }
 
 async def fetch_html_playwright(
     url: str, wait_for_selector: Optional[str] = None, timeout_seconds: float = 60.0
 ) -> str:
     """
-    Récupère le HTML d'une page avec Playwright optimisé (chaque appel crée un nouveau browser).
+    Récupère le HTML d'une page avec Playwright optimisé (navigateur emprunté au pool partagé).
     Intègre les meilleures pratiques anti-détection et optimisations de performance.
     """
-    async with async_playwright() as p:
-        # Configuration browser optimale
-        browser = await p.chromium.launch(
-            headless=PLAYWRIGHT_CONFIG['headless'],
-            args=PLAYWRIGHT_CONFIG['args']
-        )
-        
-        # Contexte optimisé avec headers réalistes
-        context = await browser.new_context(
-            viewport=PLAYWRIGHT_CONFIG['viewport'],
-            user_agent=get_random_user_agent(),
-            ignore_https_errors=PLAYWRIGHT_CONFIG['ignore_https_errors'],
-            java_script_enabled=PLAYWRIGHT_CONFIG['java_script_enabled'],
-            accept_downloads=PLAYWRIGHT_CONFIG['accept_downloads'],
-            has_touch=PLAYWRIGHT_CONFIG['has_touch'],
-            is_mobile=PLAYWRIGHT_CONFIG['is_mobile'],
-            locale=PLAYWRIGHT_CONFIG['locale'],
-            timezone_id=PLAYWRIGHT_CONFIG['timezone_id'],
-            color_scheme=PLAYWRIGHT_CONFIG['color_scheme'],
-            extra_http_headers=get_optimal_headers()
-        )
-        
-        page = await context.new_page()
+    html, _status, _retry_after = await _render_html(url, wait_for_selector, timeout_seconds)
+    return html
+
+
+async def _render_html(
+    url: str, wait_for_selector: Optional[str], timeout_seconds: float
+) -> Tuple[str, Optional[int], Optional[str]]:
+    """
+    Corps de fetch_html_playwright : (html, statut HTTP de la navigation, Retry-After).
+    Statut None pour un rendu servi depuis le cache (seules les pages en succès y sont).
+    """
+    from .browser_pool import get_browser_pool
+
+    render_cache = get_render_cache()
+    cache_key = _render_cache_key('html', url, False, wait_for_selector)
+    if render_cache is not None:
+        cached_html = render_cache.get(cache_key)
+        if cached_html is not None:
+            print(f"♻️ Rendu servi depuis le cache: {url}")
+            return cached_html, None, None
+
+    pool = get_browser_pool()
+    render_start = time.perf_counter()
+    html, status, retry_after = await pool.run_async(
+        _fetch_html_pooled(pool, url, wait_for_selector, timeout_seconds)
+    )
+    # Page d'erreur ou challenge anti-bot (page.goto ne lève pas sur 4xx/5xx) : jamais mise en cache
+    if render_cache is not None and status is not None and status < 400:
+        render_cache.put(cache_key, html, time.perf_counter() - render_start)
+    return html, status, retry_after
+
+
+def _resolve_sections(sections: Optional[List[str]], default: tuple) -> List[str]:
+    """Sections demandées, validées et dans l'ordre de EXTRACTION_SECTIONS (None : sections par défaut)."""
+    if sections is None:
+        return list(default)
+    unknown = set(sections) - set(EXTRACTION_SECTIONS)
+    if unknown:
+        raise ValueError(f"Sections inconnues: {sorted(unknown)} (disponibles: {', '.join(EXTRACTION_SECTIONS)})")
+    return [section for section in EXTRACTION_SECTIONS if section in sections]
+
+
+def _sections_kind(kind: str, sections: List[str], default: tuple) -> str:
+    """Type de rendu pour le cache : une extraction partielle n'est jamais servie pour une complète."""
+    return kind if sections == list(default) else f"{kind}[{','.join(sections)}]"
+
+
+def _render_cache_key(kind: str, url: str, scroll: bool, wait_for_selector: Optional[str]) -> tuple:
+    """Clé du cache de rendus : les contextes du pool partagent la classe d'UA de PLAYWRIGHT_CONFIG."""
+    return RenderCache.make_key(
+        kind, url, scroll, wait_for_selector,
+        user_agent_class(is_mobile=PLAYWRIGHT_CONFIG['is_mobile'])
+    )
+
+
+async def _fetch_html_pooled(
+    pool, url: str, wait_for_selector: Optional[str], timeout_seconds: float
+) -> tuple:
+    """Rendu exécuté sur la boucle du pool : (html, statut HTTP ou None, en-tête Retry-After ou None)."""
+    # Politesse par hôte avant d'emprunter un contexte : l'attente n'occupe aucune place du pool
+    await get_rate_limiter().wait_async(url)
 
+    # Contexte pré-configuré (headers optimaux + anti-détection) réutilisé par le pool
+    async with pool.lease_page() as page:
         try:
-            # Optimisations de performance - bloquer images et ressources inutiles
-            await page.route("**/*.{png,jpg,jpeg,gif,svg,ico,webp}", lambda route: route.abort())
-            await page.route("**/*.{woff,woff2,ttf,eot}", lambda route: route.abort())
-            await page.route("**/*.{css}", lambda route: route.abort())
+            # Optimisations de performance - bloquer images, CSS, polices et traqueurs
+            usage = await get_resource_policy('html').attach(page)
+            waiter = QuiescenceWaiter().attach(page)
             
             # Navigation optimisée avec stratégie de fallback
             try:
-                await page.goto(
+                response = await page.goto(
                     url, 
                     wait_until="domcontentloaded",  # Plus rapide que networkidle
                     timeout=int(timeout_seconds * 1000)
@@ -248,13 +418,13 @@ async def fetch_html_playwright(
                 if "Timeout" in str(e):
                     print(f"⚠️ Timeout sur domcontentloaded, tentative en mode 'commit' (plus rapide)...")
                     # Fallback: on veut juste le HTML, même si tout n'est pas chargé
-                    await page.goto(
+                    response = await page.goto(
                         url, 
                         wait_until="commit",
                         timeout=int(timeout_seconds * 1000)
                     )
-                    # On attend un peu manuellement
-                    await asyncio.sleep(2)
+                    # On attend que la page se stabilise (2s max)
+                    await waiter.wait(page, max_wait=2, kind='commit_fallback')
                 else:
                     raise e
 
@@ -263,142 +433,136 @@ async def fetch_html_playwright(
                     wait_for_selector, timeout=int(timeout_seconds * 1000)
                 )
             else:
-                # Attendre un court délai pour le contenu dynamique
-                await asyncio.sleep(1)
+                # Contenu dynamique : DOM et réseau calmes (1s max)
+                await waiter.wait(page, max_wait=1, kind='navigation')
 
             html = await page.content()
-            
-            # Délai adaptatif pour éviter la détection
-            delay = adaptive_delay()
-            await asyncio.sleep(delay)
-            
-            return html
+            record_resource_usage(usage)
+            if response is None:
+                return html, None, None
+            return html, response.status, response.headers.get('retry-after')
             
         except Exception as e:
             print(f"⚠️ Erreur lors du fetch Playwright: {str(e)}")
             # En cas d'erreur, on peut retry avec des paramètres plus conservateurs
             raise e
-            
-        finally:
-            await page.close()
-            await context.close()
-            await browser.close()
 
 
 async def take_screenshot(url: str, timeout_seconds: float = 30.0) -> str:
     """
     Prend une capture d'écran d'une page web et la retourne en base64.
     """
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(
-            headless=PLAYWRIGHT_CONFIG['headless'],
-            args=PLAYWRIGHT_CONFIG['args']
-        )
-        context = await browser.new_context(
-            viewport=PLAYWRIGHT_CONFIG['viewport'],
-            user_agent=get_random_user_agent(),
-            ignore_https_errors=PLAYWRIGHT_CONFIG['ignore_https_errors'],
-            java_script_enabled=PLAYWRIGHT_CONFIG['java_script_enabled'],
-            extra_http_headers=get_optimal_headers()
-        )
-        page = await context.new_page()
+    from .browser_pool import get_browser_pool
 
+    pool = get_browser_pool()
+    return await pool.run_async(_take_screenshot_pooled(pool, url, timeout_seconds))
+
+
+async def _take_screenshot_pooled(pool, url: str, timeout_seconds: float):
+    """Corps de take_screenshot, exécuté sur la boucle du pool."""
+    await get_rate_limiter().wait_async(url)
+    async with pool.lease_page() as page:
         try:
+            usage = await get_resource_policy('screenshot').attach(page)
+            waiter = QuiescenceWaiter().attach(page)
             await page.goto(url, wait_until="domcontentloaded", timeout=int(timeout_seconds * 1000))
             
-            # Attendre un peu pour le rendu JS
-            await asyncio.sleep(2)
+            # Attendre la fin du rendu JS (2s max)
+            await waiter.wait(page, max_wait=2, kind='screenshot')
 
             screenshot_bytes = await page.screenshot(full_page=True)
+            record_resource_usage(usage)
             
             return screenshot_bytes
 
         except Exception as e:
             print(f"⚠️ Erreur lors de la capture d'écran Playwright: {str(e)}")
             raise e
-            
-        finally:
-            await page.close()
-            await context.close()
-            await browser.close()
 
 
 def fetch_html_with_js(
     url: str, wait_for_selector: Optional[str] = None, timeout_seconds: float = 60.0
 ) -> str:
-    return asyncio.run(fetch_html_playwright(url, wait_for_selector, timeout_seconds))
+    return run_sync(fetch_html_playwright(url, wait_for_selector, timeout_seconds))
 
 
 async def extract_complete_content_playwright(
-    url: str, timeout_seconds: float = 60.0, scroll_for_dynamic: bool = True
+    url: str, timeout_seconds: float = 60.0, scroll_for_dynamic: bool = True,
+    sections: Optional[List[str]] = None
 ) -> dict:
     """
     Extraction ULTRA-COMPLÈTE d'une page (basée sur les meilleures pratiques gratuites)
     Extrait : texte, images (y compris background CSS), vidéos, audio, formulaires, 
     tableaux, données structurées JSON-LD, métadonnées complètes
+    sections : sous-ensemble de EXTRACTION_SECTIONS (ex. ['text', 'links']) ; les autres restent vides
     """
-    async with async_playwright() as p:
-        # Configuration browser optimale
-        browser = await p.chromium.launch(
-            headless=PLAYWRIGHT_CONFIG['headless'],
-            args=PLAYWRIGHT_CONFIG['args']
-        )
-        
-        # Contexte optimisé avec headers réalistes
-        context = await browser.new_context(
-            viewport=PLAYWRIGHT_CONFIG['viewport'],
-            user_agent=get_random_user_agent(),
-            ignore_https_errors=PLAYWRIGHT_CONFIG['ignore_https_errors'],
-            java_script_enabled=PLAYWRIGHT_CONFIG['java_script_enabled'],
-            extra_http_headers=get_optimal_headers()
-        )
-        
-        page = await context.new_page()
+    from .browser_pool import get_browser_pool
+
+    sections = _resolve_sections(sections, COMPLETE_CONTENT_SECTIONS)
+    render_cache = get_render_cache()
+    cache_key = _render_cache_key(
+        _sections_kind('complete_content', sections, COMPLETE_CONTENT_SECTIONS), url, scroll_for_dynamic, None
+    )
+    if render_cache is not None:
+        cached_content = render_cache.get(cache_key)
+        if cached_content is not None:
+            print(f"♻️ Extraction servie depuis le cache: {url}")
+            return cached_content
+
+    pool = get_browser_pool()
+    render_start = time.perf_counter()
+    content = await pool.run_async(
+        _extract_complete_content_pooled(pool, url, timeout_seconds, scroll_for_dynamic, sections)
+    )
+    status = content['extraction_stats'].get('http_status')
+    if render_cache is not None and status is not None and status < 400:
+        render_cache.put(cache_key, content, time.perf_counter() - render_start)
+    return content
+
+
+async def _extract_complete_content_pooled(
+    pool, url: str, timeout_seconds: float, scroll_for_dynamic: bool, sections: List[str]
+) -> dict:
+    """Corps de extract_complete_content_playwright, exécuté sur la boucle du pool."""
+    # Politesse par hôte avant d'emprunter un contexte : l'attente n'occupe aucune place du pool
+    await get_rate_limiter().wait_async(url)
 
+    # Contexte pré-configuré (headers optimaux + anti-détection) réutilisé par le pool
+    async with pool.lease_page() as page:
         try:
             print(f"🔍 Extraction ultra-complète : {url}")
             
+            # Médias, polices et traqueurs bloqués (images et CSS gardés pour l'extraction)
+            usage = await get_resource_policy('extract').attach(page)
+            waiter = QuiescenceWaiter().attach(page)
+            settle_seconds = 0.0
+            
             # Navigation optimisée avec fallback
             try:
                 # On tente d'abord avec un timeout plus généreux (45s au lieu de 20s)
                 timeout_ms = max(int(timeout_seconds * 1000), 45000)
-                await page.goto(url, wait_until="domcontentloaded", timeout=timeout_ms)
+                response = await page.goto(url, wait_until="domcontentloaded", timeout=timeout_ms)
             except Exception as e:
                 if "Timeout" in str(e):
                     print(f"⚠️ Timeout sur domcontentloaded, tentative en mode 'commit'...")
                     # Fallback: on récupère dès que le serveur répond
-                    await page.goto(url, wait_until="commit", timeout=30000)
-                    # IMPORTANT: On attend 5s (au lieu de 2s) pour laisser le JS hydrater la page
-                    print(f"⏳ Attente de 5s pour l'hydratation du contenu...")
-                    await asyncio.sleep(5)
+                    response = await page.goto(url, wait_until="commit", timeout=30000)
+                    # IMPORTANT: on laisse le JS hydrater la page (jusqu'à 5s si elle ne se stabilise pas)
+                    print(f"⏳ Attente de l'hydratation du contenu (5s max)...")
+                    settle_seconds += await waiter.wait(page, max_wait=5, kind='commit_fallback')
                 else:
                     raise e
             
-            # Pour le contenu dynamique - scroll automatique
+            # Pour le contenu dynamique - scroll adaptatif (s'arrête quand la hauteur ne bouge plus)
+            scroll_report = None
             if scroll_for_dynamic:
                 print(f"📋 Scroll automatique pour contenu dynamique...")
-                await page.evaluate("""
-                    async () => {
-                        await new Promise((resolve) => {
-                            let totalHeight = 0;
-                            const distance = 100;
-                            const timer = setInterval(() => {
-                                const scrollHeight = document.body.scrollHeight;
-                                window.scrollBy(0, distance);
-                                totalHeight += distance;
-                                if (totalHeight >= scrollHeight) {
-                                    clearInterval(timer);
-                                    resolve();
-                                }
-                            }, 100);
-                        });
-                    }
-                """)
-                await asyncio.sleep(2)  # Attendre le chargement après scroll
+                scroll_report = await AdaptiveScroller().run(page, waiter)
                 
-            # EXTRACTION ULTRA-COMPLÈTE
+            # EXTRACTION ULTRA-COMPLÈTE (seulement les sections demandées)
             full_content = await page.evaluate(r"""
-                () => {
+                (sections) => {
+                    const want = new Set(sections);
                     const result = {
                         metadata: {},
                         text: {},
@@ -419,7 +583,7 @@ async def extract_complete_content_playwright(
                     };
                     
                     // ===== MÉTADONNÉES COMPLÈTES =====
-                    result.metadata = {
+                    if (want.has('metadata')) result.metadata = {
                         title: document.title,
                         url: window.location.href,
                         description: document.querySelector('meta[name="description"]')?.content || '',
@@ -437,7 +601,7 @@ async def extract_complete_content_playwright(
                     };
                     
                     // ===== TEXTE STRUCTURÉ =====
-                    result.text = {
+                    if (want.has('text')) result.text = {
                         fullText: document.body.innerText,
                         title: document.title,
                         headings: {
@@ -455,9 +619,10 @@ async def extract_complete_content_playwright(
                         })),
                         quotes: [...document.querySelectorAll('blockquote')].map(q => q.textContent.trim()).filter(Boolean)
                     };
+                    if (want.has('html')) result.text.html = document.documentElement.outerHTML;
                     
                     // ===== IMAGES COMPLÈTES =====
-                    result.media.images = [...document.querySelectorAll('img')].map((img, index) => ({
+                    if (want.has('images')) result.media.images = [...document.querySelectorAll('img')].map((img, index) => ({
                         src: img.src,
                         alt: img.alt || '',
                         title: img.title || '',
@@ -470,21 +635,10 @@ async def extract_complete_content_playwright(
                         index
                     })).filter(img => img.src);
                     
-                    // Images en background CSS (technique avancée)
-                    const elementsWithBg = [...document.querySelectorAll('*')].filter(el => {
-                        const bg = window.getComputedStyle(el).backgroundImage;
-                        return bg && bg !== 'none' && bg.includes('url(');
-                    });
-                    
-                    result.media.backgroundImages = elementsWithBg.map((el, index) => ({
-                        backgroundImage: window.getComputedStyle(el).backgroundImage,
-                        element: el.tagName,
-                        className: el.className,
-                        index
-                    }));
+                    // Images en background CSS : scan CSSOM séparé (background_images.py)
                     
                     // ===== VIDÉOS COMPLÈTES =====
-                    result.media.videos = [...document.querySelectorAll('video')].map((video, index) => ({
+                    if (want.has('videos')) result.media.videos = [...document.querySelectorAll('video')].map((video, index) => ({
                         src: video.src || video.currentSrc,
                         poster: video.poster,
                         sources: [...video.querySelectorAll('source')].map(s => ({
@@ -501,7 +655,7 @@ async def extract_complete_content_playwright(
                     })).filter(video => video.src);
                     
                     // YouTube, Vimeo, etc. (iframes)
-                    result.media.iframes = [...document.querySelectorAll('iframe')].map((iframe, index) => ({
+                    if (want.has('iframes')) result.media.iframes = [...document.querySelectorAll('iframe')].map((iframe, index) => ({
                         src: iframe.src,
                         width: iframe.width || 0,
                         height: iframe.height || 0,
@@ -511,7 +665,7 @@ async def extract_complete_content_playwright(
                     })).filter(iframe => iframe.src);
                     
                     // ===== AUDIO =====
-                    result.media.audios = [...document.querySelectorAll('audio')].map((audio, index) => ({
+                    if (want.has('audios')) result.media.audios = [...document.querySelectorAll('audio')].map((audio, index) => ({
                         src: audio.src || audio.currentSrc,
                         sources: [...audio.querySelectorAll('source')].map(s => ({
                             src: s.src,
@@ -524,7 +678,7 @@ async def extract_complete_content_playwright(
                     })).filter(audio => audio.src);
                     
                     // ===== LIENS OPTIMISÉS =====
-                    result.links = [...document.querySelectorAll('a[href]')].map((a, index) => ({
+                    if (want.has('links')) result.links = [...document.querySelectorAll('a[href]')].map((a, index) => ({
                         href: a.href,
                         text: a.textContent.trim(),
                         title: a.title || '',
@@ -535,7 +689,7 @@ async def extract_complete_content_playwright(
                     })).filter(link => link.href && link.text);
                     
                     // ===== FICHIERS TÉLÉCHARGEABLES =====
-                    result.files = [...document.querySelectorAll('a[href]')].filter(a => {
+                    if (want.has('files')) result.files = [...document.querySelectorAll('a[href]')].filter(a => {
                         const href = a.href.toLowerCase();
                         return href.match(/\.(pdf|doc|docx|xls|xlsx|ppt|pptx|zip|rar|7z|tar|gz|mp3|mp4|avi|mov)$/);
                     }).map((a, index) => ({
@@ -547,7 +701,7 @@ async def extract_complete_content_playwright(
                     }));
                     
                     // ===== FORMULAIRES COMPLETS =====
-                    result.forms = [...document.querySelectorAll('form')].map((form, index) => ({
+                    if (want.has('forms')) result.forms = [...document.querySelectorAll('form')].map((form, index) => ({
                         action: form.action,
                         method: form.method || 'get',
                         id: form.id || '',
@@ -566,7 +720,7 @@ async def extract_complete_content_playwright(
                     }));
                     
                     // ===== TABLEAUX STRUCTURÉS =====
-                    result.tables = [...document.querySelectorAll('table')].map((table, index) => ({
+                    if (want.has('tables')) result.tables = [...document.querySelectorAll('table')].map((table, index) => ({
                         caption: table.querySelector('caption')?.textContent?.trim() || '',
                         headers: [...table.querySelectorAll('thead th, tr:first-child th')].map(th => th.textContent.trim()),
                         rows: [...table.querySelectorAll('tbody tr, tr')]
@@ -577,7 +731,7 @@ async def extract_complete_content_playwright(
                     })).filter(table => table.headers.length > 0 || table.rows.length > 0);
                     
                     // ===== DONNÉES STRUCTURÉES JSON-LD =====
-                    result.structuredData = [...document.querySelectorAll('script[type="application/ld+json"]')]
+                    if (want.has('structured_data')) result.structuredData = [...document.querySelectorAll('script[type="application/ld+json"]')]
                         .map((script, index) => {
                             try {
                                 return {
@@ -590,16 +744,20 @@ async def extract_complete_content_playwright(
                         }).filter(Boolean);
                     
                     // ===== SCRIPTS ET STYLES =====
-                    result.scripts = [...document.querySelectorAll('script[src]')].map(s => s.src).filter(Boolean);
-                    result.styles = [...document.querySelectorAll('link[rel="stylesheet"]')].map(l => l.href).filter(Boolean);
+                    if (want.has('scripts')) result.scripts = [...document.querySelectorAll('script[src]')].map(s => s.src).filter(Boolean);
+                    if (want.has('styles')) result.styles = [...document.querySelectorAll('link[rel="stylesheet"]')].map(l => l.href).filter(Boolean);
                     
                     return result;
                 }
-            """)
+            """, sections)
+            background_scan = None
+            if 'background_images' in sections:
+                background_scan = await scan_background_images(page)
+                full_content['media']['backgroundImages'] = background_scan.pop('images')
             
             # Statistiques d'extraction
             stats = {
-                'text_length': len(full_content['text']['fullText']),
+                'text_length': len(full_content['text'].get('fullText', '')),
                 'images': len(full_content['media']['images']),
                 'background_images': len(full_content['media']['backgroundImages']),
                 'videos': len(full_content['media']['videos']),
@@ -624,105 +782,149 @@ async def extract_complete_content_playwright(
             full_content['extraction_stats'] = stats
             full_content['extraction_timestamp'] = int(time.time())
             full_content['extraction_url'] = url
+            full_content['resource_savings'] = record_resource_usage(usage)
+            full_content['extraction_stats']['settle_seconds'] = round(settle_seconds, 3)
+            full_content['extraction_stats']['scroll'] = scroll_report
+            full_content['extraction_stats']['sections'] = sections
+            full_content['extraction_stats']['background_scan'] = background_scan
+            full_content['extraction_stats']['http_status'] = response.status if response is not None else None
             
             return full_content
             
         except Exception as e:
             print(f"❌ Erreur extraction complète: {str(e)}")
             raise e
-            
-        finally:
-            await page.close()
-            await context.close()
-            await browser.close()
-def fetch_html_smart(
+
+
+async def fetch_html_smart_async(
     url: str,
-    use_js: bool = False,
+    use_js: Union[bool, str] = False,
     wait_for_selector: Optional[str] = None,
     timeout_seconds: float = 20.0,
 ) -> str:
     """
-    Fonction optimisée avec retry intelligent et configurations avancées
+    Fonction optimisée avec retry intelligent et configurations avancées (API async native)
     Compatible avec l'extraction complète
+
+    use_js='auto' : HTTP d'abord, rendu Chromium seulement si la page est une coquille
+    SPA, exige JavaScript ou semble vide ; la décision est mémorisée par domaine
+    et motif de chemin (voir render_decision.py).
     """
-    max_attempts = RETRY_CONFIG['max_retries']
-    
-    for attempt in range(max_attempts):
+    if use_js != 'auto':
+        return await _fetch_html_attempts(url, bool(use_js), wait_for_selector, timeout_seconds)
+
+    memory = get_render_memory()
+    if memory.lookup(url):
+        memory.count('js_renders')
+        return await _fetch_html_attempts(url, True, wait_for_selector, timeout_seconds)
+
+    try:
+        html = await _fetch_html_attempts(url, False, wait_for_selector, timeout_seconds)
+        # Parsing lxml hors de la boucle partagée : une grosse page ne bloque pas les autres fetchs
+        needs_js, reason = await asyncio.to_thread(_static_render_verdict, html, wait_for_selector)
+    except httpx.HTTPStatusError as e:
+        # 403/503 d'une protection anti-bot : le navigateur passe souvent là où HTTP échoue
+        html, needs_js, reason = None, True, f"http_{e.response.status_code}"
+    memory.count('static_fetches')
+
+    memory.record(url, needs_js, reason)
+    if not needs_js:
+        return html
+
+    print(f"🔁 Rendu JS nécessaire ({reason}) : {url}")
+    memory.count('escalations')
+    memory.count('js_renders')
+    return await _fetch_html_attempts(url, True, wait_for_selector, timeout_seconds)
+
+
+def _static_render_verdict(html: str, wait_for_selector: Optional[str]) -> Tuple[bool, str]:
+    """Verdict needs_js_render du HTML statique, plus présence du sélecteur attendu (CPU, hors boucle)."""
+    needs_js, reason = needs_js_render(html)
+    if wait_for_selector and not needs_js:
+        # Le sélecteur attendu doit exister dans le HTML statique
         try:
-            if use_js:
-                # Utiliser Playwright pour contenu dynamique
-                result = fetch_html_with_js(url, wait_for_selector, timeout_seconds)
-                print(f"✅ Contenu récupéré avec Playwright (tentative {attempt + 1})")
-                return result
-            else:
-                # Requête HTTP optimisée avec headers avancés
-                headers = get_optimal_headers()
-                
-                with httpx.Client(
-                    follow_redirects=True, 
-                    timeout=timeout_seconds, 
-                    headers=headers,
-                    verify=False  # Pour éviter les erreurs SSL sur certains sites
-                ) as client:
-                    
-                    # Délai adaptatif avant la requête
-                    if attempt > 0:
-                        delay = RETRY_CONFIG['backoff_factor'] * (2 ** attempt)
-                        print(f"🔄 Retry dans {delay:.1f}s...")
-                        time.sleep(delay)
-                    
-                    resp = client.get(url)
-                    
-                    # Vérifier si on doit retry basé sur le status code
-                    if resp.status_code in RETRY_CONFIG['retry_status_codes']:
-                        if attempt < max_attempts - 1:
-                            print(f"⚠️ Status {resp.status_code} - retry tentative {attempt + 2}")
-                            continue
-                    
-                    resp.raise_for_status()
-                    
-                    # Délai adaptatif après requête réussie
-                    delay = adaptive_delay()
-                    time.sleep(delay)
-                    
-                    print(f"✅ Contenu récupéré avec HTTP (tentative {attempt + 1})")
-                    return resp.text
-                    
-        except Exception as e:
-            error_msg = str(e).lower()
-            print(f"⚠️ Tentative {attempt + 1} échouée: {str(e)}")
-            
-            # Conditions de retry
-            should_retry = (
-                attempt < max_attempts - 1 and (
-                    "timeout" in error_msg or
-                    "connection" in error_msg or
-                    "network" in error_msg or
-                    "502" in error_msg or
-                    "503" in error_msg
-                )
-            )
-            
-            if should_retry:
-                retry_delay = RETRY_CONFIG['backoff_factor'] * (2 ** attempt)
-                print(f"🔄 Retry dans {retry_delay:.1f}s...")
-                time.sleep(retry_delay)
-                continue
-            else:
-                # Dernière tentative ou erreur non-retryable
-                if attempt == max_attempts - 1:
-                    print(f"❌ Échec après {max_attempts} tentatives")
-                raise e
-    
-    # Ne devrait jamais arriver
-    raise Exception(f"Échec de récupération après {max_attempts} tentatives")
+            if BeautifulSoup(html, 'lxml').select_one(wait_for_selector) is None:
+                needs_js, reason = True, 'selector_missing'
+        except Exception:
+            pass
+    return needs_js, reason
+
+
+async def _fetch_html_attempts(
+    url: str,
+    use_js: bool,
+    wait_for_selector: Optional[str],
+    timeout_seconds: float,
+) -> str:
+    """
+    Fetch HTTP ou Playwright de fetch_html_smart_async, soumis à la politique de retry
+    partagée (jitter décorrélé, Retry-After, budget, disjoncteur par hôte).
+    Une erreur définitive (404, 403...) remonte sans retry.
+    """
+    policy = get_retry_policy()
+    if use_js:
+        async def _js_attempt() -> str:
+            # Utiliser Playwright pour contenu dynamique ; page.goto ne lève pas sur 429/5xx :
+            # le statut est remonté à la politique (retry, Retry-After, disjoncteur)
+            html, status, retry_after = await _render_html(url, wait_for_selector, timeout_seconds)
+            if status in policy.retry_status_codes:
+                print(f"⚠️ Status HTTP {status} (Playwright): {url}")
+                raise RetryableStatusError(status, retry_after)
+            return html
+
+        result = await policy.execute_async(url, _js_attempt)
+        print(f"✅ Contenu récupéré avec Playwright")
+        return result
+
+    async def _http_attempt() -> str:
+        # Politesse par hôte, puis requête HTTP avec headers avancés (client partagé, keep-alive)
+        await get_rate_limiter().wait_async(url)
+        resp = await get_http_client().aget(
+            url,
+            follow_redirects=True, 
+            timeout=timeout_seconds, 
+            headers=get_optimal_headers(),
+            verify=False  # Pour éviter les erreurs SSL sur certains sites
+        )
+        resp.raise_for_status()
+        return resp.text
+
+    html = await policy.execute_async(url, _http_attempt)
+    print(f"✅ Contenu récupéré avec HTTP")
+    return html
+
+
+def fetch_html_smart(
+    url: str,
+    use_js: Union[bool, str] = False,
+    wait_for_selector: Optional[str] = None,
+    timeout_seconds: float = 20.0,
+) -> str:
+    """
+    Version synchrone de fetch_html_smart_async : soumise à la boucle partagée
+    (même client HTTP et même navigateur que les autres fetchs du processus)
+    """
+    return run_sync(fetch_html_smart_async(url, use_js, wait_for_selector, timeout_seconds))
+
+
+async def extract_complete_content_async(
+    url: str, timeout_seconds: float = 20.0, scroll_for_dynamic: bool = True,
+    sections: Optional[List[str]] = None
+) -> dict:
+    """
+    Extraction complète (API async native), utilisable depuis n'importe quelle boucle asyncio
+    """
+    return await extract_complete_content_playwright(url, timeout_seconds, scroll_for_dynamic, sections)
 
 
-def extract_complete_content_sync(url: str, timeout_seconds: float = 20.0, scroll_for_dynamic: bool = True) -> dict:
+def extract_complete_content_sync(
+    url: str, timeout_seconds: float = 20.0, scroll_for_dynamic: bool = True,
+    sections: Optional[List[str]] = None
+) -> dict:
     """
     Version synchrone de l'extraction complète pour compatibilité
     """
-    return asyncio.run(extract_complete_content_playwright(url, timeout_seconds, scroll_for_dynamic))
+    return run_sync(extract_complete_content_async(url, timeout_seconds, scroll_for_dynamic, sections))
 
 
 # =================== CLASSE PLAYWRIGHT FETCHER OPTIMISÉE ===================
@@ -751,53 +953,20 @@ class PlaywrightFetcher:
         self.stealth_enabled = STEALTH_AVAILABLE
         
     async def initialize(self, use_stealth: bool = True):
-        """Initialiser le navigateur avec TOUTES les optimisations anti-détection"""
-        if not self.browser:
-            self.playwright = await async_playwright().start()
-            
-            # Configuration avec paramètres anti-détection étendus
-            self.browser = await self.playwright.chromium.launch(
-                headless=PLAYWRIGHT_CONFIG['headless'],
-                args=PLAYWRIGHT_CONFIG['args'],
-                ignore_default_args=['--enable-automation', '--enable-blink-features=AutomationControlled']
-            )
-            
-            # Résolutions réalistes (rotation)
-            viewports = [
-                {'width': 1920, 'height': 1080},
-                {'width': 1366, 'height': 768},
-                {'width': 1536, 'height': 864},
-                {'width': 1440, 'height': 900}
-            ]
-            viewport = random.choice(viewports)
-            
-            # Context ultra-réaliste avec headers optimaux
-            self.context = await self.browser.new_context(
-                viewport=viewport,
-                user_agent=get_random_user_agent(),
-                ignore_https_errors=PLAYWRIGHT_CONFIG['ignore_https_errors'],
-                java_script_enabled=PLAYWRIGHT_CONFIG['java_script_enabled'],
-                locale=random.choice(['fr-FR', 'en-US', 'en-GB']),
-                timezone_id='Europe/Paris',
-                color_scheme='light',
-                extra_http_headers=get_optimal_headers(),
-                device_scale_factor=random.choice([1, 1.25, 1.5])
-            )
+        """
+        Préchauffer le pool partagé : les navigateurs et contextes pré-configurés
+        (headers optimaux + scripts anti-détection) viennent de browser_pool.
+        """
+        from .browser_pool import get_browser_pool
+
+        pool = get_browser_pool()
+        await pool.run_async(pool.start())
         
     async def close(self):
-        """Fermer le navigateur proprement"""
-        try:
-            if self.context:
-                await self.context.close()
-                self.context = None
-            if self.browser:
-                await self.browser.close()
-                self.browser = None
-            if self.playwright:
-                await self.playwright.stop()
-                self.playwright = None
-        except Exception as e:
-            print(f"⚠️ Erreur fermeture navigateur: {e}")
+        """Rien à fermer : le pool partagé garde les navigateurs chauds (voir shutdown_browser_pool)"""
+        self.browser = None
+        self.context = None
+        self.playwright = None
             
     async def extract_everything(
         self, 
@@ -805,14 +974,90 @@ class PlaywrightFetcher:
         use_scroll: bool = True,
         timeout_seconds: float = 30.0,
         wait_for_selector: Optional[str] = None,
-        use_stealth: bool = True
+        use_stealth: bool = True,
+        capture_network: bool = False,
+        sections: Optional[List[str]] = None
     ) -> dict:
         """
         🌟 EXTRACTION ULTRA-COMPLÈTE avec ANTI-DÉTECTION AVANCÉ intégré
+
+        capture_network=True : enregistre aussi les réponses JSON (XHR/fetch) reçues pendant
+        la navigation et le scroll ; les tableaux d'objets sont renvoyés dans 'network_collections'.
+        sections : sous-ensemble de EXTRACTION_SECTIONS (ex. ['metadata', 'links']) ; les autres restent vides.
         """
-        await self.initialize(use_stealth=use_stealth)
-        page = await self.context.new_page()
-        
+        from .browser_pool import get_browser_pool
+
+        sections = _resolve_sections(sections, EXTRACT_EVERYTHING_SECTIONS)
+        render_cache = get_render_cache()
+        kind = 'extract_everything_network' if capture_network else 'extract_everything'
+        kind = _sections_kind(kind, sections, EXTRACT_EVERYTHING_SECTIONS)
+        cache_key = _render_cache_key(kind, url, use_scroll, wait_for_selector)
+        if render_cache is not None:
+            cached_result = render_cache.get(cache_key)
+            if cached_result is not None:
+                print(f"♻️ Extraction servie depuis le cache: {url}")
+                return cached_result
+
+        pool = get_browser_pool()
+        render_start = time.perf_counter()
+        result = await pool.run_async(self._extract_everything_pooled(
+            pool, url, use_scroll, timeout_seconds, wait_for_selector, use_stealth, capture_network, sections
+        ))
+        # Ni les échecs ni les pages d'erreur ou challenges anti-bot (page.goto ne lève pas sur 4xx/5xx)
+        # ne sont mis en cache : la tentative suivante doit relancer le rendu
+        status = result.get('http_status')
+        if render_cache is not None and result.get('success') and status is not None and status < 400:
+            render_cache.put(cache_key, result, time.perf_counter() - render_start)
+        return result
+
+    async def extract_collections(
+        self,
+        url: str,
+        use_scroll: bool = True,
+        timeout_seconds: float = 30.0
+    ) -> dict:
+        """
+        Collections de données d'une page chargée par API JSON.
+        Si ses endpoints ont déjà été capturés, ils sont rappelés directement en HTTP
+        (ni rendu, ni heuristiques DOM) ; sinon la page est rendue en mode capture.
+        """
+        collections = await fetch_known_collections(url, timeout_seconds)
+        if collections is not None:
+            print(f"⚡ {len(collections)} collection(s) récupérée(s) sans rendu: {url}")
+            return {'success': True, 'url': url, 'source': 'api_replay', 'collections': collections}
+
+        result = await self.extract_everything(
+            url, use_scroll=use_scroll, timeout_seconds=timeout_seconds, capture_network=True
+        )
+        return {
+            'success': result.get('success', False),
+            'url': url,
+            'source': 'network_capture',
+            'collections': result.get('network_collections', []),
+            'error': result.get('error')
+        }
+
+    async def _extract_everything_pooled(
+        self, pool, url: str, use_scroll: bool, timeout_seconds: float,
+        wait_for_selector: Optional[str], use_stealth: bool, capture_network: bool = False,
+        sections: Optional[List[str]] = None
+    ) -> dict:
+        """Corps de extract_everything, exécuté sur la boucle du pool avec un contexte prêté."""
+        # Politesse par hôte avant d'emprunter un contexte : l'attente n'occupe aucune place du pool
+        await get_rate_limiter().wait_async(url)
+        async with pool.lease_context() as lease:
+            page = await lease.new_page()
+            return await self._extract_from_page(
+                page, url, use_scroll, timeout_seconds, wait_for_selector, use_stealth, capture_network,
+                sections
+            )
+
+    async def _extract_from_page(
+        self, page, url: str, use_scroll: bool, timeout_seconds: float,
+        wait_for_selector: Optional[str], use_stealth: bool, capture_network: bool = False,
+        sections: Optional[List[str]] = None
+    ) -> dict:
+        sections = _resolve_sections(sections, EXTRACT_EVERYTHING_SECTIONS)
         try:
             print(f"🚀 Extraction ultra-complète optimisée: {url}")
             
@@ -824,12 +1069,22 @@ class PlaywrightFetcher:
                 except Exception as e:
                     print(f"   ⚠️ Stealth non appliqué: {e}")
             
-            # Injecter les scripts anti-détection avancés
-            await self._inject_anti_detection_scripts(page)
+            # Scripts anti-détection : déjà appliqués au contexte prêté par le pool
+            
+            # Médias, polices et traqueurs bloqués (images et CSS gardés pour l'extraction)
+            usage = await get_resource_policy('extract').attach(page)
+            waiter = QuiescenceWaiter().attach(page)
+            settle_seconds = 0.0
+            
+            # Capture des réponses JSON pendant navigation + scroll (endpoints d'API de la page)
+            capture = None
+            if capture_network:
+                capture = NetworkCapture(url)
+                await capture.attach(page)
             
             # Navigation avec optimisations et fallback
             try:
-                await page.goto(
+                response = await page.goto(
                     url, 
                     wait_until='domcontentloaded',
                     timeout=int(timeout_seconds * 1000)
@@ -837,12 +1092,12 @@ class PlaywrightFetcher:
             except Exception as e:
                 if "Timeout" in str(e):
                     print(f"⚠️ Timeout sur domcontentloaded, tentative en mode 'commit'...")
-                    await page.goto(
+                    response = await page.goto(
                         url, 
                         wait_until='commit',
                         timeout=int(timeout_seconds * 1000)
                     )
-                    await asyncio.sleep(2)
+                    settle_seconds += await waiter.wait(page, max_wait=2, kind='commit_fallback')
                 else:
                     raise e
             
@@ -853,17 +1108,19 @@ class PlaywrightFetcher:
                 except:
                     print(f"⚠️ Sélecteur '{wait_for_selector}' non trouvé")
             
-            # Délai adaptatif pour le contenu dynamique
-            await asyncio.sleep(adaptive_delay())
+            # Contenu dynamique : DOM et réseau calmes (plafond : délai max de DELAY_CONFIG)
+            settle_seconds += await waiter.wait(page, max_wait=DELAY_CONFIG['max_delay'], kind='navigation')
             
             # Scroll automatique pour contenu lazy-loaded
+            scroll_report = None
             if use_scroll:
                 print("📋 Scroll automatique pour contenu dynamique...")
-                await self._auto_scroll(page)
+                scroll_report = await self._auto_scroll(page, waiter)
             
-            # EXTRACTION COMPLÈTE DIRECTE (sans appel à la fonction externe)
+            # EXTRACTION COMPLÈTE DIRECTE (seulement les sections demandées)
             full_content = await page.evaluate(r"""
-                () => {
+                (sections) => {
+                    const want = new Set(sections);
                     const result = {
                         metadata: {},
                         text: {},
@@ -884,7 +1141,7 @@ class PlaywrightFetcher:
                     };
                     
                     // ===== MÉTADONNÉES COMPLÈTES =====
-                    result.metadata = {
+                    if (want.has('metadata')) result.metadata = {
                         title: document.title || '',
                         url: window.location.href,
                         description: document.querySelector('meta[name="description"]')?.content || '',
@@ -914,9 +1171,8 @@ class PlaywrightFetcher:
                     };
                     
                     // ===== TEXTE =====
-                    result.text = {
+                    if (want.has('text')) result.text = {
                         fullText: document.body.innerText || '',
-                        html: document.documentElement.outerHTML,
                         headings: {
                             h1: Array.from(document.querySelectorAll('h1')).map(h => h.textContent.trim()).filter(Boolean),
                             h2: Array.from(document.querySelectorAll('h2')).map(h => h.textContent.trim()).filter(Boolean),
@@ -931,9 +1187,10 @@ class PlaywrightFetcher:
                             items: Array.from(list.querySelectorAll('li')).map(li => li.textContent.trim()).filter(Boolean)
                         }))
                     };
+                    if (want.has('html')) result.text.html = document.documentElement.outerHTML;
                     
                     // ===== IMAGES =====
-                    result.media.images = Array.from(document.querySelectorAll('img')).map((img, index) => ({
+                    if (want.has('images')) result.media.images = Array.from(document.querySelectorAll('img')).map((img, index) => ({
                         src: img.src || '',
                         alt: img.alt || '',
                         title: img.title || '',
@@ -942,24 +1199,10 @@ class PlaywrightFetcher:
                         index
                     })).filter(img => img.src);
                     
-                    // Images background CSS
-                    result.media.backgroundImages = Array.from(document.querySelectorAll('*'))
-                        .filter(el => {
-                            const bg = window.getComputedStyle(el).backgroundImage;
-                            return bg && bg !== 'none' && bg.includes('url');
-                        })
-                        .map((el, index) => {
-                            const bg = window.getComputedStyle(el).backgroundImage;
-                            const urlMatch = bg.match(/url\\(['"]?([^'"]+)['"]?\\)/);
-                            return {
-                                url: urlMatch ? urlMatch[1] : bg,
-                                element: el.tagName,
-                                index
-                            };
-                        });
+                    // Images background CSS : scan CSSOM séparé (background_images.py)
                     
                     // ===== VIDÉOS =====
-                    result.media.videos = Array.from(document.querySelectorAll('video')).map((video, index) => ({
+                    if (want.has('videos')) result.media.videos = Array.from(document.querySelectorAll('video')).map((video, index) => ({
                         src: video.src || video.currentSrc || '',
                         poster: video.poster || '',
                         width: video.width || 0,
@@ -968,21 +1211,21 @@ class PlaywrightFetcher:
                     })).filter(video => video.src);
                     
                     // ===== AUDIO =====
-                    result.media.audios = Array.from(document.querySelectorAll('audio')).map((audio, index) => ({
+                    if (want.has('audios')) result.media.audios = Array.from(document.querySelectorAll('audio')).map((audio, index) => ({
                         src: audio.src || audio.currentSrc || '',
                         controls: audio.controls,
                         index
                     })).filter(audio => audio.src);
                     
                     // ===== IFRAMES =====
-                    result.media.iframes = Array.from(document.querySelectorAll('iframe')).map((iframe, index) => ({
+                    if (want.has('iframes')) result.media.iframes = Array.from(document.querySelectorAll('iframe')).map((iframe, index) => ({
                         src: iframe.src || '',
                         title: iframe.title || '',
                         index
                     })).filter(iframe => iframe.src);
                     
                     // ===== LIENS =====
-                    result.links = Array.from(document.querySelectorAll('a')).map((a, index) => ({
+                    if (want.has('links')) result.links = Array.from(document.querySelectorAll('a')).map((a, index) => ({
                         href: a.href || '',
                         text: a.textContent.trim(),
                         title: a.title || '',
@@ -990,7 +1233,7 @@ class PlaywrightFetcher:
                     })).filter(link => link.href && link.text);
                     
                     // ===== FICHIERS =====
-                    result.files = Array.from(document.querySelectorAll('a[href]'))
+                    if (want.has('files')) result.files = Array.from(document.querySelectorAll('a[href]'))
                         .filter(a => {
                             const href = (a.href || '').toLowerCase();
                             return /\\.(pdf|doc|docx|xls|xlsx|ppt|pptx|zip|rar|7z|tar|gz|csv|txt|json|xml)$/.test(href);
@@ -1003,7 +1246,7 @@ class PlaywrightFetcher:
                         }));
                     
                     // ===== FORMULAIRES =====
-                    result.forms = Array.from(document.querySelectorAll('form')).map((form, index) => ({
+                    if (want.has('forms')) result.forms = Array.from(document.querySelectorAll('form')).map((form, index) => ({
                         action: form.action || '',
                         method: form.method || 'get',
                         id: form.id || '',
@@ -1011,7 +1254,7 @@ class PlaywrightFetcher:
                     }));
                     
                     // ===== TABLEAUX =====
-                    result.tables = Array.from(document.querySelectorAll('table')).map((table, index) => ({
+                    if (want.has('tables')) result.tables = Array.from(document.querySelectorAll('table')).map((table, index) => ({
                         headers: Array.from(table.querySelectorAll('th')).map(th => th.textContent.trim()),
                         rows: Array.from(table.querySelectorAll('tr')).map(tr => 
                             Array.from(tr.querySelectorAll('td')).map(td => td.textContent.trim())
@@ -1020,7 +1263,7 @@ class PlaywrightFetcher:
                     }));
                     
                     // ===== DONNÉES STRUCTURÉES =====
-                    result.structuredData = Array.from(document.querySelectorAll('script[type="application/ld+json"]'))
+                    if (want.has('structured_data')) result.structuredData = Array.from(document.querySelectorAll('script[type="application/ld+json"]'))
                         .map(script => {
                             try {
                                 return JSON.parse(script.textContent);
@@ -1030,9 +1273,17 @@ class PlaywrightFetcher:
                         })
                         .filter(Boolean);
                     
+                    // ===== SCRIPTS ET STYLES =====
+                    if (want.has('scripts')) result.scripts = Array.from(document.querySelectorAll('script[src]')).map(s => s.src).filter(Boolean);
+                    if (want.has('styles')) result.styles = Array.from(document.querySelectorAll('link[rel="stylesheet"]')).map(l => l.href).filter(Boolean);
+                    
                     return result;
                 }
-            """)
+            """, sections)
+            background_scan = None
+            if 'background_images' in sections:
+                background_scan = await scan_background_images(page)
+                full_content['media']['backgroundImages'] = background_scan.pop('images')
             
             # Calculer statistiques
             summary = self._calculate_summary_direct(full_content)
@@ -1043,8 +1294,14 @@ class PlaywrightFetcher:
                 'data': full_content,
                 'summary': summary,
                 'url': url,
+                'http_status': response.status if response is not None else None,
                 'extraction_type': 'ultra_complete',
                 'extraction_method': 'playwright_fetcher_optimized',
+                'resource_savings': record_resource_usage(usage),
+                'settle_seconds': round(settle_seconds, 3),
+                'scroll': scroll_report,
+                'sections': sections,
+                'background_scan': background_scan,
                 'optimizations_used': [
                     'Headers anti-détection avancés',
                     'User-Agent rotation automatique', 
@@ -1055,6 +1312,8 @@ class PlaywrightFetcher:
                 ],
                 'timestamp': time.time()
             }
+            if capture is not None:
+                result['network_collections'] = await capture.finish()
             
             print("✅ Extraction PlaywrightFetcher optimisée terminée !")
             print(f"   📝 Texte: {summary['total_text_length']:,} caractères")
@@ -1071,134 +1330,11 @@ class PlaywrightFetcher:
                 'url': url,
                 'extraction_method': 'playwright_fetcher_optimized'
             }
-        finally:
-            await page.close()
-    
-    async def _inject_anti_detection_scripts(self, page):
-        """
-        🛡️ Injection des scripts anti-détection ultra-avancés
-        Couvre: WebDriver masking, Chrome runtime, fingerprinting, etc.
-        """
-        await page.add_init_script("""
-            // =================== MASQUAGE WEBDRIVER ===================
-            
-            // 1. Masquer la propriété webdriver
-            Object.defineProperty(navigator, 'webdriver', {
-                get: () => undefined
-            });
-            
-            // 2. Supprimer les flags d'automation
-            delete window.cdc_adoQpoasnfa76pfcZLmcfl_Array;
-            delete window.cdc_adoQpoasnfa76pfcZLmcfl_Promise;
-            delete window.cdc_adoQpoasnfa76pfcZLmcfl_Symbol;
-            
-            // =================== CHROME RUNTIME ===================
-            
-            // 3. Simuler l'objet Chrome (critique pour Cloudflare)
-            window.chrome = {
-                runtime: {
-                    connect: () => {},
-                    sendMessage: () => {},
-                    onConnect: { addListener: () => {}, removeListener: () => {} },
-                    onMessage: { addListener: () => {}, removeListener: () => {} }
-                },
-                loadTimes: function() {
-                    return {
-                        commitLoadTime: Math.random() * 1000 + 1000,
-                        connectionInfo: 'h2',
-                        finishDocumentLoadTime: Math.random() * 1000 + 2000,
-                        finishLoadTime: Math.random() * 1000 + 2500,
-                        navigationType: 'Navigation'
-                    };
-                },
-                app: { isInstalled: false }
-            };
-            
-            // =================== PLUGINS RÉALISTES ===================
-            
-            // 4. Simuler des plugins de navigateur réalistes
-            Object.defineProperty(navigator, 'plugins', {
-                get: () => {
-                    const plugins = [
-                        { name: 'Chrome PDF Plugin', filename: 'internal-pdf-viewer', length: 1 },
-                        { name: 'Chrome PDF Viewer', filename: 'mhjfbmdgcfjbbpaeojofohoefgiehjai', length: 1 },
-                        { name: 'Native Client', filename: 'internal-nacl-plugin', length: 2 }
-                    ];
-                    plugins.refresh = () => {};
-                    return plugins;
-                }
-            });
-            
-            // =================== PERMISSIONS API ===================
-            
-            // 5. Mockup permissions réalistes
-            const originalQuery = window.navigator.permissions.query;
-            window.navigator.permissions.query = (parameters) => {
-                if (parameters.name === 'notifications') {
-                    return Promise.resolve({ state: 'prompt' });
-                }
-                return Promise.resolve({ state: 'prompt' });
-            };
-            
-            // =================== WEBGL PROTECTION ===================
-            
-            // 6. Masquer les infos GPU WebGL
-            const getParameter = WebGLRenderingContext.prototype.getParameter;
-            WebGLRenderingContext.prototype.getParameter = function(parameter) {
-                const fakeValues = {
-                    37445: 'Intel Inc.',
-                    37446: 'Intel Iris OpenGL Engine'
-                };
-                return fakeValues[parameter] || getParameter.apply(this, [parameter]);
-            };
-            
-            // =================== HARDWARE MASKING ===================
-            
-            // 7. Hardware concurrency réaliste
-            Object.defineProperty(navigator, 'hardwareConcurrency', {
-                get: () => [4, 8, 12, 16][Math.floor(Math.random() * 4)]
-            });
-            
-            // 8. Device memory réaliste
-            Object.defineProperty(navigator, 'deviceMemory', {
-                get: () => [4, 8, 16][Math.floor(Math.random() * 3)]
-            });
-            
-            // 9. Platform cohérent
-            Object.defineProperty(navigator, 'platform', {
-                get: () => 'Win32'
-            });
-            
-            Object.defineProperty(navigator, 'vendor', {
-                get: () => 'Google Inc.'
-            });
-            
-            console.info('🛡️ Anti-detection scripts loaded');
-        """)
-        print("   🛡️ Scripts anti-détection injectés")
+        # La page est fermée par le lease (après mesure de la mémoire du renderer)
     
-    async def _auto_scroll(self, page):
-        """Scroll automatique optimisé"""
-        await page.evaluate("""
-            async () => {
-                await new Promise((resolve) => {
-                    let totalHeight = 0;
-                    const distance = 100;
-                    const timer = setInterval(() => {
-                        const scrollHeight = document.body.scrollHeight;
-                        window.scrollBy(0, distance);
-                        totalHeight += distance;
-
-                        if (totalHeight >= scrollHeight) {
-                            clearInterval(timer);
-                            window.scrollTo(0, 0);
-                            resolve();
-                        }
-                    }, 100);
-                });
-            }
-        """)
-        await asyncio.sleep(1)
+    async def _auto_scroll(self, page, waiter: Optional[QuiescenceWaiter] = None) -> dict:
+        """Scroll adaptatif par hauteur d'écran, arrêté quand la page ne grandit plus (auto_scroller.py)"""
+        return await AdaptiveScroller().run(page, waiter)
     
     def _calculate_summary_direct(self, content: dict) -> dict:
         """Calculer un résumé des données extraites directement"""
@@ -0,0 +1,404 @@
+# backend/src/core/http_cache.py
+# Cache HTTP sur disque sous le client partagé (RFC 9111, cache privé)
+# Fraîcheur via Cache-Control/Expires, revalidation ETag/Last-Modified, éviction LRU par taille
+# RELEVANT FILES: http_client.py, fetcher_playwright.py, site_estimator.py, path_finder.py
+
+import hashlib
+import json
+import os
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional, Tuple
+
+import httpx
+
+
+# Configuration du cache (surchargeable par variables d'environnement)
+HTTP_CACHE_CONFIG = {
+    'enabled': os.getenv('HTTP_CACHE_ENABLED', '1') == '1',
+    'directory': os.getenv(
+        'HTTP_CACHE_DIR',
+        os.path.join(os.path.dirname(__file__), '..', '..', '.cache', 'http')
+    ),
+    'max_size_mb': float(os.getenv('HTTP_CACHE_MAX_MB', '200')),
+    'heuristic_fraction': 0.1,         # 10 % de (Date - Last-Modified), RFC 9111 §4.2.2
+    'heuristic_max_lifetime': 24 * 3600
+}
+
+# Statuts cachables sans fraîcheur explicite (RFC 9110 §15.1)
+_HEURISTIC_STATUSES = {200, 203, 204, 206, 300, 301, 308, 404, 405, 410, 414, 501}
+# En-têtes qui décrivent le transport, pas la représentation stockée (corps déjà décodé)
+_TRANSPORT_HEADERS = {'content-encoding', 'content-length', 'transfer-encoding', 'connection', 'keep-alive'}
+
+
+def _parse_cache_control(value: str) -> Dict[str, Optional[str]]:
+    directives = {}
+    for part in (value or '').split(','):
+        part = part.strip()
+        if not part:
+            continue
+        name, _, arg = part.partition('=')
+        directives[name.strip().lower()] = arg.strip().strip('"') or None
+    return directives
+
+
+def _parse_http_date(value: Optional[str]) -> Optional[float]:
+    if not value:
+        return None
+    try:
+        return parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+def _seconds(value: Optional[str]) -> Optional[int]:
+    try:
+        return max(0, int(value))
+    except (TypeError, ValueError):
+        return None
+
+
+class CacheEntry:
+    """Réponse stockée : métadonnées (JSON) + corps décodé."""
+
+    def __init__(self, key: str, meta: Dict, body: bytes):
+        self.key = key
+        self.meta = meta
+        self.body = body
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        return self.meta['headers']
+
+    def _header(self, name: str) -> Optional[str]:
+        for key, value in self.headers.items():
+            if key.lower() == name:
+                return value
+        return None
+
+    def freshness_lifetime(self) -> float:
+        """Durée de fraîcheur (RFC 9111 §4.2.1), heuristique si aucune directive explicite."""
+        cache_control = _parse_cache_control(self._header('cache-control'))
+        max_age = _seconds(cache_control.get('max-age'))
+        if max_age is not None:
+            return max_age
+
+        date = _parse_http_date(self._header('date')) or self.meta['response_time']
+        expires = _parse_http_date(self._header('expires'))
+        if self._header('expires') is not None:
+            return max(0.0, expires - date) if expires else 0.0
+
+        last_modified = _parse_http_date(self._header('last-modified'))
+        if last_modified and self.meta['status_code'] in _HEURISTIC_STATUSES:
+            return min(
+                (date - last_modified) * HTTP_CACHE_CONFIG['heuristic_fraction'],
+                HTTP_CACHE_CONFIG['heuristic_max_lifetime']
+            )
+        return 0.0
+
+    def current_age(self) -> float:
+        """Âge courant (RFC 9111 §4.2.3, simplifié : horloges supposées cohérentes)."""
+        age_header = _seconds(self._header('age')) or 0
+        return age_header + max(0.0, time.time() - self.meta['response_time'])
+
+    def is_fresh(self) -> bool:
+        cache_control = _parse_cache_control(self._header('cache-control'))
+        if 'no-cache' in cache_control:
+            return False
+        return self.freshness_lifetime() > self.current_age()
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """En-têtes de revalidation (If-None-Match / If-Modified-Since)."""
+        headers = {}
+        etag = self._header('etag')
+        last_modified = self._header('last-modified')
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+        return headers
+
+    def matches_vary(self, request_headers: Dict[str, str]) -> bool:
+        """Le cache ne sert une entrée que si les en-têtes listés par Vary concordent."""
+        stored = self.meta.get('vary', {})
+        if '*' in stored:
+            return False
+        lowered = {k.lower(): v for k, v in (request_headers or {}).items()}
+        return all(lowered.get(name) == value for name, value in stored.items())
+
+    def to_response(self, method: str = 'GET') -> httpx.Response:
+        return httpx.Response(
+            status_code=self.meta['status_code'],
+            headers=self.headers,
+            content=self.body,
+            request=httpx.Request(method, self.meta['url'])
+        )
+
+
+class HttpCache:
+    """
+    Cache HTTP privé sur disque, partagé par le processus.
+
+    Cache-Control de la requête : seul no-store est honoré. Les valeurs
+    max-age=0/no-cache envoyées par get_optimal_headers() imitent un
+    navigateur vis-à-vis du serveur et ne sont pas une politique de cache.
+    """
+
+    def __init__(self, directory: Optional[str] = None, max_size_mb: Optional[float] = None):
+        self.directory = os.path.abspath(directory or HTTP_CACHE_CONFIG['directory'])
+        self.max_size = int((max_size_mb or HTTP_CACHE_CONFIG['max_size_mb']) * 1024 * 1024)
+        self._lock = threading.Lock()
+        self._index: Optional[Dict[str, Tuple[int, float]]] = None   # clé -> (taille, dernier accès)
+        self.stats = {
+            'hits': 0,
+            'misses': 0,
+            'revalidations': 0,
+            'not_modified': 0,
+            'stores': 0,
+            'evictions': 0,
+            'bytes_saved': 0
+        }
+
+    # =================== STOCKAGE ===================
+
+    @staticmethod
+    def make_key(method: str, url: str, follow_redirects: bool = False) -> str:
+        """
+        Clé d'une requête. Suivre ou non les redirections change la réponse obtenue pour une même URL
+        (3xx d'un côté, page finale de l'autre) : les deux cas ne partagent jamais une entrée.
+        """
+        suffix = ' follow' if follow_redirects else ''
+        return hashlib.sha256(f"{method.upper()} {url}{suffix}".encode()).hexdigest()
+
+    def _paths(self, key: str) -> Tuple[str, str]:
+        base = os.path.join(self.directory, key[:2], key)
+        return base + '.json', base + '.body'
+
+    def _load_index(self):
+        """Reconstruit l'index LRU depuis le disque (au premier accès)."""
+        if self._index is not None:
+            return
+        self._index = {}
+        if not os.path.isdir(self.directory):
+            return
+        for root, _, files in os.walk(self.directory):
+            for name in files:
+                if not name.endswith('.body'):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                self._index[name[:-5]] = (stat.st_size, stat.st_mtime)
+
+    def _read(self, key: str) -> Optional[CacheEntry]:
+        meta_path, body_path = self._paths(key)
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            with open(body_path, 'rb') as f:
+                body = f.read()
+        except (OSError, ValueError):
+            return None
+        return CacheEntry(key, meta, body)
+
+    def _write(self, key: str, meta: Dict, body: bytes):
+        meta_path, body_path = self._paths(key)
+        os.makedirs(os.path.dirname(meta_path), exist_ok=True)
+        suffix = f".{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(body_path + suffix, 'wb') as f:
+            f.write(body)
+        with open(meta_path + suffix, 'w', encoding='utf-8') as f:
+            json.dump(meta, f)
+        os.replace(body_path + suffix, body_path)
+        os.replace(meta_path + suffix, meta_path)
+
+    def _delete(self, key: str):
+        for path in self._paths(key):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def _touch(self, key: str, size: int):
+        now = time.time()
+        self._index[key] = (size, now)
+        try:
+            os.utime(self._paths(key)[1], (now, now))
+        except OSError:
+            pass
+
+    def _evict(self):
+        """Éviction LRU jusqu'à repasser sous la taille maximale."""
+        total = sum(size for size, _ in self._index.values())
+        if total <= self.max_size:
+            return
+        for key, (size, _) in sorted(self._index.items(), key=lambda item: item[1][1]):
+            self._delete(key)
+            del self._index[key]
+            self.stats['evictions'] += 1
+            total -= size
+            if total <= self.max_size:
+                break
+
+    # =================== API ===================
+
+    def lookup(
+        self, method: str, url: str, request_headers: Optional[Dict[str, str]] = None,
+        follow_redirects: bool = False
+    ) -> Optional[CacheEntry]:
+        """Entrée stockée pour la requête (fraîche ou à revalider), None si absente."""
+        if method.upper() != 'GET' or self._request_forbids(request_headers):
+            return None
+        key = self.make_key(method, url, follow_redirects)
+        with self._lock:
+            self._load_index()
+            if key not in self._index:
+                self.stats['misses'] += 1
+                return None
+            entry = self._read(key)
+            if entry is None or not entry.matches_vary(request_headers):
+                self.stats['misses'] += 1
+                return None
+            self._touch(key, len(entry.body))
+        return entry
+
+    def serve(self, entry: CacheEntry, method: str = 'GET') -> httpx.Response:
+        """Réponse fraîche servie depuis le disque."""
+        with self._lock:
+            self.stats['hits'] += 1
+            self.stats['bytes_saved'] += len(entry.body)
+        response = entry.to_response(method)
+        response.extensions['from_cache'] = True
+        return response
+
+    def handle_response(
+        self,
+        method: str,
+        url: str,
+        request_headers: Optional[Dict[str, str]],
+        entry: Optional[CacheEntry],
+        response: httpx.Response,
+        follow_redirects: bool = False
+    ) -> httpx.Response:
+        """
+        Traite la réponse réseau : 304 -> entrée rafraîchie et servie,
+        sinon stockage si la réponse est cachable.
+        """
+        if entry is not None and response.status_code == 304:
+            merged = dict(entry.headers)
+            for name, value in response.headers.items():
+                if name.lower() not in _TRANSPORT_HEADERS:
+                    merged[name] = value
+            entry.meta['headers'] = merged
+            entry.meta['response_time'] = time.time()
+            with self._lock:
+                self._write(entry.key, entry.meta, entry.body)
+                self.stats['revalidations'] += 1
+                self.stats['not_modified'] += 1
+                self.stats['bytes_saved'] += len(entry.body)
+            revalidated = entry.to_response(method)
+            revalidated.extensions['from_cache'] = True
+            return revalidated
+
+        if entry is not None:
+            with self._lock:
+                self.stats['revalidations'] += 1
+        if self._is_storable(method, request_headers, response):
+            self.store(method, url, request_headers, response, follow_redirects)
+        return response
+
+    def store(
+        self, method: str, url: str, request_headers: Optional[Dict[str, str]], response: httpx.Response,
+        follow_redirects: bool = False
+    ):
+        lowered = {k.lower(): v for k, v in (request_headers or {}).items()}
+        vary_names = [v.strip().lower() for v in response.headers.get('vary', '').split(',') if v.strip()]
+        meta = {
+            'url': str(response.url),
+            'status_code': response.status_code,
+            'headers': {k: v for k, v in response.headers.items() if k.lower() not in _TRANSPORT_HEADERS},
+            'vary': {name: lowered.get(name) for name in vary_names},
+            'response_time': time.time()
+        }
+        body = response.content
+        if len(body) > self.max_size:
+            return
+        key = self.make_key(method, url, follow_redirects)
+        with self._lock:
+            self._load_index()
+            try:
+                self._write(key, meta, body)
+            except OSError as e:
+                print(f"⚠️ Cache HTTP: écriture impossible ({e})")
+                return
+            self._touch(key, len(body))
+            self.stats['stores'] += 1
+            self._evict()
+
+    @staticmethod
+    def _request_forbids(request_headers: Optional[Dict[str, str]]) -> bool:
+        for name, value in (request_headers or {}).items():
+            if name.lower() == 'cache-control' and 'no-store' in _parse_cache_control(value):
+                return True
+        return False
+
+    def _is_storable(self, method: str, request_headers: Optional[Dict[str, str]], response: httpx.Response) -> bool:
+        """Réponse stockable (RFC 9111 §3) ; redirections temporaires exclues."""
+        if method.upper() != 'GET' or self._request_forbids(request_headers):
+            return False
+        if any(r.status_code not in (301, 308) for r in response.history):
+            return False
+        cache_control = _parse_cache_control(response.headers.get('cache-control'))
+        if 'no-store' in cache_control:
+            return False
+        if response.headers.get('vary', '').strip() == '*':
+            return False
+        explicit = (
+            'max-age' in cache_control
+            or 'expires' in response.headers
+            or 'public' in cache_control
+        )
+        if response.status_code in _HEURISTIC_STATUSES and (
+            explicit or 'etag' in response.headers or 'last-modified' in response.headers
+        ):
+            return True
+        return explicit and response.status_code < 400
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            self._load_index()
+            lookups = self.stats['hits'] + self.stats['misses'] + self.stats['revalidations']
+            return {
+                **self.stats,
+                'hit_ratio': round((self.stats['hits'] + self.stats['not_modified']) / lookups, 3) if lookups else 0.0,
+                'entries': len(self._index),
+                'size_mb': round(sum(size for size, _ in self._index.values()) / (1024 * 1024), 2),
+                'max_size_mb': round(self.max_size / (1024 * 1024), 2)
+            }
+
+    def clear(self):
+        with self._lock:
+            self._load_index()
+            for key in list(self._index):
+                self._delete(key)
+            self._index = {}
+
+
+# Instance globale (singleton pattern)
+_cache_instance = None
+_cache_lock = threading.Lock()
+
+
+def get_http_cache() -> Optional[HttpCache]:
+    """Cache HTTP du processus, ou None s'il est désactivé (HTTP_CACHE_ENABLED=0)."""
+    global _cache_instance
+    if not HTTP_CACHE_CONFIG['enabled']:
+        return None
+    if _cache_instance is None:
+        with _cache_lock:
+            if _cache_instance is None:
+                _cache_instance = HttpCache()
+    return _cache_instance
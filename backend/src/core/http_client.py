@@ -0,0 +1,324 @@
+# backend/src/core/http_client.py
+# Client HTTP partagé (sync + async) pour tous les fetchs statiques de src/core
+# Keep-alive, HTTP/2 si h2 est installé, limite de connexions par hôte, stats de réutilisation
+# Les GET passent par le cache disque de http_cache.py (désactivable par requête avec cache=False)
+# RELEVANT FILES: http_cache.py, fetcher.py, fetcher_playwright.py, site_checker.py, site_estimator.py, path_finder.py, subdomain_finder.py
+
+import asyncio
+import os
+import threading
+import weakref
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+import httpx
+
+from .http_cache import get_http_cache
+
+try:
+    import h2  # noqa: F401  (requis par httpx pour HTTP/2)
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+    print("⚠️ h2 non disponible - client HTTP partagé en HTTP/1.1 uniquement")
+
+
+# Configuration du client partagé (surchargeable par variables d'environnement)
+HTTP_CLIENT_CONFIG = {
+    'http2': os.getenv('HTTP_CLIENT_HTTP2', '1') == '1',
+    'max_connections': int(os.getenv('HTTP_CLIENT_MAX_CONNECTIONS', '100')),
+    'max_keepalive_connections': int(os.getenv('HTTP_CLIENT_MAX_KEEPALIVE', '20')),
+    'keepalive_expiry': float(os.getenv('HTTP_CLIENT_KEEPALIVE_EXPIRY', '30')),
+    'max_connections_per_host': int(os.getenv('HTTP_CLIENT_MAX_PER_HOST', '6')),
+    'default_timeout': 20.0
+}
+
+
+class SharedHttpClient:
+    """
+    Couche HTTP partagée par le processus.
+
+    - Un httpx.Client par valeur de `verify` (la vérification TLS est fixée au niveau client)
+    - Un httpx.AsyncClient par boucle asyncio et par `verify` (les clients async sont liés à leur boucle)
+    - Headers, timeout et follow_redirects restent choisis à chaque requête
+    - Au plus max_connections_per_host requêtes simultanées vers un même hôte
+
+    La réutilisation est mesurée via l'extension `trace` de httpcore :
+    une requête envoyée sans nouvelle connexion TCP a réutilisé une connexion
+    keep-alive ou un flux HTTP/2 multiplexé.
+    """
+
+    def __init__(
+        self,
+        http2: Optional[bool] = None,
+        max_connections: Optional[int] = None,
+        max_keepalive_connections: Optional[int] = None,
+        keepalive_expiry: Optional[float] = None,
+        max_connections_per_host: Optional[int] = None
+    ):
+        use_http2 = HTTP_CLIENT_CONFIG['http2'] if http2 is None else http2
+        self.http2 = use_http2 and HTTP2_AVAILABLE
+        self.max_connections_per_host = max(
+            1, max_connections_per_host or HTTP_CLIENT_CONFIG['max_connections_per_host']
+        )
+        self.limits = httpx.Limits(
+            max_connections=max_connections or HTTP_CLIENT_CONFIG['max_connections'],
+            max_keepalive_connections=max_keepalive_connections or HTTP_CLIENT_CONFIG['max_keepalive_connections'],
+            keepalive_expiry=keepalive_expiry or HTTP_CLIENT_CONFIG['keepalive_expiry']
+        )
+
+        self._lock = threading.Lock()
+        self._clients: Dict[bool, httpx.Client] = {}
+        self._async_clients = weakref.WeakKeyDictionary()   # boucle -> {verify: AsyncClient}
+        self._host_semaphores: Dict[str, threading.BoundedSemaphore] = {}
+        self._async_host_semaphores = weakref.WeakKeyDictionary()   # boucle -> {hôte: Semaphore}
+
+        self.stats = {
+            'requests': 0,
+            'connections_opened': 0,
+            'http2_responses': 0,
+            'errors': 0,
+            'hosts': {}
+        }
+
+    # =================== CLIENTS ===================
+
+    def _client_kwargs(self, verify: bool) -> Dict:
+        return {
+            'http2': self.http2,
+            'limits': self.limits,
+            'verify': verify,
+            'timeout': HTTP_CLIENT_CONFIG['default_timeout']
+        }
+
+    def get_client(self, verify: bool = True) -> httpx.Client:
+        """Client synchrone partagé (créé à la première utilisation)."""
+        client = self._clients.get(verify)
+        if client is None:
+            with self._lock:
+                client = self._clients.get(verify)
+                if client is None:
+                    client = httpx.Client(**self._client_kwargs(verify))
+                    self._clients[verify] = client
+        return client
+
+    def get_async_client(self, verify: bool = True) -> httpx.AsyncClient:
+        """Client asynchrone partagé pour la boucle courante."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            clients = self._async_clients.setdefault(loop, {})
+            client = clients.get(verify)
+            if client is None:
+                client = httpx.AsyncClient(**self._client_kwargs(verify))
+                clients[verify] = client
+        return client
+
+    # =================== LIMITES PAR HÔTE ===================
+
+    def _host_semaphore(self, host: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            semaphore = self._host_semaphores.get(host)
+            if semaphore is None:
+                semaphore = threading.BoundedSemaphore(self.max_connections_per_host)
+                self._host_semaphores[host] = semaphore
+        return semaphore
+
+    def _async_host_semaphore(self, host: str) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            semaphores = self._async_host_semaphores.setdefault(loop, {})
+            semaphore = semaphores.get(host)
+            if semaphore is None:
+                semaphore = asyncio.Semaphore(self.max_connections_per_host)
+                semaphores[host] = semaphore
+        return semaphore
+
+    # =================== STATISTIQUES ===================
+
+    def _host_stats(self, host: str) -> Dict:
+        return self.stats['hosts'].setdefault(host, {'requests': 0, 'connections_opened': 0})
+
+    def _record_event(self, host: str, event_name: str):
+        """Compte les requêtes envoyées et les connexions TCP ouvertes (redirections incluses)."""
+        if event_name == 'connection.connect_tcp.complete':
+            key = 'connections_opened'
+        elif event_name.endswith('send_request_headers.started'):
+            key = 'requests'
+        else:
+            return
+        with self._lock:
+            self.stats[key] += 1
+            self._host_stats(host)[key] += 1
+
+    def _record_response(self, response: httpx.Response):
+        if response.http_version == 'HTTP/2':
+            with self._lock:
+                self.stats['http2_responses'] += 1
+
+    def _record_error(self):
+        with self._lock:
+            self.stats['errors'] += 1
+
+    def get_stats(self) -> Dict:
+        """Statistiques de réutilisation des connexions (globales et par hôte)."""
+        with self._lock:
+            requests_sent = self.stats['requests']
+            opened = self.stats['connections_opened']
+            return {
+                'requests': requests_sent,
+                'connections_opened': opened,
+                'connections_reused': max(0, requests_sent - opened),
+                'reuse_ratio': round(1 - opened / requests_sent, 3) if requests_sent else 0.0,
+                'http2_enabled': self.http2,
+                'http2_responses': self.stats['http2_responses'],
+                'errors': self.stats['errors'],
+                'hosts': {host: dict(values) for host, values in self.stats['hosts'].items()}
+            }
+
+    def get_cache_stats(self) -> Optional[Dict]:
+        """Statistiques du cache disque (None s'il est désactivé)."""
+        http_cache = get_http_cache()
+        return http_cache.get_stats() if http_cache is not None else None
+
+    def reset_stats(self):
+        with self._lock:
+            self.stats.update({'requests': 0, 'connections_opened': 0, 'http2_responses': 0, 'errors': 0, 'hosts': {}})
+
+    # =================== REQUÊTES ===================
+
+    def request(self, method: str, url: str, verify: bool = True, cache: bool = True, **kwargs) -> httpx.Response:
+        """
+        Requête synchrone via le client partagé.
+        kwargs : ceux de httpx.Client.request (headers, timeout, follow_redirects...).
+        cache=False contourne le cache disque (mesures en direct, ex. SiteChecker).
+        """
+        http_cache = get_http_cache() if cache else None
+        if http_cache is None:
+            return self._send(method, url, verify, kwargs)
+
+        request_headers = kwargs.get('headers')
+        follow_redirects = bool(kwargs.get('follow_redirects', False))
+        entry = http_cache.lookup(method, url, request_headers, follow_redirects)
+        if entry is not None and entry.is_fresh():
+            return http_cache.serve(entry, method)
+        if entry is not None:
+            kwargs['headers'] = {**(request_headers or {}), **entry.conditional_headers()}
+
+        response = self._send(method, url, verify, kwargs)
+        return http_cache.handle_response(method, url, request_headers, entry, response, follow_redirects)
+
+    def _send(self, method: str, url: str, verify: bool, kwargs: Dict) -> httpx.Response:
+        host = urlparse(url).netloc
+        extensions = dict(kwargs.pop('extensions', None) or {})
+        extensions['trace'] = lambda event_name, info: self._record_event(host, event_name)
+
+        with self._host_semaphore(host):
+            try:
+                response = self.get_client(verify).request(method, url, extensions=extensions, **kwargs)
+            except Exception:
+                self._record_error()
+                raise
+        self._record_response(response)
+        return response
+
+    def get(self, url: str, **kwargs) -> httpx.Response:
+        return self.request('GET', url, **kwargs)
+
+    def head(self, url: str, **kwargs) -> httpx.Response:
+        return self.request('HEAD', url, **kwargs)
+
+    async def arequest(self, method: str, url: str, verify: bool = True, cache: bool = True, **kwargs) -> httpx.Response:
+        """Requête asynchrone via le client partagé de la boucle courante (accès disque hors boucle)."""
+        http_cache = get_http_cache() if cache else None
+        if http_cache is None:
+            return await self._asend(method, url, verify, kwargs)
+
+        request_headers = kwargs.get('headers')
+        follow_redirects = bool(kwargs.get('follow_redirects', False))
+        entry = await asyncio.to_thread(http_cache.lookup, method, url, request_headers, follow_redirects)
+        if entry is not None and entry.is_fresh():
+            return http_cache.serve(entry, method)
+        if entry is not None:
+            kwargs['headers'] = {**(request_headers or {}), **entry.conditional_headers()}
+
+        response = await self._asend(method, url, verify, kwargs)
+        return await asyncio.to_thread(
+            http_cache.handle_response, method, url, request_headers, entry, response, follow_redirects
+        )
+
+    async def _asend(self, method: str, url: str, verify: bool, kwargs: Dict) -> httpx.Response:
+        host = urlparse(url).netloc
+
+        async def _trace(event_name, info):
+            self._record_event(host, event_name)
+
+        extensions = dict(kwargs.pop('extensions', None) or {})
+        extensions['trace'] = _trace
+
+        async with self._async_host_semaphore(host):
+            try:
+                response = await self.get_async_client(verify).request(method, url, extensions=extensions, **kwargs)
+            except Exception:
+                self._record_error()
+                raise
+        self._record_response(response)
+        return response
+
+    async def aget(self, url: str, **kwargs) -> httpx.Response:
+        return await self.arequest('GET', url, **kwargs)
+
+    async def ahead(self, url: str, **kwargs) -> httpx.Response:
+        return await self.arequest('HEAD', url, **kwargs)
+
+    # =================== FERMETURE ===================
+
+    def close(self):
+        """Ferme les clients synchrones (les clients async sont fermés par aclose())."""
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients = {}
+        for client in clients:
+            try:
+                client.close()
+            except Exception:
+                pass
+
+    async def aclose(self):
+        """Ferme les clients async de la boucle courante."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            clients = list(self._async_clients.pop(loop, {}).values())
+        for client in clients:
+            try:
+                await client.aclose()
+            except Exception:
+                pass
+
+
+# Instance globale (singleton pattern)
+_http_client_instance = None
+_http_client_lock = threading.Lock()
+
+
+def get_http_client() -> SharedHttpClient:
+    """Obtenir le client HTTP partagé du processus."""
+    global _http_client_instance
+    if _http_client_instance is None:
+        with _http_client_lock:
+            if _http_client_instance is None:
+                _http_client_instance = SharedHttpClient()
+    return _http_client_instance
+
+
+def get_http_stats() -> Dict:
+    """Raccourci : statistiques de réutilisation du client partagé."""
+    return get_http_client().get_stats()
+
+
+def close_http_client():
+    """Fermer le client HTTP partagé"""
+    global _http_client_instance
+    with _http_client_lock:
+        if _http_client_instance is not None:
+            _http_client_instance.close()
+            _http_client_instance = None
@@ -0,0 +1,113 @@
+# backend/src/core/loop_runner.py
+# Boucle asyncio longue durée dans un thread dédié, partagée par tout le processus
+# Le code synchrone (threads Django) y soumet ses coroutines au lieu d'appeler asyncio.run()
+# RELEVANT FILES: browser_pool.py, fetcher_playwright.py, http_client.py
+
+import asyncio
+import atexit
+import concurrent.futures
+import threading
+from typing import Any, Optional
+
+
+class LoopRunner:
+    """
+    Boucle asyncio exécutée en permanence dans un thread daemon.
+
+    - run(coro)       : depuis du code synchrone, bloque jusqu'au résultat
+    - submit(coro)    : depuis du code synchrone, renvoie un concurrent.futures.Future
+    - run_async(coro) : depuis une autre boucle asyncio
+
+    Toutes les coroutines soumises partagent la même boucle : les objets liés
+    à une boucle (navigateurs Playwright, httpx.AsyncClient) sont réutilisés
+    d'un appel à l'autre au lieu d'être recréés par asyncio.run().
+    """
+
+    def __init__(self, name: str = 'scraper-loop'):
+        self.name = name
+        self._loop = None
+        self._thread = None
+        self._lock = threading.Lock()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """Boucle du runner (démarrée à la première utilisation)."""
+        with self._lock:
+            if self._loop is None or not self._thread.is_alive():
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=self._loop.run_forever,
+                    name=self.name,
+                    daemon=True
+                )
+                self._thread.start()
+            return self._loop
+
+    def in_loop(self) -> bool:
+        """True si l'appelant s'exécute déjà sur la boucle du runner."""
+        try:
+            return asyncio.get_running_loop() is self._loop
+        except RuntimeError:
+            return False
+
+    def submit(self, coro) -> concurrent.futures.Future:
+        """Planifie une coroutine sur la boucle du runner."""
+        loop = self.loop
+        if self.in_loop():
+            coro.close()
+            raise RuntimeError(f"{self.name}: soumission bloquante depuis sa propre boucle, utiliser 'await'")
+        return asyncio.run_coroutine_threadsafe(coro, loop)
+
+    def run(self, coro, timeout: Optional[float] = None) -> Any:
+        """Exécute une coroutine sur la boucle du runner depuis du code synchrone."""
+        return self.submit(coro).result(timeout)
+
+    async def run_async(self, coro) -> Any:
+        """Exécute une coroutine sur la boucle du runner depuis n'importe quelle boucle."""
+        loop = self.loop
+        if self.in_loop():
+            return await coro
+        return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, loop))
+
+    def shutdown(self, timeout: float = 10.0):
+        """Arrête la boucle et attend la fin du thread."""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = None
+            self._thread = None
+        if loop is None or not thread.is_alive():
+            return
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout=timeout)
+
+
+# Instance globale (singleton pattern)
+_runner_instance = None
+_runner_lock = threading.Lock()
+
+
+def get_loop_runner() -> LoopRunner:
+    """Obtenir la boucle partagée du processus."""
+    global _runner_instance
+    if _runner_instance is None:
+        with _runner_lock:
+            if _runner_instance is None:
+                _runner_instance = LoopRunner()
+    return _runner_instance
+
+
+def run_sync(coro, timeout: Optional[float] = None) -> Any:
+    """Remplaçant de asyncio.run() pour le code synchrone : exécute sur la boucle partagée."""
+    return get_loop_runner().run(coro, timeout)
+
+
+def shutdown_loop_runner():
+    """Arrêter la boucle partagée"""
+    global _runner_instance
+    with _runner_lock:
+        if _runner_instance is not None:
+            _runner_instance.shutdown()
+            _runner_instance = None
+
+
+atexit.register(shutdown_loop_runner)
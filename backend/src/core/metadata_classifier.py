@@ -5,9 +5,10 @@
 
 from typing import Dict, Optional
 from bs4 import BeautifulSoup
-import httpx
 import json
 
+from .http_client import get_http_client
+
 
 class MetadataClassifier:
     """
@@ -260,11 +261,10 @@ class MetadataClassifier:
             Dict avec classification ou None
         """
         try:
-            with httpx.Client(timeout=self.timeout, follow_redirects=True) as client:
-                response = client.get(url, headers={'User-Agent': self.user_agent})
-                
-                if response.status_code == 200:
-                    return self.classify_from_metadata(response.text, url)
+            response = get_http_client().get(url, headers={'User-Agent': self.user_agent}, timeout=self.timeout, follow_redirects=True)
+            
+            if response.status_code == 200:
+                return self.classify_from_metadata(response.text, url)
         except Exception as e:
             print(f"[!] Erreur fetch metadata: {e}")
         
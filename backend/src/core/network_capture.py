@@ -0,0 +1,244 @@
+# backend/src/core/network_capture.py
+# Capture des réponses JSON (XHR/fetch) pendant le rendu Playwright
+# Détecte les tableaux d'objets (listes de produits, annonces...) et les renvoie comme collections
+# Les endpoints découverts sont mémorisés pour être rappelés directement en HTTP (sans rendu ni heuristiques DOM)
+# RELEVANT FILES: fetcher_playwright.py, http_client.py, analyzer.py
+
+import asyncio
+import json
+import os
+import threading
+import time
+from collections import Counter
+from typing import Any, Dict, List, Optional
+
+from .http_client import get_http_client
+from .rate_limiter import get_rate_limiter
+
+
+# Configuration de la capture (surchargeable par variables d'environnement)
+NETWORK_CAPTURE_CONFIG = {
+    'max_responses': int(os.getenv('NETWORK_CAPTURE_MAX_RESPONSES', '60')),
+    'max_body_bytes': int(os.getenv('NETWORK_CAPTURE_MAX_BYTES', str(5 * 1024 * 1024))),
+    'min_items': int(os.getenv('NETWORK_CAPTURE_MIN_ITEMS', '3')),
+    'min_shared_keys': 0.5,     # part des clés communes aux objets d'un tableau
+    'sample_size': 5,
+    'endpoint_ttl': float(os.getenv('NETWORK_CAPTURE_ENDPOINT_TTL', '86400'))
+}
+
+# Headers de requête utiles pour rejouer un appel d'API hors navigateur
+_REPLAY_HEADERS = ('accept', 'content-type', 'x-requested-with', 'accept-language')
+
+
+def _is_json_response(response) -> bool:
+    content_type = (response.headers.get('content-type') or '').lower()
+    return 'json' in content_type and response.request.resource_type in ('xhr', 'fetch')
+
+
+def _shared_keys_ratio(items: List[Dict]) -> float:
+    counts = Counter(key for item in items for key in item.keys())
+    if not counts:
+        return 0.0
+    shared = sum(1 for count in counts.values() if count >= len(items) * 0.8)
+    return shared / len(counts)
+
+
+def find_collections(payload: Any, path: str = '$', min_items: Optional[int] = None) -> List[Dict]:
+    """
+    Tableaux d'objets homogènes d'un payload JSON (parcours en profondeur).
+    Renvoie [{'path': '$.data.products', 'items': [...], 'fields': [...]}, ...], plus grand d'abord.
+    """
+    min_items = min_items or NETWORK_CAPTURE_CONFIG['min_items']
+    collections = []
+
+    def _walk(value: Any, current: str):
+        if isinstance(value, dict):
+            for key, child in value.items():
+                _walk(child, f"{current}.{key}")
+        elif isinstance(value, list):
+            objects = [item for item in value if isinstance(item, dict)]
+            if (len(objects) >= min_items and len(objects) >= len(value) * 0.8
+                    and _shared_keys_ratio(objects) >= NETWORK_CAPTURE_CONFIG['min_shared_keys']):
+                fields = [key for key, _ in Counter(k for item in objects for k in item).most_common()]
+                collections.append({'path': current, 'items': objects, 'fields': fields})
+                return   # les tableaux imbriqués dans les items font partie de la collection
+            for index, child in enumerate(value[:50]):
+                _walk(child, f"{current}[{index}]")
+
+    _walk(payload, path)
+    return sorted(collections, key=lambda c: len(c['items']), reverse=True)
+
+
+def _collection(endpoint: Dict, items: List[Dict], fields: Optional[List[str]] = None) -> Dict:
+    if fields is None:
+        fields = [key for key, _ in Counter(k for item in items for k in item).most_common()]
+    return {
+        'endpoint': endpoint,
+        'items_count': len(items),
+        'fields': fields,
+        'items': items,
+        'sample': items[:NETWORK_CAPTURE_CONFIG['sample_size']]
+    }
+
+
+def extract_at_path(payload: Any, path: str) -> Any:
+    """Valeur d'un chemin '$.a.b[0].c' produit par find_collections."""
+    value = payload
+    for token in path.lstrip('$').replace('[', '.[').split('.'):
+        if not token:
+            continue
+        if token.startswith('['):
+            value = value[int(token[1:-1])]
+        else:
+            value = value[token]
+    return value
+
+
+class NetworkCapture:
+    """
+    Enregistre les réponses JSON d'une page pendant la navigation et le scroll.
+
+        capture = NetworkCapture(page_url)
+        await capture.attach(page)      # avant page.goto
+        ...                             # navigation, scroll
+        collections = await capture.finish()
+    """
+
+    def __init__(self, page_url: str):
+        self.page_url = page_url
+        self.responses: List[Dict] = []
+        self._tasks: List[asyncio.Task] = []
+        self.skipped = 0
+
+    async def attach(self, page):
+        page.on('response', self._on_response)
+
+    def _on_response(self, response):
+        if not _is_json_response(response) or response.status != 200:
+            return
+        if len(self._tasks) >= NETWORK_CAPTURE_CONFIG['max_responses']:
+            self.skipped += 1
+            return
+        self._tasks.append(asyncio.ensure_future(self._read(response)))
+
+    async def _read(self, response):
+        try:
+            length = response.headers.get('content-length')
+            if length and length.isdigit() and int(length) > NETWORK_CAPTURE_CONFIG['max_body_bytes']:
+                self.skipped += 1
+                return
+            body = await response.body()
+            if len(body) > NETWORK_CAPTURE_CONFIG['max_body_bytes']:
+                self.skipped += 1
+                return
+            request = response.request
+            self.responses.append({
+                'url': response.url,
+                'method': request.method,
+                'post_data': request.post_data,
+                'headers': {k: v for k, v in request.headers.items() if k.lower() in _REPLAY_HEADERS},
+                'payload': json.loads(body)
+            })
+        except Exception:
+            # Corps indisponible (page fermée, redirection) ou JSON invalide
+            self.skipped += 1
+
+    async def finish(self) -> List[Dict]:
+        """Attend les lectures en cours et renvoie les collections trouvées, avec leur endpoint."""
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        collections = []
+        for captured in self.responses:
+            for found in find_collections(captured['payload']):
+                endpoint = {
+                    'url': captured['url'],
+                    'method': captured['method'],
+                    'post_data': captured['post_data'],
+                    'headers': captured['headers'],
+                    'path': found['path']
+                }
+                collections.append(_collection(endpoint, found['items'], found['fields']))
+        collections.sort(key=lambda c: c['items_count'], reverse=True)
+        if collections:
+            print(f"📡 {len(collections)} collection(s) JSON capturée(s) sur {len(self.responses)} réponse(s)")
+            get_endpoint_registry().record(self.page_url, [c['endpoint'] for c in collections])
+        return collections
+
+
+async def replay_endpoint(endpoint: Dict, timeout_seconds: float = 20.0) -> List[Dict]:
+    """Rappelle un endpoint capturé en HTTP et renvoie les items au même chemin JSON."""
+    await get_rate_limiter().wait_async(endpoint['url'])
+    response = await get_http_client().arequest(
+        endpoint['method'], endpoint['url'],
+        headers=endpoint.get('headers') or None,
+        content=endpoint.get('post_data'),
+        timeout=timeout_seconds,
+        follow_redirects=True,
+        verify=False
+    )
+    response.raise_for_status()
+    items = extract_at_path(response.json(), endpoint['path'])
+    return [item for item in items if isinstance(item, dict)] if isinstance(items, list) else []
+
+
+class EndpointRegistry:
+    """Endpoints JSON découverts par page (mémoire du processus, avec TTL)."""
+
+    def __init__(self, ttl: Optional[float] = None):
+        self.ttl = ttl or NETWORK_CAPTURE_CONFIG['endpoint_ttl']
+        self._lock = threading.Lock()
+        self._endpoints: Dict[str, Dict] = {}
+
+    def record(self, page_url: str, endpoints: List[Dict]):
+        with self._lock:
+            self._endpoints[page_url] = {'endpoints': endpoints, 'recorded_at': time.time()}
+
+    def lookup(self, page_url: str) -> List[Dict]:
+        with self._lock:
+            entry = self._endpoints.get(page_url)
+            if entry is None:
+                return []
+            if time.time() - entry['recorded_at'] > self.ttl:
+                del self._endpoints[page_url]
+                return []
+            return list(entry['endpoints'])
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            return {
+                'pages': len(self._endpoints),
+                'endpoints': sum(len(e['endpoints']) for e in self._endpoints.values())
+            }
+
+
+# Instance globale (singleton pattern)
+_registry_instance = None
+_registry_lock = threading.Lock()
+
+
+def get_endpoint_registry() -> EndpointRegistry:
+    global _registry_instance
+    if _registry_instance is None:
+        with _registry_lock:
+            if _registry_instance is None:
+                _registry_instance = EndpointRegistry()
+    return _registry_instance
+
+
+async def fetch_known_collections(page_url: str, timeout_seconds: float = 20.0) -> Optional[List[Dict]]:
+    """
+    Collections d'une page déjà capturée, récupérées directement en HTTP.
+    None si aucun endpoint n'est connu ou si un rappel échoue (il faut alors rendre la page).
+    """
+    endpoints = get_endpoint_registry().lookup(page_url)
+    if not endpoints:
+        return None
+    collections = []
+    for endpoint in endpoints:
+        try:
+            items = await replay_endpoint(endpoint, timeout_seconds)
+        except Exception as e:
+            print(f"⚠️ Endpoint {endpoint['url']} non rejouable: {e}")
+            return None
+        collections.append(_collection(endpoint, items))
+    return collections
@@ -1,13 +1,16 @@
 # backend/src/core/page_detector.py
 # Détection intelligente de pages avec screenshot
-# Utilise Playwright pour rapidité + rendu JS
+# Utilise Playwright pour rapidité + rendu JS (navigateur emprunté au pool partagé)
 
-from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeout
+from playwright.async_api import TimeoutError as PlaywrightTimeout
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin, urlparse
 from typing import Dict, List, Set
 import base64
-import time
+
+from .browser_pool import get_browser_pool
+from .resource_policy import get_resource_policy, record_resource_usage
+from .wait_strategy import QuiescenceWaiter
 
 
 class PageDetector:
@@ -42,25 +45,29 @@ class PageDetector:
             'stats': {}
         }
         
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            context = browser.new_context(
-                viewport={'width': 1920, 'height': 1080},
-                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-            )
-            page = context.new_page()
-            
+        return get_browser_pool().run(self._analyze_async(result, max_depth))
+    
+    async def _analyze_async(self, result: Dict, max_depth: int) -> Dict:
+        """Corps de analyze_with_screenshot, exécuté sur la boucle du pool."""
+        async with get_browser_pool().page(
+            viewport={'width': 1920, 'height': 1080},
+            user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+        ) as page:
             try:
+                # Médias et traqueurs bloqués (rendu visuel gardé pour le screenshot)
+                usage = await get_resource_policy('screenshot').attach(page)
+                waiter = QuiescenceWaiter().attach(page)
+                
                 # 1. Charger homepage + screenshot
                 try:
-                    page.goto(self.base_url, timeout=self.timeout, wait_until='networkidle')
+                    await page.goto(self.base_url, timeout=self.timeout, wait_until='networkidle')
                 except PlaywrightTimeout:
                     # Fallback si networkidle est trop long
-                    page.goto(self.base_url, timeout=self.timeout, wait_until='domcontentloaded')
+                    await page.goto(self.base_url, timeout=self.timeout, wait_until='domcontentloaded')
                 
                 # Screenshot full page (peut échouer sur certains sites très longs, donc on fallback sur viewport si besoin)
                 try:
-                    screenshot_bytes = page.screenshot(full_page=False, type='png') # Viewport seulement pour la rapidité
+                    screenshot_bytes = await page.screenshot(full_page=False, type='png') # Viewport seulement pour la rapidité
                 except:
                     screenshot_bytes = None
 
@@ -68,9 +75,9 @@ class PageDetector:
                     result['screenshot'] = base64.b64encode(screenshot_bytes).decode()
                 
                 # 2. Extraire les liens (après rendu JS)
-                page.wait_for_timeout(2000)  # Attendre animations/lazy loading
+                await waiter.wait(page, max_wait=2, kind='screenshot')  # Animations/lazy loading (2s max)
                 
-                html = page.content()
+                html = await page.content()
                 soup = BeautifulSoup(html, 'html.parser')
                 
                 # 3. Analyser navigation principale
@@ -119,14 +126,13 @@ class PageDetector:
                     'images_count': len(soup.find_all('img')),
                     'forms_count': len(soup.find_all('form')),
                     'external_links': len(soup.find_all('a', href=lambda h: h and not self._is_internal(h))),
-                    'has_pagination': self._detect_pagination(soup)
+                    'has_pagination': self._detect_pagination(soup),
+                    'resources': record_resource_usage(usage)
                 }
                 
             except Exception as e:
                 print(f"Erreur PageDetector: {e}")
                 result['error'] = str(e)
-            finally:
-                browser.close()
         
         return result
     
@@ -0,0 +1,185 @@
+# backend/src/core/parsed_page.py
+# Document parsé une seule fois et partagé par analyzer, ContentDetector et AIStructureValidator
+# Un seul parsing lxml par page, textes (brut, normalisé, minuscules) calculés à la demande et mis en cache,
+# index balise / classe / id construits en un parcours et réutilisés par les sélecteurs simples,
+# jetons du balisage (classes, id, itemprop, attributs) par élément pour l'identification des champs
+# RELEVANT FILES: analyzer.py, content_detector.py, ai_structure_validator.py, selector_matcher.py
+
+import re
+from functools import cached_property
+from typing import Callable, Dict, FrozenSet, List, Optional, Tuple, Union
+
+from bs4 import BeautifulSoup, Tag
+
+from .selector_matcher import SelectorMatcher
+
+
+# Sélecteurs servis par les index (une balise, une classe ou un id seuls)
+_TAG_SELECTOR_RE = re.compile(r'^[a-zA-Z][a-zA-Z0-9-]*$')
+_CLASS_SELECTOR_RE = re.compile(r'^\.(-?[_a-zA-Z][\w-]*)$')
+_ID_SELECTOR_RE = re.compile(r'^#(-?[_a-zA-Z][\w-]*)$')
+_TOKEN_RE = re.compile(r'\w+')
+
+
+class ElementTokens:
+    """
+    Jetons du balisage d'un sous-arbre : noms de balises, noms et valeurs d'attributs
+    (class, id, itemprop, href, src...), en minuscules et découpés sur les caractères non alphanumériques.
+    `mot in jetons` équivaut à chercher le mot dans le HTML sérialisé, hors texte : recherche dans l'ensemble,
+    puis à l'intérieur des jetons (« price » dans « productprice »).
+    """
+
+    __slots__ = ('tokens', '_joined')
+
+    def __init__(self, tokens: FrozenSet[str]):
+        self.tokens = tokens
+        self._joined: Optional[str] = None
+
+    def __contains__(self, word: str) -> bool:
+        if word in self.tokens:
+            return True
+        if self._joined is None:
+            self._joined = ' '.join(self.tokens)
+        return word in self._joined
+
+
+class ParsedPage:
+    """
+    Page HTML parsée une fois.
+
+        page = ParsedPage(html, url)
+        page.soup                  # arbre BeautifulSoup (lxml)
+        page.text_lower            # texte complet en minuscules (calculé une fois)
+        page.select('.product')    # via l'index des classes, résultat mis en cache
+
+    Les composants acceptent indifféremment un HTML brut ou une ParsedPage (ParsedPage.ensure).
+    """
+
+    def __init__(self, html: str, url: str = ''):
+        self.html = html or ''
+        self.url = url
+        self.soup = BeautifulSoup(self.html, 'lxml')
+        self._select_cache: Dict[str, List[Tag]] = {}
+        self._match_cache: Dict[SelectorMatcher, Dict[str, List[Tag]]] = {}
+        self._tag_tokens: Dict[int, Tuple[str, ...]] = {}
+        self._element_tokens: Dict[int, ElementTokens] = {}
+        self._element_texts: Dict[int, str] = {}
+        self._memo: Dict[object, object] = {}
+
+    @classmethod
+    def ensure(cls, page_or_html: Union['ParsedPage', str], url: str = '') -> 'ParsedPage':
+        """Réutilise une ParsedPage existante, ou parse un HTML brut."""
+        if isinstance(page_or_html, ParsedPage):
+            return page_or_html
+        return cls(page_or_html, url)
+
+    # =================== TEXTES ===================
+
+    @cached_property
+    def text(self) -> str:
+        """Texte complet du document (get_text brut, scripts compris comme avant)."""
+        return self.soup.get_text()
+
+    @cached_property
+    def text_lower(self) -> str:
+        return self.text.lower()
+
+    @cached_property
+    def normalized_text(self) -> str:
+        """Texte aux espaces normalisés (séparateur espace, blancs retirés)."""
+        return self.soup.get_text(separator=' ', strip=True)
+
+    # =================== INDEX ===================
+
+    @cached_property
+    def _indexes(self):
+        """Index balise, classe et id, construits en un seul parcours (ordre du document)."""
+        by_tag: Dict[str, List[Tag]] = {}
+        by_class: Dict[str, List[Tag]] = {}
+        by_id: Dict[str, List[Tag]] = {}
+        for tag in self.soup.find_all(True):
+            by_tag.setdefault(tag.name, []).append(tag)
+            for class_name in tag.get('class') or ():
+                bucket = by_class.setdefault(class_name, [])
+                # Classe répétée sur un même élément (class="a a") : une seule entrée
+                if not bucket or bucket[-1] is not tag:
+                    bucket.append(tag)
+            element_id = tag.get('id')
+            if element_id:
+                by_id.setdefault(element_id, []).append(tag)
+        return by_tag, by_class, by_id
+
+    @property
+    def tags_by_name(self) -> Dict[str, List[Tag]]:
+        return self._indexes[0]
+
+    @property
+    def tags_by_class(self) -> Dict[str, List[Tag]]:
+        return self._indexes[1]
+
+    @property
+    def tags_by_id(self) -> Dict[str, List[Tag]]:
+        return self._indexes[2]
+
+    def select(self, selector: str) -> List[Tag]:
+        """
+        soup.select mis en cache par sélecteur ; les sélecteurs simples (balise, .classe, #id)
+        sont servis par les index sans reparcourir l'arbre. Ne pas modifier la liste renvoyée.
+        """
+        selector = selector.strip()
+        cached = self._select_cache.get(selector)
+        if cached is not None:
+            return cached
+        if _TAG_SELECTOR_RE.match(selector):
+            result = self.tags_by_name.get(selector.lower(), [])
+        elif _CLASS_SELECTOR_RE.match(selector):
+            result = self.tags_by_class.get(selector[1:], [])
+        elif _ID_SELECTOR_RE.match(selector):
+            result = self.tags_by_id.get(selector[1:], [])
+        else:
+            result = self.soup.select(selector)
+        self._select_cache[selector] = result
+        return result
+
+    def match(self, matcher: SelectorMatcher) -> Dict[str, List[Tag]]:
+        """Groupes d'une table de sélecteurs compilée, en un seul parcours (mis en cache par table)."""
+        cached = self._match_cache.get(matcher)
+        if cached is None:
+            cached = self._match_cache[matcher] = matcher.match(self.soup)
+        return cached
+
+    def memo(self, key, compute: Callable[[], object]):
+        """Résultat d'un calcul sur la page (ex. passage d'un moteur de motifs), mémorisé par clé."""
+        if key not in self._memo:
+            self._memo[key] = compute()
+        return self._memo[key]
+
+    # =================== ÉLÉMENTS ===================
+
+    def _own_tokens(self, tag: Tag) -> Tuple[str, ...]:
+        """Jetons d'une balise seule (nom, attributs), calculés une fois par balise."""
+        tokens = self._tag_tokens.get(id(tag))
+        if tokens is None:
+            parts = [tag.name]
+            for name, value in tag.attrs.items():
+                parts.append(name)
+                parts.append(value if isinstance(value, str) else ' '.join(value))
+            tokens = self._tag_tokens[id(tag)] = tuple(_TOKEN_RE.findall(' '.join(parts).lower()))
+        return tokens
+
+    def element_tokens(self, element: Tag) -> ElementTokens:
+        """Jetons du balisage du sous-arbre de `element` (remplace str(element).lower())."""
+        cached = self._element_tokens.get(id(element))
+        if cached is None:
+            tokens = set(self._own_tokens(element))
+            for tag in element.find_all(True):
+                tokens.update(self._own_tokens(tag))
+            cached = self._element_tokens[id(element)] = ElementTokens(frozenset(tokens))
+        return cached
+
+    def element_text_lower(self, element: Tag) -> str:
+        """element.get_text().lower(), calculé une fois par élément."""
+        text = self._element_texts.get(id(element))
+        if text is None:
+            text = self._element_texts[id(element)] = element.get_text().lower()
+        return text
@@ -3,12 +3,13 @@
 # Utilise des sources passives (Wayback Machine, Common Crawl, etc.)
 # RELEVANT FILES: subdomain_finder.py, analyzer.py, site_checker.py
 
-import httpx
 import re
 from typing import Dict, List, Set
 from urllib.parse import urlparse, urljoin
 from bs4 import BeautifulSoup
 
+from .http_client import get_http_client
+
 
 def find_paths_wayback(domain: str, timeout: int = 15) -> Set[str]:
     """
@@ -21,25 +22,24 @@ def find_paths_wayback(domain: str, timeout: int = 15) -> Set[str]:
         # API Wayback Machine pour obtenir toutes les URLs archivées
         url = f"http://web.archive.org/cdx/search/cdx?url={domain}/*&output=json&fl=original&collapse=urlkey"
         
-        with httpx.Client(timeout=timeout, follow_redirects=True) as client:
-            response = client.get(url)
+        response = get_http_client().get(url, timeout=timeout, follow_redirects=True)
+        
+        if response.status_code == 200:
+            data = response.json()
             
-            if response.status_code == 200:
-                data = response.json()
-                
-                # Première ligne est l'en-tête, on la saute
-                for entry in data[1:]:
-                    if entry and len(entry) > 0:
-                        archived_url = entry[0]
-                        parsed = urlparse(archived_url)
-                        
-                        # Extraire le chemin
-                        if parsed.path and parsed.path != '/':
-                            # Nettoyer le chemin
-                            path = parsed.path.rstrip('/')
-                            if path and not path.startswith('/wp-'):  # Ignorer WordPress admin
-                                paths.add(path)
-    
+            # Première ligne est l'en-tête, on la saute
+            for entry in data[1:]:
+                if entry and len(entry) > 0:
+                    archived_url = entry[0]
+                    parsed = urlparse(archived_url)
+                    
+                    # Extraire le chemin
+                    if parsed.path and parsed.path != '/':
+                        # Nettoyer le chemin
+                        path = parsed.path.rstrip('/')
+                        if path and not path.startswith('/wp-'):  # Ignorer WordPress admin
+                            paths.add(path)
+
     except Exception as e:
         print(f"[Wayback] Erreur: {e}")
     
@@ -97,34 +97,33 @@ def find_paths_sitemap(base_url: str, timeout: int = 10) -> Set[str]:
     ]
     
     try:
-        with httpx.Client(timeout=timeout, follow_redirects=True) as client:
-            for sitemap_path in sitemap_urls:
-                sitemap_url = urljoin(base_url, sitemap_path)
+        for sitemap_path in sitemap_urls:
+            sitemap_url = urljoin(base_url, sitemap_path)
+            
+            try:
+                response = get_http_client().get(sitemap_url, timeout=timeout, follow_redirects=True)
                 
-                try:
-                    response = client.get(sitemap_url)
+                if response.status_code == 200:
+                    # Parser le XML
+                    soup = BeautifulSoup(response.content, 'xml')
                     
-                    if response.status_code == 200:
-                        # Parser le XML
-                        soup = BeautifulSoup(response.content, 'xml')
-                        
-                        # Trouver tous les <loc> tags
-                        for loc in soup.find_all('loc'):
-                            url = loc.get_text().strip()
-                            parsed = urlparse(url)
-                            
-                            if parsed.path and parsed.path != '/':
-                                path = parsed.path.rstrip('/')
-                                if path:
-                                    paths.add(path)
+                    # Trouver tous les <loc> tags
+                    for loc in soup.find_all('loc'):
+                        url = loc.get_text().strip()
+                        parsed = urlparse(url)
                         
-                        # Si on a trouvé des URLs, pas besoin de chercher d'autres sitemaps
-                        if paths:
-                            break
-                
-                except:
-                    continue
-    
+                        if parsed.path and parsed.path != '/':
+                            path = parsed.path.rstrip('/')
+                            if path:
+                                paths.add(path)
+                    
+                    # Si on a trouvé des URLs, pas besoin de chercher d'autres sitemaps
+                    if paths:
+                        break
+            
+            except:
+                continue
+
     except Exception as e:
         print(f"[Sitemap] Erreur: {e}")
     
@@ -140,32 +139,31 @@ def find_paths_robots(base_url: str, timeout: int = 10) -> Set[str]:
     try:
         robots_url = urljoin(base_url, '/robots.txt')
         
-        with httpx.Client(timeout=timeout, follow_redirects=True) as client:
-            response = client.get(robots_url)
+        response = get_http_client().get(robots_url, timeout=timeout, follow_redirects=True)
+        
+        if response.status_code == 200:
+            lines = response.text.split('\n')
             
-            if response.status_code == 200:
-                lines = response.text.split('\n')
+            for line in lines:
+                line = line.strip()
                 
-                for line in lines:
-                    line = line.strip()
+                # Chercher les directives Disallow et Allow
+                if line.startswith('Disallow:') or line.startswith('Allow:'):
+                    path = line.split(':', 1)[1].strip()
                     
-                    # Chercher les directives Disallow et Allow
-                    if line.startswith('Disallow:') or line.startswith('Allow:'):
-                        path = line.split(':', 1)[1].strip()
-                        
-                        # Nettoyer les wildcards
-                        path = path.replace('*', '').rstrip('/')
-                        
-                        if path and path != '/' and not path.startswith('#'):
-                            paths.add(path)
+                    # Nettoyer les wildcards
+                    path = path.replace('*', '').rstrip('/')
                     
-                    # Chercher les références aux sitemaps
-                    elif line.startswith('Sitemap:'):
-                        sitemap_url = line.split(':', 1)[1].strip()
-                        parsed = urlparse(sitemap_url)
-                        if parsed.path and parsed.path != '/':
-                            paths.add(parsed.path.rstrip('/'))
-    
+                    if path and path != '/' and not path.startswith('#'):
+                        paths.add(path)
+                
+                # Chercher les références aux sitemaps
+                elif line.startswith('Sitemap:'):
+                    sitemap_url = line.split(':', 1)[1].strip()
+                    parsed = urlparse(sitemap_url)
+                    if parsed.path and parsed.path != '/':
+                        paths.add(parsed.path.rstrip('/'))
+
     except Exception as e:
         print(f"[Robots.txt] Erreur: {e}")
     
@@ -179,28 +177,27 @@ def find_paths_crawl_homepage(base_url: str, timeout: int = 10) -> Set[str]:
     paths = set()
     
     try:
-        with httpx.Client(timeout=timeout, follow_redirects=True) as client:
-            response = client.get(base_url)
+        response = get_http_client().get(base_url, timeout=timeout, follow_redirects=True)
+        
+        if response.status_code == 200:
+            soup = BeautifulSoup(response.content, 'html.parser')
+            base_domain = urlparse(base_url).netloc
             
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
-                base_domain = urlparse(base_url).netloc
+            # Trouver tous les liens <a>
+            for link in soup.find_all('a', href=True):
+                href = link['href']
                 
-                # Trouver tous les liens <a>
-                for link in soup.find_all('a', href=True):
-                    href = link['href']
-                    
-                    # Construire l'URL absolue
-                    absolute_url = urljoin(base_url, href)
-                    parsed = urlparse(absolute_url)
-                    
-                    # Ne garder que les liens du même domaine
-                    if parsed.netloc == base_domain:
-                        if parsed.path and parsed.path != '/':
-                            path = parsed.path.rstrip('/')
-                            if path and not any(ext in path.lower() for ext in ['.jpg', '.png', '.gif', '.css', '.js', '.pdf']):
-                                paths.add(path)
-    
+                # Construire l'URL absolue
+                absolute_url = urljoin(base_url, href)
+                parsed = urlparse(absolute_url)
+                
+                # Ne garder que les liens du même domaine
+                if parsed.netloc == base_domain:
+                    if parsed.path and parsed.path != '/':
+                        path = parsed.path.rstrip('/')
+                        if path and not any(ext in path.lower() for ext in ['.jpg', '.png', '.gif', '.css', '.js', '.pdf']):
+                            paths.add(path)
+
     except Exception as e:
         print(f"[Crawl Homepage] Erreur: {e}")
     
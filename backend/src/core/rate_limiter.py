@@ -0,0 +1,303 @@
+# backend/src/core/rate_limiter.py
+# Politesse par hôte : un seau à jetons par hôte au lieu d'un sleep global après chaque fetch
+# Seules les requêtes vers un même hôte s'attendent ; Crawl-delay de robots.txt respecté
+# RELEVANT FILES: fetcher_playwright.py, smart_crawler.py, http_client.py, api/views.py
+
+import asyncio
+import os
+import random
+import threading
+import time
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+from .http_client import get_http_client
+
+
+# Configuration de la politesse (surchargeable par variables d'environnement)
+RATE_LIMIT_CONFIG = {
+    'enabled': os.getenv('RATE_LIMIT_ENABLED', '1') == '1',
+    'default_interval': float(os.getenv('RATE_LIMIT_INTERVAL', '1.13')),   # Rate limiting Nginx (1 req/sec)
+    'burst': int(os.getenv('RATE_LIMIT_BURST', '1')),
+    'jitter': float(os.getenv('RATE_LIMIT_JITTER', '0.3')),                # Espacement non régulier (anti-détection)
+    'respect_robots': os.getenv('RATE_LIMIT_RESPECT_ROBOTS', '1') == '1',
+    'max_crawl_delay': float(os.getenv('RATE_LIMIT_MAX_CRAWL_DELAY', '30')),
+    'robots_timeout': 5.0
+}
+
+
+def host_of(url: str) -> str:
+    """Hôte (netloc) d'une URL ; accepte aussi un hôte nu."""
+    return urlparse(url).netloc or url
+
+
+class HostBucket:
+    """
+    Seau à jetons d'un hôte, en ordonnancement virtuel (GCRA) :
+    `burst` requêtes peuvent partir immédiatement, puis une toutes les `interval` secondes.
+    reserve() réserve le prochain créneau et renvoie l'attente correspondante,
+    ce qui sert aussi bien les appelants sync qu'async.
+    """
+
+    def __init__(self, interval: float, burst: int = 1, jitter: float = 0.0):
+        self.interval = max(0.0, interval)
+        self.burst = max(1, burst)
+        self.jitter = max(0.0, jitter)
+        self._next_slot = 0.0          # instant théorique de la prochaine requête (monotonic)
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        with self._lock:
+            now = time.monotonic()
+            tolerance = (self.burst - 1) * self.interval
+            wait = max(0.0, self._next_slot - now - tolerance)
+            spacing = self.interval * (1 + random.uniform(0, self.jitter))
+            self._next_slot = max(self._next_slot, now) + spacing
+            return wait
+
+
+class HostRateLimiter:
+    """
+    Ordonnanceur de politesse partagé par le processus.
+
+    - Intervalle par hôte = max(intervalle configuré, Crawl-delay de robots.txt)
+    - robots.txt lu une seule fois par hôte via le client HTTP partagé (donc le cache disque)
+    - configure_host() applique le délai choisi par l'utilisateur pour un site, le temps d'une session
+      (jamais sous l'intervalle par défaut) ; release() le retire à la fin de la session
+    """
+
+    def __init__(
+        self,
+        default_interval: Optional[float] = None,
+        burst: Optional[int] = None,
+        jitter: Optional[float] = None,
+        respect_robots: Optional[bool] = None
+    ):
+        self.default_interval = RATE_LIMIT_CONFIG['default_interval'] if default_interval is None else default_interval
+        self.burst = burst or RATE_LIMIT_CONFIG['burst']
+        self.jitter = RATE_LIMIT_CONFIG['jitter'] if jitter is None else jitter
+        self.respect_robots = RATE_LIMIT_CONFIG['respect_robots'] if respect_robots is None else respect_robots
+
+        self._lock = threading.Lock()
+        self._buckets: Dict[str, HostBucket] = {}
+        self._overrides: Dict[str, Dict[str, Dict]] = {}       # hôte -> propriétaire -> politesse demandée
+        self._crawl_delays: Dict[str, Optional[float]] = {}   # hôte -> Crawl-delay (None si absent)
+
+        self.stats = {
+            'requests': 0,
+            'delayed': 0,
+            'total_wait': 0.0,
+            'robots_fetched': 0,
+            'hosts': {}
+        }
+
+    # =================== CONFIGURATION ===================
+
+    def configure_host(
+        self, url_or_host: str, interval: Optional[float] = None, burst: Optional[int] = None,
+        owner: str = 'default'
+    ):
+        """
+        Politesse demandée pour un hôte par `owner` (ex. délai saisi dans l'interface pour une session).
+        Ne peut que ralentir l'hôte : intervalle >= intervalle par défaut, rafale <= rafale par défaut ;
+        si plusieurs propriétaires configurent le même hôte, la demande la plus stricte s'applique.
+        """
+        host = host_of(url_or_host)
+        with self._lock:
+            override = self._overrides.setdefault(host, {}).setdefault(owner, {})
+            if interval is not None:
+                override['interval'] = max(self.default_interval, interval)
+            if burst is not None:
+                override['burst'] = min(self.burst, burst)
+        self._refresh_bucket(host)
+
+    def release(self, owner: str):
+        """Retire la politesse demandée par `owner` sur tous ses hôtes (fin de session)."""
+        with self._lock:
+            hosts = [host for host, owners in self._overrides.items() if owners.pop(owner, None) is not None]
+            for host in hosts:
+                if not self._overrides[host]:
+                    del self._overrides[host]
+        for host in hosts:
+            self._refresh_bucket(host)
+
+    def set_crawl_delay(self, url_or_host: str, crawl_delay: Optional[float]):
+        host = host_of(url_or_host)
+        if crawl_delay is not None:
+            crawl_delay = min(float(crawl_delay), RATE_LIMIT_CONFIG['max_crawl_delay'])
+        with self._lock:
+            self._crawl_delays[host] = crawl_delay
+        self._refresh_bucket(host)
+
+    def _refresh_bucket(self, host: str):
+        """Applique la politesse courante au seau existant sans perdre son prochain créneau."""
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is not None:
+                bucket.interval = self.interval_for(host)
+                bucket.burst = max(1, self.burst_for(host))
+
+    def interval_for(self, host: str) -> float:
+        overrides = self._overrides.get(host, {}).values()
+        interval = max([self.default_interval] + [o['interval'] for o in overrides if 'interval' in o])
+        crawl_delay = self._crawl_delays.get(host)
+        return max(interval, crawl_delay or 0.0)
+
+    def burst_for(self, host: str) -> int:
+        overrides = self._overrides.get(host, {}).values()
+        return min([self.burst] + [o['burst'] for o in overrides if 'burst' in o])
+
+    def _bucket(self, host: str) -> HostBucket:
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = HostBucket(self.interval_for(host), self.burst_for(host), self.jitter)
+                self._buckets[host] = bucket
+        return bucket
+
+    # =================== ROBOTS.TXT ===================
+
+    def _robots_pending(self, host: str) -> bool:
+        """True si robots.txt de l'hôte reste à lire (et le marque comme en cours)."""
+        if not self.respect_robots:
+            return False
+        with self._lock:
+            if host in self._crawl_delays:
+                return False
+            self._crawl_delays[host] = None
+            self.stats['robots_fetched'] += 1
+        return True
+
+    @staticmethod
+    def _robots_url(url: str) -> str:
+        parsed = urlparse(url)
+        return f"{parsed.scheme or 'https'}://{parsed.netloc}/robots.txt"
+
+    @staticmethod
+    def parse_crawl_delay(robots_txt: str) -> Optional[float]:
+        """
+        Crawl-delay du groupe `User-agent: *`.
+        Lu à la main : urllib.robotparser n'accepte que des délais entiers.
+        """
+        agents, in_rules, delay = [], False, None
+        for raw_line in robots_txt.splitlines():
+            line = raw_line.split('#', 1)[0].strip()
+            if ':' not in line:
+                continue
+            field, value = (part.strip() for part in line.split(':', 1))
+            field = field.lower()
+            if field == 'user-agent':
+                if in_rules:
+                    agents, in_rules = [], False
+                agents.append(value)
+            else:
+                in_rules = True
+                if field == 'crawl-delay' and '*' in agents:
+                    try:
+                        delay = float(value)
+                    except ValueError:
+                        pass
+        return delay
+
+    def _apply_robots(self, host: str, response):
+        if response.status_code == 200:
+            crawl_delay = self.parse_crawl_delay(response.text)
+            if crawl_delay:
+                print(f"🤖 Crawl-delay {crawl_delay}s respecté pour {host}")
+                self.set_crawl_delay(host, crawl_delay)
+
+    def _load_robots(self, url: str, host: str):
+        try:
+            response = get_http_client().get(
+                self._robots_url(url), timeout=RATE_LIMIT_CONFIG['robots_timeout'],
+                follow_redirects=True, verify=False
+            )
+            self._apply_robots(host, response)
+        except Exception as e:
+            print(f"⚠️ robots.txt illisible pour {host}: {e}")
+
+    async def _aload_robots(self, url: str, host: str):
+        try:
+            response = await get_http_client().aget(
+                self._robots_url(url), timeout=RATE_LIMIT_CONFIG['robots_timeout'],
+                follow_redirects=True, verify=False
+            )
+            self._apply_robots(host, response)
+        except Exception as e:
+            print(f"⚠️ robots.txt illisible pour {host}: {e}")
+
+    # =================== ATTENTE ===================
+
+    def reserve(self, url: str) -> float:
+        """Réserve un créneau pour l'hôte de l'URL et renvoie l'attente nécessaire (s)."""
+        host = host_of(url)
+        wait = self._bucket(host).reserve()
+        with self._lock:
+            host_stats = self.stats['hosts'].setdefault(host, {'requests': 0, 'delayed': 0, 'total_wait': 0.0})
+            self.stats['requests'] += 1
+            host_stats['requests'] += 1
+            if wait > 0:
+                self.stats['delayed'] += 1
+                self.stats['total_wait'] += wait
+                host_stats['delayed'] += 1
+                host_stats['total_wait'] += wait
+        return wait
+
+    def wait(self, url: str) -> float:
+        """Bloque jusqu'au créneau de l'hôte (appelants synchrones)."""
+        if not RATE_LIMIT_CONFIG['enabled']:
+            return 0.0
+        host = host_of(url)
+        if self._robots_pending(host):
+            self._load_robots(url, host)
+        delay = self.reserve(url)
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    async def wait_async(self, url: str) -> float:
+        """Attend le créneau de l'hôte sans bloquer la boucle : les autres hôtes continuent."""
+        if not RATE_LIMIT_CONFIG['enabled']:
+            return 0.0
+        host = host_of(url)
+        if self._robots_pending(host):
+            await self._aload_robots(url, host)
+        delay = self.reserve(url)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return delay
+
+    # =================== STATISTIQUES ===================
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            return {
+                **self.stats,
+                'total_wait': round(self.stats['total_wait'], 3),
+                'crawl_delays': {h: d for h, d in self._crawl_delays.items() if d},
+                'hosts': {
+                    host: {**values, 'total_wait': round(values['total_wait'], 3)}
+                    for host, values in self.stats['hosts'].items()
+                }
+            }
+
+    def reset(self):
+        with self._lock:
+            self._buckets.clear()
+            self._crawl_delays.clear()
+            self.stats.update({'requests': 0, 'delayed': 0, 'total_wait': 0.0, 'robots_fetched': 0, 'hosts': {}})
+
+
+# Instance globale (singleton pattern)
+_rate_limiter_instance = None
+_rate_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> HostRateLimiter:
+    """Obtenir l'ordonnanceur de politesse du processus."""
+    global _rate_limiter_instance
+    if _rate_limiter_instance is None:
+        with _rate_limiter_lock:
+            if _rate_limiter_instance is None:
+                _rate_limiter_instance = HostRateLimiter()
+    return _rate_limiter_instance
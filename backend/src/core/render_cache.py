@@ -0,0 +1,160 @@
+# backend/src/core/render_cache.py
+# Cache mémoire des rendus Playwright (HTML post-rendu et payloads d'extraction)
+# Clé : type de rendu, URL, scroll, sélecteur attendu, classe de User-Agent ; TTL + plafond de taille
+# RELEVANT FILES: fetcher_playwright.py, browser_pool.py
+
+import copy
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+
+# Configuration du cache (surchargeable par variables d'environnement)
+RENDER_CACHE_CONFIG = {
+    'enabled': os.getenv('RENDER_CACHE_ENABLED', '1') == '1',
+    'ttl': float(os.getenv('RENDER_CACHE_TTL', '600')),             # 10 min : analyse -> start -> rescrape
+    'max_size_mb': float(os.getenv('RENDER_CACHE_MAX_MB', '100')),
+    'max_entries': int(os.getenv('RENDER_CACHE_MAX_ENTRIES', '500'))
+}
+
+_MOBILE_MARKERS = ('mobile', 'android', 'iphone', 'ipad')
+
+
+def user_agent_class(user_agent: Optional[str] = None, is_mobile: bool = False) -> str:
+    """Classe de User-Agent (desktop/mobile) : le rendu diffère par classe, pas par version."""
+    if is_mobile or any(marker in (user_agent or '').lower() for marker in _MOBILE_MARKERS):
+        return 'mobile'
+    return 'desktop'
+
+
+def _payload_size(value: Any) -> int:
+    if isinstance(value, (str, bytes)):
+        return len(value)
+    try:
+        return len(json.dumps(value, default=str))
+    except (TypeError, ValueError):
+        return 0
+
+
+class RenderCache:
+    """
+    Cache LRU en mémoire des rendus Chromium, partagé par le processus.
+    Chaque entrée garde la durée du rendu qu'elle évite, pour mesurer
+    les secondes-navigateur économisées.
+    """
+
+    def __init__(
+        self,
+        ttl: Optional[float] = None,
+        max_size_mb: Optional[float] = None,
+        max_entries: Optional[int] = None
+    ):
+        self.ttl = ttl or RENDER_CACHE_CONFIG['ttl']
+        self.max_size = int((max_size_mb or RENDER_CACHE_CONFIG['max_size_mb']) * 1024 * 1024)
+        self.max_entries = max_entries or RENDER_CACHE_CONFIG['max_entries']
+        self._lock = threading.Lock()
+        self._entries: 'OrderedDict[Tuple, Dict]' = OrderedDict()
+        self._size = 0
+        self.stats = {
+            'hits': 0,
+            'misses': 0,
+            'expired': 0,
+            'stores': 0,
+            'evictions': 0,
+            'render_seconds_saved': 0.0
+        }
+
+    @staticmethod
+    def make_key(
+        kind: str,
+        url: str,
+        scroll: bool = False,
+        wait_selector: Optional[str] = None,
+        ua_class: str = 'desktop'
+    ) -> Tuple:
+        return (kind, url, bool(scroll), wait_selector or '', ua_class)
+
+    def get(self, key: Tuple) -> Optional[Any]:
+        """Rendu en cache (copie) ou None si absent/expiré."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats['misses'] += 1
+                return None
+            if time.time() - entry['stored_at'] > self.ttl:
+                self._remove(key)
+                self.stats['expired'] += 1
+                self.stats['misses'] += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats['hits'] += 1
+            self.stats['render_seconds_saved'] += entry['render_seconds']
+            value = entry['value']
+        # Les payloads d'extraction sont des dicts que les appelants complètent
+        return value if isinstance(value, str) else copy.deepcopy(value)
+
+    def put(self, key: Tuple, value: Any, render_seconds: float = 0.0):
+        size = _payload_size(value)
+        if size > self.max_size:
+            return
+        stored = value if isinstance(value, str) else copy.deepcopy(value)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = {
+                'value': stored,
+                'size': size,
+                'stored_at': time.time(),
+                'render_seconds': render_seconds
+            }
+            self._size += size
+            self.stats['stores'] += 1
+            while self._entries and (self._size > self.max_size or len(self._entries) > self.max_entries):
+                self._remove(next(iter(self._entries)))
+                self.stats['evictions'] += 1
+
+    def _remove(self, key: Tuple):
+        entry = self._entries.pop(key)
+        self._size -= entry['size']
+
+    def invalidate(self, url: str):
+        """Supprime tous les rendus d'une URL (toutes options confondues)."""
+        with self._lock:
+            for key in [k for k in self._entries if k[1] == url]:
+                self._remove(key)
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            lookups = self.stats['hits'] + self.stats['misses']
+            return {
+                **self.stats,
+                'render_seconds_saved': round(self.stats['render_seconds_saved'], 2),
+                'hit_ratio': round(self.stats['hits'] / lookups, 3) if lookups else 0.0,
+                'entries': len(self._entries),
+                'size_mb': round(self._size / (1024 * 1024), 2)
+            }
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+
+# Instance globale (singleton pattern)
+_cache_instance = None
+_cache_lock = threading.Lock()
+
+
+def get_render_cache() -> Optional[RenderCache]:
+    """Cache de rendus du processus, ou None s'il est désactivé (RENDER_CACHE_ENABLED=0)."""
+    global _cache_instance
+    if not RENDER_CACHE_CONFIG['enabled']:
+        return None
+    if _cache_instance is None:
+        with _cache_lock:
+            if _cache_instance is None:
+                _cache_instance = RenderCache()
+    return _cache_instance
@@ -0,0 +1,194 @@
+# backend/src/core/render_decision.py
+# Décision statique vs rendu JS : HTTP d'abord, Chromium seulement si la page en a besoin
+# La décision est mémorisée par domaine et motif de chemin (/produit/123 -> /produit/{n})
+# RELEVANT FILES: fetcher_playwright.py, analyzer.py, views.py
+
+import re
+import threading
+import time
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlparse
+
+from lxml import html as lxml_html
+
+
+# Seuils de détection (ajustables)
+RENDER_DECISION_CONFIG = {
+    'min_text_length': 250,        # Texte visible minimal d'une page "réelle"
+    'shell_text_length': 1000,     # En dessous, un point de montage SPA vide = coquille
+    'min_scripts_for_shell': 3,    # Scripts attendus sur une coquille sans point de montage connu
+    'memory_ttl': 24 * 3600,       # Durée de validité d'une décision mémorisée (s)
+    'max_entries': 5000,           # Motifs mémorisés au maximum
+    'host_min_observations': 3     # Observations concordantes pour généraliser au domaine
+}
+
+# Points de montage des frameworks SPA
+_SPA_ROOT_XPATH = (
+    "//*[@id='root' or @id='app' or @id='__next' or @id='__nuxt' or @id='___gatsby' "
+    "or @id='svelte' or @ng-version or @ng-app or @data-reactroot or @data-v-app]"
+)
+
+# Avertissements <noscript> / pages de challenge qui exigent JavaScript
+_JS_REQUIRED_RE = re.compile(
+    r"(enable|activ\w*|turn on|requires?|nécessite|need)\s+(?:\w+\s+){0,3}javascript"
+    r"|javascript\s+(?:is\s+)?(required|disabled|désactivé|requis)"
+    r"|just a moment|checking your browser|vérification de votre navigateur",
+    re.IGNORECASE
+)
+
+_ID_SEGMENT_RE = re.compile(r"^(\d+|[0-9a-f]{8,}|[0-9a-f-]{32,36})$", re.IGNORECASE)
+_NUMBERED_SEGMENT_RE = re.compile(r"\d+")
+
+
+def path_pattern(url: str, max_depth: int = 4) -> str:
+    """
+    Motif de chemin servant de clé de mémoire :
+    les identifiants numériques/hexadécimaux deviennent {id}, les chiffres d'un slug {n}.
+    """
+    segments = [s for s in urlparse(url).path.split('/') if s][:max_depth]
+    pattern = []
+    for segment in segments:
+        if _ID_SEGMENT_RE.match(segment):
+            pattern.append('{id}')
+        else:
+            pattern.append(_NUMBERED_SEGMENT_RE.sub('{n}', segment.lower()))
+    return '/' + '/'.join(pattern)
+
+
+def needs_js_render(html: str) -> Tuple[bool, str]:
+    """
+    Indique si un HTML statique doit être rendu par Chromium.
+    Retourne (besoin_js, raison) ; la raison sert aux logs et aux statistiques.
+    """
+    if not html or not html.strip():
+        return True, 'empty_response'
+
+    try:
+        doc = lxml_html.fromstring(html)
+    except Exception:
+        return True, 'unparsable_html'
+
+    return needs_js_render_doc(doc)
+
+
+def needs_js_render_doc(doc) -> Tuple[bool, str]:
+    """
+    needs_js_render sur un arbre lxml déjà parsé (évite un second parsing).
+    Attention : scripts, styles, noscript et templates sont retirés de l'arbre.
+    """
+    noscript_text = ' '.join(n.text_content() for n in doc.iter('noscript'))
+    script_count = sum(1 for _ in doc.iter('script'))
+
+    # Texte visible (hors scripts, styles, noscript, templates)
+    for node in doc.xpath('//script|//style|//noscript|//template'):
+        node.drop_tree()
+    visible_text = ' '.join(doc.text_content().split())
+    text_length = len(visible_text)
+
+    if _JS_REQUIRED_RE.search(visible_text[:2000]) and text_length < RENDER_DECISION_CONFIG['shell_text_length']:
+        return True, 'js_challenge'
+
+    spa_roots = doc.xpath(_SPA_ROOT_XPATH)
+    if spa_roots and text_length < RENDER_DECISION_CONFIG['shell_text_length']:
+        if any(len(' '.join(root.text_content().split())) < 50 for root in spa_roots):
+            return True, 'spa_shell'
+
+    if text_length < RENDER_DECISION_CONFIG['min_text_length']:
+        if noscript_text and _JS_REQUIRED_RE.search(noscript_text):
+            return True, 'noscript_warning'
+        if script_count >= RENDER_DECISION_CONFIG['min_scripts_for_shell']:
+            return True, 'missing_content'
+
+    return False, 'static_ok'
+
+
+class RenderDecisionMemory:
+    """
+    Mémoire des décisions de rendu par (domaine, motif de chemin).
+    Un domaine dont toutes les pages observées concordent est généralisé
+    aux motifs encore inconnus (SPA complète ou site entièrement statique).
+    """
+
+    def __init__(self, ttl: Optional[float] = None, max_entries: Optional[int] = None):
+        self.ttl = ttl or RENDER_DECISION_CONFIG['memory_ttl']
+        self.max_entries = max_entries or RENDER_DECISION_CONFIG['max_entries']
+        self._lock = threading.Lock()
+        self._patterns: Dict[Tuple[str, str], Dict] = {}
+        self._hosts: Dict[str, Dict] = {}
+        self.stats = {
+            'static_fetches': 0,
+            'js_renders': 0,
+            'escalations': 0,
+            'memory_hits': 0
+        }
+
+    @staticmethod
+    def _key(url: str) -> Tuple[str, str]:
+        return urlparse(url).netloc.lower(), path_pattern(url)
+
+    def lookup(self, url: str) -> Optional[bool]:
+        """Décision mémorisée pour l'URL (True = rendu JS), None si inconnue."""
+        host, pattern = self._key(url)
+        now = time.time()
+        with self._lock:
+            entry = self._patterns.get((host, pattern))
+            if entry and now - entry['updated_at'] < self.ttl:
+                self.stats['memory_hits'] += 1
+                return entry['use_js']
+
+            host_entry = self._hosts.get(host)
+            if host_entry and now - host_entry['updated_at'] < self.ttl:
+                total = host_entry['js'] + host_entry['static']
+                if total >= RENDER_DECISION_CONFIG['host_min_observations']:
+                    if host_entry['js'] == total or host_entry['static'] == total:
+                        self.stats['memory_hits'] += 1
+                        return host_entry['js'] == total
+        return None
+
+    def record(self, url: str, use_js: bool, reason: str = ''):
+        """Mémorise la décision prise pour l'URL."""
+        host, pattern = self._key(url)
+        now = time.time()
+        with self._lock:
+            if len(self._patterns) >= self.max_entries and (host, pattern) not in self._patterns:
+                oldest = min(self._patterns, key=lambda k: self._patterns[k]['updated_at'])
+                del self._patterns[oldest]
+            self._patterns[(host, pattern)] = {'use_js': use_js, 'reason': reason, 'updated_at': now}
+
+            host_entry = self._hosts.setdefault(host, {'js': 0, 'static': 0, 'updated_at': now})
+            host_entry['js' if use_js else 'static'] += 1
+            host_entry['updated_at'] = now
+
+    def count(self, key: str):
+        with self._lock:
+            self.stats[key] += 1
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            fetched = self.stats['static_fetches'] + self.stats['js_renders']
+            return {
+                **self.stats,
+                'js_ratio': round(self.stats['js_renders'] / fetched, 3) if fetched else 0.0,
+                'patterns': len(self._patterns),
+                'hosts': len(self._hosts)
+            }
+
+    def clear(self):
+        with self._lock:
+            self._patterns.clear()
+            self._hosts.clear()
+
+
+# Instance globale (singleton pattern)
+_memory_instance = None
+_memory_lock = threading.Lock()
+
+
+def get_render_memory() -> RenderDecisionMemory:
+    """Obtenir la mémoire de décisions de rendu du processus."""
+    global _memory_instance
+    if _memory_instance is None:
+        with _memory_lock:
+            if _memory_instance is None:
+                _memory_instance = RenderDecisionMemory()
+    return _memory_instance
@@ -0,0 +1,211 @@
+# backend/src/core/resource_policy.py
+# Politique d'interception réseau commune à toutes les navigations Playwright
+# Bloque par type de ressource (selon le mode d'extraction) et par domaine tiers (analytics, pubs)
+# Mesure par page les requêtes bloquées et les octets économisés (estimation par type)
+# RELEVANT FILES: fetcher_playwright.py, smart_crawler.py, page_detector.py, browser_pool.py
+
+import os
+import threading
+from typing import Dict, FrozenSet, Iterable, Optional
+from urllib.parse import urlparse
+
+
+# Domaines tiers jamais utiles à l'extraction (suffixes : couvre les sous-domaines)
+TRACKER_DOMAINS = (
+    'google-analytics.com', 'googletagmanager.com', 'googletagservices.com',
+    'doubleclick.net', 'googlesyndication.com', 'googleadservices.com', 'adservice.google.com',
+    'connect.facebook.net', 'facebook.com/tr', 'analytics.tiktok.com', 'snap.licdn.com',
+    'hotjar.com', 'clarity.ms', 'segment.io', 'segment.com', 'mixpanel.com', 'amplitude.com',
+    'criteo.com', 'criteo.net', 'taboola.com', 'outbrain.com', 'amazon-adsystem.com',
+    'adnxs.com', 'scorecardresearch.com', 'quantserve.com', 'nr-data.net', 'matomo.cloud',
+    'hs-analytics.net', 'hubspot.com', 'intercom.io', 'zopim.com', 'crisp.chat'
+)
+
+# Types de ressources bloqués par mode (types Playwright : request.resource_type)
+RESOURCE_POLICY_MODES = {
+    # HTML seul : aucun rendu visuel nécessaire
+    'html': frozenset({'image', 'media', 'font', 'stylesheet'}),
+    # Crawl de navigation : seuls le DOM et les liens comptent
+    'crawl': frozenset({'image', 'media', 'font', 'stylesheet'}),
+    # Extraction complète : images gardées (naturalWidth) et CSS gardé (background-image calculé)
+    'extract': frozenset({'media', 'font'}),
+    # Capture d'écran : rendu visuel fidèle, seuls médias et traqueurs sont coupés
+    'screenshot': frozenset({'media'})
+}
+
+# Taille typique d'une réponse par type (ordre de grandeur HTTP Archive) pour estimer les économies
+TYPICAL_RESOURCE_BYTES = {
+    'image': 25_000,
+    'media': 500_000,
+    'font': 35_000,
+    'stylesheet': 20_000,
+    'script': 25_000,
+    'xhr': 5_000,
+    'fetch': 5_000,
+    'other': 5_000
+}
+
+# Configuration de l'interception (surchargeable par variables d'environnement)
+RESOURCE_POLICY_CONFIG = {
+    'enabled': os.getenv('RESOURCE_BLOCKING_ENABLED', '1') == '1',
+    'block_trackers': os.getenv('RESOURCE_BLOCK_TRACKERS', '1') == '1',
+    'extra_blocked_domains': tuple(
+        d.strip() for d in os.getenv('RESOURCE_BLOCKED_DOMAINS', '').split(',') if d.strip()
+    )
+}
+
+
+class ResourceUsage:
+    """Compteurs réseau d'une page (requêtes servies/bloquées, octets chargés/économisés)."""
+
+    def __init__(self, mode: str):
+        self.mode = mode
+        self.requests_allowed = 0
+        self.requests_blocked = 0
+        self.bytes_loaded = 0
+        self.bytes_saved_estimate = 0
+        self.blocked_by_type: Dict[str, int] = {}
+        self.blocked_third_party = 0
+
+    def record_blocked(self, resource_type: str, third_party: bool):
+        self.requests_blocked += 1
+        self.bytes_saved_estimate += TYPICAL_RESOURCE_BYTES.get(resource_type, TYPICAL_RESOURCE_BYTES['other'])
+        self.blocked_by_type[resource_type] = self.blocked_by_type.get(resource_type, 0) + 1
+        if third_party:
+            self.blocked_third_party += 1
+
+    def reset(self):
+        self.__init__(self.mode)
+
+    def summary(self) -> Dict:
+        return {
+            'mode': self.mode,
+            'requests_allowed': self.requests_allowed,
+            'requests_blocked': self.requests_blocked,
+            'blocked_third_party': self.blocked_third_party,
+            'blocked_by_type': dict(self.blocked_by_type),
+            'bytes_loaded': self.bytes_loaded,
+            'bytes_saved_estimate': self.bytes_saved_estimate
+        }
+
+
+class ResourcePolicy:
+    """
+    Politique d'interception d'un mode d'extraction.
+    attach(page) installe une route '**/*' qui abandonne les requêtes bloquées
+    et renvoie le ResourceUsage de la page.
+    """
+
+    def __init__(
+        self,
+        mode: str,
+        blocked_types: Optional[Iterable[str]] = None,
+        blocked_domains: Optional[Iterable[str]] = None
+    ):
+        self.mode = mode
+        self.blocked_types: FrozenSet[str] = frozenset(
+            RESOURCE_POLICY_MODES.get(mode, frozenset()) if blocked_types is None else blocked_types
+        )
+        if blocked_domains is None:
+            blocked_domains = (TRACKER_DOMAINS if RESOURCE_POLICY_CONFIG['block_trackers'] else ()) \
+                + RESOURCE_POLICY_CONFIG['extra_blocked_domains']
+        self.blocked_domains = tuple(blocked_domains)
+
+    def is_blocked_domain(self, url: str) -> bool:
+        parsed = urlparse(url)
+        host = parsed.hostname or ''
+        for domain in self.blocked_domains:
+            if '/' in domain:
+                # Entrée avec chemin (ex. facebook.com/tr : pixel sans bloquer le domaine)
+                domain_host, path = domain.split('/', 1)
+                if (host == domain_host or host.endswith('.' + domain_host)) and parsed.path.startswith('/' + path):
+                    return True
+            elif host == domain or host.endswith('.' + domain):
+                return True
+        return False
+
+    def should_block(self, resource_type: str, url: str) -> bool:
+        if resource_type == 'document':
+            return False
+        return resource_type in self.blocked_types or self.is_blocked_domain(url)
+
+    async def attach(self, page) -> ResourceUsage:
+        """Installe l'interception sur la page (avant page.goto)."""
+        usage = ResourceUsage(self.mode)
+        if not RESOURCE_POLICY_CONFIG['enabled']:
+            return usage
+
+        async def _handle(route):
+            request = route.request
+            if self.should_block(request.resource_type, request.url):
+                usage.record_blocked(request.resource_type, self.is_blocked_domain(request.url))
+                await route.abort()
+            else:
+                usage.requests_allowed += 1
+                await route.continue_()
+
+        def _on_response(response):
+            length = response.headers.get('content-length')
+            if length and length.isdigit():
+                usage.bytes_loaded += int(length)
+
+        await page.route('**/*', _handle)
+        page.on('response', _on_response)
+        return usage
+
+
+class ResourceSavings:
+    """Cumul des économies de toutes les pages, par mode (statistiques du processus)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._modes: Dict[str, Dict] = {}
+
+    def record(self, usage: ResourceUsage):
+        with self._lock:
+            totals = self._modes.setdefault(usage.mode, {
+                'pages': 0, 'requests_allowed': 0, 'requests_blocked': 0,
+                'bytes_loaded': 0, 'bytes_saved_estimate': 0
+            })
+            totals['pages'] += 1
+            totals['requests_allowed'] += usage.requests_allowed
+            totals['requests_blocked'] += usage.requests_blocked
+            totals['bytes_loaded'] += usage.bytes_loaded
+            totals['bytes_saved_estimate'] += usage.bytes_saved_estimate
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            return {mode: dict(values) for mode, values in self._modes.items()}
+
+
+# Instances globales (singleton pattern)
+_policies: Dict[str, ResourcePolicy] = {}
+_savings = ResourceSavings()
+_policies_lock = threading.Lock()
+
+
+def get_resource_policy(mode: str) -> ResourcePolicy:
+    """Politique partagée d'un mode : 'html', 'crawl', 'extract' ou 'screenshot'."""
+    policy = _policies.get(mode)
+    if policy is None:
+        with _policies_lock:
+            policy = _policies.setdefault(mode, ResourcePolicy(mode))
+    return policy
+
+
+def record_resource_usage(usage: ResourceUsage) -> Dict:
+    """
+    Ajoute les compteurs d'une page aux statistiques du processus et renvoie son résumé.
+    Les compteurs repartent de zéro : une page réutilisée (crawl) rapporte page par page.
+    """
+    _savings.record(usage)
+    summary = usage.summary()
+    usage.reset()
+    if summary['requests_blocked']:
+        print(f"🚫 {summary['requests_blocked']} requêtes bloquées "
+              f"(~{summary['bytes_saved_estimate'] // 1024} Ko économisés, mode {summary['mode']})")
+    return summary
+
+
+def get_resource_stats() -> Dict:
+    return _savings.get_stats()
@@ -0,0 +1,367 @@
+# backend/src/core/retry_policy.py
+# Politique de retry unique pour tous les fetchers : backoff à jitter décorrélé, Retry-After,
+# budget de retries et disjoncteur par hôte (échec immédiat quand un hôte est tombé)
+# RELEVANT FILES: fetcher_playwright.py, fetcher.py, fetcher_advanced_free_complete.py, rate_limiter.py
+
+import asyncio
+import os
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Awaitable, Callable, Dict, Optional
+from urllib.parse import urlparse
+
+import httpx
+
+try:
+    from playwright.async_api import Error as PlaywrightError
+    from playwright.async_api import TimeoutError as PlaywrightTimeout
+    PLAYWRIGHT_AVAILABLE = True
+except ImportError:
+    PLAYWRIGHT_AVAILABLE = False
+
+
+# Configuration des retries (surchargeable par variables d'environnement)
+RETRY_POLICY_CONFIG = {
+    'max_attempts': int(os.getenv('RETRY_MAX_ATTEMPTS', '3')),
+    'base_delay': float(os.getenv('RETRY_BASE_DELAY', '0.3')),
+    'max_delay': float(os.getenv('RETRY_MAX_DELAY', '20')),
+    'max_retry_after': float(os.getenv('RETRY_MAX_RETRY_AFTER', '60')),    # au-delà : on abandonne
+    'retry_status_codes': (429, 500, 502, 503, 504),
+    'budget_ratio': float(os.getenv('RETRY_BUDGET_RATIO', '0.2')),         # retries / requêtes
+    'budget_max_tokens': float(os.getenv('RETRY_BUDGET_MAX_TOKENS', '10')),  # réserve pleine (et initiale)
+    'breaker_failure_threshold': int(os.getenv('CIRCUIT_FAILURE_THRESHOLD', '5')),
+    'breaker_reset_timeout': float(os.getenv('CIRCUIT_RESET_TIMEOUT', '30'))
+}
+
+# Erreurs réseau Chromium (Playwright ne les type pas : seul le message les distingue)
+_CHROMIUM_NETWORK_ERRORS = (
+    'net::ERR_CONNECTION', 'net::ERR_TIMED_OUT', 'net::ERR_NAME_NOT_RESOLVED',
+    'net::ERR_EMPTY_RESPONSE', 'net::ERR_NETWORK', 'net::ERR_ADDRESS_UNREACHABLE'
+)
+
+
+class RetryableStatusError(Exception):
+    """Statut HTTP hors httpx (ex. réponse de page.goto) à soumettre à la politique de retry."""
+
+    def __init__(self, status_code: int, retry_after: Optional[str] = None):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+
+class CircuitOpenError(Exception):
+    """Hôte considéré comme hors service : la requête échoue sans être envoyée."""
+
+    def __init__(self, host: str, retry_in: float):
+        super().__init__(f"Disjoncteur ouvert pour {host} (nouvel essai dans {retry_in:.1f}s)")
+        self.host = host
+        self.retry_in = retry_in
+
+
+class RetryBudget:
+    """
+    Budget de retries partagé : chaque requête dépose `ratio` jeton, chaque retry en consomme un.
+    Lors d'une panne généralisée, les retries plafonnent à ~ratio du trafic au lieu de le multiplier.
+    """
+
+    def __init__(self, ratio: Optional[float] = None, max_tokens: Optional[float] = None):
+        self.ratio = RETRY_POLICY_CONFIG['budget_ratio'] if ratio is None else ratio
+        self.max_tokens = RETRY_POLICY_CONFIG['budget_max_tokens'] if max_tokens is None else max_tokens
+        self._tokens = self.max_tokens
+        self._lock = threading.Lock()
+
+    def deposit(self):
+        with self._lock:
+            self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+    @property
+    def tokens(self) -> float:
+        return self._tokens
+
+
+class CircuitBreaker:
+    """
+    Disjoncteur par hôte :
+    - closed    : requêtes normales ; `failure_threshold` échecs consécutifs -> open
+    - open      : échec immédiat (CircuitOpenError) pendant `reset_timeout` secondes
+    - half_open : une seule requête d'essai ; succès -> closed, échec -> open
+    """
+
+    def __init__(self, failure_threshold: Optional[int] = None, reset_timeout: Optional[float] = None):
+        self.failure_threshold = failure_threshold or RETRY_POLICY_CONFIG['breaker_failure_threshold']
+        self.reset_timeout = RETRY_POLICY_CONFIG['breaker_reset_timeout'] if reset_timeout is None else reset_timeout
+        self._lock = threading.Lock()
+        self._hosts: Dict[str, Dict] = {}
+
+    def _host(self, host: str) -> Dict:
+        return self._hosts.setdefault(host, {'state': 'closed', 'failures': 0, 'opened_at': 0.0, 'trial': False})
+
+    def allow(self, host: str):
+        """Lève CircuitOpenError si l'hôte est en panne ; laisse passer une requête d'essai après le délai."""
+        with self._lock:
+            entry = self._host(host)
+            if entry['state'] == 'closed':
+                return
+            elapsed = time.monotonic() - entry['opened_at']
+            if entry['state'] == 'open' and elapsed >= self.reset_timeout:
+                entry['state'] = 'half_open'
+            if entry['state'] == 'half_open' and not entry['trial']:
+                entry['trial'] = True
+                return
+            raise CircuitOpenError(host, max(0.0, self.reset_timeout - elapsed))
+
+    def release_trial(self, host: str):
+        """Requête d'essai abandonnée sans verdict (annulation, timeout externe) : un autre essai peut partir."""
+        with self._lock:
+            entry = self._host(host)
+            entry['trial'] = False
+
+    def record_success(self, host: str):
+        with self._lock:
+            entry = self._host(host)
+            entry.update({'state': 'closed', 'failures': 0, 'trial': False})
+
+    def record_failure(self, host: str) -> bool:
+        """Compte un échec ; renvoie True si le disjoncteur vient de s'ouvrir."""
+        with self._lock:
+            entry = self._host(host)
+            entry['failures'] += 1
+            entry['trial'] = False
+            if entry['state'] == 'half_open' or entry['failures'] >= self.failure_threshold:
+                was_open = entry['state'] == 'open'
+                entry.update({'state': 'open', 'opened_at': time.monotonic()})
+                return not was_open
+            return False
+
+    def state(self, host: str) -> str:
+        with self._lock:
+            return self._host(host)['state']
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            return {
+                host: {'state': entry['state'], 'failures': entry['failures']}
+                for host, entry in self._hosts.items() if entry['state'] != 'closed' or entry['failures']
+            }
+
+
+class RetryPolicy:
+    """
+    Politique de retry partagée par les fetchers.
+
+    execute_async(url, operation) / execute(url, operation) appellent `operation`
+    (sans argument) jusqu'à max_attempts fois :
+    - seules les erreurs transitoires sont réessayées (timeouts, connexion, 429/5xx)
+    - attente = Retry-After si le serveur l'indique, sinon jitter décorrélé
+      (min(max_delay, uniform(base_delay, 3 * attente_précédente)))
+    - chaque retry consomme le budget partagé ; budget vide -> pas de retry
+    - le disjoncteur de l'hôte est consulté avant chaque tentative
+    """
+
+    def __init__(
+        self,
+        max_attempts: Optional[int] = None,
+        base_delay: Optional[float] = None,
+        max_delay: Optional[float] = None,
+        retry_status_codes: Optional[tuple] = None,
+        budget: Optional[RetryBudget] = None,
+        breaker: Optional[CircuitBreaker] = None
+    ):
+        self.max_attempts = max_attempts or RETRY_POLICY_CONFIG['max_attempts']
+        self.base_delay = RETRY_POLICY_CONFIG['base_delay'] if base_delay is None else base_delay
+        self.max_delay = max_delay or RETRY_POLICY_CONFIG['max_delay']
+        self.retry_status_codes = frozenset(retry_status_codes or RETRY_POLICY_CONFIG['retry_status_codes'])
+        self.budget = budget or RetryBudget()
+        self.breaker = breaker or CircuitBreaker()
+
+        self._lock = threading.Lock()
+        self.stats = {
+            'calls': 0,
+            'attempts': 0,
+            'retries': 0,
+            'successes': 0,
+            'failures': 0,
+            'retry_after_honoured': 0,
+            'budget_exhausted': 0,
+            'circuit_rejections': 0,
+            'circuits_opened': 0
+        }
+
+    # =================== CLASSIFICATION ===================
+
+    def status_of(self, error: Exception) -> Optional[int]:
+        if isinstance(error, httpx.HTTPStatusError):
+            return error.response.status_code
+        if isinstance(error, RetryableStatusError):
+            return error.status_code
+        return None
+
+    def is_retryable(self, error: Exception) -> bool:
+        """Erreur transitoire (qui vaut un nouvel essai) ou définitive (404, URL invalide...)."""
+        status = self.status_of(error)
+        if status is not None:
+            return status in self.retry_status_codes
+        if isinstance(error, (httpx.TimeoutException, httpx.TransportError, asyncio.TimeoutError)):
+            return not isinstance(error, (httpx.UnsupportedProtocol, httpx.InvalidURL))
+        if PLAYWRIGHT_AVAILABLE:
+            if isinstance(error, PlaywrightTimeout):
+                return True
+            if isinstance(error, PlaywrightError):
+                return any(marker in str(error) for marker in _CHROMIUM_NETWORK_ERRORS)
+        return False
+
+    def retry_after(self, error: Exception) -> Optional[float]:
+        """Délai Retry-After (secondes ou date HTTP) porté par l'erreur, s'il existe."""
+        if isinstance(error, httpx.HTTPStatusError):
+            value = error.response.headers.get('Retry-After')
+        elif isinstance(error, RetryableStatusError):
+            value = error.retry_after
+        else:
+            return None
+        if not value:
+            return None
+        value = value.strip()
+        if value.isdigit():
+            return float(value)
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+
+    # =================== DÉCISION ===================
+
+    def next_delay(self, previous_delay: float) -> float:
+        """Jitter décorrélé : étale les retries de clients concurrents au lieu de les synchroniser."""
+        upper = max(self.base_delay, previous_delay * 3)
+        return min(self.max_delay, random.uniform(self.base_delay, upper))
+
+    def _count(self, key: str, amount: int = 1):
+        with self._lock:
+            self.stats[key] += amount
+
+    def _on_failure(self, host: str, error: Exception, attempt: int, max_attempts: int,
+                    previous_delay: float) -> Optional[float]:
+        """Enregistre l'échec ; renvoie l'attente avant le prochain essai, ou None pour abandonner."""
+        retryable = self.is_retryable(error)
+        if not retryable:
+            # Erreur définitive (404, 403...) : l'hôte a répondu, il n'est pas en panne
+            self.breaker.record_success(host)
+        elif self.breaker.record_failure(host):
+            self._count('circuits_opened')
+            print(f"🔌 Disjoncteur ouvert pour {host}")
+
+        if not retryable or attempt >= max_attempts - 1 or self.breaker.state(host) == 'open':
+            return None
+
+        delay = self.next_delay(previous_delay)
+        retry_after = self.retry_after(error)
+        if retry_after is not None:
+            if retry_after > RETRY_POLICY_CONFIG['max_retry_after']:
+                print(f"⏳ Retry-After de {retry_after:.0f}s pour {host} : abandon")
+                return None
+            delay = retry_after
+            self._count('retry_after_honoured')
+
+        if not self.budget.withdraw():
+            self._count('budget_exhausted')
+            print(f"💸 Budget de retries épuisé, abandon pour {host}")
+            return None
+
+        self._count('retries')
+        print(f"🔄 Tentative {attempt + 1} échouée ({str(error)[:80]}) - retry dans {delay:.1f}s")
+        return delay
+
+    def _before_attempt(self, host: str, attempt: int):
+        try:
+            self.breaker.allow(host)
+        except CircuitOpenError:
+            self._count('circuit_rejections')
+            raise
+        self._count('attempts')
+        if attempt == 0:
+            self._count('calls')
+            self.budget.deposit()
+
+    # =================== EXÉCUTION ===================
+
+    async def execute_async(self, url: str, operation: Callable[[], Awaitable[Any]],
+                            max_attempts: Optional[int] = None) -> Any:
+        host = urlparse(url).netloc or url
+        max_attempts = max_attempts or self.max_attempts
+        delay = self.base_delay
+        attempt = 0
+        while True:
+            self._before_attempt(host, attempt)
+            try:
+                result = await operation()
+            except Exception as e:
+                delay = self._on_failure(host, e, attempt, max_attempts, delay)
+                if delay is None:
+                    self._count('failures')
+                    raise
+                await asyncio.sleep(delay)
+                attempt += 1
+                continue
+            except BaseException:
+                # CancelledError (annulation du crawl, asyncio.wait_for) : l'essai en demi-ouverture est libéré
+                self.breaker.release_trial(host)
+                raise
+            self.breaker.record_success(host)
+            self._count('successes')
+            return result
+
+    def execute(self, url: str, operation: Callable[[], Any], max_attempts: Optional[int] = None) -> Any:
+        """Version synchrone de execute_async (même budget, même disjoncteur)."""
+        host = urlparse(url).netloc or url
+        max_attempts = max_attempts or self.max_attempts
+        delay = self.base_delay
+        attempt = 0
+        while True:
+            self._before_attempt(host, attempt)
+            try:
+                result = operation()
+            except Exception as e:
+                delay = self._on_failure(host, e, attempt, max_attempts, delay)
+                if delay is None:
+                    self._count('failures')
+                    raise
+                time.sleep(delay)
+                attempt += 1
+                continue
+            except BaseException:
+                self.breaker.release_trial(host)
+                raise
+            self.breaker.record_success(host)
+            self._count('successes')
+            return result
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            stats = dict(self.stats)
+        stats['budget_tokens'] = round(self.budget.tokens, 2)
+        stats['circuits'] = self.breaker.get_stats()
+        return stats
+
+
+# Instance globale (singleton pattern)
+_retry_policy_instance = None
+_retry_policy_lock = threading.Lock()
+
+
+def get_retry_policy() -> RetryPolicy:
+    """Obtenir la politique de retry partagée (budget et disjoncteurs communs au processus)."""
+    global _retry_policy_instance
+    if _retry_policy_instance is None:
+        with _retry_policy_lock:
+            if _retry_policy_instance is None:
+                _retry_policy_instance = RetryPolicy()
+    return _retry_policy_instance
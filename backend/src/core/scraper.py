@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Union
 
 from bs4 import BeautifulSoup, Tag
 
@@ -15,7 +15,7 @@ from src.core.fetcher_playwright import fetch_html_smart, extract_complete_conte
 
 
 def scrape_url(
-    url: str, collection_index: int = 0, max_items: int = 1000, use_js: bool = False
+    url: str, collection_index: int = 0, max_items: int = 1000, use_js: Union[bool, str] = False
 ) -> Dict[str, Any]:
     html = fetch_html_smart(url, use_js=use_js)
     soup = BeautifulSoup(html, "lxml")
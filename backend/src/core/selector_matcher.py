@@ -0,0 +1,226 @@
+# backend/src/core/selector_matcher.py
+# Table de sélecteurs CSS compilée en un seul moteur : un parcours du DOM pour tous les sélecteurs
+# Sélecteurs composés simples (balise, .classe, #id, [attr], [attr=|*=|^=|$=|~=valeur]) et listes « a, b » ;
+# chaque élément est rattaché à tous les sélecteurs qu'il vérifie, mêmes résultats que soup.select
+# Les sélecteurs hors de ce sous-ensemble (combinateurs, pseudo-classes) passent par soup.select
+# RELEVANT FILES: content_detector.py, parsed_page.py
+
+import re
+from typing import Dict, List, Optional, Tuple
+
+from bs4 import Tag
+
+
+_SIMPLE_PART_RE = re.compile(
+    r"""\.(?P<cls>-?[_a-zA-Z][\w-]*)"""
+    r"""|\#(?P<id>-?[_a-zA-Z][\w-]*)"""
+    r"""|\[\s*(?P<attr>[a-zA-Z_][\w:-]*)\s*(?:(?P<op>[~^$*]?=)\s*"""
+    r"""(?P<value>"[^"\\]*"|'[^'\\]*'|[^\s"'\]\\]+)\s*)?\]"""
+)
+_TAG_RE = re.compile(r'\*|[a-zA-Z][\w-]*')
+_WHITESPACE_RE = re.compile(r'[ \t\r\n\f]')
+
+
+class _Compound:
+    """Sélecteur composé sans combinateur : balise, classes, id et conditions d'attributs."""
+
+    __slots__ = ('tag', 'classes', 'element_id', 'attributes')
+
+    def __init__(self, tag: Optional[str], classes: Tuple[str, ...], element_id: Optional[str],
+                 attributes: Tuple[Tuple[str, Optional[str], str], ...]):
+        self.tag = tag
+        self.classes = classes
+        self.element_id = element_id
+        self.attributes = attributes
+
+    def key(self) -> Tuple[str, Optional[str]]:
+        """Critère le plus sélectif, utilisé pour n'évaluer le sélecteur que sur les éléments concernés."""
+        if self.element_id is not None:
+            return 'id', self.element_id
+        if self.classes:
+            return 'class', self.classes[0]
+        if self.tag is not None:
+            return 'tag', self.tag
+        if self.attributes:
+            return 'attr', self.attributes[0][0]
+        return 'any', None
+
+    def matches(self, element: Tag, classes: List[str]) -> bool:
+        if self.tag is not None and element.name != self.tag:
+            return False
+        for class_name in self.classes:
+            if class_name not in classes:
+                return False
+        if self.element_id is not None and element.attrs.get('id') != self.element_id:
+            return False
+        for name, op, value in self.attributes:
+            if not _attribute_matches(element.attrs.get(name), name, op, value):
+                return False
+        return True
+
+
+def _attribute_matches(actual, name: str, op: Optional[str], value: str) -> bool:
+    """Condition d'attribut, avec la sémantique de soupsieve (valeurs multiples jointes par un espace)."""
+    if actual is None:
+        return False
+    if op is None:
+        return True
+    if not isinstance(actual, str):
+        actual = ' '.join(actual)
+    if name == 'type':
+        # Seul attribut HTML comparé sans casse par soupsieve
+        actual, value = actual.lower(), value.lower()
+    if op == '=':
+        return actual == value
+    if not value:
+        return False
+    if op == '*=':
+        return value in actual
+    if op == '^=':
+        return actual.startswith(value)
+    if op == '$=':
+        return actual.endswith(value)
+    # '~=' : mot d'une liste séparée par des espaces
+    return not _WHITESPACE_RE.search(value) and value in _WHITESPACE_RE.split(actual)
+
+
+def compile_compound(selector: str) -> Optional[_Compound]:
+    """Compile un sélecteur composé simple ; None s'il sort du sous-ensemble pris en charge."""
+    selector = selector.strip()
+    if not selector:
+        return None
+    tag = None
+    position = 0
+    tag_match = _TAG_RE.match(selector)
+    if tag_match:
+        tag = None if tag_match.group(0) == '*' else tag_match.group(0).lower()
+        position = tag_match.end()
+    classes: List[str] = []
+    element_id = None
+    attributes = []
+    while position < len(selector):
+        part = _SIMPLE_PART_RE.match(selector, position)
+        if not part:
+            return None
+        if part.group('cls'):
+            classes.append(part.group('cls'))
+        elif part.group('id'):
+            if element_id is not None and element_id != part.group('id'):
+                return None
+            element_id = part.group('id')
+        else:
+            value = part.group('value') or ''
+            if value[:1] in ('"', "'"):
+                value = value[1:-1]
+            attributes.append((part.group('attr').lower(), part.group('op'), value))
+        position = part.end()
+    return _Compound(tag, tuple(classes), element_id, tuple(attributes))
+
+
+def compile_selector(selector: str) -> Optional[List[_Compound]]:
+    """Compile un sélecteur ou une liste « a, b » ; None si une alternative n'est pas prise en charge."""
+    compounds = []
+    for alternative in selector.split(','):
+        compound = compile_compound(alternative)
+        if compound is None:
+            return None
+        compounds.append(compound)
+    return compounds
+
+
+class SelectorMatcher:
+    """
+    Groupes nommés de sélecteurs évalués en un seul parcours du DOM.
+
+        matcher = SelectorMatcher({'products': ['.product', '[itemtype*="Product"]'], 'tables': ['table']})
+        matcher.match(soup)    # {'products': [...], 'tables': [...]}
+
+    Résultat d'un groupe : concaténation des résultats de ses sélecteurs dans l'ordre de la table,
+    chacun dans l'ordre du document (un élément vérifiant deux sélecteurs du groupe y figure deux fois),
+    exactement comme une boucle de soup.select. Ajouter un groupe n'ajoute pas de parcours.
+    """
+
+    def __init__(self, groups: Dict[str, List[str]]):
+        self.groups = {name: list(selectors) for name, selectors in groups.items()}
+        self.selectors: List[str] = []
+        self._selector_index: Dict[str, int] = {}
+        # Sélecteurs compilés, indexés par leur critère le plus sélectif
+        self._by_key: Dict[Tuple[str, Optional[str]], List[Tuple[_Compound, int]]] = {}
+        self._attribute_names: set = set()
+        self._has_universal = False
+        # Sélecteurs non pris en charge : soup.select
+        self.fallback_selectors: List[str] = []
+
+        for selectors in self.groups.values():
+            for selector in selectors:
+                if selector in self._selector_index:
+                    continue
+                index = len(self.selectors)
+                self._selector_index[selector] = index
+                self.selectors.append(selector)
+                compounds = compile_selector(selector)
+                if compounds is None:
+                    self.fallback_selectors.append(selector)
+                    continue
+                for compound in compounds:
+                    key = compound.key()
+                    self._by_key.setdefault(key, []).append((compound, index))
+                    if key[0] == 'attr':
+                        self._attribute_names.add(key[1])
+                    elif key[0] == 'any':
+                        self._has_universal = True
+
+    def match_selectors(self, root: Tag) -> Dict[str, List[Tag]]:
+        """Éléments de chaque sélecteur (descendants de root, ordre du document), en un parcours."""
+        buckets: List[List[Tag]] = [[] for _ in self.selectors]
+        by_key = self._by_key
+        attribute_names = self._attribute_names
+        for element in root.descendants:
+            if not isinstance(element, Tag):
+                continue
+            classes = element.attrs.get('class') or []
+            if isinstance(classes, str):
+                classes = classes.split()
+            candidates = []
+            found = by_key.get(('tag', element.name))
+            if found:
+                candidates.extend(found)
+            for class_name in classes:
+                found = by_key.get(('class', class_name))
+                if found:
+                    candidates.extend(found)
+            element_id = element.attrs.get('id')
+            if element_id is not None:
+                found = by_key.get(('id', element_id))
+                if found:
+                    candidates.extend(found)
+            if attribute_names:
+                for name in element.attrs:
+                    if name in attribute_names:
+                        candidates.extend(by_key[('attr', name)])
+            if self._has_universal:
+                candidates.extend(by_key[('any', None)])
+
+            for compound, index in candidates:
+                bucket = buckets[index]
+                # Un élément une seule fois par sélecteur (« a, b » vérifiés tous les deux, classe répétée)
+                if bucket and bucket[-1] is element:
+                    continue
+                if compound.matches(element, classes):
+                    bucket.append(element)
+
+        results = {selector: buckets[index] for selector, index in self._selector_index.items()}
+        for selector in self.fallback_selectors:
+            try:
+                results[selector] = root.select(selector)
+            except Exception:
+                results[selector] = []   # sélecteur invalide : ignoré, comme avant
+        return results
+
+    def match(self, root: Tag) -> Dict[str, List[Tag]]:
+        """Éléments de chaque groupe."""
+        by_selector = self.match_selectors(root)
+        return {
+            name: [element for selector in selectors for element in by_selector[selector]]
+            for name, selectors in self.groups.items()
+        }
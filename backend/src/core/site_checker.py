@@ -9,6 +9,8 @@ from typing import Dict, List, Optional, Tuple
 from urllib.parse import urlparse
 import time
 
+from .http_client import get_http_client
+
 
 class SiteChecker:
     """
@@ -430,61 +432,64 @@ class SiteChecker:
         }
         
         try:
-            with httpx.Client(
+            # Client partagé : connexion keep-alive réutilisée entre les vérifications
+            # (sans cache disque : on mesure l'état et le temps de réponse réels)
+            response = get_http_client().get(
+                url,
+                cache=False,
                 timeout=self.timeout,
                 follow_redirects=self.follow_redirects,
                 headers={'User-Agent': self.user_agent}
-            ) as client:
-                response = client.get(url)
-                
-                # Temps de réponse
-                result['response_time'] = round(time.time() - start_time, 2)
-                
-                # Status
-                result['status_code'] = response.status_code
-                result['accessible'] = response.status_code < 400
-                
-                # Informations du statut
-                status_info = self.get_status_info(response.status_code)
-                result['status_info'] = status_info
-                result['scrapable'] = status_info['scrapable']
+            )
+            
+            # Temps de réponse
+            result['response_time'] = round(time.time() - start_time, 2)
+            
+            # Status
+            result['status_code'] = response.status_code
+            result['accessible'] = response.status_code < 400
+            
+            # Informations du statut
+            status_info = self.get_status_info(response.status_code)
+            result['status_info'] = status_info
+            result['scrapable'] = status_info['scrapable']
+            
+            # Headers
+            result['server'] = response.headers.get('server', 'Unknown')
+            result['content_type'] = response.headers.get('content-type', 'Unknown')
+            result['content_length'] = response.headers.get('content-length')
+            
+            # Chaîne de redirections
+            if len(response.history) > 0:
+                result['redirect_chain'] = [
+                    {'url': r.url.unicode_string(), 'status': r.status_code} 
+                    for r in response.history
+                ]
+            
+            # Analyser le contenu si HTML
+            if 'text/html' in result['content_type']:
+                content = response.text
                 
-                # Headers
-                result['server'] = response.headers.get('server', 'Unknown')
-                result['content_type'] = response.headers.get('content-type', 'Unknown')
-                result['content_length'] = response.headers.get('content-length')
+                # Titre
+                result['title'] = self.extract_title(content)
                 
-                # Chaîne de redirections
-                if len(response.history) > 0:
-                    result['redirect_chain'] = [
-                        {'url': r.url.unicode_string(), 'status': r.status_code} 
-                        for r in response.history
-                    ]
+                # Protections anti-scraping
+                result['protections'] = self.detect_protection(
+                    dict(response.headers), 
+                    content
+                )
                 
-                # Analyser le contenu si HTML
-                if 'text/html' in result['content_type']:
-                    content = response.text
-                    
-                    # Titre
-                    result['title'] = self.extract_title(content)
-                    
-                    # Protections anti-scraping
-                    result['protections'] = self.detect_protection(
-                        dict(response.headers), 
-                        content
-                    )
-                    
-                    # Stack technologique
-                    result['tech_stack'] = self.extract_tech_stack(
-                        dict(response.headers),
-                        content
-                    )
-                    
-                    # Si protections détectées, marquer comme non scrapable
-                    if result['protections']:
-                        result['scrapable'] = False
-                        result['status_info']['message'] += f" - Protection détectée: {', '.join(result['protections'])}"
+                # Stack technologique
+                result['tech_stack'] = self.extract_tech_stack(
+                    dict(response.headers),
+                    content
+                )
                 
+                # Si protections détectées, marquer comme non scrapable
+                if result['protections']:
+                    result['scrapable'] = False
+                    result['status_info']['message'] += f" - Protection détectée: {', '.join(result['protections'])}"
+            
         except httpx.TimeoutException:
             result['error'] = 'Timeout - Site trop lent ou injoignable'
             result['status_info'] = {
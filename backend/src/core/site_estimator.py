@@ -3,12 +3,13 @@
 # Utilise sitemap.xml, robots.txt, et échantillonnage intelligent
 # RELEVANT FILES: smart_crawler.py, views.py
 
-import httpx
 from bs4 import BeautifulSoup
 from typing import Dict, Optional
 from urllib.parse import urljoin, urlparse
 import re
 
+from .http_client import get_http_client
+
 
 class SiteEstimator:
     """
@@ -150,17 +151,16 @@ class SiteEstimator:
         # 1. URLScan.io
         try:
             url = f"https://urlscan.io/api/v1/search/?q=domain:{domain}"
-            with httpx.Client(timeout=10, follow_redirects=True) as client:
-                response = client.get(url)
-                if response.status_code == 200:
-                    data = response.json()
-                    total = data.get('total', 0)
-                    if total > 0:
-                        return {
-                            'count': total,
-                            'source': 'urlscan.io',
-                            'type': 'passive_scan'
-                        }
+            response = get_http_client().get(url, timeout=10, follow_redirects=True)
+            if response.status_code == 200:
+                data = response.json()
+                total = data.get('total', 0)
+                if total > 0:
+                    return {
+                        'count': total,
+                        'source': 'urlscan.io',
+                        'type': 'passive_scan'
+                    }
         except:
             pass
 
@@ -169,18 +169,17 @@ class SiteEstimator:
             # CDX API pour compter les URLs uniques (collapse=urlkey)
             # On limite à 500 pour ne pas surcharger, mais si on atteint 500 c'est qu'il y en a bcp
             url = f"http://web.archive.org/cdx/search/cdx?url={domain}/*&output=json&fl=original&collapse=urlkey&limit=500"
-            with httpx.Client(timeout=15, follow_redirects=True) as client:
-                response = client.get(url)
-                if response.status_code == 200:
-                    data = response.json()
-                    # Le premier élément est le header ["original"], on l'enlève
-                    if len(data) > 1:
-                        count = len(data) - 1
-                        return {
-                            'count': count if count < 500 else 500, # Si 500, c'est probablement plus
-                            'source': 'wayback_machine',
-                            'type': 'historical_index'
-                        }
+            response = get_http_client().get(url, timeout=15, follow_redirects=True)
+            if response.status_code == 200:
+                data = response.json()
+                # Le premier élément est le header ["original"], on l'enlève
+                if len(data) > 1:
+                    count = len(data) - 1
+                    return {
+                        'count': count if count < 500 else 500, # Si 500, c'est probablement plus
+                        'source': 'wayback_machine',
+                        'type': 'historical_index'
+                    }
         except:
             pass
             
@@ -198,7 +197,7 @@ class SiteEstimator:
         
         for sitemap_url in sitemap_urls:
             try:
-                response = httpx.get(sitemap_url, headers=self.headers, timeout=self.timeout, follow_redirects=True)
+                response = get_http_client().get(sitemap_url, headers=self.headers, timeout=self.timeout, follow_redirects=True)
                 if response.status_code == 200:
                     soup = BeautifulSoup(response.text, 'xml')
                     
@@ -235,7 +234,7 @@ class SiteEstimator:
     def _count_sitemap_urls(self, sitemap_url: str) -> int:
         """Compte les URLs dans un sitemap spécifique."""
         try:
-            response = httpx.get(sitemap_url, headers=self.headers, timeout=self.timeout)
+            response = get_http_client().get(sitemap_url, headers=self.headers, timeout=self.timeout)
             if response.status_code == 200:
                 soup = BeautifulSoup(response.text, 'xml')
                 return len(soup.find_all('url'))
@@ -249,7 +248,7 @@ class SiteEstimator:
         """
         try:
             robots_url = f"{self.base_url}/robots.txt"
-            response = httpx.get(robots_url, headers=self.headers, timeout=self.timeout)
+            response = get_http_client().get(robots_url, headers=self.headers, timeout=self.timeout)
             
             if response.status_code == 200:
                 content = response.text
@@ -279,7 +278,7 @@ class SiteEstimator:
         Échantillonne la page d'accueil pour estimer la taille du site.
         """
         try:
-            response = httpx.get(
+            response = get_http_client().get(
                 self.base_url, 
                 headers=self.headers, 
                 timeout=self.timeout, 
@@ -1,14 +1,178 @@
 # backend/src/core/smart_crawler.py
 # Crawler intelligent utilisant Playwright pour découvrir la structure d'un site
 # Similaire à Web Scraper, ParseHub, Octoparse - ouvre le site réel et détecte les patterns
-# RELEVANT FILES: fetcher_playwright.py, path_finder.py, analyzer.py
+# Mode hybride (défaut) : pages récupérées en HTTP + lxml, navigateur seulement si la page l'exige
+# RELEVANT FILES: fetcher_playwright.py, path_finder.py, analyzer.py, crawl_checkpoint.py, static_crawl.py
 
-from playwright.sync_api import sync_playwright, Page, Browser
+from playwright.async_api import Page
 from urllib.parse import urlparse, urljoin
-from typing import Dict, List, Set, Tuple
+from contextlib import AsyncExitStack
+from typing import Dict, List, Optional, Set, Tuple
+import asyncio
+import os
 import re
 import time
 
+from .browser_pool import get_browser_pool
+from .crawl_checkpoint import CRAWL_CHECKPOINT_CONFIG, get_checkpoint_store
+from .crawl_frontier import CrawlFrontier, link_key
+from .rate_limiter import get_rate_limiter
+from .render_decision import get_render_memory
+from .resource_policy import get_resource_policy, record_resource_usage
+from .retry_policy import RETRY_POLICY_CONFIG, RetryableStatusError, get_retry_policy
+from .static_crawl import (
+    CONTENT_RENDER_REASONS, STATIC_CRAWL_CONFIG, fetch_static, harvest_html, is_js_challenge
+)
+from .wait_strategy import QuiescenceWaiter
+
+
+# Configuration du crawl concurrent (surchargeable par variables d'environnement)
+CRAWL_CONFIG = {
+    'concurrency': int(os.getenv('CRAWL_CONCURRENCY', '4')),             # pages chargées en parallèle
+    'contexts': int(os.getenv('CRAWL_CONTEXTS', '2')),                   # contextes navigateur (pages réparties)
+    'per_host_concurrency': int(os.getenv('CRAWL_PER_HOST_CONCURRENCY', '4')),
+    # 'hybrid' : HTTP + lxml, rendu navigateur si nécessaire ; 'browser' : Playwright pour chaque page
+    'mode': os.getenv('CRAWL_MODE', 'hybrid'),
+}
+
+CRAWL_MODES = ('hybrid', 'browser')
+
+# Options des contextes de crawl (desktop français)
+CRAWL_CONTEXT_OPTIONS = {
+    'user_agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36',
+    'viewport': {'width': 1920, 'height': 1080},
+    'device_scale_factor': 1,
+    'has_touch': False,
+    'is_mobile': False,
+    'java_script_enabled': True,
+    'locale': 'fr-FR',
+    'timezone_id': 'Europe/Paris'
+}
+
+# En-têtes des requêtes HTTP du mode hybride (même navigateur annoncé que les contextes)
+CRAWL_STATIC_HEADERS = {
+    'User-Agent': CRAWL_CONTEXT_OPTIONS['user_agent'],
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'fr-FR,fr;q=0.9,en-US;q=0.8,en;q=0.7'
+}
+
+# Script anti-détection basique
+CRAWL_INIT_SCRIPT = """
+    Object.defineProperty(navigator, 'webdriver', {
+        get: () => undefined
+    });
+    Object.defineProperty(navigator, 'languages', {
+        get: () => ['fr-FR', 'fr', 'en-US', 'en']
+    });
+    Object.defineProperty(navigator, 'plugins', {
+        get: () => [1, 2, 3, 4, 5]
+    });
+"""
+
+# Zones de navigation communes (un lien peut appartenir à plusieurs zones)
+NAVIGATION_ZONES = {
+    'header': 'header a, .header a, #header a, [class*="header"] a',
+    'nav': 'nav a, .nav a, .navbar a, .navigation a, [role="navigation"] a',
+    'menu': '.menu a, #menu a, [class*="menu"] a',
+    'footer': 'footer a, .footer a, #footer a, [class*="footer"] a',
+    'sidebar': 'aside a, .sidebar a, #sidebar a, [class*="sidebar"] a'
+}
+
+# Sélecteurs communs pour la pagination
+PAGINATION_SELECTORS = [
+    '.pagination a',
+    '.pager a',
+    '[class*="page"] a',
+    'a[rel="next"]',
+    'a[rel="prev"]',
+    'nav[aria-label*="pagination"] a',
+    'nav[aria-label*="Pagination"] a'
+]
+
+PREVIEW_META_SELECTORS = {
+    'description': 'meta[name="description"]',
+    'keywords': 'meta[name="keywords"]',
+    'og:title': 'meta[property="og:title"]',
+    'og:description': 'meta[property="og:description"]',
+    'og:image': 'meta[property="og:image"]'
+}
+
+# Contenu principal : premier sélecteur présent
+PREVIEW_MAIN_SELECTORS = ['main', 'article', '.content', '.main-content', '#content', '[role="main"]', 'body']
+
+# Collecte de toute la page en un aller-retour : liens [zone, href, texte], dédoublonnés par zone
+_HARVEST_SCRIPT = """
+(opts) => {
+    const text = (el) => (el.innerText || '').trim();
+    const links = [];
+    const zonedHrefs = new Set();
+
+    for (const [zone, selector] of Object.entries(opts.zones)) {
+        const seen = new Set();
+        for (const a of [...document.querySelectorAll(selector)].slice(0, opts.zoneLimit)) {
+            const href = a.getAttribute('href');
+            if (!href || seen.has(href)) continue;
+            seen.add(href);
+            zonedHrefs.add(href);
+            links.push([zone, href, text(a)]);
+        }
+    }
+    const otherSeen = new Set();
+    for (const a of [...document.querySelectorAll('a[href]')].slice(0, opts.otherLimit)) {
+        const href = a.getAttribute('href');
+        if (!href || zonedHrefs.has(href) || otherSeen.has(href)) continue;
+        otherSeen.add(href);
+        links.push(['other', href, text(a)]);
+    }
+
+    const pagination = new Set();
+    for (const selector of opts.pagination) {
+        for (const a of document.querySelectorAll(selector)) {
+            const href = a.getAttribute('href');
+            if (href) pagination.add(href);
+        }
+    }
+
+    const meta = {};
+    for (const [key, selector] of Object.entries(opts.meta)) {
+        const content = document.querySelector(selector)?.getAttribute('content');
+        if (content) meta[key] = content;
+    }
+    const images = [...document.querySelectorAll('img')].slice(0, opts.maxImages)
+        .map(img => [img.getAttribute('src') || '', img.getAttribute('alt') || '',
+                     img.getAttribute('width') || '0', img.getAttribute('height') || '0'])
+        .filter(img => img[0]);
+
+    let mainText = '';
+    for (const selector of opts.main) {
+        const el = document.querySelector(selector);
+        if (el) {
+            mainText = (el.innerText || '').split(/\s+/).filter(Boolean).join(' ');
+            break;
+        }
+    }
+
+    return {
+        title: document.title,
+        links,
+        pagination: [...pagination],
+        preview: {
+            meta,
+            images,
+            text: mainText.slice(0, opts.textLimit),
+            textTruncated: mainText.length > opts.textLimit,
+            stats: {
+                total_links: document.querySelectorAll('a[href]').length,
+                total_images: document.images.length,
+                total_forms: document.forms.length,
+                total_tables: document.getElementsByTagName('table').length,
+                total_lists: document.querySelectorAll('ul, ol').length
+            }
+        }
+    };
+}
+"""
+
 
 class SmartCrawler:
     """
@@ -19,7 +183,21 @@ class SmartCrawler:
     - Les répertoires et chemins
     """
     
-    def __init__(self, base_url: str, max_pages: int = 30, timeout: int = 30000):
+    def __init__(
+        self,
+        base_url: str,
+        max_pages: int = 30,
+        timeout: int = 30000,
+        concurrency: Optional[int] = None,
+        contexts: Optional[int] = None,
+        checkpoint_id: Optional[str] = None,
+        mode: Optional[str] = None
+    ):
+        """
+        mode : 'hybrid' (HTTP + lxml, navigateur si nécessaire) ou 'browser' (défaut : CRAWL_CONFIG['mode']).
+        checkpoint_id : identifiant du point de reprise (ex. session_checkpoint_id(session.id)).
+        L'état est sauvegardé périodiquement ; s'il existe déjà, le crawl reprend là où il s'était arrêté.
+        """
         self.base_url = base_url
         self.max_pages = max_pages
         self.timeout = timeout
@@ -27,6 +205,31 @@ class SmartCrawler:
         self.visited_urls = set()
         self.discovered_paths = set()
         self.navigation_links = {}
+        self.concurrency = max(1, concurrency or CRAWL_CONFIG['concurrency'])
+        self.contexts = max(1, min(contexts or CRAWL_CONFIG['contexts'], self.concurrency))
+        self.crawl_seconds = 0.0
+        self.mode = mode or CRAWL_CONFIG['mode']
+        if self.mode not in CRAWL_MODES:
+            raise ValueError(f"Mode de crawl inconnu: {self.mode} (attendu: {', '.join(CRAWL_MODES)})")
+        # Pages servies en HTTP, rendues par le navigateur (dont escalades depuis HTTP), cibles non HTML
+        self.fetch_stats = {'static': 0, 'rendered': 0, 'escalated': 0, 'skipped_non_html': 0, 'transient_failures': 0,
+                            'render_reasons': {}}
+        # URLs à visiter par priorité (zone, profondeur, nouveauté du chemin), partage visited_urls
+        self.frontier = CrawlFrontier(visited=self.visited_urls)
+        self._navigation_keys: Dict[str, Set[Tuple]] = {}
+        self._host_slots: Dict[str, asyncio.Semaphore] = {}
+        # Résultats accumulés (restaurés depuis le point de reprise le cas échéant)
+        self.pages_data: List[Dict] = []
+        self.all_navigation: Dict[str, List[Dict]] = {}
+        self._completed_urls: Set[str] = set()     # pages terminées (réussies ou en erreur)
+        self.checkpoint_id = checkpoint_id
+        self.checkpoint_store = get_checkpoint_store() if checkpoint_id else None
+        self.resumed_pages = 0
+        self._last_checkpoint = (0, time.monotonic())
+        self._unsaved_pages: List[Dict] = []       # résultats pas encore ajoutés au point de reprise
+        self._checkpoint_lock = asyncio.Lock()     # écritures dans l'ordre des instantanés
+        if self.checkpoint_store:
+            self._restore_checkpoint()
         
     def is_same_domain(self, url: str) -> bool:
         """Vérifie si l'URL appartient au même domaine (ou sous-domaine)."""
@@ -77,7 +280,29 @@ class SmartCrawler:
         
         return True
     
-    def extract_page_preview(self, page: Page) -> Dict:
+    async def harvest_page(self, page: Page) -> Dict:
+        """
+        Collecte en un seul page.evaluate tout ce dont le crawl a besoin (titre, liens par zone,
+        pagination, prévisualisation), sous forme de tableaux compacts.
+        Remplace des centaines d'allers-retours CDP (query_selector_all + get_attribute/inner_text par lien).
+        """
+        return await page.evaluate(_HARVEST_SCRIPT, self.harvest_options())
+    
+    @staticmethod
+    def harvest_options() -> Dict:
+        """Sélecteurs et limites de la collecte (navigateur et lxml)."""
+        return {
+            'zones': NAVIGATION_ZONES,
+            'zoneLimit': 50,
+            'otherLimit': 100,
+            'pagination': PAGINATION_SELECTORS,
+            'meta': PREVIEW_META_SELECTORS,
+            'main': PREVIEW_MAIN_SELECTORS,
+            'maxImages': 10,
+            'textLimit': 300
+        }
+
+    async def extract_page_preview(self, page: Page, harvest: Optional[Dict] = None) -> Dict:
         """
         Extrait une prévisualisation du contenu de la page :
         - Images principales
@@ -99,244 +324,138 @@ class SmartCrawler:
         }
         
         try:
-            # Meta tags
-            meta_selectors = {
-                'description': 'meta[name="description"]',
-                'keywords': 'meta[name="keywords"]',
-                'og:title': 'meta[property="og:title"]',
-                'og:description': 'meta[property="og:description"]',
-                'og:image': 'meta[property="og:image"]'
-            }
+            if harvest is None:
+                harvest = await self.harvest_page(page)
+            raw = harvest['preview']
             
-            for key, selector in meta_selectors.items():
-                try:
-                    element = page.query_selector(selector)
-                    if element:
-                        content = element.get_attribute('content')
-                        if content:
-                            preview['meta'][key] = content[:200]
-                except:
-                    pass
+            # Meta tags
+            preview['meta'] = {key: content[:200] for key, content in raw['meta'].items() if content}
             
             # Images principales (seulement les grandes images, pas les icônes)
-            try:
-                images = page.query_selector_all('img')
-                for img in images[:10]:  # Max 10 images
-                    try:
-                        src = img.get_attribute('src')
-                        alt = img.get_attribute('alt') or ''
-                        width = img.get_attribute('width') or '0'
-                        height = img.get_attribute('height') or '0'
-                        
-                        if src:
-                            # Normaliser l'URL de l'image
-                            if src.startswith('//'):
-                                src = 'https:' + src
-                            elif src.startswith('/'):
-                                src = self.base_url.rstrip('/') + src
-                            elif not src.startswith('http'):
-                                src = self.base_url.rstrip('/') + '/' + src
-                            
-                            # Filtrer les petites images (icônes, logos)
-                            try:
-                                w = int(width) if width.isdigit() else 999
-                                h = int(height) if height.isdigit() else 999
-                                if w > 100 or h > 100:  # Images de taille raisonnable
-                                    preview['images'].append({
-                                        'src': src,
-                                        'alt': alt[:100],
-                                        'width': width,
-                                        'height': height
-                                    })
-                            except:
-                                # Si pas de dimensions, on garde quand même
-                                preview['images'].append({
-                                    'src': src,
-                                    'alt': alt[:100]
-                                })
-                    except:
-                        continue
-            except:
-                pass
-            
-            # Texte principal (extrait du corps de la page)
-            try:
-                # Chercher le contenu principal
-                main_selectors = [
-                    'main',
-                    'article',
-                    '.content',
-                    '.main-content',
-                    '#content',
-                    '[role="main"]',
-                    'body'
-                ]
+            for src, alt, width, height in raw['images']:
+                # Normaliser l'URL de l'image
+                if src.startswith('//'):
+                    src = 'https:' + src
+                elif src.startswith('/'):
+                    src = self.base_url.rstrip('/') + src
+                elif not src.startswith('http'):
+                    src = self.base_url.rstrip('/') + '/' + src
                 
-                for selector in main_selectors:
-                    try:
-                        main_element = page.query_selector(selector)
-                        if main_element:
-                            text = main_element.inner_text()
-                            # Nettoyer et limiter
-                            text = ' '.join(text.split())  # Normaliser les espaces
-                            preview['text_preview'] = text[:300] + '...' if len(text) > 300 else text
-                            break
-                    except:
-                        continue
-            except:
-                pass
+                # Filtrer les petites images (icônes, logos)
+                w = int(width) if width.isdigit() else 999
+                h = int(height) if height.isdigit() else 999
+                if w > 100 or h > 100:  # Images de taille raisonnable
+                    preview['images'].append({
+                        'src': src,
+                        'alt': alt[:100],
+                        'width': width,
+                        'height': height
+                    })
+            
+            # Texte principal (espaces normalisés et tronqué côté navigateur)
+            preview['text_preview'] = raw['text'] + '...' if raw['textTruncated'] else raw['text']
             
             # Statistiques
-            try:
-                preview['stats']['total_links'] = len(page.query_selector_all('a[href]'))
-                preview['stats']['total_images'] = len(page.query_selector_all('img'))
-                preview['stats']['total_forms'] = len(page.query_selector_all('form'))
-                preview['stats']['total_tables'] = len(page.query_selector_all('table'))
-                preview['stats']['total_lists'] = len(page.query_selector_all('ul, ol'))
-            except:
-                pass
+            preview['stats'].update(raw['stats'])
             
         except Exception as e:
             print(f"    └─ Erreur extraction preview: {e}")
         
         return preview
     
-    def extract_navigation_links(self, page: Page) -> Dict[str, List[Dict]]:
+    async def extract_navigation_links(self, page: Page, harvest: Optional[Dict] = None) -> Dict[str, List[Dict]]:
         """
         Extrait les liens de navigation depuis les zones clés du site.
         Similaire à la détection automatique de Web Scraper/Octoparse.
+        Les doublons (même zone, même href) sont retirés dans le navigateur ;
+        'other' ne contient que les liens absents des zones.
         """
-        navigation_data = {
-            'header': [],
-            'nav': [],
-            'menu': [],
-            'footer': [],
-            'sidebar': [],
-            'other': []
-        }
+        navigation_data = {zone: [] for zone in NAVIGATION_ZONES}
+        navigation_data['other'] = []
         
-        # Sélecteurs pour les zones de navigation communes
-        selectors = {
-            'header': 'header a, .header a, #header a, [class*="header"] a',
-            'nav': 'nav a, .nav a, .navbar a, .navigation a, [role="navigation"] a',
-            'menu': '.menu a, #menu a, [class*="menu"] a',
-            'footer': 'footer a, .footer a, #footer a, [class*="footer"] a',
-            'sidebar': 'aside a, .sidebar a, #sidebar a, [class*="sidebar"] a'
-        }
+        if harvest is None:
+            harvest = await self.harvest_page(page)
         
-        for zone, selector in selectors.items():
-            try:
-                links = page.query_selector_all(selector)
-                
-                for link in links[:50]:  # Limiter pour éviter les surcharges
-                    try:
-                        href = link.get_attribute('href')
-                        text = link.inner_text().strip()
-                        
-                        if href and self.is_valid_page(href):
-                            normalized = self.normalize_url(href)
-                            
-                            if self.is_same_domain(normalized):
-                                navigation_data[zone].append({
-                                    'url': normalized,
-                                    'text': text,
-                                    'href': href
-                                })
-                    except:
-                        continue
-            except:
+        zoned_urls = set()
+        for zone, href, text in harvest['links']:
+            if not self.is_valid_page(href):
                 continue
-        
-        # Extraire tous les autres liens de la page
-        try:
-            all_links = page.query_selector_all('a[href]')
-            
-            for link in all_links[:100]:  # Limiter
-                try:
-                    href = link.get_attribute('href')
-                    text = link.inner_text().strip()
-                    
-                    if href and self.is_valid_page(href):
-                        normalized = self.normalize_url(href)
-                        
-                        if self.is_same_domain(normalized):
-                            # Vérifier si déjà dans une zone spécifique
-                            already_added = any(
-                                normalized in [item['url'] for item in zone_links]
-                                for zone_links in navigation_data.values()
-                            )
-                            
-                            if not already_added:
-                                navigation_data['other'].append({
-                                    'url': normalized,
-                                    'text': text,
-                                    'href': href
-                                })
-                except:
+            normalized = self.normalize_url(href)
+            if not self.is_same_domain(normalized):
+                continue
+            if zone == 'other':
+                # Vérifier si déjà dans une zone spécifique
+                if normalized in zoned_urls:
                     continue
-        except:
-            pass
+            else:
+                zoned_urls.add(normalized)
+            navigation_data[zone].append({
+                'url': normalized,
+                'text': text,
+                'href': href
+            })
         
         return navigation_data
     
-    def detect_pagination(self, page: Page) -> List[str]:
+    async def detect_pagination(self, page: Page, harvest: Optional[Dict] = None) -> List[str]:
         """Détecte les liens de pagination."""
-        pagination_urls = []
-        
-        # Sélecteurs communs pour la pagination
-        pagination_selectors = [
-            '.pagination a',
-            '.pager a',
-            '[class*="page"] a',
-            'a[rel="next"]',
-            'a[rel="prev"]',
-            'nav[aria-label*="pagination"] a',
-            'nav[aria-label*="Pagination"] a'
-        ]
+        if harvest is None:
+            harvest = await self.harvest_page(page)
         
-        for selector in pagination_selectors:
-            try:
-                links = page.query_selector_all(selector)
-                for link in links:
-                    href = link.get_attribute('href')
-                    if href:
-                        normalized = self.normalize_url(href)
-                        if self.is_same_domain(normalized):
-                            pagination_urls.append(normalized)
-            except:
-                continue
+        pagination_urls = set()
+        for href in harvest['pagination']:
+            normalized = self.normalize_url(href)
+            if self.is_same_domain(normalized):
+                pagination_urls.add(normalized)
         
-        return list(set(pagination_urls))
+        return list(pagination_urls)
     
-    def crawl_page(self, page: Page, url: str) -> Dict:
-        """Crawl une page et extrait toutes les informations."""
+    async def crawl_page(
+        self, page: Page, url: str, waiter: Optional[QuiescenceWaiter] = None, resource_usage=None
+    ) -> Dict:
+        """
+        Crawl une page et extrait toutes les informations.
+        waiter / resource_usage : suivi réseau et compteurs déjà attachés à la page (un par page de crawl).
+        """
         print(f"[*] Crawling: {url}")
         
         response = None
+        waiter = waiter or QuiescenceWaiter().attach(page)
+        settle_seconds = 0.0
         try:
+            # Politesse par hôte (n'attend que si l'hôte a été sollicité récemment)
+            await get_rate_limiter().wait_async(url)
+            
             # Essai 1: Chargement standard (domcontentloaded)
             try:
-                response = page.goto(url, wait_until='domcontentloaded', timeout=self.timeout)
+                response = await page.goto(url, wait_until='domcontentloaded', timeout=self.timeout)
             except Exception as e:
                 print(f"    ⚠️ Timeout sur domcontentloaded, tentative en mode 'commit' (plus rapide)...")
                 # Essai 2: Mode dégradé (commit) - on veut juste le HTML
-                response = page.goto(url, wait_until='commit', timeout=self.timeout)
-                # On attend un peu manuellement pour laisser une chance au contenu de s'afficher
-                page.wait_for_timeout(2000)
+                response = await page.goto(url, wait_until='commit', timeout=self.timeout)
+                # On laisse une chance au contenu de s'afficher (2s max)
+                settle_seconds += await waiter.wait(page, max_wait=2, kind='commit_fallback')
             
-            # Attendre un peu pour que le JavaScript s'exécute
-            page.wait_for_timeout(1000)
+            # Attendre que le JavaScript ait fini de modifier la page (1s max)
+            settle_seconds += await waiter.wait(page, max_wait=1, kind='navigation')
             
-            # Extraire les informations + preview du contenu
+            # Extraire les informations + preview du contenu (un seul aller-retour navigateur)
+            harvest_start = time.perf_counter()
+            harvest = await self.harvest_page(page)
+            harvest_ms = (time.perf_counter() - harvest_start) * 1000
             page_data = {
                 'url': url,
                 'status': response.status if response else None,
-                'title': page.title(),
+                'title': harvest['title'],
                 'path': urlparse(url).path,
-                'navigation': self.extract_navigation_links(page),
-                'pagination': self.detect_pagination(page),
-                'preview': self.extract_page_preview(page)
+                'navigation': await self.extract_navigation_links(page, harvest),
+                'pagination': await self.detect_pagination(page, harvest),
+                'preview': await self.extract_page_preview(page, harvest),
+                'settle_seconds': round(settle_seconds, 3),
+                'harvest_ms': round(harvest_ms, 1)
             }
+            if resource_usage is not None:
+                page_data['resources'] = record_resource_usage(resource_usage)
             
             return page_data
             
@@ -344,6 +463,306 @@ class SmartCrawler:
             print(f"    └─ Erreur: {e}")
             return None
     
+    async def crawl_static(self, url: str) -> Tuple[Optional[Dict], str]:
+        """
+        Crawl d'une page sans navigateur (mode hybride) : GET via le client HTTP partagé, collecte lxml.
+        Retourne (page_data, 'static_ok'), (None, 'non_html') pour une cible ignorée,
+        (None, 'transient_error') après l'échec des retries (réseau, 429, 5xx : ni rendu ni mémorisation),
+        ou (None, raison) si la page doit être rendue par le navigateur.
+        """
+        print(f"[*] Crawling (HTTP): {url}")
+        
+        async def _attempt() -> Dict:
+            await get_rate_limiter().wait_async(url)
+            fetched = await fetch_static(url, CRAWL_STATIC_HEADERS, self.timeout / 1000)
+            if fetched['status'] in RETRY_POLICY_CONFIG['retry_status_codes']:
+                # Challenge anti-bot servi en 503 : décision de contenu, pas une panne
+                if fetched['html'] and await asyncio.to_thread(is_js_challenge, fetched['html']):
+                    fetched['challenge'] = True
+                    return fetched
+                raise RetryableStatusError(fetched['status'], fetched['retry_after'])
+            return fetched
+        
+        try:
+            # Backoff, Retry-After et disjoncteur partagés : un hôte qui demande de ralentir n'est pas
+            # relancé aussitôt par le navigateur
+            fetched = await get_retry_policy().execute_async(url, _attempt)
+        except Exception as e:
+            print(f"    └─ Échec HTTP transitoire ({e}), page ignorée")
+            return None, 'transient_error'
+        if fetched['skipped']:
+            print(f"    └─ Ignorée: {fetched['content_type']}")
+            return None, fetched['skipped']
+        if fetched.get('challenge'):
+            return None, 'js_challenge'
+        if fetched['status'] in STATIC_CRAWL_CONFIG['escalate_statuses']:
+            return None, f"status_{fetched['status']}"
+        
+        # Parsing et XPath lxml hors de la boucle : les autres pages du crawl avancent pendant ce temps
+        harvest_start = time.perf_counter()
+        harvest, reason = await asyncio.to_thread(harvest_html, fetched['html'], self.harvest_options())
+        harvest_ms = (time.perf_counter() - harvest_start) * 1000
+        if harvest is None:
+            return None, reason
+        page_data = {
+            'url': url,
+            'status': fetched['status'],
+            'title': harvest['title'],
+            'path': urlparse(url).path,
+            'navigation': await self.extract_navigation_links(None, harvest),
+            'pagination': await self.detect_pagination(None, harvest),
+            'preview': await self.extract_page_preview(None, harvest),
+            'settle_seconds': 0.0,
+            'harvest_ms': round(harvest_ms, 1),
+            'fetch': 'static'
+        }
+        return page_data, reason
+    
+    async def crawl_url(self, worker: Dict, url: str) -> Optional[Dict]:
+        """
+        Crawl d'une URL selon le mode : en hybride, HTTP d'abord et navigateur seulement si
+        la décision mémorisée pour ce motif d'URL ou les heuristiques (liens/contenu générés en JS) l'exigent.
+        """
+        memory = get_render_memory()
+        reason = None
+        if self.mode == 'hybrid' and memory.lookup(url) is not True:
+            page_data, reason = await self.crawl_static(url)
+            if reason == 'non_html':
+                self.fetch_stats['skipped_non_html'] += 1
+                return None
+            if reason == 'transient_error':
+                self.fetch_stats['transient_failures'] += 1
+                return None
+            if page_data is not None:
+                self.fetch_stats['static'] += 1
+                memory.count('static_fetches')
+                memory.record(url, False, reason)
+                return page_data
+            print(f"    └─ Rendu navigateur nécessaire ({reason})")
+            self.fetch_stats['escalated'] += 1
+            self.fetch_stats['render_reasons'][reason] = self.fetch_stats['render_reasons'].get(reason, 0) + 1
+            memory.count('escalations')
+            # Seules les raisons tirées du contenu valent pour tout le motif d'URL (403, réponse vide : cette page)
+            if reason in CONTENT_RENDER_REASONS:
+                memory.record(url, True, reason)
+        
+        if worker.get('page') is None:
+            await worker['open_page'](worker)
+        page_data = await self.crawl_page(worker['page'], url, worker['waiter'], worker['resource_usage'])
+        self.fetch_stats['rendered'] += 1
+        if self.mode == 'hybrid':
+            memory.count('js_renders')
+        if page_data is not None:
+            page_data['fetch'] = 'browser'
+            if reason:
+                page_data['render_reason'] = reason
+        return page_data
+    
+    async def _crawl_pages(self) -> Tuple[List[Dict], Dict[str, List[Dict]]]:
+        """
+        Crawl concurrent, exécuté sur la boucle du pool : `concurrency` workers, pages navigateur
+        réparties sur `contexts` contextes. En mode hybride, les contextes ne sont ouverts qu'à la
+        première page à rendre (un site entièrement statique ne lance jamais Chromium).
+        """
+        pool = get_browser_pool()
+        async with AsyncExitStack() as stack:
+            contexts = []
+            contexts_lock = asyncio.Lock()
+            
+            async def _open_page(worker: Dict):
+                async with contexts_lock:
+                    if not contexts:
+                        for _ in range(self.contexts):
+                            context = await stack.enter_async_context(pool.context(**CRAWL_CONTEXT_OPTIONS))
+                            await context.add_init_script(CRAWL_INIT_SCRIPT)
+                            contexts.append(context)
+                page = await contexts[worker['index'] % len(contexts)].new_page()
+                worker.update({
+                    'page': page,
+                    # Images, CSS, polices et traqueurs bloqués : seuls le DOM et les liens comptent
+                    'resource_usage': await get_resource_policy('crawl').attach(page),
+                    'waiter': QuiescenceWaiter().attach(page)
+                })
+            
+            workers = [
+                {'index': index, 'page': None, 'resource_usage': None, 'waiter': None, 'open_page': _open_page}
+                for index in range(self.concurrency)
+            ]
+            if self.mode == 'browser':
+                for worker in workers:
+                    await _open_page(worker)
+            return await self._run_workers(workers)
+    
+    async def _run_workers(self, workers: List[Dict]) -> Tuple[List[Dict], Dict[str, List[Dict]]]:
+        """
+        File d'URLs partagée par les workers (une page chacun).
+        Le crawl s'arrête quand max_pages pages sont lancées ou que la file est vide sans page en cours.
+        """
+        if self.base_url not in self.frontier:
+            self.frontier.push(self.base_url, zone='nav')
+        pages_data, all_navigation = self.pages_data, self.all_navigation
+        state = {'in_flight': 0}
+        condition = asyncio.Condition()
+        
+        async def _next_url() -> Optional[str]:
+            async with condition:
+                while True:
+                    if len(self.visited_urls) >= self.max_pages:
+                        return None
+                    # Meilleure URL non visitée (marquée visitée par le frontier)
+                    url = self.frontier.pop()
+                    if url is not None:
+                        state['in_flight'] += 1
+                        return url
+                    if state['in_flight'] == 0:
+                        return None
+                    # File vide mais des pages en cours peuvent découvrir de nouveaux liens
+                    await condition.wait()
+        
+        async def _worker(worker: Dict):
+            while True:
+                url = await _next_url()
+                if url is None:
+                    return
+                page_data = None
+                checkpoint = None
+                try:
+                    # Politesse par hôte : nombre de pages en parallèle plafonné (en plus du rate limiter)
+                    async with self._host_slot(url):
+                        page_data = await self.crawl_url(worker, url)
+                finally:
+                    async with condition:
+                        state['in_flight'] -= 1
+                        self._completed_urls.add(url)
+                        if page_data:
+                            pages_data.append(page_data)
+                            self._record_page(page_data, all_navigation)
+                            if self.checkpoint_store:
+                                self._unsaved_pages.append({'url': url, 'page': page_data})
+                        checkpoint = self._checkpoint_if_due()
+                        condition.notify_all()
+                # Écriture hors de la boucle : les autres workers continuent pendant la sauvegarde
+                if checkpoint:
+                    await self._write_checkpoint(*checkpoint)
+        
+        start = time.perf_counter()
+        await asyncio.gather(*(_worker(worker) for worker in workers))
+        self.crawl_seconds = time.perf_counter() - start
+        await self.save_checkpoint()
+        return pages_data, all_navigation
+    
+    def _host_slot(self, url: str) -> asyncio.Semaphore:
+        host = urlparse(url).netloc.lower()
+        slot = self._host_slots.get(host)
+        if slot is None:
+            slot = self._host_slots[host] = asyncio.Semaphore(CRAWL_CONFIG['per_host_concurrency'])
+        return slot
+    
+    def _record_page(self, page_data: Dict, all_navigation: Dict[str, List[Dict]]):
+        """Ajoute les chemins, liens de navigation et pages de pagination d'une page crawlée."""
+        depth = self.frontier.depth_of(page_data['url']) + 1
+        self._merge_page_results(page_data, all_navigation)
+        
+        # Ajouter aux URLs à visiter (ignoré si déjà visitée ou en file)
+        for zone, links in page_data['navigation'].items():
+            for link_data in links:
+                self.frontier.push(link_data['url'], zone=zone, depth=depth)
+        
+        # Ajouter les pages de pagination
+        for pag_url in page_data['pagination']:
+            self.frontier.push(pag_url, zone='other', depth=depth, pagination=True)
+    
+    def _merge_page_results(self, page_data: Dict, all_navigation: Dict[str, List[Dict]]):
+        """Chemin et liens de navigation (dédoublonnés) d'une page, aussi rejoué à la reprise."""
+        # Ajouter le chemin découvert
+        path = page_data['path']
+        if path and path != '/':
+            self.discovered_paths.add(path.rstrip('/'))
+        
+        # Collecter les liens de navigation
+        for zone, links in page_data['navigation'].items():
+            if zone not in all_navigation:
+                all_navigation[zone] = []
+            zone_keys = self._navigation_keys.setdefault(zone, set())
+            for link_data in links:
+                key = link_key(link_data)
+                if key not in zone_keys:
+                    zone_keys.add(key)
+                    all_navigation[zone].append(link_data)
+    
+    # =================== POINT DE REPRISE ===================
+    
+    def checkpoint_state(self) -> Dict:
+        """
+        État nécessaire à la reprise : pages terminées et file (pages en cours remises en tête).
+        Les résultats des pages sont ajoutés à part (append_pages) : une sauvegarde ne réécrit pas tout le crawl.
+        """
+        return {
+            'base_url': self.base_url,
+            'completed': list(self._completed_urls),
+            'frontier': self.frontier.to_dict(pending=self.visited_urls - self._completed_urls)
+        }
+    
+    def _take_checkpoint(self) -> Tuple[Dict, List[Dict]]:
+        """Instantané (sur la boucle) : état courant et résultats pas encore sauvegardés."""
+        records, self._unsaved_pages = self._unsaved_pages, []
+        self._last_checkpoint = (len(self._completed_urls), time.monotonic())
+        return self.checkpoint_state(), records
+    
+    def _checkpoint_if_due(self) -> Optional[Tuple[Dict, List[Dict]]]:
+        """Instantané toutes les `every_pages` pages terminées ou toutes les `every_seconds` secondes."""
+        if not self.checkpoint_store:
+            return None
+        pages_at_last, time_at_last = self._last_checkpoint
+        if (len(self._completed_urls) - pages_at_last >= CRAWL_CHECKPOINT_CONFIG['every_pages']
+                or time.monotonic() - time_at_last >= CRAWL_CHECKPOINT_CONFIG['every_seconds']):
+            return self._take_checkpoint()
+        return None
+    
+    async def _write_checkpoint(self, state: Dict, records: List[Dict]):
+        """Sérialisation et écriture dans un thread ; résultats d'abord, puis l'état qui les référence."""
+        async with self._checkpoint_lock:
+            try:
+                await asyncio.to_thread(self.checkpoint_store.append_pages, self.checkpoint_id, records)
+                await asyncio.to_thread(self.checkpoint_store.save, self.checkpoint_id, state)
+            except OSError as e:
+                print(f"⚠️ Point de reprise non sauvegardé ({self.checkpoint_id}): {e}")
+                # Résultats gardés pour la prochaine sauvegarde
+                self._unsaved_pages[:0] = records
+    
+    async def save_checkpoint(self):
+        if not self.checkpoint_store:
+            return
+        await self._write_checkpoint(*self._take_checkpoint())
+    
+    def _restore_checkpoint(self):
+        state = self.checkpoint_store.load(self.checkpoint_id)
+        if state and state.get('base_url') != self.base_url:
+            print(f"⚠️ Point de reprise {self.checkpoint_id} ignoré (autre URL: {state.get('base_url')})")
+            state = None
+        if not state:
+            # Résultats orphelins d'un point de reprise absent ou ignoré : le crawl repart de zéro
+            self.checkpoint_store.delete(self.checkpoint_id)
+            return
+        # Les pages terminées ne seront pas revisitées (visited_urls est partagé avec le frontier)
+        completed = set(state['completed'])
+        self._completed_urls.update(completed)
+        self.visited_urls.update(completed)
+        self.frontier.load_dict(state['frontier'])
+        # Résultats des pages terminées, dans l'ordre du crawl ; une page ajoutée puis recrawlée
+        # (arrêt entre l'ajout et l'état) ne compte qu'une fois, avec son dernier résultat
+        pages = {}
+        for record in self.checkpoint_store.load_pages(self.checkpoint_id):
+            if record.get('url') in completed:
+                pages[record['url']] = record['page']
+        for page_data in pages.values():
+            self.pages_data.append(page_data)
+            self._merge_page_results(page_data, self.all_navigation)
+        self.resumed_pages = len(self._completed_urls)
+        self._last_checkpoint = (self.resumed_pages, time.monotonic())
+        print(f"♻️ Reprise du crawl {self.checkpoint_id}: {self.resumed_pages} pages déjà crawlées, "
+              f"{len(self.frontier)} URLs en file")
+    
     def crawl(self) -> Dict:
         """
         Crawl le site en commençant par la page d'accueil.
@@ -353,95 +772,8 @@ class SmartCrawler:
         print(f"SMART CRAWLER - Analyse de {self.base_url}")
         print(f"{'='*60}\n")
         
-        all_navigation = {}
-        urls_to_visit = [self.base_url]
-        pages_data = []
-        
-        with sync_playwright() as p:
-            # Lancer le navigateur en mode headless avec options furtives
-            browser = p.chromium.launch(
-                headless=True,
-                args=[
-                    '--disable-blink-features=AutomationControlled',
-                    '--no-sandbox',
-                    '--disable-setuid-sandbox',
-                    '--disable-dev-shm-usage',
-                    '--disable-accelerated-2d-canvas',
-                    '--disable-gpu'
-                ]
-            )
-            context = browser.new_context(
-                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36',
-                viewport={'width': 1920, 'height': 1080},
-                device_scale_factor=1,
-                has_touch=False,
-                is_mobile=False,
-                java_script_enabled=True,
-                locale='fr-FR',
-                timezone_id='Europe/Paris'
-            )
-            
-            # Script anti-détection basique
-            context.add_init_script("""
-                Object.defineProperty(navigator, 'webdriver', {
-                    get: () => undefined
-                });
-                Object.defineProperty(navigator, 'languages', {
-                    get: () => ['fr-FR', 'fr', 'en-US', 'en']
-                });
-                Object.defineProperty(navigator, 'plugins', {
-                    get: () => [1, 2, 3, 4, 5]
-                });
-            """)
-            
-            page = context.new_page()
-            
-            while urls_to_visit and len(self.visited_urls) < self.max_pages:
-                current_url = urls_to_visit.pop(0)
-                
-                # Skip si déjà visité
-                if current_url in self.visited_urls:
-                    continue
-                
-                # Marquer comme visité
-                self.visited_urls.add(current_url)
-                
-                # Crawler la page
-                page_data = self.crawl_page(page, current_url)
-                
-                if page_data:
-                    pages_data.append(page_data)
-                    
-                    # Ajouter le chemin découvert
-                    path = page_data['path']
-                    if path and path != '/':
-                        self.discovered_paths.add(path.rstrip('/'))
-                    
-                    # Collecter les liens de navigation
-                    for zone, links in page_data['navigation'].items():
-                        if zone not in all_navigation:
-                            all_navigation[zone] = []
-                        
-                        for link_data in links:
-                            link_url = link_data['url']
-                            
-                            # Ajouter à la navigation globale
-                            if link_data not in all_navigation[zone]:
-                                all_navigation[zone].append(link_data)
-                            
-                            # Ajouter aux URLs à visiter
-                            if link_url not in self.visited_urls and link_url not in urls_to_visit:
-                                urls_to_visit.append(link_url)
-                    
-                    # Ajouter les pages de pagination
-                    for pag_url in page_data['pagination']:
-                        if pag_url not in self.visited_urls and pag_url not in urls_to_visit:
-                            urls_to_visit.append(pag_url)
-                
-                # Petit délai pour éviter de surcharger le serveur
-                time.sleep(0.5)
-            
-            browser.close()
+        # Le navigateur est emprunté au pool partagé (pas de lancement Chromium par crawl)
+        pages_data, all_navigation = get_browser_pool().run(self._crawl_pages())
         
         # Organiser les résultats
         unique_paths = sorted(list(self.discovered_paths))
@@ -487,11 +819,28 @@ class SmartCrawler:
         print(f"Pages visitées: {len(self.visited_urls)}")
         print(f"Chemins découverts: {len(unique_paths)}")
         print(f"Pages principales: {len(main_pages)}")
+        crawled_now = len(self._completed_urls) - self.resumed_pages
+        pages_per_second = crawled_now / self.crawl_seconds if self.crawl_seconds else 0.0
+        print(f"Débit: {pages_per_second:.2f} pages/s ({self.concurrency} pages en parallèle)")
+        print(f"Frontier: {self.frontier.get_stats()}")
+        print(f"Récupération ({self.mode}): {self.fetch_stats['static']} en HTTP, "
+              f"{self.fetch_stats['rendered']} rendues ({self.fetch_stats['escalated']} escalades), "
+              f"{self.fetch_stats['skipped_non_html']} non HTML ignorées, "
+              f"{self.fetch_stats['transient_failures']} échecs transitoires")
         
         return {
             'success': True,
             'base_url': self.base_url,
             'pages_crawled': len(self.visited_urls),
+            'crawl_stats': {
+                'seconds': round(self.crawl_seconds, 2),
+                'pages_per_second': round(pages_per_second, 2),
+                'concurrency': self.concurrency,
+                'contexts': self.contexts,
+                'resumed_pages': self.resumed_pages,
+                'mode': self.mode,
+                'fetch': self.fetch_stats
+            },
             'total_paths': len(unique_paths),
             'paths': unique_paths,
             'main_pages': main_pages[:20],  # Top 20 pages principales
@@ -510,7 +859,10 @@ class SmartCrawler:
         }
 
 
-def discover_paths_smart(url: str, max_pages: int = 30) -> Dict:
+def discover_paths_smart(
+    url: str, max_pages: int = 30, concurrency: Optional[int] = None, checkpoint_id: Optional[str] = None,
+    mode: Optional[str] = None
+) -> Dict:
     """
     Découvre les chemins d'un site en utilisant un crawler intelligent avec Playwright.
     Similaire à Web Scraper, ParseHub, Octoparse.
@@ -518,11 +870,16 @@ def discover_paths_smart(url: str, max_pages: int = 30) -> Dict:
     Args:
         url: URL du site à crawler
         max_pages: Nombre maximum de pages à visiter
+        concurrency: Pages chargées en parallèle (défaut : CRAWL_CONFIG['concurrency'])
+        checkpoint_id: Point de reprise (sauvegarde périodique, reprise si un état existe déjà)
+        mode: 'hybrid' (HTTP + lxml, navigateur si nécessaire) ou 'browser' (défaut : CRAWL_CONFIG['mode'])
     
     Returns:
         dict avec les chemins découverts et la structure du site
     """
-    crawler = SmartCrawler(url, max_pages=max_pages)
+    crawler = SmartCrawler(
+        url, max_pages=max_pages, concurrency=concurrency, checkpoint_id=checkpoint_id, mode=mode
+    )
     return crawler.crawl()
 
 
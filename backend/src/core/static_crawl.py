@@ -0,0 +1,241 @@
+# backend/src/core/static_crawl.py
+# Crawl sans navigateur pour le SmartCrawler en mode hybride : GET via le client HTTP partagé + lxml
+# Produit la même collecte (titre, liens par zone, pagination, prévisualisation) que _HARVEST_SCRIPT
+# Sonde HEAD / Content-Type : les cibles non HTML sont ignorées ; heuristiques de rendu JS (liens et contenu)
+# RELEVANT FILES: smart_crawler.py, render_decision.py, http_client.py
+
+import os
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from lxml import html as lxml_html
+
+from .http_client import get_http_client
+from .render_decision import needs_js_render, needs_js_render_doc
+
+
+# Configuration du crawl statique (surchargeable par variables d'environnement)
+STATIC_CRAWL_CONFIG = {
+    'min_js_links': int(os.getenv('STATIC_CRAWL_MIN_JS_LINKS', '5')),     # liens sans href réel avant soupçon
+    'js_link_ratio': float(os.getenv('STATIC_CRAWL_JS_LINK_RATIO', '0.5')),
+    'min_scripts_without_links': 1,   # page sans lien crawlable mais avec scripts : liens générés en JS
+    # Statuts d'une protection anti-bot : le navigateur a une chance de passer
+    # (429 et 5xx sont transitoires : retry de la politique partagée, jamais d'escalade)
+    'escalate_statuses': {403}
+}
+
+# Raisons tirées du contenu de la page : les seules mémorisées pour le motif d'URL (RenderDecisionMemory).
+# Un échec réseau, un 429 ou un 5xx ne dit rien du besoin de rendu JS des autres pages du motif.
+CONTENT_RENDER_REASONS = frozenset({
+    'spa_shell', 'js_challenge', 'no_static_links', 'js_links', 'missing_content', 'noscript_warning'
+})
+
+HTML_CONTENT_TYPES = ('text/html', 'application/xhtml+xml')
+
+# Extensions de pages HTML : pas de sonde HEAD (le Content-Type du GET suffit)
+HTML_EXTENSIONS = {'', '.html', '.htm', '.xhtml', '.php', '.asp', '.aspx', '.jsp', '.cfm', '.shtml'}
+
+
+def _class_token(name: str) -> str:
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+# Équivalents XPath des sélecteurs CSS de smart_crawler.py (lxml sans cssselect)
+ZONE_XPATHS = {
+    'header': "//*[self::header or @id='header' or contains(@class, 'header')]//a",
+    'nav': (f"//*[self::nav or @role='navigation' or {_class_token('nav')} "
+            f"or {_class_token('navbar')} or {_class_token('navigation')}]//a"),
+    'menu': "//*[@id='menu' or contains(@class, 'menu')]//a",
+    'footer': "//*[self::footer or @id='footer' or contains(@class, 'footer')]//a",
+    'sidebar': "//*[self::aside or @id='sidebar' or contains(@class, 'sidebar')]//a"
+}
+
+PAGINATION_XPATH = (
+    "//*[contains(@class, 'page') or (self::nav and (contains(@aria-label, 'pagination') "
+    "or contains(@aria-label, 'Pagination')))]//a | //a[@rel='next' or @rel='prev']"
+)
+
+META_XPATHS = {
+    'description': "//meta[@name='description']/@content",
+    'keywords': "//meta[@name='keywords']/@content",
+    'og:title': "//meta[@property='og:title']/@content",
+    'og:description': "//meta[@property='og:description']/@content",
+    'og:image': "//meta[@property='og:image']/@content"
+}
+
+MAIN_XPATHS = [
+    '//main', '//article', f"//*[{_class_token('content')}]", f"//*[{_class_token('main-content')}]",
+    "//*[@id='content']", "//*[@role='main']", '//body'
+]
+
+_HIDDEN_TAGS = {'script', 'style', 'noscript', 'template'}
+
+
+def is_html_content_type(content_type: Optional[str]) -> bool:
+    """Content-Type HTML (absent = supposé HTML, comme un navigateur)."""
+    if not content_type:
+        return True
+    return content_type.split(';')[0].strip().lower() in HTML_CONTENT_TYPES
+
+
+def needs_head_probe(url: str) -> bool:
+    """Extension inconnue en fin de chemin (.json, .xml, .csv...) : sonder avant de télécharger le corps."""
+    last_segment = urlparse(url).path.rsplit('/', 1)[-1]
+    extension = os.path.splitext(last_segment)[1].lower()
+    return extension not in HTML_EXTENSIONS
+
+
+async def fetch_static(url: str, headers: Dict, timeout: float) -> Dict:
+    """
+    Récupère une page sans navigateur.
+    Retourne {'status', 'html', 'content_type', 'skipped', 'retry_after'} ;
+    skipped = 'non_html' si la cible n'est pas une page.
+    """
+    client = get_http_client()
+    if needs_head_probe(url):
+        try:
+            head = await client.ahead(url, headers=headers, timeout=timeout, follow_redirects=True, verify=False)
+            content_type = head.headers.get('content-type')
+            if head.status_code < 400 and not is_html_content_type(content_type):
+                return {'status': head.status_code, 'html': '', 'content_type': content_type, 'skipped': 'non_html',
+                        'retry_after': None}
+        except Exception:
+            pass   # HEAD refusé par certains serveurs : le GET tranchera
+
+    response = await client.aget(url, headers=headers, timeout=timeout, follow_redirects=True, verify=False)
+    content_type = response.headers.get('content-type')
+    retry_after = response.headers.get('retry-after')
+    if not is_html_content_type(content_type):
+        return {'status': response.status_code, 'html': '', 'content_type': content_type, 'skipped': 'non_html',
+                'retry_after': retry_after}
+    return {'status': response.status_code, 'html': response.text, 'content_type': content_type, 'skipped': None,
+            'retry_after': retry_after}
+
+
+def is_js_challenge(html: str) -> bool:
+    """Page d'erreur qui est en fait un challenge anti-bot JavaScript (ex. 503 « Just a moment... »)."""
+    return needs_js_render(html) == (True, 'js_challenge')
+
+
+def _text(element) -> str:
+    """Texte visible d'un élément (hors scripts, styles et commentaires), espaces normalisés."""
+    parts = []
+
+    def _walk(node):
+        if node.text:
+            parts.append(node.text)
+        for child in node:
+            if isinstance(child.tag, str) and child.tag not in _HIDDEN_TAGS:
+                _walk(child)
+            if child.tail:
+                parts.append(child.tail)
+
+    _walk(element)
+    return ' '.join(' '.join(parts).split())
+
+
+def harvest_document(doc, options: Dict) -> Dict:
+    """Même structure que _HARVEST_SCRIPT (smart_crawler.py), calculée sur un arbre lxml."""
+    links: List[List[str]] = []
+    zoned_hrefs = set()
+    for zone, xpath in ZONE_XPATHS.items():
+        seen = set()
+        for a in doc.xpath(xpath)[:options['zoneLimit']]:
+            href = a.get('href')
+            if not href or href in seen:
+                continue
+            seen.add(href)
+            zoned_hrefs.add(href)
+            links.append([zone, href, _text(a)])
+    other_seen = set()
+    for a in doc.xpath('//a[@href]')[:options['otherLimit']]:
+        href = a.get('href')
+        if not href or href in zoned_hrefs or href in other_seen:
+            continue
+        other_seen.add(href)
+        links.append(['other', href, _text(a)])
+
+    pagination = []
+    for a in doc.xpath(PAGINATION_XPATH):
+        href = a.get('href')
+        if href and href not in pagination:
+            pagination.append(href)
+
+    meta = {}
+    for key, xpath in META_XPATHS.items():
+        values = doc.xpath(xpath)
+        if values and values[0]:
+            meta[key] = str(values[0])
+    images = [
+        [img.get('src') or '', img.get('alt') or '', img.get('width') or '0', img.get('height') or '0']
+        for img in doc.xpath('//img')[:options['maxImages']]
+    ]
+
+    main_text = ''
+    for xpath in MAIN_XPATHS:
+        found = doc.xpath(xpath)
+        if found:
+            main_text = _text(found[0])
+            break
+
+    title = doc.findtext('.//title') or ''
+    return {
+        'title': title.strip(),
+        'links': links,
+        'pagination': pagination,
+        'preview': {
+            'meta': meta,
+            'images': [img for img in images if img[0]],
+            'text': main_text[:options['textLimit']],
+            'textTruncated': len(main_text) > options['textLimit'],
+            'stats': {
+                'total_links': len(doc.xpath('//a[@href]')),
+                'total_images': len(doc.xpath('//img')),
+                'total_forms': len(doc.xpath('//form')),
+                'total_tables': len(doc.xpath('//table')),
+                'total_lists': len(doc.xpath('//ul|//ol'))
+            }
+        }
+    }
+
+
+def links_need_js(doc) -> Optional[str]:
+    """
+    Liens générés ou gérés en JavaScript : aucun lien crawlable alors que la page a des scripts,
+    ou une majorité de liens sans cible (href="#", javascript:, <a> sans href des routeurs SPA).
+    """
+    anchors = doc.xpath('//a')
+    real = 0
+    for a in anchors:
+        href = (a.get('href') or '').strip().lower()
+        if href and not href.startswith(('#', 'javascript:')):
+            real += 1
+    fake = len(anchors) - real
+    if real == 0 and len(doc.xpath('//script')) >= STATIC_CRAWL_CONFIG['min_scripts_without_links']:
+        return 'no_static_links'
+    if fake >= STATIC_CRAWL_CONFIG['min_js_links'] and fake > STATIC_CRAWL_CONFIG['js_link_ratio'] * len(anchors):
+        return 'js_links'
+    return None
+
+
+def harvest_html(html: str, options: Dict) -> Tuple[Optional[Dict], str]:
+    """
+    Collecte d'une page HTML statique, avec un seul parsing.
+    Retourne (collecte, 'static_ok') ou (None, raison) si la page doit être rendue par le navigateur.
+    """
+    if not html or not html.strip():
+        return None, 'empty_response'
+    try:
+        doc = lxml_html.fromstring(html)
+    except Exception:
+        return None, 'unparsable_html'
+
+    reason = links_need_js(doc)
+    if reason:
+        return None, reason
+    harvest = harvest_document(doc, options)
+    # En dernier : needs_js_render_doc retire scripts/styles de l'arbre
+    use_js, reason = needs_js_render_doc(doc)
+    if use_js:
+        return None, reason
+    return harvest, 'static_ok'
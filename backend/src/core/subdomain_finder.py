@@ -7,7 +7,8 @@ import re
 import json
 from typing import List, Set
 from urllib.parse import urlparse
-import httpx
+
+from .http_client import get_http_client
 
 
 def extract_domain(url: str) -> str:
@@ -30,28 +31,27 @@ def find_subdomains_crtsh(domain: str, timeout: int = 10) -> Set[str]:
     try:
         url = f"https://crt.sh/?q=%.{domain}&output=json"
         
-        with httpx.Client(timeout=timeout, follow_redirects=True) as client:
-            response = client.get(url)
+        response = get_http_client().get(url, timeout=timeout, follow_redirects=True)
+        
+        if response.status_code == 200:
+            data = response.json()
             
-            if response.status_code == 200:
-                data = response.json()
+            for entry in data:
+                name_value = entry.get('name_value', '')
+                # Peut contenir plusieurs noms séparés par des retours à la ligne
+                names = name_value.split('\n')
                 
-                for entry in data:
-                    name_value = entry.get('name_value', '')
-                    # Peut contenir plusieurs noms séparés par des retours à la ligne
-                    names = name_value.split('\n')
+                for name in names:
+                    name = name.strip().lower()
+                    # Enlever les wildcards
+                    name = name.replace('*.', '')
                     
-                    for name in names:
-                        name = name.strip().lower()
-                        # Enlever les wildcards
-                        name = name.replace('*.', '')
-                        
-                        # Vérifier que c'est bien un sous-domaine du domaine cible
-                        if name.endswith(domain) and name != domain:
-                            # Valider que c'est un nom de domaine valide
-                            if re.match(r'^[a-z0-9.-]+$', name):
-                                subdomains.add(name)
-                
+                    # Vérifier que c'est bien un sous-domaine du domaine cible
+                    if name.endswith(domain) and name != domain:
+                        # Valider que c'est un nom de domaine valide
+                        if re.match(r'^[a-z0-9.-]+$', name):
+                            subdomains.add(name)
+            
     except Exception as e:
         print(f"Erreur crt.sh pour {domain}: {e}")
     
@@ -67,18 +67,17 @@ def find_subdomains_hackertarget(domain: str, timeout: int = 10) -> Set[str]:
     try:
         url = f"https://api.hackertarget.com/hostsearch/?q={domain}"
         
-        with httpx.Client(timeout=timeout) as client:
-            response = client.get(url)
+        response = get_http_client().get(url, timeout=timeout)
+        
+        if response.status_code == 200:
+            lines = response.text.strip().split('\n')
+            
+            for line in lines:
+                if ',' in line:
+                    subdomain = line.split(',')[0].strip().lower()
+                    if subdomain.endswith(domain) and re.match(r'^[a-z0-9.-]+$', subdomain):
+                        subdomains.add(subdomain)
             
-            if response.status_code == 200:
-                lines = response.text.strip().split('\n')
-                
-                for line in lines:
-                    if ',' in line:
-                        subdomain = line.split(',')[0].strip().lower()
-                        if subdomain.endswith(domain) and re.match(r'^[a-z0-9.-]+$', subdomain):
-                            subdomains.add(subdomain)
-                
     except Exception as e:
         print(f"Erreur HackerTarget pour {domain}: {e}")
     
@@ -95,17 +94,16 @@ def find_subdomains_alienvault(domain: str, timeout: int = 10) -> Set[str]:
     try:
         url = f"https://otx.alienvault.com/api/v1/indicators/domain/{domain}/passive_dns"
         
-        with httpx.Client(timeout=timeout, follow_redirects=True) as client:
-            response = client.get(url)
+        response = get_http_client().get(url, timeout=timeout, follow_redirects=True)
+        
+        if response.status_code == 200:
+            data = response.json()
             
-            if response.status_code == 200:
-                data = response.json()
-                
-                for entry in data.get('passive_dns', []):
-                    hostname = entry.get('hostname', '').strip().lower()
-                    if hostname and hostname.endswith(domain):
-                        subdomains.add(hostname)
-    
+            for entry in data.get('passive_dns', []):
+                hostname = entry.get('hostname', '').strip().lower()
+                if hostname and hostname.endswith(domain):
+                    subdomains.add(hostname)
+
     except Exception as e:
         print(f"[AlienVault] Erreur: {e}")
     
@@ -122,17 +120,16 @@ def find_subdomains_threatcrowd(domain: str, timeout: int = 10) -> Set[str]:
     try:
         url = f"https://www.threatcrowd.org/searchApi/v2/domain/report/?domain={domain}"
         
-        with httpx.Client(timeout=timeout, follow_redirects=True) as client:
-            response = client.get(url)
+        response = get_http_client().get(url, timeout=timeout, follow_redirects=True)
+        
+        if response.status_code == 200:
+            data = response.json()
             
-            if response.status_code == 200:
-                data = response.json()
-                
-                for subdomain in data.get('subdomains', []):
-                    subdomain = subdomain.strip().lower()
-                    if subdomain and subdomain.endswith(domain):
-                        subdomains.add(subdomain)
-    
+            for subdomain in data.get('subdomains', []):
+                subdomain = subdomain.strip().lower()
+                if subdomain and subdomain.endswith(domain):
+                    subdomains.add(subdomain)
+
     except Exception as e:
         print(f"[ThreatCrowd] Erreur: {e}")
     
@@ -149,22 +146,21 @@ def find_subdomains_urlscan(domain: str, timeout: int = 10) -> Set[str]:
     try:
         url = f"https://urlscan.io/api/v1/search/?q=domain:{domain}"
         
-        with httpx.Client(timeout=timeout, follow_redirects=True) as client:
-            response = client.get(url)
+        response = get_http_client().get(url, timeout=timeout, follow_redirects=True)
+        
+        if response.status_code == 200:
+            data = response.json()
             
-            if response.status_code == 200:
-                data = response.json()
+            for result in data.get('results', []):
+                page_domain = result.get('page', {}).get('domain', '').strip().lower()
+                if page_domain and page_domain.endswith(domain):
+                    subdomains.add(page_domain)
                 
-                for result in data.get('results', []):
-                    page_domain = result.get('page', {}).get('domain', '').strip().lower()
-                    if page_domain and page_domain.endswith(domain):
-                        subdomains.add(page_domain)
-                    
-                    # Aussi extraire du task.domain
-                    task_domain = result.get('task', {}).get('domain', '').strip().lower()
-                    if task_domain and task_domain.endswith(domain):
-                        subdomains.add(task_domain)
-    
+                # Aussi extraire du task.domain
+                task_domain = result.get('task', {}).get('domain', '').strip().lower()
+                if task_domain and task_domain.endswith(domain):
+                    subdomains.add(task_domain)
+
     except Exception as e:
         print(f"[URLScan] Erreur: {e}")
     
@@ -180,21 +176,20 @@ def find_subdomains_dnsrepo(domain: str, timeout: int = 10) -> Set[str]:
     try:
         url = f"https://dnsrepo.noc.org/?domain={domain}"
         
-        with httpx.Client(timeout=timeout, follow_redirects=True) as client:
-            response = client.get(url, headers={
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            })
+        response = get_http_client().get(url, timeout=timeout, follow_redirects=True, headers={
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+        })
+        
+        if response.status_code == 200:
+            # Parser le HTML pour extraire les sous-domaines
+            # Simple regex pour trouver les patterns de sous-domaines
+            pattern = r'([a-z0-9.-]+\.' + re.escape(domain) + r')'
+            matches = re.findall(pattern, response.text.lower())
+            
+            for match in matches:
+                if match != domain and re.match(r'^[a-z0-9.-]+$', match):
+                    subdomains.add(match)
             
-            if response.status_code == 200:
-                # Parser le HTML pour extraire les sous-domaines
-                # Simple regex pour trouver les patterns de sous-domaines
-                pattern = r'([a-z0-9.-]+\.' + re.escape(domain) + r')'
-                matches = re.findall(pattern, response.text.lower())
-                
-                for match in matches:
-                    if match != domain and re.match(r'^[a-z0-9.-]+$', match):
-                        subdomains.add(match)
-                
     except Exception as e:
         print(f"Erreur DNSRepo pour {domain}: {e}")
     
@@ -0,0 +1,173 @@
+# backend/src/core/wait_strategy.py
+# Attente de stabilisation d'une page Playwright (remplace les sleeps fixes après navigation/scroll)
+# Rend la main dès que le DOM ne mute plus et que les requêtes en vol sont terminées, avec un plafond dur
+# Chaque attente est mesurée : durée réelle par type d'attente, nombre de plafonds atteints
+# RELEVANT FILES: fetcher_playwright.py, smart_crawler.py, page_detector.py
+
+import asyncio
+import os
+import threading
+import time
+from typing import Dict, Optional
+
+
+# Configuration de l'attente (surchargeable par variables d'environnement)
+WAIT_STRATEGY_CONFIG = {
+    'quiet_ms': int(os.getenv('WAIT_QUIET_MS', '300')),                  # silence DOM + réseau requis
+    'max_wait': float(os.getenv('WAIT_MAX_SECONDS', '5')),               # plafond par défaut
+    'long_request_ms': int(os.getenv('WAIT_LONG_REQUEST_MS', '2000')),   # long-polling, beacons : ignorés après ce délai
+    'poll_interval': 0.05
+}
+
+# Résout true après quietMs sans mutation, false si le plafond est atteint avant
+_DOM_QUIET_SCRIPT = """
+({quietMs, timeoutMs}) => new Promise((resolve) => {
+    let quietTimer = null;
+    let capTimer = null;
+    const finish = (settled) => {
+        observer.disconnect();
+        clearTimeout(quietTimer);
+        clearTimeout(capTimer);
+        resolve(settled);
+    };
+    const observer = new MutationObserver(() => {
+        clearTimeout(quietTimer);
+        quietTimer = setTimeout(() => finish(true), quietMs);
+    });
+    observer.observe(document, {subtree: true, childList: true, attributes: true, characterData: true});
+    quietTimer = setTimeout(() => finish(true), quietMs);
+    capTimer = setTimeout(() => finish(false), timeoutMs);
+})
+"""
+
+# Types de requêtes qui ne se terminent jamais (ne bloquent pas la stabilisation)
+_STREAMING_TYPES = ('websocket', 'eventsource')
+
+
+class WaitStats:
+    """Durées d'attente réelles par type (navigation, scroll...) pour le processus."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._kinds: Dict[str, Dict] = {}
+
+    def record(self, kind: str, waited: float, capped: bool):
+        with self._lock:
+            entry = self._kinds.setdefault(kind, {'count': 0, 'total': 0.0, 'max': 0.0, 'capped': 0})
+            entry['count'] += 1
+            entry['total'] += waited
+            entry['max'] = max(entry['max'], waited)
+            entry['capped'] += int(capped)
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            return {
+                kind: {
+                    'count': e['count'],
+                    'avg_seconds': round(e['total'] / e['count'], 3) if e['count'] else 0.0,
+                    'max_seconds': round(e['max'], 3),
+                    'capped': e['capped']
+                }
+                for kind, e in self._kinds.items()
+            }
+
+
+_wait_stats = WaitStats()
+
+
+class QuiescenceWaiter:
+    """
+    Suivi des requêtes en vol d'une page + attente de stabilisation.
+
+        waiter = QuiescenceWaiter()
+        waiter.attach(page)                          # avant page.goto pour compter toutes les requêtes
+        await page.goto(url)
+        waited = await waiter.wait(page, max_wait=2, kind='navigation')
+    """
+
+    def __init__(self, quiet_ms: Optional[int] = None, long_request_ms: Optional[int] = None):
+        self.quiet = (quiet_ms or WAIT_STRATEGY_CONFIG['quiet_ms']) / 1000.0
+        self.long_request = (long_request_ms or WAIT_STRATEGY_CONFIG['long_request_ms']) / 1000.0
+        self._inflight: Dict[int, float] = {}     # id(request) -> début
+        self._last_activity = 0.0                  # aucune activité réseau observée
+        self.last_wait: Optional[float] = None
+
+    def _listeners(self):
+        return (('request', self._on_request),
+                ('requestfinished', self._on_request_done),
+                ('requestfailed', self._on_request_done))
+
+    def attach(self, page) -> 'QuiescenceWaiter':
+        for event, handler in self._listeners():
+            page.on(event, handler)
+        return self
+
+    def detach(self, page):
+        for event, handler in self._listeners():
+            try:
+                page.remove_listener(event, handler)
+            except Exception:
+                pass
+
+    def _on_request(self, request):
+        if request.resource_type in _STREAMING_TYPES:
+            return
+        self._inflight[id(request)] = time.monotonic()
+        self._last_activity = time.monotonic()
+
+    def _on_request_done(self, request):
+        if self._inflight.pop(id(request), None) is not None:
+            self._last_activity = time.monotonic()
+
+    def network_quiet(self) -> bool:
+        now = time.monotonic()
+        active = any(now - started < self.long_request for started in self._inflight.values())
+        return not active and now - self._last_activity >= self.quiet
+
+    async def wait(self, page, max_wait: Optional[float] = None, kind: str = 'settle') -> float:
+        """Attend DOM + réseau calmes (au plus max_wait secondes) ; renvoie la durée réellement attendue."""
+        max_wait = WAIT_STRATEGY_CONFIG['max_wait'] if max_wait is None else max_wait
+        start = time.monotonic()
+        deadline = start + max_wait
+        settled = False
+
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            if not self.network_quiet():
+                await asyncio.sleep(min(WAIT_STRATEGY_CONFIG['poll_interval'], remaining))
+                continue
+            try:
+                dom_quiet = await page.evaluate(
+                    _DOM_QUIET_SCRIPT,
+                    {'quietMs': int(self.quiet * 1000), 'timeoutMs': int(remaining * 1000)}
+                )
+            except Exception:
+                # Page en cours de navigation (contexte d'exécution détruit) : on réessaie
+                await asyncio.sleep(min(WAIT_STRATEGY_CONFIG['poll_interval'], max(0.0, remaining)))
+                continue
+            if dom_quiet and self.network_quiet():
+                settled = True
+                break
+
+        waited = time.monotonic() - start
+        self.last_wait = waited
+        _wait_stats.record(kind, waited, capped=not settled)
+        return waited
+
+
+async def wait_for_quiescence(page, max_wait: Optional[float] = None, kind: str = 'settle') -> float:
+    """
+    Attente ponctuelle sur une page sans QuiescenceWaiter attaché :
+    seules les requêtes lancées à partir de maintenant sont suivies.
+    """
+    waiter = QuiescenceWaiter().attach(page)
+    try:
+        return await waiter.wait(page, max_wait=max_wait, kind=kind)
+    finally:
+        waiter.detach(page)
+
+
+def get_wait_stats() -> Dict:
+    return _wait_stats.get_stats()
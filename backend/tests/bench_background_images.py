@@ -0,0 +1,90 @@
+# backend/tests/bench_background_images.py
+# Benchmark de la détection des images en background CSS : style calculé de chaque nœud vs scan CSSOM
+# Pages générées de 2 000 à 50 000 nœuds (cartes produits, quelques backgrounds en CSS et en style inline)
+# Vérifie aussi que les deux méthodes trouvent les mêmes images
+# RELEVANT FILES: background_images.py, fetcher_playwright.py
+
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.core.background_images import COMPUTED_STYLE_SCRIPT, CSSOM_SCRIPT
+from src.core.browser_pool import get_browser_pool, shutdown_browser_pool
+
+SIZES = [int(n) for n in os.getenv('BENCH_NODES', '2000,10000,50000').split(',')]
+RUNS = int(os.getenv('BENCH_RUNS', '5'))
+
+STYLES = """
+<style>
+  .card { padding: 4px; border: 1px solid #ddd; }
+  .card .title { font-weight: bold; }
+  .card.promo .thumb { background-image: url("/img/promo.png"); }
+  .hero { background: #000 url(/img/hero.jpg) no-repeat; }
+  .banner { background-image: url(/img/banner.jpg); }
+  .banner.off { background-image: none; }
+  @media (max-width: 10px) { .card .thumb { background-image: url(/img/never.png); } }
+  .card:hover::after { background-image: url(/img/hover.png); }
+</style>
+"""
+
+
+def build_page(nodes: int) -> str:
+    """Page d'environ `nodes` éléments : 5 nœuds par carte, 1 carte sur 50 en promo."""
+    cards = []
+    for i in range(nodes // 5):
+        promo = ' promo' if i % 50 == 0 else ''
+        inline = f' style="background-image: url(/img/inline-{i}.png)"' if i % 500 == 0 else ''
+        cards.append(
+            f'<div class="card{promo}"><div class="thumb"{inline}></div>'
+            f'<span class="title">Produit {i}</span><p>Description {i}</p><a href="/p/{i}">Voir</a></div>'
+        )
+    return (f'<!DOCTYPE html><html><head>{STYLES}</head><body>'
+            f'<div class="hero"></div><div class="banner"></div><div class="banner off"></div>'
+            f'{"".join(cards)}</body></html>')
+
+
+async def measure(page, script: str) -> tuple:
+    timings = []
+    scan = None
+    for _ in range(RUNS):
+        # Invalide les styles pour mesurer aussi le recalcul (comme après scroll ou hydratation)
+        await page.evaluate("() => document.body.classList.toggle('bench')")
+        start = time.perf_counter()
+        scan = await page.evaluate(script, 100_000)
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings), scan
+
+
+async def _bench():
+    async with get_browser_pool().page() as page:
+        for nodes in SIZES:
+            await page.set_content(build_page(nodes))
+            node_count = await page.evaluate("() => document.getElementsByTagName('*').length")
+            computed_ms, computed = await measure(page, COMPUTED_STYLE_SCRIPT)
+            cssom_ms, cssom = await measure(page, CSSOM_SCRIPT)
+
+            computed_urls = [image['url'] for image in computed['images']]
+            cssom_urls = [image['url'] for image in cssom['images']]
+            assert computed_urls == cssom_urls, "les deux méthodes doivent trouver les mêmes images"
+
+            print(f"{node_count:>7} nœuds | style calculé {computed_ms:8.1f} ms | CSSOM {cssom_ms:7.1f} ms "
+                  f"({cssom['candidates']} candidats) | x{computed_ms / max(cssom_ms, 0.01):5.1f} | "
+                  f"{len(cssom_urls)} images")
+
+
+def main():
+    print("=" * 60)
+    print(f"BENCHMARK BACKGROUNDS CSS ({RUNS} mesures par taille, médiane)")
+    print("=" * 60)
+    pool = get_browser_pool()
+    pool.run(_bench())
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    finally:
+        shutdown_browser_pool()
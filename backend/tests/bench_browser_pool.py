@@ -0,0 +1,124 @@
+# backend/tests/bench_browser_pool.py
+# Benchmark du pool de navigateurs : latence par page avec et sans pool
+# Compare aussi contexte neuf par page et contexte pré-configuré recyclé (lease_page)
+# Sert une page locale pour ne mesurer que le coût navigateur (pas le réseau)
+# RELEVANT FILES: browser_pool.py, fetcher_playwright.py
+
+import asyncio
+import os
+import statistics
+import sys
+import threading
+import time
+from http.server import HTTPServer, SimpleHTTPRequestHandler
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from playwright.async_api import async_playwright
+
+from src.core.browser_pool import get_browser_pool, shutdown_browser_pool
+from src.core.fetcher_playwright import PLAYWRIGHT_CONFIG
+
+PAGES = int(os.getenv('BENCH_PAGES', '10'))
+
+FIXTURE_HTML = """<!DOCTYPE html>
+<html><head><title>Bench</title></head>
+<body><nav><a href="/a">A</a><a href="/b">B</a></nav>
+<main>{items}</main></body></html>
+""".format(items=''.join(f'<div class="item"><h3>Item {i}</h3><p>Texte {i}</p></div>' for i in range(200)))
+
+
+class _FixtureHandler(SimpleHTTPRequestHandler):
+    def do_GET(self):
+        body = FIXTURE_HTML.encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def start_fixture_server() -> str:
+    server = HTTPServer(('127.0.0.1', 0), _FixtureHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return f"http://127.0.0.1:{server.server_port}/"
+
+
+async def fetch_without_pool(url: str) -> str:
+    """Ancien comportement : un Chromium lancé puis fermé à chaque page."""
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(
+            headless=PLAYWRIGHT_CONFIG['headless'],
+            args=PLAYWRIGHT_CONFIG['args']
+        )
+        try:
+            context = await browser.new_context(viewport=PLAYWRIGHT_CONFIG['viewport'])
+            page = await context.new_page()
+            await page.goto(url, wait_until='domcontentloaded')
+            return await page.content()
+        finally:
+            await browser.close()
+
+
+async def fetch_with_pool(url: str) -> str:
+    """Nouveau comportement : contexte emprunté à un navigateur chaud du pool."""
+    pool = get_browser_pool()
+
+    async def _fetch():
+        async with pool.page(viewport=PLAYWRIGHT_CONFIG['viewport']) as page:
+            await page.goto(url, wait_until='domcontentloaded')
+            return await page.content()
+
+    return await pool.run_async(_fetch())
+
+
+async def fetch_with_lease(url: str) -> str:
+    """Contexte pré-configuré réutilisé (anti-détection + headers déjà appliqués)."""
+    pool = get_browser_pool()
+
+    async def _fetch():
+        async with pool.lease_page() as page:
+            await page.goto(url, wait_until='domcontentloaded')
+            return await page.content()
+
+    return await pool.run_async(_fetch())
+
+
+async def measure(label: str, fetch, url: str) -> list:
+    timings = []
+    for _ in range(PAGES):
+        start = time.perf_counter()
+        html = await fetch(url)
+        timings.append((time.perf_counter() - start) * 1000)
+        assert 'Item 199' in html
+    print(f"{label:<12} médiane {statistics.median(timings):8.1f} ms | "
+          f"p95 {sorted(timings)[int(len(timings) * 0.95) - 1]:8.1f} ms | "
+          f"premier {timings[0]:8.1f} ms")
+    return timings
+
+
+async def main():
+    url = start_fixture_server()
+    print("=" * 60)
+    print(f"BENCHMARK POOL NAVIGATEURS ({PAGES} pages, {url})")
+    print("=" * 60)
+
+    without_pool = await measure("Sans pool", fetch_without_pool, url)
+    with_pool = await measure("Avec pool", fetch_with_pool, url)
+    with_lease = await measure("Ctx prêté", fetch_with_lease, url)
+
+    speedup = statistics.median(without_pool) / max(statistics.median(with_pool), 0.001)
+    print(f"\n🚀 Gain médian par page: x{speedup:.1f}")
+    lease_gain = statistics.median(with_pool) / max(statistics.median(with_lease), 0.001)
+    print(f"♻️ Gain contexte prêté vs contexte neuf: x{lease_gain:.1f}")
+    print(f"📊 Stats pool: {get_browser_pool().get_stats()}")
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main())
+    finally:
+        shutdown_browser_pool()
@@ -0,0 +1,160 @@
+# backend/tests/bench_repeating_candidates.py
+# Benchmark de la détection des collections répétées (analyzer._find_repeating_candidates)
+# Ancienne version (get_text / find sur les sous-arbres de chaque conteneur) vs passage unique de bas en haut
+# Pages catalogue générées de 1 à 5 Mo (DOM profond : sections de mise en page imbriquées, chacune avec
+# ses blocs voisins, puis grille de produits, menus, filtres, pagination)
+# Vérifie aussi que les deux versions renvoient les mêmes candidats
+# RELEVANT FILES: analyzer.py, parsed_page.py
+
+import os
+import re
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from bs4 import Tag
+
+from src.core.analyzer import _clean_text, _find_repeating_candidates
+from src.core.parsed_page import ParsedPage
+
+SIZES_MB = [float(n) for n in os.getenv('BENCH_SIZES_MB', '1,2,5').split(',')]
+RUNS = int(os.getenv('BENCH_RUNS', '3'))
+LAYOUT_DEPTH = int(os.getenv('BENCH_DEPTH', '20'))
+
+
+def build_page(target_bytes: int) -> str:
+    """Catalogue d'environ `target_bytes` : grille de produits sous LAYOUT_DEPTH sections imbriquées."""
+    menu = '<ul class="menu">' + ''.join(f'<li><a href="/c/{i}">Catégorie {i}</a></li>' for i in range(12)) + '</ul>'
+    filters = '<div class="filters">' + ''.join(
+        f'<div class="facet"><a href="?f={i}">Filtre {i}</a></div>' for i in range(20)) + '</div>'
+    # Constructeurs de pages : chaque section contient trois blocs puis la section suivante
+    layout = ''.join(
+        f'<div class="section-{level}"><div class="promo"><a href="/promo/{level}">Offre {level}</a></div>'
+        f'<div class="banner"><p>Livraison offerte</p></div><span class="badge">Nouveau</span>'
+        for level in range(LAYOUT_DEPTH)
+    )
+    head = (f'<!DOCTYPE html><html><head><title>Catalogue</title></head><body>'
+            f'<header><nav>{menu}</nav></header><aside>{filters}</aside>{layout}')
+    tail = ('<div class="pagination">' + ''.join(f'<a href="?page={i}">{i}</a>' for i in range(2, 12)) + '</div>'
+            + '</div>' * LAYOUT_DEPTH + '<footer><p>Contact</p></footer></body></html>')
+
+    cards, size, i = [], len(head) + len(tail), 0
+    while size < target_bytes:
+        card = (
+            f'<li class="product type-product post-{i}"><div class="product-inner"><div class="thumb">'
+            f'<a href="/p/{i}"><img src="/img/{i}.jpg" alt="Produit {i}"></a></div>'
+            f'<div class="details"><h2 class="title"><a href="/p/{i}">Produit numéro {i}</a></h2>'
+            f'<div class="summary"><p>Description du produit {i}, tissu résistant et coupe ajustée, '
+            f'livré sous 48 heures.</p></div><div class="meta"><span class="price"><bdi>{10 + i % 90},99 €</bdi>'
+            f'</span><span class="rating">4.{i % 10}/5</span></div></div></div></li>'
+        )
+        cards.append(card)
+        size += len(card)
+        i += 1
+    # Grille découpée en rangées de 40 produits, elles-mêmes dans une liste de rangées
+    rows = ''.join(f'<div class="row"><ul class="products">{"".join(cards[r:r + 40])}</ul></div>'
+                   for r in range(0, len(cards), 40))
+    return head + f'<main><div class="grid">{rows}</div></main>' + tail
+
+
+# =================== ANCIENNE VERSION (référence) ===================
+
+def _legacy_node_signature(tag: Tag):
+    filtered_classes = []
+    for c in tag.get("class") or []:
+        if re.match(r"^(post|id|item)-\d+", c) or c.startswith(("js-", "product_cat-", "product_tag-", "category-", "tag-")):
+            continue
+        if c in ["first", "last", "odd", "even"]:
+            continue
+        semantic = any(p in c.lower() for p in ["product", "item", "card", "post", "article", "entry", "listing",
+                                               "result", "tile", "box", "container"])
+        if semantic or c in ["has-post-thumbnail", "instock", "status-publish", "type-product"]:
+            filtered_classes.append(c)
+    return tag.name, tuple(sorted(filtered_classes))
+
+
+def _legacy_is_navigation_or_filter(container: Tag) -> bool:
+    if container.name in ["head", "nav", "header", "footer", "select", "script", "style"]:
+        return True
+    container_id = container.get("id", "").lower()
+    container_classes = " ".join(container.get("class", [])).lower()
+    nav_patterns = ["nav", "menu", "sidebar", "filter", "refinement", "facet", "breadcrumb", "pagination",
+                    "footer", "header", "toolbar", "categories", "category-list", "page-numbers", "paging"]
+    for pattern in nav_patterns:
+        if pattern in container_id or pattern in container_classes:
+            return True
+    children = [c for c in container.find_all(recursive=False) if isinstance(c, Tag)]
+    if len(children) >= 4:
+        link_only_count = 0
+        for child in children[:10]:
+            child_text = _clean_text(child.get_text(" "))
+            links = child.find_all("a")
+            if (links and len(child_text) < 50 and not child.find("img")
+                    and not child.find(class_=re.compile(r"(?i)(price|cost)"))):
+                link_only_count += 1
+        if link_only_count >= len(children[:10]) * 0.8:
+            return True
+    return False
+
+
+def legacy_find_repeating_candidates(soup, max_candidates: int):
+    candidates = []
+    for container in soup.find_all(True):
+        if _legacy_is_navigation_or_filter(container):
+            continue
+        children = [c for c in container.find_all(recursive=False) if isinstance(c, Tag)]
+        if len(children) < 4:
+            continue
+        sigs = [_legacy_node_signature(c) for c in children]
+        most_common = max(set(sigs), key=sigs.count)
+        count = sigs.count(most_common)
+        if count < 4:
+            continue
+        density = count / max(1, len(children))
+        item_nodes = [ch for ch in children if ch.name == most_common[0]]
+        richness = 0.0
+        sample_size = min(3, len(item_nodes))
+        for node in item_nodes[:sample_size]:
+            richness += 2.0 if node.find("img") else 0
+            richness += 2.0 if node.find(class_=re.compile(r"(?i)(price|cost|amount)")) else 0
+            richness += 1.5 if node.find(["h1", "h2", "h3", "h4", "h5", "h6"]) else 0
+        score = count * density * (1.0 + richness / max(1, sample_size))
+        candidates.append((container, most_common[0], count, score))
+    candidates.sort(key=lambda c: (c[3], c[2]), reverse=True)
+    return candidates[:max_candidates]
+
+
+def _timed(func, soup):
+    timings, result = [], None
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        result = func(soup, 10)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings), result
+
+
+def main():
+    print("=" * 60)
+    print(f"BENCHMARK COLLECTIONS RÉPÉTÉES ({RUNS} passes, profondeur {LAYOUT_DEPTH})")
+    print("=" * 60)
+
+    for size_mb in SIZES_MB:
+        html = build_page(int(size_mb * 1024 * 1024))
+        soup = ParsedPage(html).soup
+        nodes = len(soup.find_all(True))
+
+        legacy_time, legacy = _timed(legacy_find_repeating_candidates, soup)
+        new_time, new = _timed(_find_repeating_candidates, soup)
+
+        assert [(id(c[0]), c[1], c[2], round(c[3], 6)) for c in legacy] == [
+            (id(c.container), c.item_tag_name, c.item_count, round(c.score, 6)) for c in new
+        ], "mêmes candidats, même ordre"
+        print(f"\n📄 {len(html) / 1024 / 1024:.1f} Mo, {nodes} balises, {len(new)} candidats")
+        print(f"   ancienne version : {legacy_time * 1000:8.0f} ms")
+        print(f"   passage unique   : {new_time * 1000:8.0f} ms  (x{legacy_time / max(new_time, 1e-9):.1f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+# backend/tests/bench_smart_crawler.py
+# Benchmark du SmartCrawler sur le site de test local : débit (pages/s) selon le nombre de pages en parallèle
+# et selon le mode (browser : Playwright partout ; hybrid : HTTP + lxml, navigateur si nécessaire)
+# La latence serveur simulée rend visible le recouvrement des attentes réseau
+# Politesse désactivée pour l'hôte local (seul le coût navigateur + latence est mesuré)
+# RELEVANT FILES: smart_crawler.py, tests/fixture_site.py, browser_pool.py
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from fixture_site import all_paths, start_fixture_site
+from src.core.browser_pool import shutdown_browser_pool
+from src.core import rate_limiter
+from src.core.rate_limiter import HostRateLimiter
+from src.core.smart_crawler import SmartCrawler
+
+LATENCY = float(os.getenv('BENCH_LATENCY', '0.1'))
+CONCURRENCY_LEVELS = [int(n) for n in os.getenv('BENCH_CONCURRENCY', '1,2,4,8').split(',')]
+MODES = os.getenv('BENCH_MODES', 'browser,hybrid').split(',')
+MAX_PAGES = int(os.getenv('BENCH_PAGES', '100'))
+
+
+def main():
+    base_url = start_fixture_site(latency=LATENCY)
+    # Politesse désactivée pour le site local (configure_host ne peut que ralentir un hôte)
+    rate_limiter._rate_limiter_instance = HostRateLimiter(default_interval=0, respect_robots=False)
+    print("=" * 60)
+    print(f"BENCHMARK SMART CRAWLER ({MAX_PAGES} pages max sur {len(all_paths())}, "
+          f"latence {LATENCY * 1000:.0f} ms, {base_url})")
+    print("=" * 60)
+
+    baseline = None
+    for mode in MODES:
+        for concurrency in CONCURRENCY_LEVELS:
+            result = SmartCrawler(base_url + '/', max_pages=MAX_PAGES, concurrency=concurrency, mode=mode).crawl()
+            stats = result['crawl_stats']
+            baseline = baseline or stats['pages_per_second']
+            print(f"\n⚡ {mode:<7} {concurrency:>2} pages // : {result['pages_crawled']} pages en "
+                  f"{stats['seconds']:.1f}s -> {stats['pages_per_second']:.1f} pages/s "
+                  f"(x{stats['pages_per_second'] / max(baseline, 0.001):.1f}) | "
+                  f"{stats['fetch']['static']} HTTP, {stats['fetch']['rendered']} rendues")
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    finally:
+        shutdown_browser_pool()
@@ -0,0 +1,109 @@
+# backend/tests/fixture_site.py
+# Site local de test pour le crawler : accueil, catégories paginées, fiches produits
+# Servi par un ThreadingHTTPServer avec une latence réglable (simule un serveur distant)
+# Utilisé par les tests et benchmarks du SmartCrawler (débit en pages/s sans dépendre d'Internet)
+# RELEVANT FILES: smart_crawler.py, tests/bench_smart_crawler.py, tests/test_smart_crawler_concurrency.py
+
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+
+CATEGORIES = ['livres', 'musique', 'films', 'jeux', 'jardin']
+PRODUCTS_PER_CATEGORY = 24
+PAGE_SIZE = 6
+
+
+def _category_pages() -> int:
+    return (PRODUCTS_PER_CATEGORY + PAGE_SIZE - 1) // PAGE_SIZE
+
+
+def all_paths() -> List[str]:
+    """Tous les chemins du site (accueil, pages fixes, catégories et leurs pages, produits)."""
+    paths = ['/', '/a-propos', '/contact']
+    for category in CATEGORIES:
+        paths.append(f'/categorie/{category}')
+        paths.extend(f'/categorie/{category}/page/{n}' for n in range(2, _category_pages() + 1))
+        paths.extend(f'/produit/{category}-{i}' for i in range(PRODUCTS_PER_CATEGORY))
+    return paths
+
+
+def page_links(path: str) -> Optional[Dict]:
+    """
+    Liens d'une page : {'title', 'links': [(zone, href, texte)], 'pagination': [href]}.
+    None si le chemin n'existe pas.
+    """
+    if path not in set(all_paths()):
+        return None
+    links: List[Tuple[str, str, str]] = [('nav', f'/categorie/{c}', c.capitalize()) for c in CATEGORIES]
+    links += [('footer', '/a-propos', 'À propos'), ('footer', '/contact', 'Contact')]
+    pagination: List[str] = []
+    title = 'Accueil'
+
+    if path.startswith('/categorie/'):
+        parts = path.split('/')
+        category = parts[2]
+        page = int(parts[4]) if len(parts) > 4 else 1
+        title = f'{category.capitalize()} - page {page}'
+        first = (page - 1) * PAGE_SIZE
+        for i in range(first, min(first + PAGE_SIZE, PRODUCTS_PER_CATEGORY)):
+            links.append(('other', f'/produit/{category}-{i}', f'Produit {i}'))
+        if page < _category_pages():
+            pagination.append(f'/categorie/{category}/page/{page + 1}')
+    elif path.startswith('/produit/'):
+        category, index = path.rsplit('/', 1)[1].rsplit('-', 1)
+        title = f'Produit {index}'
+        links.append(('other', f'/categorie/{category}', 'Retour'))
+    elif path != '/':
+        title = path.strip('/').replace('-', ' ').capitalize()
+
+    return {'title': title, 'links': links, 'pagination': pagination}
+
+
+def render_page(path: str) -> Optional[str]:
+    data = page_links(path)
+    if data is None:
+        return None
+    zones = {'nav': [], 'footer': [], 'other': []}
+    for zone, href, text in data['links']:
+        zones[zone].append(f'<a href="{href}">{text}</a>')
+    pagination = ''.join(f'<a rel="next" href="{href}">Suivant</a>' for href in data['pagination'])
+    return (
+        f'<!DOCTYPE html><html><head><title>{data["title"]}</title>'
+        f'<meta name="description" content="Boutique de test - {data["title"]}"></head><body>'
+        f'<header><nav>{"".join(zones["nav"])}</nav></header>'
+        f'<main><h1>{data["title"]}</h1><p>Contenu de la page {data["title"]}.</p>'
+        f'<ul>{"".join(f"<li>{link}</li>" for link in zones["other"])}</ul>'
+        f'<div class="pagination">{pagination}</div></main>'
+        f'<footer>{"".join(zones["footer"])}</footer></body></html>'
+    )
+
+
+class _FixtureHandler(BaseHTTPRequestHandler):
+    latency = 0.0
+
+    def do_GET(self):
+        time.sleep(self.latency)
+        html = render_page(self.path.split('?')[0])
+        if html is None:
+            self.send_response(404)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        body = html.encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def start_fixture_site(latency: float = 0.0) -> str:
+    """Démarre le site dans un thread ; renvoie son URL de base (sans slash final)."""
+    handler = type('FixtureHandler', (_FixtureHandler,), {'latency': latency})
+    server = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return f"http://127.0.0.1:{server.server_port}"
@@ -0,0 +1,109 @@
+# backend/tests/test_auto_scroller.py
+# Test du scroll adaptatif : page longue statique, flux qui se termine, flux infini (budgets)
+# Page simulée (Chromium non requis) : hauteur et items évoluent quand on atteint le bas de page
+# RELEVANT FILES: auto_scroller.py, wait_strategy.py, fetcher_playwright.py
+
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.core import auto_scroller
+from src.core.auto_scroller import AdaptiveScroller
+
+
+class _FakeFeedPage:
+    """
+    Page de `height` px ; à chaque arrivée en bas, charge un lot de `batch_items` items
+    (+`batch_height` px) tant qu'il reste des lots (batches=None : flux infini).
+    """
+
+    def __init__(self, height=3000, items=20, batches=0, batch_items=10, batch_height=2000, viewport=1000):
+        self.height = height
+        self.items = items
+        self.batches = batches
+        self.batch_items = batch_items
+        self.batch_height = batch_height
+        self.viewport = viewport
+        self.scroll_y = 0
+
+    def on(self, event, callback):
+        pass
+
+    def remove_listener(self, event, callback):
+        pass
+
+    async def evaluate(self, script, arg=None):
+        await asyncio.sleep(0)
+        if script == auto_scroller._STEP_SCRIPT:
+            self.scroll_y = min(self.scroll_y + int(self.viewport * arg), self.height - self.viewport)
+            if self.scroll_y + self.viewport >= self.height and self.batches != 0:
+                self.height += self.batch_height
+                self.items += self.batch_items
+                if self.batches is not None:
+                    self.batches -= 1
+            return None
+        if script == auto_scroller._MEASURE_SCRIPT:
+            return {'height': self.height, 'position': self.scroll_y + self.viewport, 'items': self.items}
+        if 'scrollTo' in script:
+            self.scroll_y = 0
+            return None
+        return True   # script de stabilisation DOM : page calme
+
+
+def _scroll(page, **options):
+    return asyncio.run(AdaptiveScroller(**options).run(page))
+
+
+def test_long_static_page():
+    print("\n" + "=" * 60)
+    print("TEST: Page statique de 20 000 px")
+    print("=" * 60)
+
+    page = _FakeFeedPage(height=20_000)
+    report = _scroll(page)
+    print(f"   {report}")
+    # Ancien scroll : 100 px / 100 ms -> 200 pas et 20 s ; ici ~ une hauteur d'écran par pas
+    assert report['stop_reason'] == 'stable' and report['steps'] <= 25
+    assert report['items_revealed'] == 0 and page.scroll_y == 0, "retour en haut de page"
+    print("✅ Arrêt dès que la hauteur est stable en bas de page")
+
+
+def test_feed_that_ends():
+    print("\n" + "=" * 60)
+    print("TEST: Flux qui charge 3 lots puis s'arrête")
+    print("=" * 60)
+
+    report = _scroll(_FakeFeedPage(batches=3))
+    print(f"   {report}")
+    assert report['stop_reason'] == 'stable'
+    assert report['items_before'] == 20 and report['items_revealed'] == 30
+    assert report['height_after'] == 9000
+    print("✅ Items révélés par le chargement comptés")
+
+
+def test_infinite_feed_budgets():
+    print("\n" + "=" * 60)
+    print("TEST: Flux infini arrêté par les budgets")
+    print("=" * 60)
+
+    report = _scroll(_FakeFeedPage(batches=None), max_steps=30)
+    print(f"   pas     : {report}")
+    assert report['stop_reason'] == 'max_steps' and report['steps'] == 30
+
+    report = _scroll(_FakeFeedPage(batches=None), max_items=100)
+    print(f"   items   : {report}")
+    assert report['stop_reason'] == 'max_items' and report['items_after'] >= 100
+
+    report = _scroll(_FakeFeedPage(batches=None), max_seconds=0.2, max_steps=100_000)
+    print(f"   temps   : {report}")
+    assert report['stop_reason'] == 'time_budget' and report['seconds'] < 0.5
+    print("✅ Un flux infini ne bloque jamais l'extraction")
+
+
+if __name__ == "__main__":
+    test_long_static_page()
+    test_feed_that_ends()
+    test_infinite_feed_budgets()
+    print("\n✅ Tous les tests du scroll adaptatif sont passés")
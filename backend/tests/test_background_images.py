@@ -0,0 +1,60 @@
+# backend/tests/test_background_images.py
+# Test du choix de méthode pour les images en background CSS : CSSOM par défaut,
+# repli sur le style calculé si une feuille cross-origin est illisible (mode 'auto')
+# Page simulée (Chromium non requis) ; le gain réel est mesuré par bench_background_images.py
+# RELEVANT FILES: background_images.py, fetcher_playwright.py
+
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.core.background_images import COMPUTED_STYLE_SCRIPT, CSSOM_SCRIPT, scan_background_images
+
+HERO = {'url': 'hero.jpg', 'backgroundImage': 'url("hero.jpg")', 'element': 'DIV', 'className': 'hero', 'index': 0}
+CDN_BANNER = {'url': 'cdn.jpg', 'backgroundImage': 'url("cdn.jpg")', 'element': 'SECTION', 'className': 'banner', 'index': 1}
+
+
+class _FakePage:
+    def __init__(self, cross_origin_sheets=0):
+        self.cross_origin_sheets = cross_origin_sheets
+        self.scripts = []
+
+    async def evaluate(self, script, max_images):
+        await asyncio.sleep(0)
+        self.scripts.append('cssom' if script == CSSOM_SCRIPT else 'computed')
+        if script == CSSOM_SCRIPT:
+            return {'images': [HERO], 'method': 'cssom', 'candidates': 4,
+                    'crossOriginSheets': self.cross_origin_sheets}
+        assert script == COMPUTED_STYLE_SCRIPT
+        return {'images': [HERO, CDN_BANNER], 'method': 'computed', 'candidates': 12000, 'crossOriginSheets': 0}
+
+
+def test_methods():
+    print("\n" + "=" * 60)
+    print("TEST: Méthode de détection des backgrounds")
+    print("=" * 60)
+
+    page = _FakePage()
+    scan = asyncio.run(scan_background_images(page))
+    print(f"   same-origin  : {scan['method']} ({scan['candidates']} candidats)")
+    assert scan['method'] == 'cssom' and page.scripts == ['cssom'], "aucun parcours de tous les nœuds"
+
+    page = _FakePage(cross_origin_sheets=2)
+    scan = asyncio.run(scan_background_images(page))
+    print(f"   cross-origin : {scan['method']} ({len(scan['images'])} images)")
+    assert scan['method'] == 'computed' and scan['crossOriginSheets'] == 2
+    assert scan['images'][1]['url'] == 'cdn.jpg', "règles illisibles : repli complet"
+
+    page = _FakePage(cross_origin_sheets=2)
+    scan = asyncio.run(scan_background_images(page, method='cssom'))
+    assert scan['method'] == 'cssom' and page.scripts == ['cssom']
+    page = _FakePage()
+    assert asyncio.run(scan_background_images(page, method='computed'))['method'] == 'computed'
+    print("✅ CSSOM par défaut, repli seulement si des règles sont illisibles")
+
+
+if __name__ == "__main__":
+    test_methods()
+    print("\n✅ Tous les tests de détection des backgrounds sont passés")
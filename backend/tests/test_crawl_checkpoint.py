@@ -0,0 +1,195 @@
+# backend/tests/test_crawl_checkpoint.py
+# Test des points de reprise du SmartCrawler : crawl interrompu en cours de route (process tué),
+# reprise depuis le même identifiant sans revisiter les pages terminées, résultat complet
+# Pages simulées (Chromium non requis), points de reprise écrits dans un dossier temporaire
+# RELEVANT FILES: crawl_checkpoint.py, smart_crawler.py, crawl_frontier.py, tests/fixture_site.py
+
+import asyncio
+import os
+import sys
+import tempfile
+import threading
+from urllib.parse import urlparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from fixture_site import all_paths, page_links
+from src.core import crawl_checkpoint, rate_limiter, smart_crawler
+from src.core.crawl_checkpoint import CrawlCheckpointStore, get_checkpoint_store
+from src.core.crawl_frontier import CrawlFrontier
+from src.core.smart_crawler import SmartCrawler
+
+BASE_URL = 'http://fixture.test'
+CHECKPOINT_ID = 'session-test'
+
+
+class _FakeCrawlPage:
+    """Page de crawl simulée ; après `crash_after` navigations, goto ne rend plus la main (process figé)."""
+
+    def __init__(self, visits: list, crash_after: int = None):
+        self.visits = visits
+        self.crash_after = crash_after
+        self.path = '/'
+
+    def on(self, event, callback):
+        pass
+
+    async def goto(self, url, **kwargs):
+        if self.crash_after is not None and len(self.visits) >= self.crash_after:
+            await asyncio.Event().wait()
+        self.visits.append(url)
+        await asyncio.sleep(0.005)
+        self.path = urlparse(url).path or '/'
+        return type('Response', (), {'status': 200})()
+
+    async def evaluate(self, script, arg=None):
+        await asyncio.sleep(0)
+        if script != smart_crawler._HARVEST_SCRIPT:
+            return True
+        data = page_links(self.path)
+        return {
+            'title': data['title'],
+            'links': [list(link) for link in data['links']],
+            'pagination': data['pagination'],
+            'preview': {'meta': {}, 'images': [], 'text': '', 'textTruncated': False, 'stats': {}}
+        }
+
+
+def _workers(crawler: SmartCrawler, visits: list, crash_after: int = None):
+    return [{'page': _FakeCrawlPage(visits, crash_after), 'waiter': None, 'resource_usage': None}
+            for _ in range(crawler.concurrency)]
+
+
+async def _crash(crawler: SmartCrawler, workers, after_seconds: float):
+    """Simule l'arrêt du process : les tâches du crawl sont annulées sans sauvegarde finale."""
+    try:
+        await asyncio.wait_for(crawler._run_workers(workers), timeout=after_seconds)
+    except asyncio.TimeoutError:
+        pass
+
+
+def test_frontier_roundtrip():
+    print("\n" + "=" * 60)
+    print("TEST: Sérialisation du frontier")
+    print("=" * 60)
+
+    frontier = CrawlFrontier()
+    frontier.push(f'{BASE_URL}/produit/a', zone='other', depth=2)
+    frontier.push(f'{BASE_URL}/categorie/livres', zone='nav', depth=1)
+    frontier.push(f'{BASE_URL}/contact', zone='footer', depth=1)
+    in_flight = frontier.pop()
+    state = frontier.to_dict(pending=[in_flight])
+
+    restored = CrawlFrontier()
+    restored.load_dict(state)
+    order = []
+    while True:
+        url = restored.pop()
+        if url is None:
+            break
+        order.append(url.replace(BASE_URL, ''))
+    print(f"   {order}")
+    assert order == ['/categorie/livres', '/produit/a', '/contact'], "page en cours d'abord, puis même ordre"
+    assert restored.depth_of(f'{BASE_URL}/produit/a') == 2
+    print("✅ File restaurée dans son ordre de service")
+
+
+def test_resume_after_crash():
+    print("\n" + "=" * 60)
+    print("TEST: Reprise d'un crawl interrompu")
+    print("=" * 60)
+
+    expected = len(all_paths())
+    first_visits = []
+    crawler = SmartCrawler(BASE_URL, max_pages=1000, concurrency=4, checkpoint_id=CHECKPOINT_ID, mode='browser')
+    asyncio.run(_crash(crawler, _workers(crawler, first_visits, crash_after=60), after_seconds=2))
+
+    saved = get_checkpoint_store().load(CHECKPOINT_ID)
+    completed = set(saved['completed'])
+    print(f"   interrompu après {len(first_visits)} pages, point de reprise : {len(completed)} terminées")
+    assert 0 < len(completed) <= len(first_visits) < expected
+    assert len({r['url'] for r in get_checkpoint_store().load_pages(CHECKPOINT_ID)} & completed) == len(completed)
+    assert saved['frontier']['pending'], "pages en cours au moment de l'arrêt remises en file"
+
+    second_visits = []
+    resumed = SmartCrawler(BASE_URL, max_pages=1000, concurrency=4, checkpoint_id=CHECKPOINT_ID, mode='browser')
+    assert resumed.resumed_pages == len(completed)
+    pages_data, navigation = asyncio.run(resumed._run_workers(_workers(resumed, second_visits)))
+    print(f"   reprise : {len(second_visits)} pages crawlées, total {len(pages_data)}")
+
+    assert not completed & set(second_visits), "aucune page terminée revisitée"
+    assert len(second_visits) == len(set(second_visits))
+    assert {page['url'] for page in pages_data} == {BASE_URL + (p if p != '/' else '') for p in all_paths()}
+    assert len(pages_data) == expected, "résultats d'avant l'arrêt conservés"
+    assert len(navigation['nav']) == 5, "liens de navigation dédoublonnés après reprise"
+    print("✅ Le crawl repart du point de reprise et couvre tout le site")
+
+
+def test_resume_ignores_other_url():
+    print("\n" + "=" * 60)
+    print("TEST: Point de reprise d'une autre URL ignoré")
+    print("=" * 60)
+
+    store = get_checkpoint_store()
+    store.save('session-autre', {'base_url': 'http://ailleurs.test', 'completed': [BASE_URL], 'frontier': {}})
+    store.append_pages('session-autre', [{'url': BASE_URL, 'page': {'url': BASE_URL}}])
+    crawler = SmartCrawler(BASE_URL, max_pages=5, checkpoint_id='session-autre')
+    assert crawler.resumed_pages == 0 and BASE_URL not in crawler.visited_urls and not crawler.pages_data
+    assert store.load_pages('session-autre') == [], "résultats de l'autre crawl écartés"
+
+    store.save('session-autre', {'base_url': BASE_URL, 'completed': [], 'frontier': {}})
+    assert store.delete('session-autre') and not store.delete('session-autre')
+    assert store.load('inexistant') is None
+    print("✅ Pas de mélange entre deux crawls")
+
+
+def test_checkpoint_off_loop_and_incremental():
+    print("\n" + "=" * 60)
+    print("TEST: Sauvegardes hors boucle et incrémentales")
+    print("=" * 60)
+
+    store = get_checkpoint_store()
+    writes = []
+    original_save, original_append = store.save, store.append_pages
+
+    def _save(checkpoint_id, state):
+        writes.append(('save', threading.get_ident(), len(state.get('completed', [])), 'pages' in state))
+        original_save(checkpoint_id, state)
+
+    def _append(checkpoint_id, records):
+        writes.append(('append', threading.get_ident(), len(records), False))
+        original_append(checkpoint_id, records)
+
+    store.save, store.append_pages = _save, _append
+    try:
+        visits = []
+        crawler = SmartCrawler(BASE_URL, max_pages=1000, concurrency=4, checkpoint_id='session-increment',
+                               mode='browser')
+        pages_data, _ = asyncio.run(crawler._run_workers(_workers(crawler, visits)))
+    finally:
+        store.save, store.append_pages = original_save, original_append
+
+    loop_thread = threading.get_ident()
+    saves = [w for w in writes if w[0] == 'save']
+    appended = sum(w[2] for w in writes if w[0] == 'append')
+    print(f"   {len(saves)} sauvegardes d'état, {appended} résultats ajoutés pour {len(pages_data)} pages")
+    assert all(thread != loop_thread for _, thread, _, _ in writes), "écritures dans un thread, pas sur la boucle"
+    assert not any(has_pages for _, _, _, has_pages in saves), "l'état ne contient plus les résultats"
+    assert appended == len(pages_data), "chaque résultat écrit une seule fois"
+    assert len(saves) >= len(pages_data) // 5
+    assert len(store.load_pages('session-increment')) == len(pages_data)
+    store.delete('session-increment')
+    print("✅ Chaque sauvegarde n'écrit que les nouvelles pages, sans bloquer les workers")
+
+
+if __name__ == "__main__":
+    rate_limiter.RATE_LIMIT_CONFIG['enabled'] = False
+    smart_crawler.CRAWL_CHECKPOINT_CONFIG['every_pages'] = 5
+    with tempfile.TemporaryDirectory() as directory:
+        crawl_checkpoint._store_instance = CrawlCheckpointStore(directory)
+        test_frontier_roundtrip()
+        test_resume_after_crash()
+        test_resume_ignores_other_url()
+        test_checkpoint_off_loop_and_incremental()
+    print("\n✅ Tous les tests des points de reprise sont passés")
@@ -0,0 +1,85 @@
+# backend/tests/test_crawl_frontier.py
+# Test du frontier du crawler : dédoublonnage, ordre par priorité, relèvement de priorité,
+# nouveauté des préfixes de chemin et coût linéaire sur des dizaines de milliers d'URLs
+# RELEVANT FILES: crawl_frontier.py, smart_crawler.py
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.core.crawl_frontier import CrawlFrontier, path_prefix
+
+BASE = 'https://shop.example.com'
+
+
+def test_priority_and_dedup():
+    print("\n" + "=" * 60)
+    print("TEST: Priorité et dédoublonnage")
+    print("=" * 60)
+
+    frontier = CrawlFrontier()
+    for i in range(5):
+        frontier.push(f'{BASE}/produit/{i}', zone='other', depth=1)
+    frontier.push(f'{BASE}/mentions-legales', zone='footer', depth=1)
+    frontier.push(f'{BASE}/categorie/livres', zone='nav', depth=1)
+    frontier.push(f'{BASE}/categorie/livres/page/2', zone='other', depth=2, pagination=True)
+    assert not frontier.push(f'{BASE}/produit/0', zone='other', depth=1), "doublon ignoré"
+    assert path_prefix(f'{BASE}/produit/0') == '/produit' and path_prefix(BASE) == '/'
+
+    order = []
+    while True:
+        url = frontier.pop()
+        if url is None:
+            break
+        order.append(url.replace(BASE, ''))
+    print(f"   {order}")
+    assert order[0] == '/categorie/livres', "lien de menu d'abord"
+    assert order[1] == '/produit/0', "premier produit : préfixe nouveau"
+    assert order.index('/mentions-legales') < order.index('/produit/1'), "nouveau préfixe > produit de plus"
+    assert len(order) == 8 and not frontier.push(f'{BASE}/produit/3'), "URL visitée jamais remise en file"
+    print("✅ Pages structurantes servies avant les pages sœurs")
+
+
+def test_priority_upgrade():
+    print("\n" + "=" * 60)
+    print("TEST: Relèvement de priorité")
+    print("=" * 60)
+
+    frontier = CrawlFrontier()
+    frontier.push(f'{BASE}/blog', zone='footer', depth=3)
+    frontier.push(f'{BASE}/aide', zone='other', depth=1)
+    assert frontier.push(f'{BASE}/blog', zone='nav', depth=1), "revu dans le menu : priorité relevée"
+    assert frontier.pop() == f'{BASE}/blog' and frontier.depth_of(f'{BASE}/blog') == 1
+    assert frontier.pop() == f'{BASE}/aide' and frontier.pop() is None, "entrée périmée ignorée"
+    print(f"   {frontier.get_stats()}")
+    print("✅ Une URL n'est servie qu'une fois, avec sa meilleure priorité")
+
+
+def test_scales_linearly():
+    print("\n" + "=" * 60)
+    print("TEST: Coût sur des dizaines de milliers d'URLs")
+    print("=" * 60)
+
+    def _run(count: int) -> float:
+        frontier = CrawlFrontier()
+        start = time.perf_counter()
+        for i in range(count):
+            frontier.push(f'{BASE}/section-{i % 50}/page-{i}', zone='other', depth=i % 4)
+            frontier.push(f'{BASE}/section-{i % 50}/page-{i // 2}', zone='other', depth=1)
+        while frontier.pop() is not None:
+            pass
+        return time.perf_counter() - start
+
+    small, large = _run(5_000), _run(50_000)
+    print(f"   5 000 URLs : {small * 1000:.0f} ms | 50 000 URLs : {large * 1000:.0f} ms")
+    assert large < small * 20, "quasi linéaire (n log n), pas quadratique"
+    print("✅ Pas de parcours de liste par URL")
+
+
+if __name__ == "__main__":
+    test_priority_and_dedup()
+    test_priority_upgrade()
+    test_scales_linearly()
+    print("\n✅ Tous les tests du frontier sont passés")
@@ -0,0 +1,68 @@
+# backend/tests/test_extraction_sections.py
+# Test du paramètre sections= de l'extraction ultra-complète : validation, sections par défaut,
+# et séparation des extractions partielles dans le cache de rendus (sans Chromium)
+# RELEVANT FILES: fetcher_playwright.py, render_cache.py
+
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.core import render_cache as render_cache_module
+from src.core.fetcher_playwright import (
+    COMPLETE_CONTENT_SECTIONS, EXTRACT_EVERYTHING_SECTIONS, PlaywrightFetcher,
+    _render_cache_key, _resolve_sections, _sections_kind, extract_complete_content_playwright
+)
+from src.core.render_cache import RenderCache
+
+
+def test_resolve_sections():
+    print("\n" + "=" * 60)
+    print("TEST: Validation des sections")
+    print("=" * 60)
+
+    assert 'html' not in COMPLETE_CONTENT_SECTIONS and 'scripts' in COMPLETE_CONTENT_SECTIONS
+    assert 'html' in EXTRACT_EVERYTHING_SECTIONS and 'scripts' not in EXTRACT_EVERYTHING_SECTIONS
+    assert _resolve_sections(None, COMPLETE_CONTENT_SECTIONS) == list(COMPLETE_CONTENT_SECTIONS)
+    assert _resolve_sections(['links', 'text', 'links'], COMPLETE_CONTENT_SECTIONS) == ['text', 'links'], \
+        "ordre canonique, sans doublon"
+    try:
+        _resolve_sections(['text', 'videos_hd'], COMPLETE_CONTENT_SECTIONS)
+        raise AssertionError("section inconnue acceptée")
+    except ValueError as e:
+        print(f"   {e}")
+    print("✅ Sections validées et normalisées")
+
+
+def test_partial_extractions_cached_separately():
+    print("\n" + "=" * 60)
+    print("TEST: Extractions partielles distinctes dans le cache")
+    print("=" * 60)
+
+    cache = RenderCache(ttl=60)
+    render_cache_module._cache_instance = cache
+    url = 'https://example.invalid/article'
+
+    full_kind = _sections_kind('complete_content', list(COMPLETE_CONTENT_SECTIONS), COMPLETE_CONTENT_SECTIONS)
+    text_kind = _sections_kind('complete_content', ['text'], COMPLETE_CONTENT_SECTIONS)
+    print(f"   {full_kind} / {text_kind}")
+    assert full_kind == 'complete_content', "clé historique inchangée pour l'extraction complète"
+    assert _render_cache_key(full_kind, url, True, None) != _render_cache_key(text_kind, url, True, None)
+
+    cache.put(_render_cache_key(text_kind, url, True, None), {'text': {'fullText': 'texte seul'}})
+    content = asyncio.run(extract_complete_content_playwright(url, sections=['text']))
+    assert content['text']['fullText'] == 'texte seul'
+
+    everything_kind = _sections_kind('extract_everything', ['metadata', 'links'], EXTRACT_EVERYTHING_SECTIONS)
+    cache.put(_render_cache_key(everything_kind, url, True, None), {'success': True, 'sections': ['metadata', 'links']})
+    result = asyncio.run(PlaywrightFetcher().extract_everything(url, sections=['links', 'metadata']))
+    assert result['sections'] == ['metadata', 'links']
+    print(f"   {cache.get_stats()}")
+    print("✅ Une extraction partielle n'est jamais servie pour une complète (et inversement)")
+
+
+if __name__ == "__main__":
+    test_resolve_sections()
+    test_partial_extractions_cached_separately()
+    print("\n✅ Tous les tests des sections d'extraction sont passés")
@@ -0,0 +1,98 @@
+# backend/tests/test_field_tokens.py
+# Test de l'index de jetons du balisage (ParsedPage.element_tokens) utilisé par ContentDetector._identify_fields :
+# mêmes champs identifiés qu'avec str(elem).lower(), sans resérialiser les sous-arbres
+# Grille produits générée localement (réseau non requis)
+# RELEVANT FILES: parsed_page.py, content_detector.py
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from bench_repeating_candidates import build_page
+from fixture_site import render_page
+from test_parsed_page import _catalog_html
+from src.core.content_detector import ContentDetector
+from src.core.parsed_page import ParsedPage
+
+MARKUP_HTML = (
+    '<html><body><div class="productPrice card" data-sku="A1" itemprop="offers">'
+    '<span itemprop="ratingValue">4</span><time datetime="2024-01-01">hier</time>'
+    '<a href="/auteur/jean" title="Profil">Jean</a><img src="/img/x.jpg" alt="Photo"></div>'
+    '<div class="card"><p>Modèle 2024, autonomie 500 km</p></div>'
+    '<div class="card"><input name="email" placeholder="Adresse"></div></body></html>'
+)
+
+
+def _legacy_identify_fields(elements, config):
+    """Ancienne version : str(elem).lower() et get_text() pour chaque champ et chaque élément."""
+    fields = []
+    for field in config['required_elements'] + config['optional_elements']:
+        for elem in elements[:5]:
+            elem_str = str(elem).lower()
+            elem_text = elem.get_text().lower()
+            if (field in elem_text) or (field in elem_str) or \
+               (field == 'price' and any(curr in elem_text for curr in ['€', '$', '£', 'fcfa', 'xof'])) or \
+               (field == 'image' and elem.find('img')) or \
+               (field == 'model' and any(kw in elem_text for kw in ['model', 'modèle', 'série', 'edition'])) or \
+               (field == 'specs' and any(kw in elem_text for kw in ['km/h', 'mph', '0-60', 'autonomie', 'range',
+                                                                    'battery', 'wh'])):
+                fields.append(field)
+                break
+    return fields
+
+
+def test_same_fields_as_serialization():
+    print("\n" + "=" * 60)
+    print("TEST: Mêmes champs qu'avec str(elem).lower()")
+    print("=" * 60)
+
+    detector = ContentDetector()
+    pages = [MARKUP_HTML, _catalog_html(60), build_page(200_000), render_page('/'), render_page('/produit/jeux-3')]
+    checked = 0
+    for html in pages:
+        page = ParsedPage(html)
+        matches = page.match(detector.matcher)
+        for content_type, config in detector.CONTENT_TYPES.items():
+            elements = matches[content_type][:50]
+            if elements:
+                assert detector._identify_fields(page, elements, config) == _legacy_identify_fields(elements, config), \
+                    content_type
+                checked += 1
+    tokens = ParsedPage(MARKUP_HTML).element_tokens(ParsedPage(MARKUP_HTML).soup.body)
+    for word in ['price', 'sku', 'rating', 'date', 'auteur', 'email', 'placeholder', 'img']:
+        assert word in tokens, word
+    assert 'review' not in tokens
+    print(f"   {checked} types vérifiés sur {len(pages)} pages")
+    print("✅ Champs identiques")
+
+
+def test_detection_speed():
+    print("\n" + "=" * 60)
+    print("TEST: Identification des champs sur une grande grille produits")
+    print("=" * 60)
+
+    detector = ContentDetector()
+    page = ParsedPage(build_page(2 * 1024 * 1024))
+    matches = page.match(detector.matcher)
+    typed = [(matches[t][:50], config) for t, config in detector.CONTENT_TYPES.items() if matches[t]]
+
+    start = time.perf_counter()
+    legacy = [_legacy_identify_fields(elements, config) for elements, config in typed]
+    legacy_time = time.perf_counter() - start
+    start = time.perf_counter()
+    indexed = [detector._identify_fields(page, elements, config) for elements, config in typed]
+    indexed_time = time.perf_counter() - start
+    assert indexed == legacy
+    print(f"   {len(typed)} types : str(elem) {legacy_time * 1000:.0f} ms, jetons {indexed_time * 1000:.0f} ms "
+          f"(x{legacy_time / max(indexed_time, 1e-9):.1f})")
+    assert indexed_time < legacy_time
+    print("✅ Recherches dans les jetons au lieu de resérialiser les sous-arbres")
+
+
+if __name__ == "__main__":
+    test_same_fields_as_serialization()
+    test_detection_speed()
+    print("\n✅ Tous les tests de l'index de jetons sont passés")
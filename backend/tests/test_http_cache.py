@@ -0,0 +1,146 @@
+# backend/tests/test_http_cache.py
+# Test du cache HTTP disque : fraîcheur max-age, revalidation ETag/Last-Modified, éviction LRU,
+# redirections (301 et page finale jamais servies à la place l'une de l'autre)
+# Le serveur local compte les requêtes réellement reçues
+# RELEVANT FILES: http_cache.py, http_client.py
+
+import os
+import sys
+import tempfile
+import threading
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.core import http_cache
+from src.core.http_cache import HttpCache
+from src.core.http_client import SharedHttpClient
+
+LAST_MODIFIED = formatdate(0, usegmt=True)
+
+
+class _CacheHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    hits = {}
+
+    def do_GET(self):
+        type(self).hits[self.path] = type(self).hits.get(self.path, 0) + 1
+        headers = {'Content-Type': 'text/plain'}
+        status = 200
+
+        if self.path == '/robots.txt':
+            headers['Cache-Control'] = 'max-age=3600'
+        elif self.path == '/sitemap.xml':
+            headers['Cache-Control'] = 'no-cache'
+            headers['ETag'] = '"v1"'
+            if self.headers.get('If-None-Match') == '"v1"':
+                status = 304
+        elif self.path == '/home':
+            headers['Last-Modified'] = LAST_MODIFIED
+            headers['Cache-Control'] = 'max-age=0'
+            if self.headers.get('If-Modified-Since') == LAST_MODIFIED:
+                status = 304
+        elif self.path == '/private':
+            headers['Cache-Control'] = 'no-store'
+        elif self.path.startswith('/big'):
+            headers['Cache-Control'] = 'max-age=3600'
+        elif self.path.startswith('/ancien'):
+            status = 301
+            headers['Location'] = '/nouveau'
+            headers['Cache-Control'] = 'max-age=3600'
+        elif self.path == '/nouveau':
+            headers['Cache-Control'] = 'max-age=3600'
+
+        body = b'' if status == 304 else (b'x' * 400_000 if self.path.startswith('/big') else self.path.encode())
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def start_server() -> str:
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _CacheHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return f"http://127.0.0.1:{server.server_port}"
+
+
+def test_cache_semantics(base_url: str, client: SharedHttpClient, cache: HttpCache):
+    print("\n" + "=" * 60)
+    print("TEST: Fraîcheur, revalidation et no-store")
+    print("=" * 60)
+
+    for _ in range(3):
+        for path in ('/robots.txt', '/sitemap.xml', '/home', '/private'):
+            response = client.get(base_url + path)
+            assert response.status_code == 200 and response.text == path
+
+    hits = _CacheHandler.hits
+    print(f"   Requêtes reçues par le serveur: {hits}")
+    assert hits['/robots.txt'] == 1, "max-age doit servir depuis le disque"
+    assert hits['/sitemap.xml'] == 3, "no-cache doit revalider à chaque fois"
+    assert hits['/home'] == 3
+    assert hits['/private'] == 3, "no-store ne doit jamais être stocké"
+
+    stats = cache.get_stats()
+    print(f"   Stats cache: {stats}")
+    assert stats['hits'] == 2 and stats['not_modified'] == 4
+    print("✅ Sémantique RFC respectée")
+
+
+def test_lru_eviction(base_url: str, client: SharedHttpClient, cache: HttpCache):
+    print("\n" + "=" * 60)
+    print("TEST: Éviction LRU par taille (max 1 Mo)")
+    print("=" * 60)
+
+    client.get(base_url + '/big-1')
+    client.get(base_url + '/big-2')
+    client.get(base_url + '/big-1')            # big-1 devient le plus récent
+    client.get(base_url + '/big-3')            # dépasse 1 Mo -> évince big-2
+    client.get(base_url + '/big-1')
+    client.get(base_url + '/big-2')
+
+    hits = _CacheHandler.hits
+    print(f"   big-1: {hits['/big-1']} requête(s), big-2: {hits['/big-2']} requête(s)")
+    assert hits['/big-1'] == 1 and hits['/big-2'] == 2
+    assert cache.get_stats()['size_mb'] <= 1.0
+    print("✅ Entrée la moins récemment utilisée évincée")
+
+
+def test_redirects(base_url: str, client: SharedHttpClient, cache: HttpCache):
+    print("\n" + "=" * 60)
+    print("TEST: Redirections suivies ou non, dans les deux ordres")
+    print("=" * 60)
+
+    # Sans suivre puis en suivant (site_estimator, puis path_finder), et l'ordre inverse
+    for path, orders in (('/ancien-a', (False, True)), ('/ancien-b', (True, False))):
+        for _ in range(2):
+            for follow in orders:
+                response = client.get(base_url + path, follow_redirects=follow)
+                if follow:
+                    assert response.status_code == 200 and response.text == '/nouveau', path
+                    assert str(response.url) == base_url + '/nouveau'
+                else:
+                    assert response.status_code == 301 and response.headers['Location'] == '/nouveau', path
+
+    hits = _CacheHandler.hits
+    print(f"   /ancien-a: {hits['/ancien-a']}, /ancien-b: {hits['/ancien-b']}, /nouveau: {hits['/nouveau']}")
+    assert hits['/ancien-a'] == 2 and hits['/ancien-b'] == 2, "301 et chaîne suivie stockés séparément"
+    print("✅ Chaque appelant reçoit la réponse correspondant à follow_redirects")
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as directory:
+        test_cache = HttpCache(directory=directory, max_size_mb=1)
+        http_cache._cache_instance = test_cache
+        url = start_server()
+        shared_client = SharedHttpClient()
+        test_cache_semantics(url, shared_client, test_cache)
+        test_lru_eviction(url, shared_client, test_cache)
+        test_redirects(url, shared_client, test_cache)
+    print("\n✅ Tous les tests du cache HTTP sont passés")
@@ -0,0 +1,95 @@
+# backend/tests/test_http_client.py
+# Test du client HTTP partagé : réutilisation keep-alive et limite par hôte
+# Sert des pages locales pour compter les connexions TCP réellement ouvertes
+# RELEVANT FILES: http_client.py, fetcher.py, fetcher_playwright.py
+
+import asyncio
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.core.http_client import SharedHttpClient
+
+REQUESTS = 20
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'   # keep-alive côté serveur
+    in_flight = 0
+    max_in_flight = 0
+    lock = threading.Lock()
+
+    def do_GET(self):
+        cls = type(self)
+        with cls.lock:
+            cls.in_flight += 1
+            cls.max_in_flight = max(cls.max_in_flight, cls.in_flight)
+        time.sleep(0.02)
+        body = b'<html><body>ok</body></html>'
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        with cls.lock:
+            cls.in_flight -= 1
+
+    def log_message(self, *args):
+        pass
+
+
+def start_server() -> str:
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _KeepAliveHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return f"http://127.0.0.1:{server.server_port}/"
+
+
+def test_sync_reuse(url: str):
+    print("\n" + "=" * 60)
+    print("TEST: Réutilisation des connexions (sync)")
+    print("=" * 60)
+
+    client = SharedHttpClient()
+    for _ in range(REQUESTS):
+        assert client.get(url).status_code == 200
+    stats = client.get_stats()
+    print(f"Requêtes: {stats['requests']} | Connexions ouvertes: {stats['connections_opened']} "
+          f"| Réutilisation: {stats['reuse_ratio']:.0%}")
+    assert stats['requests'] == REQUESTS
+    assert stats['connections_opened'] == 1, "une seule connexion keep-alive attendue"
+    client.close()
+    print("✅ Connexion keep-alive réutilisée")
+
+
+def test_async_reuse_and_host_limit(url: str):
+    print("\n" + "=" * 60)
+    print("TEST: Réutilisation + limite par hôte (async)")
+    print("=" * 60)
+
+    client = SharedHttpClient(max_connections_per_host=3)
+    _KeepAliveHandler.max_in_flight = 0
+
+    async def _run():
+        responses = await asyncio.gather(*(client.aget(url) for _ in range(REQUESTS)))
+        await client.aclose()
+        return responses
+
+    responses = asyncio.run(_run())
+    stats = client.get_stats()
+    print(f"Requêtes: {stats['requests']} | Connexions ouvertes: {stats['connections_opened']} "
+          f"| Max simultané côté serveur: {_KeepAliveHandler.max_in_flight}")
+    assert all(r.status_code == 200 for r in responses)
+    assert stats['connections_opened'] <= 3
+    assert _KeepAliveHandler.max_in_flight <= 3
+    print("✅ Limite par hôte respectée, connexions réutilisées")
+
+
+if __name__ == "__main__":
+    base_url = start_server()
+    test_sync_reuse(base_url)
+    test_async_reuse_and_host_limit(base_url)
+    print("\n✅ Tous les tests du client HTTP partagé sont passés")
@@ -0,0 +1,91 @@
+# backend/tests/test_loop_runner.py
+# Test de la boucle partagée : plusieurs threads synchrones soumettent leurs fetchs
+# à la même boucle (plus d'asyncio.run par appel)
+# RELEVANT FILES: loop_runner.py, fetcher_playwright.py, http_client.py
+
+import asyncio
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.core import rate_limiter
+from src.core.fetcher_playwright import fetch_html_smart, fetch_html_smart_async
+from src.core.http_client import get_http_client
+from src.core.loop_runner import get_loop_runner, run_sync
+
+THREADS = 8
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        body = f'<html><body><h1>{self.path}</h1></body></html>'.encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def start_server() -> str:
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return f"http://127.0.0.1:{server.server_port}"
+
+
+def test_single_loop_for_all_threads():
+    print("\n" + "=" * 60)
+    print("TEST: Une seule boucle pour tous les threads")
+    print("=" * 60)
+
+    async def _current_loop():
+        return asyncio.get_running_loop()
+
+    with ThreadPoolExecutor(max_workers=THREADS) as executor:
+        loops = list(executor.map(lambda _: run_sync(_current_loop()), range(THREADS * 2)))
+
+    assert len({id(loop) for loop in loops}) == 1
+    assert loops[0] is get_loop_runner().loop
+    print(f"✅ {len(loops)} soumissions depuis {THREADS} threads -> 1 boucle")
+
+
+def test_fetch_html_smart_sync_and_async(base_url: str):
+    print("\n" + "=" * 60)
+    print("TEST: fetch_html_smart (sync) et fetch_html_smart_async")
+    print("=" * 60)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=THREADS) as executor:
+        pages = list(executor.map(lambda i: fetch_html_smart(f"{base_url}/page-{i}"), range(THREADS)))
+    elapsed = time.perf_counter() - start
+    assert all(f'/page-{i}' in html for i, html in enumerate(pages))
+
+    async def _gather():
+        return await asyncio.gather(*(fetch_html_smart_async(f"{base_url}/async-{i}") for i in range(THREADS)))
+
+    async_pages = asyncio.run(_gather())
+    assert all(f'/async-{i}' in html for i, html in enumerate(async_pages))
+
+    stats = get_http_client().get_stats()
+    print(f"⏱️ {THREADS} fetchs sync concurrents: {elapsed:.2f}s")
+    print(f"📊 Client HTTP: {stats['requests']} requêtes, {stats['connections_opened']} connexions")
+    print("✅ API sync et async fonctionnelles")
+
+
+if __name__ == "__main__":
+    # Pas de politesse par hôte contre le serveur local
+    rate_limiter.RATE_LIMIT_CONFIG['enabled'] = False
+
+    url = start_server()
+    test_single_loop_for_all_threads()
+    test_fetch_html_smart_sync_and_async(url)
+    print("\n✅ Tous les tests de la boucle partagée sont passés")
@@ -0,0 +1,145 @@
+# backend/tests/test_network_capture.py
+# Test du mode capture réseau : détection des tableaux d'objets JSON, capture sur une page simulée,
+# puis rappel direct des endpoints en HTTP (serveur local, sans Chromium)
+# RELEVANT FILES: network_capture.py, fetcher_playwright.py
+
+import asyncio
+import json
+import os
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.core import rate_limiter
+from src.core.fetcher_playwright import PlaywrightFetcher
+from src.core.network_capture import NetworkCapture, extract_at_path, find_collections, get_endpoint_registry
+
+PRODUCTS = [{'id': i, 'name': f'Produit {i}', 'price': 10 + i, 'tags': ['a', 'b']} for i in range(12)]
+API_PAYLOAD = {
+    'meta': {'page': 1, 'total': 12},
+    'data': {'products': PRODUCTS, 'filters': [{'name': 'prix'}]},
+}
+
+
+class _ApiHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    hits = 0
+
+    def _send_json(self, payload):
+        type(self).hits += 1
+        body = json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        self._send_json(API_PAYLOAD)
+
+    def do_POST(self):
+        query = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+        self._send_json({'results': [{'hit': i, 'q': query['q']} for i in range(4)]})
+
+    def log_message(self, *args):
+        pass
+
+
+def start_server() -> str:
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _ApiHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return f"http://127.0.0.1:{server.server_port}"
+
+
+class _FakeRequest:
+    def __init__(self, method='GET', post_data=None, resource_type='fetch'):
+        self.method = method
+        self.post_data = post_data
+        self.resource_type = resource_type
+        self.headers = {'accept': 'application/json', 'content-type': 'application/json', 'cookie': 'secret'}
+
+
+class _FakeResponse:
+    def __init__(self, url, payload, request, content_type='application/json; charset=utf-8'):
+        self.url = url
+        self.status = 200
+        self.request = request
+        self.headers = {'content-type': content_type}
+        self._body = json.dumps(payload).encode()
+
+    async def body(self):
+        await asyncio.sleep(0)
+        return self._body
+
+
+class _FakePage:
+    def __init__(self):
+        self.listeners = {}
+
+    def on(self, event, callback):
+        self.listeners[event] = callback
+
+    def emit(self, response):
+        self.listeners['response'](response)
+
+
+def test_find_collections():
+    print("\n" + "=" * 60)
+    print("TEST: Détection des tableaux d'objets")
+    print("=" * 60)
+
+    collections = find_collections(API_PAYLOAD)
+    print(f"   {[(c['path'], len(c['items'])) for c in collections]}")
+    assert [c['path'] for c in collections] == ['$.data.products'], "filtres (1 item) et tags (scalaires) ignorés"
+    assert collections[0]['fields'][:3] == ['id', 'name', 'price']
+    assert extract_at_path(API_PAYLOAD, '$.data.products')[3]['name'] == 'Produit 3'
+
+    mixed = {'blocks': [{'items': PRODUCTS[:4]}, {'items': PRODUCTS[4:9]}]}
+    paths = [c['path'] for c in find_collections(mixed)]
+    assert paths == ['$.blocks[1].items', '$.blocks[0].items']
+    assert find_collections([{'a': 1}, {'b': 2}, {'c': 3}]) == [], "objets sans clés communes"
+    print("✅ Collections homogènes repérées avec leur chemin JSON")
+
+
+def test_capture_and_replay(base_url: str):
+    print("\n" + "=" * 60)
+    print("TEST: Capture pendant le rendu puis rappel HTTP direct")
+    print("=" * 60)
+
+    page_url = base_url + '/catalogue'
+
+    async def _render():
+        page = _FakePage()
+        capture = NetworkCapture(page_url)
+        await capture.attach(page)
+        page.emit(_FakeResponse(base_url + '/api/products?page=1', API_PAYLOAD, _FakeRequest()))
+        page.emit(_FakeResponse(base_url + '/api/search', {'results': [{'hit': i, 'q': 'x'} for i in range(4)]},
+                                _FakeRequest('POST', json.dumps({'q': 'velo'}))))
+        page.emit(_FakeResponse(base_url + '/app.js', {}, _FakeRequest(resource_type='script')))
+        page.emit(_FakeResponse(base_url + '/config', [{'k': 1}] * 5, _FakeRequest(), content_type='text/html'))
+        return await capture.finish()
+
+    collections = asyncio.run(_render())
+    print(f"   {[(c['endpoint']['url'], c['endpoint']['path'], c['items_count']) for c in collections]}")
+    assert [c['items_count'] for c in collections] == [12, 4]
+    assert 'cookie' not in collections[0]['endpoint']['headers'], "pas de cookie de session rejoué"
+    assert len(get_endpoint_registry().lookup(page_url)) == 2
+
+    _ApiHandler.hits = 0
+    replayed = asyncio.run(PlaywrightFetcher().extract_collections(page_url))
+    print(f"   source={replayed['source']} -> {[c['items_count'] for c in replayed['collections']]}")
+    assert replayed['source'] == 'api_replay' and _ApiHandler.hits == 2
+    assert replayed['collections'][0]['items'][5]['name'] == 'Produit 5'
+    assert replayed['collections'][1]['items'][0]['q'] == 'velo', "corps POST rejoué"
+    print("✅ Endpoints rappelés en HTTP, sans navigateur")
+
+
+if __name__ == "__main__":
+    rate_limiter.RATE_LIMIT_CONFIG['enabled'] = False
+
+    url = start_server()
+    test_find_collections()
+    test_capture_and_replay(url)
+    print("\n✅ Tous les tests de capture réseau sont passés")
@@ -0,0 +1,134 @@
+# backend/tests/test_parsed_page.py
+# Test du document partagé ParsedPage : un seul parsing par page pour analyze_url,
+# ContentDetector et AIStructureValidator, résultats identiques au passage du HTML brut
+# Page catalogue générée localement (réseau non requis : fetch_html_smart remplacé)
+# RELEVANT FILES: parsed_page.py, analyzer.py, content_detector.py, ai_structure_validator.py
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from bs4 import BeautifulSoup
+
+from src.core import analyzer
+from src.core.ai_structure_validator import AIStructureValidator
+from src.core.content_detector import ContentDetector
+from src.core.parsed_page import ParsedPage
+
+
+def _catalog_html(products: int = 400) -> str:
+    cards = ''.join(
+        f'<div class="product product-card" itemtype="https://schema.org/Product">'
+        f'<img src="/img/{i}.jpg" alt="Produit {i}"><h3 class="name">Produit {i}</h3>'
+        f'<span class="price">{10 + i},99 €</span><span class="stock">En stock</span>'
+        f'<button>Ajouter au panier</button></div>'
+        for i in range(products)
+    )
+    comments = ''.join(
+        f'<div class="comment"><span class="author">Client {i}</span><p>Très bon produit, avis utile, '
+        f'il y a {i} jours</p></div>'
+        for i in range(20)
+    )
+    return (
+        '<!DOCTYPE html><html><head><title>Catalogue de test</title></head><body>'
+        '<header><nav class="menu"><a href="/">Accueil</a><a href="/blog">Blog</a></nav></header>'
+        f'<main><section class="listing">{cards}</section>'
+        '<article class="post"><h2>Guide d\'achat</h2><p class="author">Par Jean</p>'
+        '<time>Publié le 15 janvier 2024</time><p>' + 'Texte du guide. ' * 40 + '</p></article>'
+        f'<section id="comments">{comments}</section>'
+        '<div class="pagination"><a href="?page=2">2</a><a href="?page=3">3</a><a rel="next" href="?page=2">Suivant</a></div>'
+        '<table><tr><th>Taille</th></tr><tr><td>M</td></tr></table>'
+        '</main><footer class="footer"><a href="/contact">Contact</a></footer></body></html>'
+    )
+
+
+class _ParseCounter:
+    """Compte les constructions de BeautifulSoup (= parsings complets)."""
+
+    def __enter__(self):
+        self.count = 0
+        self._original = BeautifulSoup.__init__
+        counter = self
+
+        def _counting_init(soup, *args, **kwargs):
+            counter.count += 1
+            return counter._original(soup, *args, **kwargs)
+
+        BeautifulSoup.__init__ = _counting_init
+        return self
+
+    def __exit__(self, *exc):
+        BeautifulSoup.__init__ = self._original
+
+
+def test_select_matches_soupsieve():
+    print("\n" + "=" * 60)
+    print("TEST: Sélecteurs servis par les index")
+    print("=" * 60)
+
+    page = ParsedPage(_catalog_html(50))
+    for selector in ['article', 'p', '.product', '.price', '#comments', 'div[class*="product"]',
+                     '[itemtype*="Product"]', '.pagination, .pager', 'a[rel="next"]', '.absent']:
+        expected = page.soup.select(selector)
+        assert page.select(selector) == expected, selector
+        assert page.select(selector) is page.select(selector), "résultat mis en cache"
+    assert page.text_lower == page.soup.get_text().lower()
+    print(f"   {len(page.tags_by_name)} balises, {len(page.tags_by_class)} classes indexées")
+    print("✅ Mêmes éléments, dans l'ordre du document")
+
+
+def test_same_results_as_raw_html():
+    print("\n" + "=" * 60)
+    print("TEST: Résultats identiques HTML brut / ParsedPage")
+    print("=" * 60)
+
+    html = _catalog_html()
+    detector, validator = ContentDetector(), AIStructureValidator()
+    from_html = detector.detect_content_types(html, 'https://shop.test/')
+    page = ParsedPage(html, 'https://shop.test/')
+    from_page = detector.detect_content_types(page, 'https://shop.test/')
+    assert from_html == from_page
+    print(f"   types détectés : {[t['type'] for t in from_page['detected_types']]}")
+
+    with _ParseCounter() as per_type:
+        raw = validator.validate_all_detected_types(html, from_html['detected_types'])
+    with _ParseCounter() as shared:
+        reused = validator.validate_all_detected_types(page, from_page['detected_types'])
+    assert raw == reused
+    assert per_type.count == 1 and shared.count == 0, "un parsing pour tous les types, aucun si déjà parsée"
+    print(f"   validation : {raw['validation_summary']}")
+    print("✅ Détection et validation inchangées")
+
+
+def test_analyze_url_parses_once():
+    print("\n" + "=" * 60)
+    print("TEST: analyze_url parse la page une seule fois")
+    print("=" * 60)
+
+    html = _catalog_html(1500)
+    original_fetch = analyzer.fetch_html_smart
+    analyzer.fetch_html_smart = lambda url, use_js=False: html
+    try:
+        with _ParseCounter() as counter:
+            start = time.perf_counter()
+            result = analyzer.analyze_url('https://shop.test/catalogue')
+            elapsed = time.perf_counter() - start
+    finally:
+        analyzer.fetch_html_smart = original_fetch
+
+    scrapable = result['scrapable_content']
+    print(f"   {len(html) / 1024:.0f} Ko : {counter.count} parsing(s), {elapsed * 1000:.0f} ms, "
+          f"{scrapable['total_types']} types validés")
+    assert counter.count == 1
+    assert result['page_title'] == 'Catalogue de test'
+    assert any(t['type'] == 'products' for t in scrapable['detected_types'])
+    print("✅ Un parsing partagé par l'analyse, la détection et la validation")
+
+
+if __name__ == "__main__":
+    test_select_matches_soupsieve()
+    test_same_results_as_raw_html()
+    test_analyze_url_parses_once()
+    print("\n✅ Tous les tests de ParsedPage sont passés")
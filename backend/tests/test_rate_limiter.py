@@ -0,0 +1,239 @@
+# backend/tests/test_rate_limiter.py
+# Test de la politesse par hôte : seul un même hôte attend, Crawl-delay de robots.txt respecté
+# Deux hôtes distincts sont simulés par 127.0.0.1 et localhost sur le même serveur local
+# RELEVANT FILES: rate_limiter.py, fetcher_playwright.py
+
+import asyncio
+import os
+import sys
+import threading
+import time
+from contextlib import asynccontextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.core import browser_pool, rate_limiter, render_cache
+from src.core.fetcher_playwright import fetch_html_playwright, fetch_html_smart_async
+from src.core.rate_limiter import HostBucket, HostRateLimiter
+
+INTERVAL = 0.3
+
+
+class _PoliteHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        if self.path == '/robots.txt':
+            # Seul "localhost" annonce un Crawl-delay
+            if self.headers.get('Host', '').startswith('localhost'):
+                body = b"User-agent: *\nCrawl-delay: 0.5\nDisallow: /admin\n"
+            else:
+                body = b"User-agent: *\nDisallow:\n"
+            content_type = 'text/plain'
+        else:
+            body = (f"<html><body><main><h1>Page {self.path}</h1>"
+                    f"<p>{'Contenu statique. ' * 40}</p></main></body></html>").encode()
+            content_type = 'text/html'
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def start_server() -> int:
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _PoliteHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server.server_port
+
+
+def test_bucket_spacing():
+    print("\n" + "=" * 60)
+    print("TEST: Seau à jetons (rafale puis espacement)")
+    print("=" * 60)
+
+    bucket = HostBucket(interval=1.0, burst=2)
+    waits = [bucket.reserve() for _ in range(4)]
+    print(f"   Attentes réservées: {[round(w, 2) for w in waits]}")
+    assert waits[0] == 0 and waits[1] == 0, "la rafale part immédiatement"
+    assert 0.9 < waits[2] <= 1.0 and 1.9 < waits[3] <= 2.0
+    print("✅ Créneaux réservés à intervalle régulier après la rafale")
+
+
+def test_hosts_are_independent(port: int):
+    print("\n" + "=" * 60)
+    print("TEST: Seul un même hôte est ralenti")
+    print("=" * 60)
+
+    limiter = HostRateLimiter(default_interval=INTERVAL, jitter=0, respect_robots=False)
+    hosts = [f"http://127.0.0.1:{port}/", f"http://localhost:{port}/", f"http://[::1]:{port}/"]
+
+    async def _distinct():
+        return await asyncio.gather(*(limiter.wait_async(url) for url in hosts))
+
+    start = time.perf_counter()
+    waits = asyncio.run(_distinct())
+    distinct_elapsed = time.perf_counter() - start
+    assert all(w == 0 for w in waits), "des hôtes différents ne s'attendent pas"
+
+    async def _same_host():
+        return await asyncio.gather(*(limiter.wait_async(hosts[0] + f"p{i}") for i in range(3)))
+
+    start = time.perf_counter()
+    asyncio.run(_same_host())
+    same_elapsed = time.perf_counter() - start
+
+    print(f"⏱️ 3 hôtes distincts: {distinct_elapsed:.2f}s | 3 requêtes même hôte: {same_elapsed:.2f}s")
+    assert distinct_elapsed < 0.1
+    assert same_elapsed >= 2 * INTERVAL * 0.95, "le même hôte doit être espacé"
+    print(f"📊 {limiter.get_stats()}")
+    print("✅ Politesse par hôte respectée")
+
+
+def test_robots_crawl_delay(port: int):
+    print("\n" + "=" * 60)
+    print("TEST: Crawl-delay de robots.txt")
+    print("=" * 60)
+
+    limiter = HostRateLimiter(default_interval=0.1, jitter=0)
+    limiter.wait(f"http://localhost:{port}/a")
+    limiter.wait(f"http://127.0.0.1:{port}/a")
+
+    assert limiter.interval_for(f"localhost:{port}") == 0.5
+    assert limiter.interval_for(f"127.0.0.1:{port}") == 0.1
+    limiter.configure_host(f"http://127.0.0.1:{port}", interval=0.2)
+    assert limiter.interval_for(f"127.0.0.1:{port}") == 0.2
+
+    stats = limiter.get_stats()
+    print(f"📊 {stats}")
+    assert stats['robots_fetched'] == 2
+    print("✅ Crawl-delay appliqué au seul hôte qui l'annonce")
+
+
+def test_fetch_pipeline(port: int):
+    print("\n" + "=" * 60)
+    print("TEST: fetch_html_smart_async sur deux hôtes en parallèle")
+    print("=" * 60)
+
+    rate_limiter._rate_limiter_instance = HostRateLimiter(default_interval=INTERVAL, jitter=0, respect_robots=False)
+    urls = [f"http://{host}:{port}/page-{i}" for i in range(3) for host in ('127.0.0.1', 'localhost')]
+
+    async def _fetch_all():
+        return await asyncio.gather(*(fetch_html_smart_async(url, use_js=False) for url in urls))
+
+    start = time.perf_counter()
+    pages = asyncio.run(_fetch_all())
+    elapsed = time.perf_counter() - start
+    assert all('Page /page-' in html for html in pages)
+
+    # 3 requêtes par hôte : 2 intervalles, les deux hôtes en parallèle
+    print(f"⏱️ 6 pages sur 2 hôtes: {elapsed:.2f}s (séquentiel avec un délai global: ~{5 * INTERVAL:.1f}s)")
+    assert elapsed < 4 * INTERVAL
+    print("✅ Les hôtes progressent en parallèle")
+
+
+def test_session_overrides():
+    print("\n" + "=" * 60)
+    print("TEST: Délai utilisateur limité à la session")
+    print("=" * 60)
+
+    limiter = HostRateLimiter(default_interval=1.0, jitter=0, respect_robots=False)
+    host = 'boutique.example'
+    limiter.configure_host(f"https://{host}/a", interval=0.5, owner='session-1')
+    assert limiter.interval_for(host) == 1.0, "un délai court ne descend pas sous l'intervalle par défaut"
+    limiter.configure_host(f"https://{host}/b", interval=3.0, owner='session-2')
+    limiter.configure_host(f"https://{host}/c", burst=5, owner='session-2')
+    assert limiter.interval_for(host) == 3.0 and limiter.burst_for(host) == 1, "la demande la plus stricte"
+
+    limiter.reserve(f"https://{host}/")
+    limiter.release('session-2')
+    assert limiter.interval_for(host) == 1.0 and limiter._bucket(host).interval == 1.0
+    limiter.release('session-1')
+    limiter.release('session-inconnue')
+    assert not limiter._overrides
+    print("✅ Délais de session plafonnés par la politesse par défaut et retirés en fin de session")
+
+
+class _FakeResponse:
+    status = 200
+    headers = {}
+
+
+class _FakePage:
+    async def route(self, pattern, handler):
+        pass
+
+    def on(self, event, callback):
+        pass
+
+    def remove_listener(self, event, callback):
+        pass
+
+    async def evaluate(self, script, args=None):
+        return True
+
+    async def goto(self, url, **kwargs):
+        return _FakeResponse()
+
+    async def content(self):
+        return '<html>rendu</html>'
+
+
+class _CountingPool:
+    """Pool simulé qui mesure le nombre maximal de pages prêtées en même temps."""
+
+    def __init__(self):
+        self.active = 0
+        self.max_active = 0
+
+    async def run_async(self, coro):
+        return await coro
+
+    @asynccontextmanager
+    async def lease_page(self):
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            yield _FakePage()
+        finally:
+            self.active -= 1
+
+
+def test_wait_outside_pool_lease():
+    print("\n" + "=" * 60)
+    print("TEST: Attente de politesse hors du contexte prêté")
+    print("=" * 60)
+
+    rate_limiter._rate_limiter_instance = HostRateLimiter(default_interval=INTERVAL, jitter=0, respect_robots=False)
+    render_cache._cache_instance = None
+    pool = _CountingPool()
+    original_get_pool = browser_pool.get_browser_pool
+    browser_pool.get_browser_pool = lambda: pool
+    try:
+        async def _render_all():
+            return await asyncio.gather(*(fetch_html_playwright(f"https://lent.example/p{i}") for i in range(3)))
+
+        start = time.perf_counter()
+        asyncio.run(_render_all())
+        elapsed = time.perf_counter() - start
+    finally:
+        browser_pool.get_browser_pool = original_get_pool
+    print(f"   3 rendus du même hôte en {elapsed:.2f}s, {pool.max_active} contexte(s) prêté(s) au plus")
+    assert elapsed >= 2 * INTERVAL * 0.9
+    assert pool.max_active == 1, "une requête qui attend son créneau n'occupe pas le pool"
+    print("✅ Le pool reste disponible pour les autres hôtes pendant l'attente")
+
+
+if __name__ == "__main__":
+    server_port = start_server()
+    test_bucket_spacing()
+    test_hosts_are_independent(server_port)
+    test_robots_crawl_delay(server_port)
+    test_fetch_pipeline(server_port)
+    test_session_overrides()
+    test_wait_outside_pool_lease()
+    print("\n✅ Tous les tests du rate limiter sont passés")
@@ -0,0 +1,196 @@
+# backend/tests/test_render_cache.py
+# Test du cache de rendus Playwright : clés, TTL, plafond de taille, métriques
+# Vérifie aussi que fetch_html_playwright sert un rendu en cache sans lancer Chromium,
+# et que ni lui ni extract_everything ne mettent en cache une page d'erreur (403/503)
+# RELEVANT FILES: render_cache.py, fetcher_playwright.py
+
+import asyncio
+import os
+import sys
+import time
+from contextlib import asynccontextmanager
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.core import browser_pool as browser_pool_module
+from src.core import render_cache as render_cache_module
+from src.core.fetcher_playwright import PlaywrightFetcher, _render_cache_key, fetch_html_playwright
+from src.core.render_cache import RenderCache, user_agent_class
+
+
+def test_keys_and_metrics():
+    print("\n" + "=" * 60)
+    print("TEST: Clés et métriques")
+    print("=" * 60)
+
+    cache = RenderCache(ttl=60)
+    key = RenderCache.make_key('html', 'https://a.fr/', scroll=False, wait_selector=None)
+    cache.put(key, '<html>a</html>', render_seconds=2.5)
+
+    assert cache.get(key) == '<html>a</html>'
+    assert cache.get(RenderCache.make_key('html', 'https://a.fr/', scroll=True)) is None
+    assert cache.get(RenderCache.make_key('html', 'https://a.fr/', wait_selector='.item')) is None
+    assert cache.get(RenderCache.make_key('html', 'https://a.fr/', ua_class='mobile')) is None
+    assert user_agent_class('Mozilla/5.0 (iPhone; CPU iPhone OS 17_0)') == 'mobile'
+
+    payload_key = RenderCache.make_key('extract_everything', 'https://a.fr/', scroll=True)
+    cache.put(payload_key, {'success': True, 'items': [1, 2]}, render_seconds=4.0)
+    first = cache.get(payload_key)
+    first['items'].append(3)
+    assert cache.get(payload_key)['items'] == [1, 2], "les payloads doivent être copiés"
+
+    stats = cache.get_stats()
+    print(f"   {stats}")
+    assert stats['hits'] == 3 and stats['misses'] == 3
+    assert stats['render_seconds_saved'] == 10.5
+    print("✅ Options de rendu distinguées, métriques correctes")
+
+
+def test_ttl_and_size_cap():
+    print("\n" + "=" * 60)
+    print("TEST: TTL et plafond de taille")
+    print("=" * 60)
+
+    cache = RenderCache(ttl=0.05, max_size_mb=1)
+    key = RenderCache.make_key('html', 'https://ttl.fr/')
+    cache.put(key, 'x')
+    time.sleep(0.1)
+    assert cache.get(key) is None and cache.get_stats()['expired'] == 1
+
+    cache = RenderCache(ttl=60, max_size_mb=1)
+    for i in range(3):
+        cache.put(RenderCache.make_key('html', f'https://big.fr/{i}'), 'x' * 400_000)
+    stats = cache.get_stats()
+    print(f"   {stats}")
+    assert stats['entries'] == 2 and stats['evictions'] == 1
+    assert cache.get(RenderCache.make_key('html', 'https://big.fr/0')) is None
+    print("✅ Entrées expirées et évincées")
+
+
+def test_fetch_uses_cache():
+    print("\n" + "=" * 60)
+    print("TEST: fetch_html_playwright consulte le cache avant le rendu")
+    print("=" * 60)
+
+    cache = RenderCache(ttl=60)
+    render_cache_module._cache_instance = cache
+    url = 'https://example.invalid/catalogue'
+    cache.put(_render_cache_key('html', url, False, None), '<html>rendu</html>', render_seconds=3.0)
+
+    html = asyncio.run(fetch_html_playwright(url))
+    assert html == '<html>rendu</html>'
+    print(f"   {cache.get_stats()}")
+    print("✅ Aucun navigateur lancé pour un rendu en cache")
+
+
+class _FakeResponse:
+    def __init__(self, status: int):
+        self.status = status
+        self.headers = {}
+
+
+class _FakePage:
+    """Page simulée : page.goto renvoie le statut HTTP donné, comme Playwright (sans lever sur 4xx/5xx)."""
+
+    def __init__(self, status: int):
+        self.status = status
+
+    async def route(self, pattern, handler):
+        pass
+
+    def on(self, event, callback):
+        pass
+
+    def remove_listener(self, event, callback):
+        pass
+
+    async def evaluate(self, script, args=None):
+        # Extraction (args = liste des sections) : contenu minimal ; attente de calme DOM : True
+        if isinstance(args, list):
+            return {'text': {'fullText': f'statut {self.status}'}, 'media': {}, 'links': []}
+        return True
+
+    async def goto(self, url, **kwargs):
+        return _FakeResponse(self.status)
+
+    async def content(self):
+        return f'<html>statut {self.status}</html>'
+
+
+class _FakePool:
+    def __init__(self, status: int):
+        self.status = status
+        self.renders = 0
+
+    async def run_async(self, coro):
+        return await coro
+
+    @asynccontextmanager
+    async def lease_page(self):
+        self.renders += 1
+        yield _FakePage(self.status)
+
+    @asynccontextmanager
+    async def lease_context(self):
+        self.renders += 1
+        yield self
+
+    async def new_page(self):
+        return _FakePage(self.status)
+
+
+def test_error_pages_not_cached():
+    print("\n" + "=" * 60)
+    print("TEST: Pages d'erreur (403/503) jamais mises en cache")
+    print("=" * 60)
+
+    cache = RenderCache(ttl=60)
+    render_cache_module._cache_instance = cache
+    original_get_pool = browser_pool_module.get_browser_pool
+    try:
+        for status, cached in [(503, False), (403, False), (200, True)]:
+            pool = _FakePool(status)
+            browser_pool_module.get_browser_pool = lambda: pool
+            url = f'https://example.invalid/statut-{status}'
+            for _ in range(2):
+                assert asyncio.run(fetch_html_playwright(url)) == f'<html>statut {status}</html>'
+            assert pool.renders == (1 if cached else 2), status
+            print(f"   {status} : {pool.renders} rendu(s)")
+    finally:
+        browser_pool_module.get_browser_pool = original_get_pool
+    print("✅ Seules les pages en succès sont servies depuis le cache")
+
+
+def test_error_extractions_not_cached():
+    print("\n" + "=" * 60)
+    print("TEST: extract_everything ne met pas en cache les pages d'erreur")
+    print("=" * 60)
+
+    cache = RenderCache(ttl=60)
+    render_cache_module._cache_instance = cache
+    fetcher = PlaywrightFetcher()
+    original_get_pool = browser_pool_module.get_browser_pool
+    try:
+        for status, cached in [(503, False), (403, False), (200, True)]:
+            pool = _FakePool(status)
+            browser_pool_module.get_browser_pool = lambda: pool
+            url = f'https://example.invalid/extraction-{status}'
+            for _ in range(2):
+                result = asyncio.run(fetcher.extract_everything(
+                    url, use_scroll=False, use_stealth=False, sections=['links']
+                ))
+                assert result['success'] and result['http_status'] == status
+            assert pool.renders == (1 if cached else 2), status
+            print(f"   {status} : {pool.renders} rendu(s)")
+    finally:
+        browser_pool_module.get_browser_pool = original_get_pool
+    print("✅ Challenges et pages d'erreur re-rendus à chaque extraction")
+
+
+if __name__ == "__main__":
+    test_keys_and_metrics()
+    test_ttl_and_size_cap()
+    test_fetch_uses_cache()
+    test_error_pages_not_cached()
+    test_error_extractions_not_cached()
+    print("\n✅ Tous les tests du cache de rendus sont passés")
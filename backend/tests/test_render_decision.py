@@ -0,0 +1,100 @@
+# backend/tests/test_render_decision.py
+# Test de la décision statique vs rendu JS (use_js='auto')
+# Vérifie les heuristiques (coquille SPA, <noscript>, contenu manquant) et la mémoire par motif
+# RELEVANT FILES: render_decision.py, fetcher_playwright.py
+
+import os
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.core import fetcher_playwright, rate_limiter
+from src.core.render_decision import RenderDecisionMemory, get_render_memory, needs_js_render, path_pattern
+
+STATIC_PAGE = "<html><head><title>Catalogue</title></head><body><main>{}</main></body></html>".format(
+    ''.join(f'<article><h2>Produit {i}</h2><p>Description détaillée du produit {i}.</p></article>' for i in range(20))
+)
+SPA_SHELL = '<html><head><script src="/app.js"></script></head><body><div id="root"></div></body></html>'
+NOSCRIPT_PAGE = '<html><body><noscript>Vous devez activer JavaScript pour utiliser ce site.</noscript></body></html>'
+
+
+def test_heuristics():
+    print("\n" + "=" * 60)
+    print("TEST: Heuristiques needs_js_render")
+    print("=" * 60)
+
+    cases = [
+        (STATIC_PAGE, False, 'static_ok'),
+        (SPA_SHELL, True, 'spa_shell'),
+        (NOSCRIPT_PAGE, True, 'noscript_warning'),
+        ('', True, 'empty_response'),
+        ('<html><body>' + '<script>x()</script>' * 5 + '<p>Chargement...</p></body></html>', True, 'missing_content'),
+    ]
+    for html, expected, expected_reason in cases:
+        needs_js, reason = needs_js_render(html)
+        print(f"   {expected_reason:<18} -> {needs_js} ({reason})")
+        assert (needs_js, reason) == (expected, expected_reason)
+    print("✅ Heuristiques correctes")
+
+
+def test_memory_patterns():
+    print("\n" + "=" * 60)
+    print("TEST: Mémoire par domaine et motif de chemin")
+    print("=" * 60)
+
+    assert path_pattern('https://shop.fr/produit/123') == path_pattern('https://shop.fr/produit/456')
+    assert path_pattern('https://shop.fr/produit/123') != path_pattern('https://shop.fr/blog/123')
+
+    memory = RenderDecisionMemory()
+    memory.record('https://shop.fr/produit/123', True, 'spa_shell')
+    assert memory.lookup('https://shop.fr/produit/999') is True
+    assert memory.lookup('https://shop.fr/blog/1') is None
+
+    # Domaine généralisé après plusieurs observations concordantes
+    for path in ('/a', '/b/1', '/c'):
+        memory.record(f'https://static.fr{path}', False, 'static_ok')
+    assert memory.lookup('https://static.fr/nouvelle-page') is False
+    print("✅ Décisions mémorisées et généralisées")
+
+
+def test_auto_mode_stays_static():
+    print("\n" + "=" * 60)
+    print("TEST: use_js='auto' sur une page statique (aucun navigateur)")
+    print("=" * 60)
+
+    class _Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            body = STATIC_PAGE.encode()
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/html; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_port}"
+
+    for i in range(5):
+        html = fetcher_playwright.fetch_html_smart(f"{base_url}/produit/{i}", use_js='auto')
+        assert 'Produit 19' in html
+
+    stats = get_render_memory().get_stats()
+    print(f"📊 {stats}")
+    assert stats['js_renders'] == 0 and stats['static_fetches'] == 5
+    print("✅ Aucune page rendue avec Chromium")
+
+
+if __name__ == "__main__":
+    # Pas de politesse par hôte contre le serveur local
+    rate_limiter.RATE_LIMIT_CONFIG['enabled'] = False
+
+    test_heuristics()
+    test_memory_patterns()
+    test_auto_mode_stays_static()
+    print("\n✅ Tous les tests de décision de rendu sont passés")
@@ -0,0 +1,82 @@
+# backend/tests/test_repeating_candidates.py
+# Test du passage unique de bas en haut de l'analyzer (_collect_node_stats) :
+# longueurs de texte et drapeaux identiques à get_text / find nœud par nœud (scripts, commentaires,
+# espaces insécables, template), filtres de navigation et collections détectées sur un catalogue
+# RELEVANT FILES: analyzer.py, tests/bench_repeating_candidates.py
+
+import os
+import re
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from bench_repeating_candidates import build_page, legacy_find_repeating_candidates
+from src.core.analyzer import (
+    _clean_text,
+    _collect_node_stats,
+    _find_repeating_candidates,
+    _is_navigation_or_filter,
+)
+from src.core.parsed_page import ParsedPage
+
+TRICKY_HTML = (
+    '<html><head><title> Titre </title><style>.a { color: red }</style></head><body>'
+    '<div id="root">  <!-- commentaire -->\n <p>Un texte   <b>gras</b></p>'
+    '<script>var x = "long script " + 1;</script><template><p>Gabarit</p></template>'
+    '<ul class="menu"><li><a href="/a">A</a></li><li><a href="/b">B</a></li><li><a href="/c">C</a></li>'
+    '<li><a href="/d">D</a></li></ul>'
+    '<div class="list"><div class="card"><img src="x.jpg"><span class="amount">3</span></div>'
+    '<div class="card"><h3>T</h3><span class="cost">5 €</span></div><div class="card"> </div>'
+    '<div class="card"><a href="/e">E</a></div></div>'
+    '<p> &nbsp; </p><p>&nbsp;Prix&nbsp;\u2009net</p><span></span><![CDATA[donnée]]>fin</div></body></html>'
+)
+
+
+def test_stats_match_tree_walks():
+    print("\n" + "=" * 60)
+    print("TEST: Données mémorisées = get_text / find")
+    print("=" * 60)
+
+    for html in [TRICKY_HTML, build_page(200_000)]:
+        soup = ParsedPage(html).soup
+        stats = _collect_node_stats(soup)
+        for tag in soup.find_all(True):
+            node = stats[id(tag)]
+            assert node.text_len == len(_clean_text(tag.get_text(" "))), tag.name
+            assert node.children == tag.find_all(recursive=False)
+            assert node.has_link == bool(tag.find_all("a"))
+            assert node.has_image == bool(tag.find("img"))
+            assert node.has_title == bool(tag.find(["h1", "h2", "h3", "h4", "h5", "h6"]))
+            assert node.has_nav_price == bool(tag.find(class_=re.compile(r"(?i)(price|cost)")))
+            assert node.has_price == bool(tag.find(class_=re.compile(r"(?i)(price|cost|amount)")))
+            assert node.size == 1 + len(tag.find_all(True))
+        print(f"   {len(stats)} nœuds vérifiés")
+    print("✅ Un seul parcours, mêmes valeurs que les parcours de sous-arbres")
+
+
+def test_navigation_and_candidates():
+    print("\n" + "=" * 60)
+    print("TEST: Filtres de navigation et collections")
+    print("=" * 60)
+
+    soup = ParsedPage(TRICKY_HTML).soup
+    assert _is_navigation_or_filter(soup.find('ul', class_='menu'))
+    assert not _is_navigation_or_filter(soup.find('div', class_='list'))
+
+    soup = ParsedPage(build_page(300_000)).soup
+    legacy = legacy_find_repeating_candidates(soup, 10)
+    candidates = _find_repeating_candidates(soup, 10)
+    assert [(id(c[0]), c[1], c[2], round(c[3], 6)) for c in legacy] == [
+        (id(c.container), c.item_tag_name, c.item_count, round(c.score, 6)) for c in candidates
+    ]
+    best = candidates[0]
+    assert best.container.get('class') == ['products'] and best.item_tag_name == 'li'
+    print(f"   meilleure collection : ul.products, {best.item_count} items, score {best.score:.1f}")
+    print("✅ Mêmes candidats que l'ancienne version")
+
+
+if __name__ == "__main__":
+    test_stats_match_tree_walks()
+    test_navigation_and_candidates()
+    print("\n✅ Tous les tests des collections répétées sont passés")
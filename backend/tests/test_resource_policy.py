@@ -0,0 +1,140 @@
+# backend/tests/test_resource_policy.py
+# Test de la politique d'interception réseau : blocage par type et par domaine tiers, selon le mode
+# Page et routes simulées (Chromium non requis) : on rejoue les requêtes d'une page e-commerce type
+# RELEVANT FILES: resource_policy.py, fetcher_playwright.py, smart_crawler.py, page_detector.py
+
+import asyncio
+import io
+import os
+import sys
+from contextlib import redirect_stdout
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.core.resource_policy import (
+    ResourcePolicy, get_resource_policy, get_resource_stats, record_resource_usage
+)
+
+# (type Playwright, URL) des requêtes émises par une page produit typique
+PAGE_REQUESTS = [
+    ('document', 'https://shop.example.com/produits'),
+    ('stylesheet', 'https://shop.example.com/static/app.css'),
+    ('script', 'https://shop.example.com/static/app.js'),
+    ('image', 'https://cdn.example.com/img/produit-1.jpg'),
+    ('image', 'https://cdn.example.com/img/produit-2.jpg'),
+    ('font', 'https://fonts.gstatic.com/s/roboto.woff2'),
+    ('media', 'https://shop.example.com/video/promo.mp4'),
+    ('script', 'https://www.googletagmanager.com/gtm.js?id=GTM-X'),
+    ('script', 'https://connect.facebook.net/fr_FR/fbevents.js'),
+    ('image', 'https://www.facebook.com/tr?id=1&ev=PageView'),
+    ('xhr', 'https://region1.google-analytics.com/g/collect'),
+    ('fetch', 'https://shop.example.com/api/produits?page=1'),
+]
+
+
+class _FakeRoute:
+    def __init__(self, resource_type: str, url: str):
+        self.request = type('Request', (), {'resource_type': resource_type, 'url': url})()
+        self.outcome = None
+
+    async def abort(self):
+        self.outcome = 'aborted'
+
+    async def continue_(self):
+        self.outcome = 'continued'
+
+
+class _FakePage:
+    """Rejoue PAGE_REQUESTS à travers la route installée par la politique."""
+
+    def __init__(self):
+        self.handler = None
+        self.listeners = {}
+
+    async def route(self, pattern, handler):
+        assert pattern == '**/*'
+        self.handler = handler
+
+    def on(self, event, callback):
+        self.listeners[event] = callback
+
+    async def load(self):
+        outcomes = {}
+        for resource_type, url in PAGE_REQUESTS:
+            route = _FakeRoute(resource_type, url)
+            await self.handler(route)
+            outcomes[url] = route.outcome
+            if route.outcome == 'continued':
+                headers = {'content-length': '1000'}
+                self.listeners['response'](type('Response', (), {'headers': headers})())
+        return outcomes
+
+
+def _run(policy: ResourcePolicy):
+    async def _navigate():
+        page = _FakePage()
+        usage = await policy.attach(page)
+        outcomes = await page.load()
+        return usage, outcomes
+    return asyncio.run(_navigate())
+
+
+def test_modes():
+    print("\n" + "=" * 60)
+    print("TEST: Blocage selon le mode d'extraction")
+    print("=" * 60)
+
+    usage, outcomes = _run(get_resource_policy('html'))
+    assert outcomes['https://shop.example.com/produits'] == 'continued'
+    assert outcomes['https://shop.example.com/static/app.js'] == 'continued'
+    assert outcomes['https://shop.example.com/api/produits?page=1'] == 'continued'
+    assert outcomes['https://cdn.example.com/img/produit-1.jpg'] == 'aborted'
+    assert outcomes['https://shop.example.com/static/app.css'] == 'aborted'
+    output = io.StringIO()
+    with redirect_stdout(output):
+        html_summary = record_resource_usage(usage)
+    assert '🚫 9 requêtes bloquées' in output.getvalue(), "journal des requêtes bloquées de la page"
+    print(f"   html       : {html_summary}")
+    assert html_summary['requests_blocked'] == 9 and html_summary['requests_allowed'] == 3
+    assert html_summary['bytes_loaded'] == 3000
+
+    usage, outcomes = _run(get_resource_policy('extract'))
+    assert outcomes['https://cdn.example.com/img/produit-1.jpg'] == 'continued', "images gardées pour l'extraction"
+    assert outcomes['https://shop.example.com/static/app.css'] == 'continued'
+    assert outcomes['https://www.googletagmanager.com/gtm.js?id=GTM-X'] == 'aborted'
+    assert outcomes['https://www.facebook.com/tr?id=1&ev=PageView'] == 'aborted', "pixel bloqué par chemin"
+    extract_summary = record_resource_usage(usage)
+    print(f"   extract    : {extract_summary}")
+    assert extract_summary['blocked_third_party'] == 4
+
+    usage, _ = _run(get_resource_policy('screenshot'))
+    screenshot_summary = record_resource_usage(usage)
+    print(f"   screenshot : {screenshot_summary}")
+    assert screenshot_summary['blocked_by_type'] == {'media': 1, 'script': 2, 'image': 1, 'xhr': 1}
+    print("✅ Chaque mode bloque ce qui lui est inutile, jamais le document")
+
+
+def test_custom_policy_and_totals():
+    print("\n" + "=" * 60)
+    print("TEST: Politique personnalisée et cumul par mode")
+    print("=" * 60)
+
+    policy = ResourcePolicy('custom', blocked_types={'image'}, blocked_domains=('example.com',))
+    assert policy.is_blocked_domain('https://cdn.example.com/x.js')
+    assert not policy.is_blocked_domain('https://notexample.com/x.js')
+    usage, outcomes = _run(policy)
+    assert outcomes['https://shop.example.com/produits'] == 'continued'
+    assert outcomes['https://fonts.gstatic.com/s/roboto.woff2'] == 'continued'
+    record_resource_usage(usage)
+    assert usage.requests_blocked == 0, "les compteurs repartent de zéro après record"
+
+    stats = get_resource_stats()
+    print(f"   {stats}")
+    assert stats['html']['pages'] == 1 and stats['html']['bytes_saved_estimate'] > 500_000
+    print("✅ Économies cumulées par mode")
+
+
+if __name__ == "__main__":
+    test_modes()
+    test_custom_policy_and_totals()
+    print("\n✅ Tous les tests de la politique d'interception sont passés")
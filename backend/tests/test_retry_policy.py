@@ -0,0 +1,284 @@
+# backend/tests/test_retry_policy.py
+# Test de la politique de retry : Retry-After, erreurs définitives, budget, disjoncteur par hôte
+# Le serveur local compte les requêtes reçues ; un port fermé simule un hôte en panne,
+# un pool de navigateurs simulé des réponses 503 de page.goto (Playwright ne lève pas sur 5xx)
+# RELEVANT FILES: retry_policy.py, fetcher_playwright.py, fetcher.py
+
+import asyncio
+import os
+import socket
+import sys
+import threading
+import time
+from contextlib import asynccontextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import httpx
+
+from src.core import browser_pool as browser_pool_module
+from src.core import rate_limiter, render_cache, retry_policy
+from src.core.fetcher import fetch_html
+from src.core.fetcher_playwright import fetch_html_smart_async
+from src.core.retry_policy import CircuitBreaker, CircuitOpenError, RetryBudget, RetryPolicy
+
+
+class _FlakyHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    hits = {}
+
+    def do_GET(self):
+        count = type(self).hits[self.path] = type(self).hits.get(self.path, 0) + 1
+        headers = {'Content-Type': 'text/html'}
+        if self.path == '/missing':
+            status = 404
+        elif self.path == '/flaky' and count == 1:
+            status, headers['Retry-After'] = 503, '1'
+        elif self.path == '/overloaded':
+            status, headers['Retry-After'] = 429, '3600'
+        else:
+            status = 200
+        body = f"<html><body><main><p>{self.path} {'texte ' * 60}</p></main></body></html>".encode()
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class _GotoResponse:
+    def __init__(self, status: int, headers: dict):
+        self.status = status
+        self.headers = headers
+
+
+class _StatusPage:
+    """Page simulée dont page.goto renvoie le statut suivant de la séquence du pool."""
+
+    def __init__(self, pool):
+        self.pool = pool
+        self.status = None
+
+    async def route(self, pattern, handler):
+        pass
+
+    def on(self, event, callback):
+        pass
+
+    def remove_listener(self, event, callback):
+        pass
+
+    async def evaluate(self, script, args=None):
+        return True
+
+    async def goto(self, url, **kwargs):
+        self.status, headers = self.pool.responses.pop(0)
+        self.pool.navigations += 1
+        return _GotoResponse(self.status, headers)
+
+    async def content(self):
+        return f'<html>statut {self.status}</html>'
+
+
+class _StatusPool:
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.navigations = 0
+
+    async def run_async(self, coro):
+        return await coro
+
+    @asynccontextmanager
+    async def lease_page(self):
+        yield _StatusPage(self)
+
+
+def start_server() -> str:
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _FlakyHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return f"http://127.0.0.1:{server.server_port}"
+
+
+def closed_port_url() -> str:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        port = sock.getsockname()[1]
+    return f"http://127.0.0.1:{port}/"
+
+
+def test_backoff_and_budget():
+    print("\n" + "=" * 60)
+    print("TEST: Jitter décorrélé et budget de retries")
+    print("=" * 60)
+
+    policy = RetryPolicy(base_delay=0.5, max_delay=4.0)
+    delay = policy.base_delay
+    for _ in range(50):
+        upper = min(4.0, max(0.5, delay * 3))
+        delay = policy.next_delay(delay)
+        assert 0.5 <= delay <= upper
+    print(f"   Dernier délai tiré: {delay:.2f}s (borné par max_delay=4s)")
+
+    budget = RetryBudget(ratio=0.5, max_tokens=2)
+    assert budget.withdraw() and budget.withdraw() and not budget.withdraw()
+    budget.deposit()
+    budget.deposit()
+    assert budget.withdraw(), "deux requêtes à ratio 0.5 rechargent un retry"
+    print("✅ Délais bornés, budget consommé puis rechargé")
+
+
+def test_retry_after_and_permanent_errors(base_url: str):
+    print("\n" + "=" * 60)
+    print("TEST: Retry-After et erreurs définitives")
+    print("=" * 60)
+
+    policy = retry_policy._retry_policy_instance = RetryPolicy(base_delay=0.05)
+
+    start = time.perf_counter()
+    html = asyncio.run(fetch_html_smart_async(base_url + '/flaky', use_js=False))
+    elapsed = time.perf_counter() - start
+    assert '/flaky' in html and _FlakyHandler.hits['/flaky'] == 2
+    assert elapsed >= 0.95, "Retry-After: 1 doit être respecté"
+    print(f"⏱️ 503 + Retry-After: 1 -> succès en {elapsed:.2f}s")
+
+    try:
+        fetch_html(base_url + '/missing')
+        raise AssertionError("404 attendu")
+    except httpx.HTTPStatusError:
+        pass
+    assert _FlakyHandler.hits['/missing'] == 1, "un 404 ne doit pas être réessayé"
+
+    start = time.perf_counter()
+    try:
+        fetch_html(base_url + '/overloaded')
+        raise AssertionError("429 attendu")
+    except httpx.HTTPStatusError:
+        pass
+    assert _FlakyHandler.hits['/overloaded'] == 1 and time.perf_counter() - start < 1
+    print("   404 et Retry-After d'une heure : abandon immédiat")
+
+    stats = policy.get_stats()
+    print(f"📊 {stats}")
+    assert stats['retry_after_honoured'] == 1 and stats['retries'] == 1
+    print("✅ Seules les erreurs transitoires sont réessayées")
+
+
+def test_playwright_status_retried():
+    print("\n" + "=" * 60)
+    print("TEST: 503 d'une navigation Playwright réessayé")
+    print("=" * 60)
+
+    policy = retry_policy._retry_policy_instance = RetryPolicy(base_delay=0.05)
+    render_cache._cache_instance = render_cache.RenderCache(ttl=60)
+    pool = _StatusPool([(503, {'retry-after': '1'}), (200, {})])
+    original_get_pool = browser_pool_module.get_browser_pool
+    browser_pool_module.get_browser_pool = lambda: pool
+    try:
+        start = time.perf_counter()
+        html = asyncio.run(fetch_html_smart_async('https://rendu.example/', use_js=True))
+        elapsed = time.perf_counter() - start
+    finally:
+        browser_pool_module.get_browser_pool = original_get_pool
+
+    assert html == '<html>statut 200</html>' and pool.navigations == 2
+    assert elapsed >= 0.95, "Retry-After: 1 doit être respecté"
+    stats = policy.get_stats()
+    print(f"⏱️ 503 + Retry-After: 1 -> rendu en {elapsed:.2f}s ; {stats}")
+    assert stats['retries'] == 1 and stats['retry_after_honoured'] == 1
+    assert policy.breaker.state('rendu.example') == 'closed'
+    print("✅ Statuts transitoires des rendus soumis à la politique de retry")
+
+
+def test_circuit_breaker():
+    print("\n" + "=" * 60)
+    print("TEST: Disjoncteur par hôte")
+    print("=" * 60)
+
+    dead_url = closed_port_url()
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=0.5)
+    retry_policy._retry_policy_instance = RetryPolicy(base_delay=0.01, max_delay=0.02, breaker=breaker)
+
+    # 3 tentatives échouées (connexion refusée) ouvrent le disjoncteur
+    try:
+        fetch_html(dead_url)
+        raise AssertionError("ConnectError attendu")
+    except httpx.ConnectError:
+        pass
+    assert breaker.state('127.0.0.1:' + dead_url.rsplit(':', 1)[1].strip('/')) == 'open'
+
+    start = time.perf_counter()
+    for _ in range(20):
+        try:
+            fetch_html(dead_url)
+        except CircuitOpenError:
+            pass
+    fail_fast = time.perf_counter() - start
+    print(f"⏱️ 20 requêtes vers un hôte en panne: {fail_fast * 1000:.1f}ms")
+    assert fail_fast < 0.1
+
+    # Après reset_timeout : une seule requête d'essai, qui échoue et rouvre le disjoncteur
+    time.sleep(0.6)
+    try:
+        fetch_html(dead_url)
+    except httpx.ConnectError:
+        pass
+    try:
+        fetch_html(dead_url)
+        raise AssertionError("CircuitOpenError attendu")
+    except CircuitOpenError as e:
+        print(f"   {e}")
+
+    stats = retry_policy._retry_policy_instance.get_stats()
+    print(f"📊 {stats}")
+    assert stats['circuit_rejections'] == 21 and stats['circuits_opened'] == 2
+    print("✅ Échec immédiat tant que l'hôte est en panne")
+
+
+def test_cancelled_trial_released():
+    print("\n" + "=" * 60)
+    print("TEST: Essai en demi-ouverture annulé")
+    print("=" * 60)
+
+    host = 'lent.example'
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.05)
+    policy = RetryPolicy(base_delay=0.01, max_delay=0.02, breaker=breaker)
+    breaker.record_failure(host)
+    time.sleep(0.1)
+
+    async def _slow():
+        await asyncio.sleep(10)
+        return 'jamais'
+
+    async def _ok():
+        return 'ok'
+
+    async def _run():
+        try:
+            await asyncio.wait_for(policy.execute_async(f'https://{host}/', _slow), timeout=0.05)
+            raise AssertionError("TimeoutError attendu")
+        except asyncio.TimeoutError:
+            pass
+        # L'essai annulé ne bloque pas l'hôte : un nouvel essai passe et referme le disjoncteur
+        return await policy.execute_async(f'https://{host}/', _ok)
+
+    assert asyncio.run(_run()) == 'ok'
+    assert breaker.state(host) == 'closed'
+    print("✅ Essai libéré à l'annulation, l'hôte reste joignable")
+
+
+if __name__ == "__main__":
+    # Pas de politesse par hôte contre le serveur local
+    rate_limiter.RATE_LIMIT_CONFIG['enabled'] = False
+
+    url = start_server()
+    test_backoff_and_budget()
+    test_retry_after_and_permanent_errors(url)
+    test_playwright_status_retried()
+    test_circuit_breaker()
+    test_cancelled_trial_released()
+    print("\n✅ Tous les tests de la politique de retry sont passés")
@@ -0,0 +1,108 @@
+# backend/tests/test_selector_matcher.py
+# Test du moteur de sélecteurs compilé (SelectorMatcher) : mêmes éléments que soup.select pour chaque
+# sélecteur de la table CONTENT_TYPES et des cas limites, un seul parcours pour tous les types de contenus
+# Pages générées localement (réseau non requis)
+# RELEVANT FILES: selector_matcher.py, content_detector.py, parsed_page.py
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from bench_repeating_candidates import build_page
+from fixture_site import render_page
+from test_parsed_page import _catalog_html
+from src.core.content_detector import ContentDetector
+from src.core.parsed_page import ParsedPage
+from src.core.selector_matcher import SelectorMatcher, compile_selector
+
+EDGE_HTML = (
+    '<html><body><div class="Product product  card" id="main" data-x="a b">'
+    '<input type="TEXT" name="q"><a rel="next prefetch" href="/2">2</a>'
+    '<span class="commentaire price-box">x</span><div class="comment-list"><p class="comment">ok</p></div>'
+    '<section itemtype="https://schema.org/Product"><img src="a.jpg"></section>'
+    '<table class="grid data-table"><tr><td>1</td></tr></table></div></body></html>'
+)
+EDGE_SELECTORS = [
+    '.product', '.Product', '.product.card', 'div.card', '#main', 'div#main.card', '*', 'IMG',
+    '[data-x]', '[data-x="a b"]', '[data-x~="b"]', '[data-x^="a"]', '[data-x$="b"]', '[data-x*=" "]',
+    '[class*="comment"]', '[class="comment"]', 'a[rel="next"]', 'a[rel~="next"]', 'input[type="text"]',
+    '[itemtype*="Product"]', '.grid, table', 'table, .grid', '.pagination, .pager',
+    'div > p', 'div p.comment', 'p:first-child', '[data-x*=""]'
+]
+
+
+def _legacy_groups(soup, groups):
+    """Ancienne boucle : un soup.select par sélecteur."""
+    result = {}
+    for name, selectors in groups.items():
+        elements = []
+        for selector in selectors:
+            try:
+                elements.extend(soup.select(selector))
+            except Exception:
+                continue
+        result[name] = elements
+    return result
+
+
+def _same(left, right) -> bool:
+    return [id(e) for e in left] == [id(e) for e in right]
+
+
+def test_matches_soupsieve():
+    print("\n" + "=" * 60)
+    print("TEST: Mêmes éléments que soup.select")
+    print("=" * 60)
+
+    matcher = SelectorMatcher({'edge': EDGE_SELECTORS})
+    assert matcher.fallback_selectors == ['div > p', 'div p.comment', 'p:first-child']
+    assert compile_selector('.a, b') is not None and compile_selector('a:hover') is None
+
+    detector = ContentDetector()
+    pages = [EDGE_HTML, _catalog_html(100), build_page(300_000), render_page('/'), render_page('/produit/jeux-3')]
+    for html in pages:
+        soup = ParsedPage(html).soup
+        by_selector = matcher.match_selectors(soup)
+        for selector in EDGE_SELECTORS:
+            assert _same(by_selector[selector], soup.select(selector)), selector
+        groups = detector.matcher.match(soup)
+        legacy = _legacy_groups(soup, detector.matcher.groups)
+        assert all(_same(groups[name], elements) for name, elements in legacy.items())
+    print(f"   {len(EDGE_SELECTORS)} cas limites et {len(detector.matcher.selectors)} sélecteurs de la table "
+          f"sur {len(pages)} pages")
+    print("✅ Résultats identiques, dans le même ordre")
+
+
+def test_single_walk():
+    print("\n" + "=" * 60)
+    print("TEST: Un parcours pour toute la table")
+    print("=" * 60)
+
+    detector = ContentDetector()
+    assert not detector.matcher.fallback_selectors, "toute la table CONTENT_TYPES est compilée"
+    soup = ParsedPage(build_page(500_000)).soup
+
+    start = time.perf_counter()
+    legacy = _legacy_groups(soup, detector.matcher.groups)
+    legacy_time = time.perf_counter() - start
+    start = time.perf_counter()
+    compiled = detector.matcher.match(soup)
+    compiled_time = time.perf_counter() - start
+    assert all(_same(compiled[name], legacy[name]) for name in legacy)
+    print(f"   {len(detector.matcher.selectors)} sélecteurs : soup.select {legacy_time * 1000:.0f} ms, "
+          f"parcours unique {compiled_time * 1000:.0f} ms (x{legacy_time / max(compiled_time, 1e-9):.1f})")
+
+    page = ParsedPage(_catalog_html(100))
+    first = detector.detect_content_types(page)
+    assert page.match(detector.matcher) is page.match(detector.matcher), "un parcours par page et par table"
+    assert first['has_pagination'] and first['total_pages_estimate'] > 1
+    print("✅ Détection servie par un seul parcours du DOM")
+
+
+if __name__ == "__main__":
+    test_matches_soupsieve()
+    test_single_walk()
+    print("\n✅ Tous les tests du moteur de sélecteurs sont passés")
@@ -0,0 +1,115 @@
+# backend/tests/test_smart_crawler_concurrency.py
+# Test du crawl concurrent du SmartCrawler : N pages en parallèle sur le site de test,
+# chaque URL visitée une seule fois, max_pages et plafond par hôte respectés
+# Pages simulées (Chromium non requis) : goto attend une latence, la collecte lit fixture_site
+# RELEVANT FILES: smart_crawler.py, tests/fixture_site.py
+
+import asyncio
+import os
+import sys
+from urllib.parse import urlparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from fixture_site import all_paths, page_links
+from src.core import rate_limiter, smart_crawler
+from src.core.smart_crawler import SmartCrawler
+
+BASE_URL = 'http://fixture.test'
+LATENCY = 0.03
+
+
+class _Tracker:
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+        self.visits = []
+
+
+class _FakeCrawlPage:
+    """Page de crawl simulée : goto prend LATENCY secondes, la collecte renvoie les liens du site de test."""
+
+    def __init__(self, tracker: _Tracker):
+        self.tracker = tracker
+        self.path = '/'
+
+    def on(self, event, callback):
+        pass
+
+    async def goto(self, url, **kwargs):
+        self.tracker.active += 1
+        self.tracker.peak = max(self.tracker.peak, self.tracker.active)
+        self.tracker.visits.append(url)
+        try:
+            await asyncio.sleep(LATENCY)
+        finally:
+            self.tracker.active -= 1
+        self.path = urlparse(url).path or '/'
+        return type('Response', (), {'status': 200})()
+
+    async def evaluate(self, script, arg=None):
+        await asyncio.sleep(0)
+        if script != smart_crawler._HARVEST_SCRIPT:
+            return True   # script de stabilisation DOM
+        data = page_links(self.path)
+        return {
+            'title': data['title'],
+            'links': [list(link) for link in data['links']],
+            'pagination': data['pagination'],
+            'preview': {'meta': {}, 'images': [], 'text': '', 'textTruncated': False, 'stats': {}}
+        }
+
+
+def _crawl(concurrency: int, max_pages: int = 1000):
+    tracker = _Tracker()
+    crawler = SmartCrawler(BASE_URL, max_pages=max_pages, concurrency=concurrency, mode='browser')
+    workers = [{'page': _FakeCrawlPage(tracker), 'waiter': None, 'resource_usage': None}
+               for _ in range(crawler.concurrency)]
+    pages_data, navigation = asyncio.run(crawler._run_workers(workers))
+    return crawler, tracker, pages_data, navigation
+
+
+def test_concurrent_crawl():
+    print("\n" + "=" * 60)
+    print("TEST: Crawl concurrent du site de test")
+    print("=" * 60)
+
+    expected = len(all_paths())
+    sequential, seq_tracker, seq_pages, _ = _crawl(concurrency=1)
+    parallel, par_tracker, par_pages, navigation = _crawl(concurrency=8)
+
+    for label, crawler, pages in (('1 page ', sequential, seq_pages), ('8 pages', parallel, par_pages)):
+        print(f"   {label}: {len(pages)} pages en {crawler.crawl_seconds:.2f}s "
+              f"({len(pages) / crawler.crawl_seconds:.0f} pages/s)")
+
+    assert len(seq_pages) == len(par_pages) == expected, "tout le site découvert"
+    assert len(par_tracker.visits) == len(set(par_tracker.visits)), "aucune URL visitée deux fois"
+    assert seq_tracker.peak == 1 and par_tracker.peak == smart_crawler.CRAWL_CONFIG['per_host_concurrency']
+    assert parallel.crawl_seconds < sequential.crawl_seconds / 2.5
+    assert {link['url'] for link in navigation['nav']} == {f'{BASE_URL}/categorie/livres',
+                                                           f'{BASE_URL}/categorie/musique',
+                                                           f'{BASE_URL}/categorie/films',
+                                                           f'{BASE_URL}/categorie/jeux',
+                                                           f'{BASE_URL}/categorie/jardin'}
+    print(f"   pic de pages simultanées sur l'hôte : {par_tracker.peak}")
+    print("✅ Même résultat qu'en séquentiel, plusieurs fois plus rapide")
+
+
+def test_max_pages():
+    print("\n" + "=" * 60)
+    print("TEST: Budget max_pages en concurrent")
+    print("=" * 60)
+
+    crawler, tracker, pages, _ = _crawl(concurrency=6, max_pages=10)
+    print(f"   {len(pages)} pages, {len(tracker.visits)} navigations")
+    assert len(pages) == 10 and len(tracker.visits) == 10 and len(crawler.visited_urls) == 10
+    print("✅ Jamais plus de max_pages navigations")
+
+
+if __name__ == "__main__":
+    rate_limiter.RATE_LIMIT_CONFIG['enabled'] = False
+    smart_crawler.CRAWL_CONFIG['per_host_concurrency'] = 4
+    test_concurrent_crawl()
+    test_max_pages()
+    print("\n✅ Tous les tests du crawl concurrent sont passés")
@@ -0,0 +1,97 @@
+# backend/tests/test_smart_crawler_harvest.py
+# Test de la collecte en un aller-retour du SmartCrawler : liens par zone, pagination, prévisualisation
+# Page simulée (Chromium non requis) : compte les appels navigateur faits par crawl_page
+# RELEVANT FILES: smart_crawler.py, wait_strategy.py
+
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.core import rate_limiter, smart_crawler
+from src.core.smart_crawler import SmartCrawler
+
+# Ce que renvoie _HARVEST_SCRIPT pour une page catalogue (liens déjà dédoublonnés par zone)
+HARVEST = {
+    'title': 'Catalogue',
+    'links': [
+        ['nav', '/livres/', 'Livres'],
+        ['nav', 'https://shop.example.com/contact', 'Contact'],
+        ['footer', 'mailto:contact@example.com', 'Écrire'],
+        ['footer', 'https://autre-site.com/partenaire', 'Partenaire'],
+        ['other', '/livres', 'Livres (doublon normalisé)'],
+        ['other', '/livres/1?ref=home#avis', 'Livre 1'],
+        ['other', '/static/catalogue.pdf', 'PDF'],
+    ],
+    'pagination': ['?page=2', '/catalogue?page=2', 'https://autre-site.com/?page=3'],
+    'preview': {
+        'meta': {'description': 'd' * 250},
+        'images': [['/img/couverture.jpg', 'Couverture', '300', '400'], ['/img/icone.png', '', '16', '16']],
+        'text': 'Bienvenue dans le catalogue',
+        'textTruncated': True,
+        'stats': {'total_links': 7, 'total_images': 2, 'total_forms': 1, 'total_tables': 0, 'total_lists': 3}
+    }
+}
+
+
+class _FakePage:
+    def __init__(self):
+        self.calls = []
+
+    def on(self, event, callback):
+        pass
+
+    async def goto(self, url, **kwargs):
+        self.calls.append('goto')
+        return type('Response', (), {'status': 200})()
+
+    async def evaluate(self, script, arg=None):
+        await asyncio.sleep(0)
+        if script == smart_crawler._HARVEST_SCRIPT:
+            self.calls.append('harvest')
+            return HARVEST
+        return True   # script de stabilisation DOM
+
+    def __getattr__(self, name):
+        # query_selector_all, get_attribute, inner_text, title... : ne doivent plus être appelés
+        raise AssertionError(f"appel navigateur inattendu: page.{name}")
+
+
+def test_crawl_page_single_round_trip():
+    print("\n" + "=" * 60)
+    print("TEST: crawl_page en un seul aller-retour de collecte")
+    print("=" * 60)
+
+    crawler = SmartCrawler('https://shop.example.com')
+    page = _FakePage()
+    data = asyncio.run(crawler.crawl_page(page, 'https://shop.example.com/catalogue'))
+    print(f"   appels navigateur : {page.calls}")
+    assert page.calls == ['goto', 'harvest']
+    assert data['title'] == 'Catalogue' and data['status'] == 200
+
+    navigation = data['navigation']
+    print(f"   navigation : { {zone: [l['url'] for l in links] for zone, links in navigation.items() if links} }")
+    assert [l['url'] for l in navigation['nav']] == [
+        'https://shop.example.com/livres', 'https://shop.example.com/contact'
+    ]
+    assert navigation['footer'] == [], "mailto et domaine externe ignorés"
+    assert [l['url'] for l in navigation['other']] == ['https://shop.example.com/livres/1'], \
+        "doublon d'une zone (après normalisation) et fichiers exclus"
+
+    assert sorted(data['pagination']) == ['https://shop.example.com', 'https://shop.example.com/catalogue']
+
+    preview = data['preview']
+    assert len(preview['meta']['description']) == 200
+    assert preview['images'] == [{
+        'src': 'https://shop.example.com/img/couverture.jpg', 'alt': 'Couverture', 'width': '300', 'height': '400'
+    }], "icônes filtrées"
+    assert preview['text_preview'] == 'Bienvenue dans le catalogue...'
+    assert preview['stats']['total_forms'] == 1
+    print("✅ Liens, pagination et prévisualisation identiques, sans appel par lien")
+
+
+if __name__ == "__main__":
+    rate_limiter.RATE_LIMIT_CONFIG['enabled'] = False
+    test_crawl_page_single_round_trip()
+    print("\n✅ Tous les tests de collecte du SmartCrawler sont passés")
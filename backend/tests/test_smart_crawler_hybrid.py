@@ -0,0 +1,197 @@
+# backend/tests/test_smart_crawler_hybrid.py
+# Test du mode hybride du SmartCrawler sur le site de test servi en HTTP local :
+# pages statiques collectées par lxml sans navigateur, coquille SPA envoyée au navigateur (simulé),
+# cible non HTML ignorée après une sonde HEAD (corps jamais téléchargé), 429 / 503 retentés sans rendu
+# ni mémorisation de la décision
+# RELEVANT FILES: smart_crawler.py, static_crawl.py, render_decision.py, tests/fixture_site.py
+
+import asyncio
+import os
+import sys
+from http.server import ThreadingHTTPServer
+from threading import Thread
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from lxml import html as lxml_html
+
+from fixture_site import _FixtureHandler, all_paths, page_links, render_page
+from src.core import rate_limiter, retry_policy, smart_crawler
+from src.core.render_decision import get_render_memory
+from src.core.retry_policy import CircuitBreaker, RetryPolicy
+from src.core.smart_crawler import SmartCrawler
+from src.core.static_crawl import harvest_html, is_js_challenge, links_need_js, needs_head_probe
+
+SPA_SHELL = (
+    '<!DOCTYPE html><html><head><title>App</title></head><body><div id="root"></div>'
+    '<script src="/app.js"></script><script src="/vendor.js"></script><script>boot()</script></body></html>'
+)
+EXTRA_LINKS = ('<a href="/app">Application</a><a href="/export/catalogue.json">Export</a>'
+               '<a href="/limite/offres">Offres</a><a href="/panne/stock">Stock</a>')
+STATIC_PAGE = '<html><body><main><a href="/">Accueil</a><p>' + 'texte ' * 100 + '</p></main></body></html>'
+
+
+class _HybridHandler(_FixtureHandler):
+    """Site de test + une coquille SPA (/app) et un export JSON (/export/catalogue.json)."""
+    requests = []
+
+    def _body(self):
+        path = self.path.split('?')[0]
+        if path == '/app':
+            return 'text/html; charset=utf-8', SPA_SHELL.encode()
+        if path == '/export/catalogue.json':
+            return 'application/json', b'[' + b'{"id": 1},' * 2000 + b'{"id": 2}]'
+        if path in ('/limite/offres', '/panne/stock'):
+            return 'text/html; charset=utf-8', STATIC_PAGE.encode()
+        html = render_page(path)
+        if html is None:
+            return None, b''
+        if path == '/':
+            html = html.replace('</main>', EXTRA_LINKS + '</main>')
+        return 'text/html; charset=utf-8', html.encode()
+
+    def _status(self, content_type) -> int:
+        path = self.path.split('?')[0]
+        if path == '/panne/stock':
+            return 503
+        if path == '/limite/offres':
+            # 429 au premier GET, puis la page
+            return 429 if self.requests.count(('GET', path)) == 1 else 200
+        return 404 if content_type is None else 200
+
+    def _respond(self, send_body: bool):
+        self.requests.append((self.command, self.path))
+        content_type, body = self._body()
+        status = self._status(content_type)
+        self.send_response(status)
+        if status in (429, 503):
+            self.send_header('Retry-After', '0')
+        if content_type:
+            self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if send_body:
+            self.wfile.write(body)
+
+    def do_GET(self):
+        self._respond(send_body=True)
+
+    def do_HEAD(self):
+        self._respond(send_body=False)
+
+
+class _FakeBrowserPage:
+    """Page navigateur simulée : rend la coquille SPA avec ses liens générés en JS."""
+
+    def __init__(self, rendered: list):
+        self.rendered = rendered
+
+    def on(self, event, callback):
+        pass
+
+    async def goto(self, url, **kwargs):
+        self.rendered.append(url)
+        return type('Response', (), {'status': 200})()
+
+    async def evaluate(self, script, arg=None):
+        if script != smart_crawler._HARVEST_SCRIPT:
+            return True
+        return {
+            'title': 'App',
+            'links': [['nav', '/categorie/livres', 'Livres'], ['other', '/produit/livres-0', 'Produit 0']],
+            'pagination': [],
+            'preview': {'meta': {}, 'images': [], 'text': 'Tableau de bord', 'textTruncated': False, 'stats': {}}
+        }
+
+
+def _start_server() -> str:
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _HybridHandler)
+    Thread(target=server.serve_forever, daemon=True).start()
+    return f"http://127.0.0.1:{server.server_port}"
+
+
+def test_static_harvest_matches_fixture():
+    print("\n" + "=" * 60)
+    print("TEST: Collecte lxml équivalente à la collecte navigateur")
+    print("=" * 60)
+
+    options = SmartCrawler.harvest_options()
+    for path in ['/', '/categorie/livres', '/categorie/livres/page/4', '/produit/jeux-3']:
+        harvest, reason = harvest_html(render_page(path), options)
+        expected = page_links(path)
+        assert reason == 'static_ok', (path, reason)
+        assert harvest['title'] == expected['title']
+        # Les liens de <header><nav> appartiennent aux deux zones, comme avec querySelectorAll
+        zones = {}
+        for zone, href, text in harvest['links']:
+            zones.setdefault(zone, []).append((href, text))
+        assert zones['nav'] == zones['header'] == [(href, text) for zone, href, text in expected['links'] if zone == 'nav']
+        assert [href for href, _ in zones['footer']] == ['/a-propos', '/contact']
+        # 'other' : liens hors zones (le lien « Suivant » de pagination compris)
+        zoned = {href for zone, href, _ in expected['links'] if zone != 'other'}
+        assert sorted(href for href, _ in zones.get('other', [])) == sorted(
+            [href for zone, href, _ in expected['links'] if zone == 'other' and href not in zoned]
+            + expected['pagination'])
+        assert harvest['pagination'] == expected['pagination']
+        assert harvest['preview']['meta']['description'].endswith(expected['title'])
+        print(f"   {path}: {len(harvest['links'])} liens, pagination {harvest['pagination']}")
+
+    assert harvest_html(SPA_SHELL, options) == (None, 'no_static_links')
+    router = '<html><body>' + '<a>Lien</a>' * 8 + '<a href="/ok">Ok</a><p>' + 'texte ' * 100 + '</p></body></html>'
+    assert links_need_js(lxml_html.fromstring(router)) == 'js_links'
+    assert needs_head_probe('https://x.test/export/catalogue.json')
+    assert not needs_head_probe('https://x.test/produit/livre-1') and not needs_head_probe('https://x.test/a.php')
+    assert is_js_challenge('<html><head><title>Just a moment...</title></head><body><p>Please enable '
+                           'JavaScript and cookies to continue</p></body></html>'), "503 anti-bot : rendu"
+    assert not is_js_challenge('<html><body><p>Service indisponible</p></body></html>'), "503 ordinaire : retry"
+    print("✅ Mêmes liens, zones, pagination et métadonnées qu'avec le navigateur")
+
+
+def test_hybrid_crawl():
+    print("\n" + "=" * 60)
+    print("TEST: Crawl hybride HTTP + navigateur à la demande")
+    print("=" * 60)
+
+    base_url = _start_server()
+    _HybridHandler.requests = []
+    rendered, opened = [], []
+    memory = get_render_memory()
+    memory.clear()
+    retry_policy._retry_policy_instance = RetryPolicy(
+        base_delay=0.01, max_delay=0.02, breaker=CircuitBreaker(failure_threshold=100))
+
+    async def _open_page(worker):
+        opened.append(worker['index'])
+        worker.update({'page': _FakeBrowserPage(rendered), 'waiter': None, 'resource_usage': None})
+
+    crawler = SmartCrawler(base_url, max_pages=1000, concurrency=4, mode='hybrid')
+    workers = [{'index': i, 'page': None, 'waiter': None, 'resource_usage': None, 'open_page': _open_page}
+               for i in range(crawler.concurrency)]
+    pages_data, _ = asyncio.run(crawler._run_workers(workers))
+
+    stats = crawler.fetch_stats
+    print(f"   {len(pages_data)} pages, récupération : {stats}")
+    assert len(pages_data) == len(all_paths()) + 2, "site complet + coquille SPA + page d'abord limitée (429)"
+    assert rendered == [f'{base_url}/app'] and len(opened) == 1, "navigateur ouvert pour la seule coquille SPA"
+    assert stats['static'] == len(all_paths()) + 1 and stats['escalated'] == 1 and stats['rendered'] == 1
+    assert stats['render_reasons'] == {'no_static_links': 1}
+    assert stats['skipped_non_html'] == 1 and stats['transient_failures'] == 1
+    assert _HybridHandler.requests.count(('GET', '/limite/offres')) == 2, "429 retenté par HTTP, pas par Chromium"
+    assert _HybridHandler.requests.count(('GET', '/panne/stock')) == retry_policy.RETRY_POLICY_CONFIG['max_attempts']
+    assert memory.lookup(f'{base_url}/panne/stock') is not True, "un 503 ne fige pas le motif sur Chromium"
+    assert memory.lookup(f'{base_url}/app') is True
+    json_requests = [method for method, path in _HybridHandler.requests if path == '/export/catalogue.json']
+    assert json_requests == ['HEAD'], "export JSON sondé en HEAD, jamais téléchargé"
+    by_url = {page['url']: page for page in pages_data}
+    assert by_url[f'{base_url}/app']['fetch'] == 'browser'
+    assert by_url[f'{base_url}/app']['render_reason'] == 'no_static_links'
+    assert by_url[f'{base_url}/categorie/livres']['fetch'] == 'static'
+    print("✅ Pages statiques sans Chromium, rendu réservé aux pages qui en ont besoin")
+
+
+if __name__ == "__main__":
+    rate_limiter.RATE_LIMIT_CONFIG['enabled'] = False
+    test_static_harvest_matches_fixture()
+    test_hybrid_crawl()
+    print("\n✅ Tous les tests du crawl hybride sont passés")
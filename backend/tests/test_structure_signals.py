@@ -0,0 +1,106 @@
+# backend/tests/test_structure_signals.py
+# Test du moteur unique de l'AIStructureValidator (StructureSignalMatcher) : mêmes comptes que
+# re.findall / re.search motif par motif et type par type, mêmes validations, un passage par page
+# Pages générées localement (réseau non requis)
+# RELEVANT FILES: ai_structure_validator.py, parsed_page.py, content_detector.py
+
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from bench_repeating_candidates import build_page
+from fixture_site import render_page
+from test_parsed_page import _catalog_html
+from src.core.ai_structure_validator import AIStructureValidator
+from src.core.content_detector import ContentDetector
+from src.core.parsed_page import ParsedPage
+
+# Motifs qui se recouvrent (« buy » dans deux types, « written by » / « by », « 3 jours » / « il y a »)
+OVERLAP_HTML = (
+    '<html><body><div class="job-offer" data-Salary="x"><h1>Offre CDI temps plein, full-time</h1>'
+    '<p>Written by Jean, by Marie. Buy now, buy! Acheter ou louer : 120 m² 3 chambres, USD 30 € 12,50</p>'
+    '<p>Il y a 3 jours, 12 heures ago. Recette : 2 étapes, mélange 10 minutes. 4/5 ★★ 5 étoiles</p>'
+    '<p>Le 12 janvier à 18h30 ou 9:45, réserver. Niveau débutant, durée 3 heures, certificat.</p>'
+    '<span class="STOCK">En stock</span><span class="author-name">x</span><time>hier</time></div>'
+    '<!-- instructions --><script>var rating = 5;</script></body></html>'
+)
+
+
+def _legacy_signals(page: ParsedPage, config: dict):
+    """Ancienne version : un soup.select par balise, un re.findall par indicateur, un re.search par marqueur."""
+    tags = [len(page.soup.select(selector)) for selector in config['html_tags']]
+    indicators = [(p, len(re.findall(p, page.text_lower, re.IGNORECASE))) for p in config['text_indicators']]
+    markers = [m for m in config['structure_markers'] if re.search(rf'\b{m}\b', page.html, re.IGNORECASE)]
+    return tags, indicators, markers
+
+
+def test_same_counts_as_separate_regexes():
+    print("\n" + "=" * 60)
+    print("TEST: Mêmes comptes que re.findall / re.search")
+    print("=" * 60)
+
+    validator = AIStructureValidator()
+    pages = [OVERLAP_HTML, _catalog_html(80), build_page(200_000), render_page('/'), render_page('/produit/jeux-3')]
+    for html in pages:
+        page = ParsedPage(html)
+        signals = validator.signal_matcher.scan(page)
+        tagged = validator.tag_matcher.match_selectors(page.soup)
+        for content_type, config in validator.VALIDATION_PATTERNS.items():
+            tags, indicators, markers = _legacy_signals(page, config)
+            assert [len(tagged[selector]) for selector in config['html_tags']] == tags, content_type
+            assert signals[content_type]['text_indicators'] == indicators, content_type
+            assert signals[content_type]['structure_markers'] == markers, content_type
+
+    counts = validator.signal_matcher.scan(ParsedPage(OVERLAP_HTML))
+    print(f"   {len(validator.signal_matcher.indicators)} indicateurs, {len(validator.signal_matcher.markers)} "
+          f"marqueurs ; page de recouvrements : {counts['jobs']['text_matches']} indicateurs emploi, "
+          f"marqueurs avis {counts['reviews']['structure_markers']}")
+    print("✅ Comptes identiques, motifs qui se recouvrent compris")
+
+
+def test_validation_single_scan():
+    print("\n" + "=" * 60)
+    print("TEST: Validation de tous les types en un passage")
+    print("=" * 60)
+
+    validator = AIStructureValidator()
+    page = ParsedPage(build_page(2 * 1024 * 1024))
+    page.text_lower  # texte commun aux deux versions, hors mesure
+    detected = [{'type': t, 'name': t, 'count': 10} for t in validator.VALIDATION_PATTERNS]
+
+    scans = []
+    original_scan = validator.signal_matcher.scan
+    validator.signal_matcher.scan = lambda p: scans.append(p) or original_scan(p)
+    start = time.perf_counter()
+    result = validator.validate_all_detected_types(page, detected)
+    elapsed = time.perf_counter() - start
+    assert len(scans) == 1, "un seul passage pour tous les types"
+
+    start = time.perf_counter()
+    for config in validator.VALIDATION_PATTERNS.values():
+        _legacy_signals(page, config)
+    legacy_time = time.perf_counter() - start
+    print(f"   {len(detected)} types : motif par motif {legacy_time * 1000:.0f} ms, "
+          f"passage unique {elapsed * 1000:.0f} ms (x{legacy_time / max(elapsed, 1e-9):.1f})")
+
+    summary = result['validation_summary']
+    assert summary['total_detected'] == len(detected)
+    products = next(t for t in result['validated_types'] if t['type'] == 'products')
+    assert products['validation']['score_details']['html_tags'] == len(page.soup.select('div[class*="product"]'))
+
+    small = ParsedPage(_catalog_html(80))
+    found = ContentDetector().detect_content_types(small)['detected_types']
+    assert validator.validate_all_detected_types(small, found) == validator.validate_all_detected_types(
+        small.html, found), "HTML brut ou page partagée : même résultat"
+    print(f"   validation : {summary}")
+    print("✅ Scores calculés sur les comptes du passage unique")
+
+
+if __name__ == "__main__":
+    test_same_counts_as_separate_regexes()
+    test_validation_single_scan()
+    print("\n✅ Tous les tests du moteur de validation sont passés")
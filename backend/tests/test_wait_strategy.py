@@ -0,0 +1,132 @@
+# backend/tests/test_wait_strategy.py
+# Test de l'attente de stabilisation : rend la main dès que DOM et réseau sont calmes,
+# attend les requêtes en vol, respecte le plafond et ignore les requêtes longues (long-polling)
+# Page simulée (Chromium non requis) : mutations DOM et requêtes programmées dans le temps
+# RELEVANT FILES: wait_strategy.py, fetcher_playwright.py, smart_crawler.py, page_detector.py
+
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.core.wait_strategy import QuiescenceWaiter, get_wait_stats, wait_for_quiescence
+
+
+class _FakeRequest:
+    def __init__(self, resource_type='fetch'):
+        self.resource_type = resource_type
+
+
+class _FakePage:
+    """
+    Page simulée : mutations DOM jusqu'à `mutations_until` secondes après création,
+    le script MutationObserver est émulé côté Python.
+    """
+
+    def __init__(self, mutations_until: float = 0.0):
+        self.created = time.monotonic()
+        self.mutations_until = mutations_until
+        self.listeners = {}
+
+    def on(self, event, callback):
+        self.listeners.setdefault(event, []).append(callback)
+
+    def remove_listener(self, event, callback):
+        self.listeners[event].remove(callback)
+
+    def emit(self, event, request):
+        for callback in list(self.listeners.get(event, [])):
+            callback(request)
+
+    async def evaluate(self, script, args):
+        quiet = args['quietMs'] / 1000.0
+        cap = args['timeoutMs'] / 1000.0
+        start = time.monotonic()
+        last_mutation = self.created + self.mutations_until
+        while True:
+            now = time.monotonic()
+            if now - start >= cap:
+                return False
+            if now - max(last_mutation, start) >= quiet:
+                return True
+            await asyncio.sleep(0.01)
+
+
+def test_quiet_page_returns_fast():
+    print("\n" + "=" * 60)
+    print("TEST: Page déjà stable")
+    print("=" * 60)
+
+    async def _run():
+        page = _FakePage()
+        waiter = QuiescenceWaiter(quiet_ms=100).attach(page)
+        return await waiter.wait(page, max_wait=2, kind='test_quiet')
+
+    waited = asyncio.run(_run())
+    print(f"   attendu {waited:.2f}s (ancien sleep fixe : 2s)")
+    assert waited < 0.5
+    print("✅ Rend la main après la fenêtre de silence, pas après le plafond")
+
+
+def test_waits_for_mutations_and_requests():
+    print("\n" + "=" * 60)
+    print("TEST: Mutations DOM et requêtes en vol")
+    print("=" * 60)
+
+    async def _run():
+        page = _FakePage(mutations_until=0.4)
+        waiter = QuiescenceWaiter(quiet_ms=100).attach(page)
+        api_call = _FakeRequest()
+        page.emit('request', api_call)
+        page.emit('request', _FakeRequest('websocket'))   # jamais terminée : ignorée
+
+        async def _finish_later():
+            await asyncio.sleep(0.7)
+            page.emit('requestfinished', api_call)
+
+        asyncio.ensure_future(_finish_later())
+        return await waiter.wait(page, max_wait=3, kind='test_busy')
+
+    waited = asyncio.run(_run())
+    print(f"   attendu {waited:.2f}s (requête terminée à 0.7s)")
+    assert 0.75 <= waited < 1.5, "attend la fin de la requête puis la fenêtre de silence"
+    print("✅ Attend la fin des mutations et des requêtes")
+
+
+def test_cap_and_long_requests():
+    print("\n" + "=" * 60)
+    print("TEST: Plafond et requêtes longues")
+    print("=" * 60)
+
+    async def _capped():
+        page = _FakePage(mutations_until=10)     # page qui ne cesse de muter (carrousel)
+        return await wait_for_quiescence(page, max_wait=0.5, kind='test_capped')
+
+    waited = asyncio.run(_capped())
+    print(f"   page instable : {waited:.2f}s")
+    assert 0.5 <= waited < 0.8
+    assert get_wait_stats()['test_capped']['capped'] == 1
+
+    async def _long_polling():
+        page = _FakePage()
+        waiter = QuiescenceWaiter(quiet_ms=100, long_request_ms=300).attach(page)
+        page.emit('request', _FakeRequest('xhr'))    # long-polling jamais terminé
+        waited = await waiter.wait(page, max_wait=2, kind='test_long')
+        waiter.detach(page)
+        assert page.listeners['request'] == []
+        return waited
+
+    waited = asyncio.run(_long_polling())
+    print(f"   long-polling : {waited:.2f}s")
+    assert 0.3 <= waited < 1.0, "requête ignorée après long_request_ms"
+    print("✅ Plafond respecté, long-polling sans effet au-delà de son délai")
+
+
+if __name__ == "__main__":
+    test_quiet_page_returns_fast()
+    test_waits_for_mutations_and_requests()
+    test_cap_and_long_requests()
+    print(f"\n📊 {get_wait_stats()}")
+    print("\n✅ Tous les tests d'attente de stabilisation sont passés")